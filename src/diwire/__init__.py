@@ -11,6 +11,7 @@ from diwire._internal.markers import (
 )
 from diwire._internal.policies import DependencyRegistrationPolicy, MissingPolicy
 from diwire._internal.providers import Lifetime
+from diwire._internal.resolution_handle import ResolutionHandle
 from diwire._internal.resolver_context import ResolverContext, resolver_context
 from diwire._internal.resolvers.protocol import ResolverProtocol
 from diwire._internal.scope import BaseScope, Scope
@@ -29,6 +30,7 @@ __all__ = [
     "Maybe",
     "MissingPolicy",
     "Provider",
+    "ResolutionHandle",
     "ResolverContext",
     "ResolverProtocol",
     "Scope",
@@ -0,0 +1,3 @@
+from diwire._internal.cli import main
+
+raise SystemExit(main())
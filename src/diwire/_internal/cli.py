@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from diwire._internal.container import Container
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``python -m diwire`` command line interface.
+
+    Args:
+        argv: Command line arguments without the program name. Defaults to ``sys.argv[1:]``.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m diwire")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser(
+        "build",
+        help="Generate an ahead-of-time resolver module for a container.",
+    )
+    build_parser.add_argument(
+        "target",
+        help="Container or zero-argument container factory as 'module:attribute'.",
+    )
+    build_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        required=True,
+        help="Path of the generated Python module.",
+    )
+    build_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit with status 1 when the module is missing or out of date.",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        container = _load_container(target=args.target)
+    except (ImportError, AttributeError, TypeError, ValueError) as error:
+        parser.error(str(error))
+
+    module_source = _render_container_module(container=container, target=args.target)
+    if args.check:
+        try:
+            current_source = args.output.read_text()
+        except FileNotFoundError:
+            current_source = None
+        if current_source != module_source:
+            sys.stderr.write(
+                f"{args.output} is out of date; run `python -m diwire build {args.target} "
+                f"--output {args.output}`.\n",
+            )
+            return 1
+        return 0
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(module_source)
+    return 0
+
+
+def _load_container(*, target: str) -> Container:
+    module_name, separator, attribute_path = target.partition(":")
+    if not separator or not module_name or not attribute_path:
+        msg = f"Expected a 'module:attribute' target, got {target!r}."
+        raise ValueError(msg)
+
+    value: Any = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        value = getattr(value, attribute)
+    if not isinstance(value, Container) and callable(value):
+        value = value()
+    if not isinstance(value, Container):
+        msg = f"{target!r} is not a Container or a factory returning one."
+        raise TypeError(msg)
+    return value
+
+
+def _render_container_module(*, container: Container, target: str) -> str:
+    return container._resolvers_manager.render_aot_module(  # noqa: SLF001
+        root_scope=container._root_scope,  # noqa: SLF001
+        registrations=container._providers_registrations,  # noqa: SLF001
+        target=target,
+    )
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import functools
+import gc
 import inspect
 import logging
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping, Sequence
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from types import TracebackType
+from types import ModuleType, TracebackType
 from typing import (
     Annotated,
     Any,
@@ -60,6 +62,7 @@ from diwire._internal.providers import (
     ProviderSpec,
     ProvidersRegistrations,
 )
+from diwire._internal.resolution_handle import ResolutionHandle
 from diwire._internal.resolver_context import (
     ResolverContext,
     resolver_context as default_resolver_context,
@@ -106,6 +109,8 @@ class Container:
     _ENTRYPOINT_METHOD_NAMES: tuple[str, ...] = (
         "resolve",
         "aresolve",
+        "resolve_many",
+        "aresolve_many",
         "enter_scope",
     )
 
@@ -121,6 +126,11 @@ class Container:
         ),
         resolver_context: ResolverContext = default_resolver_context,
         use_resolver_context: bool = True,
+        compile_cache_dir: str | os.PathLike[str] | None = None,
+        aot_module: str | ModuleType | None = None,
+        concurrent_async_dependencies: bool = False,
+        concurrent_async_cleanup: bool = False,
+        deferred_cleanup: bool = False,
     ) -> None:
         """Initialize a container and configure default registration behavior.
 
@@ -145,6 +155,29 @@ class Container:
                 fallback behavior for this container.
             use_resolver_context: Wrap compiled resolvers so context-manager
                 entry binds into ``resolver_context``.
+            compile_cache_dir: Opt-in directory for an on-disk cache of compiled
+                resolver code keyed by a registration graph fingerprint. Later
+                processes that compile the same graph reuse the cached code and
+                fall back to full compilation on any mismatch. Use a directory
+                only the application can write to.
+            aot_module: Module, or importable module name, generated by
+                ``python -m diwire build``. When it was built for the current
+                registrations its precompiled resolver code is used; otherwise a
+                warning is logged and the resolver is compiled as usual.
+            concurrent_async_dependencies: Await independent async dependencies of
+                a provider concurrently with ``asyncio.gather`` instead of one after
+                another. Dependencies that share a cached provider without an async
+                lock, or that would both create cleanup resources, stay sequential so
+                scope ownership and cleanup order remain deterministic.
+            concurrent_async_cleanup: On async scope exit, await cleanups whose
+                providers do not depend on each other concurrently instead of one after
+                another. A cleanup still runs before the cleanups of its dependencies,
+                and the first cleanup error is raised as with sequential teardown.
+            deferred_cleanup: Run the cleanups of non-root scopes off the scope exit:
+                async exits schedule them as event loop tasks and sync exits submit
+                them to a bounded thread pool, so the exit returns immediately. Use
+                ``drain_cleanups``/``adrain_cleanups`` to wait for them and raise
+                their errors; closing the container drains them first.
 
         Notes:
             Common presets are: auto-wiring mode (default, both recursive),
@@ -182,11 +215,19 @@ class Container:
         self._dependency_registration_validator = DependecyRegistrationValidator()
         self._providers_registrations = ProvidersRegistrations()
         self._open_generic_registry = OpenGenericRegistry()
-        self._resolvers_manager = ResolversManager()
+        self._resolvers_manager = ResolversManager(
+            compile_cache_dir=compile_cache_dir,
+            aot_module=aot_module,
+            concurrent_async_dependencies=concurrent_async_dependencies,
+            concurrent_async_cleanup=concurrent_async_cleanup,
+            deferred_cleanup=deferred_cleanup,
+        )
         self._injected_callable_inspector = InjectedCallableInspector()
 
         self._root_resolver: ResolverProtocol | None = None
+        self._generated_root_resolver: ResolverProtocol | None = None
         self._graph_revision: int = 0
+        self._frozen_values: dict[Any, Any] | None = None
         self._registration_mutation_depth: int = 0
         self._registration_mutation_snapshot: _ContainerGraphSnapshot | None = None
         self._registration_mutation_failed: bool = False
@@ -1826,7 +1867,7 @@ class Container:
         on_missing: MissingPolicy | None = None,
     ) -> None:
         effective_on_missing = self._missing_policy if on_missing is None else on_missing
-        if effective_on_missing is MissingPolicy.ERROR:
+        if effective_on_missing is MissingPolicy.ERROR or self._frozen_values is not None:
             return
         dependency_key = self._normalize_dependency_identity_key(
             self._unwrap_provider_dependency_key(dependency),
@@ -2169,6 +2210,35 @@ class Container:
                 return marker.dependency_key
         return None
 
+    def _ensure_batch_autoregistration(
+        self,
+        dependencies: Sequence[Any],
+        *,
+        resolver: ResolverProtocol,
+        on_missing: MissingPolicy,
+    ) -> bool:
+        """Autoregister the missing keys of a batch up front and report graph changes.
+
+        Registering before the batch runs means a missing key never aborts it halfway, so
+        no key is built twice. ``Provider[...]`` keys register their target like
+        ``resolve()`` does. Other marker keys never trigger autoregistration.
+        """
+        graph_revision_before = self._graph_revision
+        for dependency in dependencies:
+            provider_inner_dependency = self._extract_provider_inner_dependency_fast(dependency)
+            if provider_inner_dependency is not None:
+                self._ensure_autoregistration(provider_inner_dependency, on_missing=on_missing)
+                continue
+            if (
+                is_maybe_annotation(dependency)
+                or is_from_context_annotation(dependency)
+                or is_all_annotation(dependency)
+                or self._is_registered_in_resolver(resolver=resolver, dependency=dependency)
+            ):
+                continue
+            self._ensure_autoregistration(dependency, on_missing=on_missing)
+        return self._graph_revision != graph_revision_before
+
     def _resolve_sync_injected_arguments(
         self,
         *,
@@ -2418,7 +2488,9 @@ class Container:
     def compile(self) -> ResolverProtocol:
         """Compile and cache the root resolver for current registrations.
 
-        Compilation is lazy and invalidated by any registration mutation. In
+        Compilation is lazy and invalidated by any registration mutation. Recompiling
+        after a mutation only replans slots whose provider or dependencies changed:
+        other slots keep their compiled methods and already-created root singletons. In
         strict mode (opt-in, autoregistration disabled) with
         ``use_resolver_context=False``, hot-path entrypoints are rebound to the
         compiled resolver for lower call overhead.
@@ -2443,7 +2515,10 @@ class Container:
             root_resolver = self._resolvers_manager.build_root_resolver(
                 root_scope=self._root_scope,
                 registrations=self._providers_registrations,
+                previous_root_resolver=self._generated_root_resolver,
+                frozen_values=self._frozen_values,
             )
+            self._generated_root_resolver = root_resolver
             if self._open_generic_registry.has_specs():
                 has_async_specs = any(
                     spec.is_async for spec in self._providers_registrations.values()
@@ -2466,6 +2541,170 @@ class Container:
 
         return self._root_resolver
 
+    def freeze(self, *, gc_freeze: bool = False) -> None:
+        """Build root singletons and recompile with them folded in as constants.
+
+        Every root-scope cached provider is built eagerly, then the resolver is
+        recompiled so their slot methods return the value directly and dependents
+        receive it as a constant, without per-call cache checks. The container
+        rejects registration mutations afterwards, and resolve-time
+        autoregistration is disabled.
+
+        Args:
+            gc_freeze: Call ``gc.freeze()`` after recompiling so the long-lived object
+                graph is moved out of garbage collector generations.
+
+        Notes:
+            Root singletons that require asynchronous resolution are folded only if
+            they were already resolved; use ``afreeze`` to build them as well.
+            Calling ``freeze`` again on a frozen container is a no-op.
+
+        Examples:
+            .. code-block:: python
+
+                container.add(Settings)
+                container.add(Repository)
+                container.freeze()
+
+        """
+        if self._frozen_values is None:
+            root_resolver = self._compiled_generated_root_resolver()
+            self._apply_frozen_values(self._resolvers_manager.build_root_singletons(root_resolver))
+        if gc_freeze:
+            gc.freeze()
+
+    async def afreeze(self, *, gc_freeze: bool = False) -> None:
+        """Build root singletons asynchronously and recompile them as constants.
+
+        Same as ``freeze`` but also builds root singletons that require asynchronous
+        resolution.
+
+        Args:
+            gc_freeze: Call ``gc.freeze()`` after recompiling.
+
+        Examples:
+            .. code-block:: python
+
+                container.add_factory(create_client)
+                await container.afreeze()
+
+        """
+        if self._frozen_values is None:
+            root_resolver = self._compiled_generated_root_resolver()
+            self._apply_frozen_values(
+                await self._resolvers_manager.abuild_root_singletons(root_resolver),
+            )
+        if gc_freeze:
+            gc.freeze()
+
+    def warmup(self, *, max_workers: int | None = None) -> dict[Any, float]:
+        """Build root singletons eagerly, independent subtrees in parallel.
+
+        Walks the compiled dependency graph and builds every root-scope cached
+        provider that is still missing. Singletons whose dependencies are already
+        built run together on a bounded thread pool, layer by layer. Each provider
+        is built through its own compiled slot method, so its lock mode guards it
+        against request traffic that runs concurrently with warm-up.
+
+        Args:
+            max_workers: Maximum number of worker threads. ``None`` uses the
+                ``ThreadPoolExecutor`` default.
+
+        Returns:
+            Build duration in seconds by dependency key for every provider built.
+
+        Notes:
+            Root singletons that require asynchronous resolution are skipped; use
+            ``awarmup`` to build them as well.
+
+        Examples:
+            .. code-block:: python
+
+                timings = container.warmup(max_workers=8)
+                slowest = max(timings, key=timings.__getitem__)
+
+        """
+        return self._resolvers_manager.warm_up_root_singletons(
+            self._compiled_generated_root_resolver(),
+            max_workers=max_workers,
+        )
+
+    async def awarmup(self, *, max_workers: int | None = None) -> dict[Any, float]:
+        """Build root singletons eagerly, awaiting independent async providers together.
+
+        Same as ``warmup`` but also builds async root singletons. Within each
+        dependency layer, async providers are awaited with ``asyncio.gather`` while
+        sync providers run on the thread pool.
+
+        Args:
+            max_workers: Maximum number of worker threads for sync providers.
+                ``None`` uses the ``ThreadPoolExecutor`` default.
+
+        Returns:
+            Build duration in seconds by dependency key for every provider built.
+
+        Examples:
+            .. code-block:: python
+
+                timings = await container.awarmup()
+
+        """
+        return await self._resolvers_manager.awarm_up_root_singletons(
+            self._compiled_generated_root_resolver(),
+            max_workers=max_workers,
+        )
+
+    def drain_cleanups(self) -> None:
+        """Wait for scope cleanups deferred to the thread pool by sync scope exits.
+
+        Only has an effect for containers created with ``deferred_cleanup=True``.
+
+        Raises:
+            BaseException: The first error raised by a deferred cleanup since the
+                previous drain, when its scope exited without an exception.
+
+        Notes:
+            Cleanups deferred by async scope exits run as event loop tasks; use
+            ``adrain_cleanups`` to await them.
+
+        Examples:
+            .. code-block:: python
+
+                container = Container(deferred_cleanup=True)
+                ...
+                container.drain_cleanups()
+
+        """
+        self._resolvers_manager.drain_deferred_cleanups()
+
+    async def adrain_cleanups(self) -> None:
+        """Await all deferred scope cleanups, including ones deferred meanwhile.
+
+        Only has an effect for containers created with ``deferred_cleanup=True``.
+
+        Raises:
+            BaseException: The first error raised by a deferred cleanup since the
+                previous drain, when its scope exited without an exception.
+
+        Examples:
+            .. code-block:: python
+
+                container = Container(deferred_cleanup=True)
+                ...
+                await container.adrain_cleanups()
+
+        """
+        await self._resolvers_manager.adrain_deferred_cleanups()
+
+    def _compiled_generated_root_resolver(self) -> ResolverProtocol:
+        self.compile()
+        return cast("ResolverProtocol", self._generated_root_resolver)
+
+    def _apply_frozen_values(self, frozen_values: dict[Any, Any]) -> None:
+        self._frozen_values = frozen_values
+        self._invalidate_compilation()
+        self.compile()
+
     def _invalidate_compilation(self) -> None:
         """Discard compiled resolver state and restore original container methods.
 
@@ -2490,6 +2729,9 @@ class Container:
 
     @contextmanager
     def _registration_mutation(self) -> Generator[None, None, None]:
+        if self._frozen_values is not None:
+            msg = "Container is frozen; registrations cannot change after freeze()."
+            raise DIWireInvalidRegistrationError(msg)
         if self._registration_mutation_depth == 0:
             self._registration_mutation_snapshot = _ContainerGraphSnapshot(
                 providers_registrations=self._providers_registrations.snapshot(),
@@ -2747,6 +2989,153 @@ class Container:
             resolver = self.compile()
             return await resolver.aresolve(dependency)
 
+    def resolve_many(
+        self,
+        dependencies: Sequence[Any],
+        *,
+        on_missing: MissingPolicy | Literal["from_container"] = "from_container",
+    ) -> tuple[Any, ...]:
+        """Resolve several dependencies synchronously in one call.
+
+        The compiled resolver builds and caches one specialized function per key
+        tuple that calls the generated provider methods directly, so repeated batches
+        skip per-key entry and dispatch overhead. The memo holds a bounded number of
+        tuples, so reuse a fixed key tuple in hot paths: tuples built dynamically per
+        call keep recompiling once the memo fills up.
+
+        Args:
+            dependencies: Dependency keys to resolve, in result order.
+            on_missing: Resolve-time auto-registration policy
+                for missing concrete dependencies, or ``"from_container"`` to
+                inherit container defaults.
+
+        Returns:
+            Resolved dependency values in the order of ``dependencies``.
+
+        Raises:
+            DIWireDependencyNotRegisteredError: If a dependency is missing in
+                strict mode and no open-generic match exists.
+            DIWireScopeMismatchError: If a dependency requires a deeper scope than
+                the current resolver.
+            DIWireAsyncDependencyInSyncContextError: If a selected graph
+                requires async resolution or cleanup.
+
+        Examples:
+            .. code-block:: python
+
+                repository, settings = container.resolve_many((Repository, Settings))
+
+        """
+        resolver = self._get_context_bound_resolver_or_none()
+        if resolver is None:
+            resolver = self._root_resolver
+            if resolver is None:
+                resolver = self.compile()
+
+        resolved_on_missing = self._resolve_resolution_on_missing(
+            on_missing=on_missing,
+            method_name="resolve_many",
+        )
+
+        if resolved_on_missing is MissingPolicy.ERROR:
+            return resolver.resolve_many(dependencies)
+
+        if self._ensure_batch_autoregistration(
+            dependencies,
+            resolver=resolver,
+            on_missing=resolved_on_missing,
+        ):
+            resolver = self.compile()
+        return resolver.resolve_many(dependencies)
+
+    async def aresolve_many(
+        self,
+        dependencies: Sequence[Any],
+        *,
+        concurrent: bool = False,
+        on_missing: MissingPolicy | Literal["from_container"] = "from_container",
+    ) -> tuple[Any, ...]:
+        """Resolve several dependencies asynchronously in one call.
+
+        Args:
+            dependencies: Dependency keys to resolve, in result order.
+            concurrent: Await independent async providers together. Providers
+                sharing a cached dependency without an async lock stay sequential.
+            on_missing: Resolve-time auto-registration policy
+                for missing concrete dependencies, or ``"from_container"`` to
+                inherit container defaults.
+
+        Returns:
+            Resolved dependency values in the order of ``dependencies``.
+
+        Raises:
+            DIWireDependencyNotRegisteredError: If a dependency is missing in
+                strict mode and no open-generic match exists.
+            DIWireScopeMismatchError: If a dependency requires a deeper scope than
+                the current resolver.
+
+        Examples:
+            .. code-block:: python
+
+                client, cache = await container.aresolve_many(
+                    (Client, Cache),
+                    concurrent=True,
+                )
+
+        """
+        resolver = self._get_context_bound_resolver_or_none()
+        if resolver is None:
+            resolver = self._root_resolver
+            if resolver is None:
+                resolver = self.compile()
+
+        resolved_on_missing = self._resolve_resolution_on_missing(
+            on_missing=on_missing,
+            method_name="aresolve_many",
+        )
+
+        if resolved_on_missing is MissingPolicy.ERROR:
+            return await resolver.aresolve_many(dependencies, concurrent=concurrent)
+
+        if self._ensure_batch_autoregistration(
+            dependencies,
+            resolver=resolver,
+            on_missing=resolved_on_missing,
+        ):
+            resolver = self.compile()
+        return await resolver.aresolve_many(dependencies, concurrent=concurrent)
+
+    @overload
+    def resolver_for(self, dependency: type[T]) -> ResolutionHandle[T]: ...
+
+    @overload
+    def resolver_for(self, dependency: Any) -> ResolutionHandle[Any]: ...
+
+    def resolver_for(self, dependency: Any) -> ResolutionHandle[Any]:
+        """Return a pre-bound resolution handle for one dependency key.
+
+        The handle calls the generated provider method for ``dependency`` directly,
+        skipping ``resolve`` dispatch. It is rebound automatically after any
+        registration mutation invalidates the compiled graph.
+
+        Args:
+            dependency: Dependency key the handle resolves.
+
+        Returns:
+            Handle callable as ``handle()`` for the current (or root) resolver, or
+            ``handle(resolver)`` for an explicit scope resolver.
+
+        Examples:
+            .. code-block:: python
+
+                get_session = container.resolver_for(Session)
+
+                with container.enter_scope(Scope.REQUEST) as request_resolver:
+                    session = get_session(request_resolver)
+
+        """
+        return ResolutionHandle(container=self, dependency=dependency)
+
     def enter_scope(
         self,
         scope: BaseScope | None = None,
@@ -2805,7 +3194,15 @@ class Container:
             msg = "Container context exit called without a matching enter."
             raise RuntimeError(msg)
 
-        return self._root_resolver.__exit__(exc_type, exc_value, traceback)
+        # Deferred scope cleanups may still use root resources, so they finish first.
+        drain_error: BaseException | None = None
+        try:
+            self._resolvers_manager.drain_deferred_cleanups()
+        except BaseException as error:  # noqa: BLE001
+            drain_error = error
+        self._root_resolver.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and drain_error is not None:
+            raise drain_error
 
     def __aenter__(self) -> ResolverProtocol:
         """Asynchronously enter the resolver context."""
@@ -2827,7 +3224,15 @@ class Container:
             msg = "Container async context exit called without a matching enter."
             raise RuntimeError(msg)
 
-        return await self._root_resolver.__aexit__(exc_type, exc_value, traceback)
+        # Deferred scope cleanups may still use root resources, so they finish first.
+        drain_error: BaseException | None = None
+        try:
+            await self._resolvers_manager.adrain_deferred_cleanups()
+        except BaseException as error:  # noqa: BLE001
+            drain_error = error
+        await self._root_resolver.__aexit__(exc_type, exc_value, traceback)
+        if exc_type is None and drain_error is not None:
+            raise drain_error
 
     def close(
         self,
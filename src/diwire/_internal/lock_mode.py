@@ -23,3 +23,11 @@ class LockMode(Enum):
 
     NONE = "none"
     """Disable locking around cache reads/writes for this provider."""
+
+    OPTIMISTIC = "optimistic"
+    """Build without holding a lock and keep the first value published to the cache.
+
+    Concurrent first calls may each run the provider; the losing values are discarded,
+    so use this only for idempotent providers. Providers that need cleanup fall back to
+    the lock ``"auto"`` would pick.
+    """
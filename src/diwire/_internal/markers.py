@@ -28,7 +28,17 @@ class Component(NamedTuple):
     value: Any
 
 
-class InjectedMarker:
+class _StatelessMarker:
+    """Base for markers without fields; equal instances keep marker keys hashable by value."""
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+
+class InjectedMarker(_StatelessMarker):
     """A marker used to indicate a parameter should be injected from the DI container.
 
     Used to identify parameters that need to be removed from callable signatures
@@ -36,11 +46,11 @@ class InjectedMarker:
     """
 
 
-class FromContextMarker:
+class FromContextMarker(_StatelessMarker):
     """Marker that indicates dependency value should be taken from scope context."""
 
 
-class MaybeMarker:
+class MaybeMarker(_StatelessMarker):
     """Marker that indicates dependency is optional and may resolve to ``None``."""
 
 
@@ -476,6 +476,18 @@ class _OpenGenericResolver:  # pragma: no cover
         except DIWireDependencyNotRegisteredError:
             return None
 
+    def resolve_many(self, dependencies: Iterable[Any]) -> tuple[Any, ...]:
+        return tuple(self.resolve(dependency) for dependency in dependencies)
+
+    async def aresolve_many(
+        self,
+        dependencies: Iterable[Any],
+        *,
+        concurrent: bool = False,  # noqa: ARG002
+    ) -> tuple[Any, ...]:
+        # Open-generic matches are cached per wrapper, so keys are resolved in order.
+        return tuple([await self.aresolve(dependency) for dependency in dependencies])
+
     def enter_scope(
         self,
         scope: BaseScope | None = None,
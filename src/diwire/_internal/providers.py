@@ -3,7 +3,7 @@ from __future__ import annotations
 import inspect
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from inspect import Parameter
 from types import TracebackType
@@ -206,6 +206,21 @@ class ProvidersRegistrations:
         self._registrations_by_slot[spec.slot] = spec
         self._refresh_needs_cleanup_flags()
 
+    def renumbered(self) -> ProvidersRegistrations:
+        """Return a copy whose specs use dense slots ``1..n`` in registration order.
+
+        Slots come from a process-wide counter, so the same graph gets different slot
+        numbers depending on what was registered before it. Renumbered copies give
+        identical generated resolver code for identical graphs.
+        """
+        registrations = ProvidersRegistrations()
+        for slot, spec in enumerate(sorted(self.values(), key=lambda item: item.slot), start=1):
+            renumbered_spec = replace(spec)
+            renumbered_spec.slot = slot
+            registrations._registrations_by_type[spec.provides] = renumbered_spec
+            registrations._registrations_by_slot[slot] = renumbered_spec
+        return registrations
+
     def get_by_type(self, dep_type: UserDependency) -> ProviderSpec:
         """Get a provider specification by the type of dependency it provides.
 
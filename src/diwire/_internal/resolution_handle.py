@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from diwire._internal.resolver_context import _ResolverBoundResolver
+
+if TYPE_CHECKING:
+    from diwire._internal.container import Container
+    from diwire._internal.resolvers.protocol import ResolverProtocol
+
+T = TypeVar("T")
+
+
+class ResolutionHandle(Generic[T]):
+    """Pre-bound resolution entrypoint for one dependency key.
+
+    Created by ``Container.resolver_for``. The handle invokes the generated provider
+    method for the key directly, skipping ``resolve`` dispatch. Its binding follows
+    the container graph revision, so registration mutations rebind the handle on its
+    next call. ``handle.resolve`` and ``handle.aresolve`` are plain functions and are
+    the cheapest entrypoints for hot paths; calling the handle itself is equivalent
+    to ``handle.resolve``.
+
+    Keys without a compiled provider slot (markers, open generics and keys left to
+    autoregistration) are routed through the container or the given resolver.
+
+    Examples:
+        .. code-block:: python
+
+            get_repository = container.resolver_for(Repository)
+            repository = get_repository()
+
+            get_session = container.resolver_for(Session).resolve
+            with container.enter_scope(Scope.REQUEST) as request_resolver:
+                session = get_session(request_resolver)
+
+    """
+
+    __slots__ = ("_container", "_dependency", "aresolve", "resolve")
+
+    resolve: Callable[..., T]
+    """Resolve the dependency from ``resolver`` or, when omitted, the current resolver."""
+
+    aresolve: Callable[..., Awaitable[T]]
+    """Asynchronous variant of ``resolve`` returning an awaitable."""
+
+    def __init__(self, *, container: Container, dependency: Any) -> None:
+        self._container = container
+        self._dependency = dependency
+        self.resolve = self._build_resolve_function(method_prefix="resolve")
+        self.aresolve = self._build_resolve_function(method_prefix="aresolve")
+
+    @property
+    def dependency(self) -> Any:
+        """Return the dependency key this handle resolves."""
+        return self._dependency
+
+    def __call__(self, resolver: ResolverProtocol | None = None) -> T:
+        """Resolve the bound dependency.
+
+        Args:
+            resolver: Scope resolver to resolve from. ``None`` resolves from the
+                resolver bound in the resolver context, or the container root resolver.
+
+        """
+        return self.resolve(resolver)
+
+    def _build_resolve_function(self, *, method_prefix: str) -> Callable[..., Any]:
+        container = self._container
+        binding = _HandleBinding(
+            container=container,
+            dependency=self._dependency,
+            method_prefix=method_prefix,
+        )
+
+        def resolve_function(resolver: Any = None) -> Any:
+            if container._graph_revision != binding.graph_revision:  # noqa: SLF001
+                binding.rebind()
+            if resolver is None:
+                get_context_resolver = binding.get_context_resolver
+                if get_context_resolver is not None:
+                    resolver = get_context_resolver()
+                if resolver is None:
+                    root_method = binding.root_method
+                    if root_method is not None:
+                        return root_method()
+                    return binding.resolve_root()
+            method = binding.methods_by_class.get(type(resolver))
+            if method is not None:
+                return method(resolver)
+            return binding.resolve_scoped(resolver)
+
+        return resolve_function
+
+
+class _HandleBinding:
+    """Slot method binding of one handle entrypoint for the current graph revision."""
+
+    __slots__ = (
+        "container",
+        "dependency",
+        "get_context_resolver",
+        "graph_revision",
+        "method_name",
+        "method_prefix",
+        "methods_by_class",
+        "root_method",
+        "root_resolver",
+        "runtime",
+    )
+
+    def __init__(self, *, container: Container, dependency: Any, method_prefix: str) -> None:
+        self.container = container
+        self.dependency = dependency
+        self.method_prefix = method_prefix
+        self.graph_revision = -1
+        self.get_context_resolver: Callable[[], Any] | None = None
+        self.root_resolver: Any = None
+        self.runtime: Any = None
+        self.method_name: str | None = None
+        self.root_method: Callable[[], Any] | None = None
+        self.methods_by_class: dict[type[Any], Callable[[Any], Any]] = {}
+
+    def rebind(self) -> None:
+        container = self.container
+        revision = container._graph_revision  # noqa: SLF001
+        container.compile()
+        root_resolver = container._generated_root_resolver  # noqa: SLF001
+        runtime = getattr(type(root_resolver), "_runtime", None)
+        slot = None if runtime is None else runtime.slot_by_dependency.get(self.dependency)
+        self.root_resolver = root_resolver
+        self.runtime = runtime
+        # Marker, open-generic and autoregistered keys keep the container routing.
+        self.method_name = None if slot is None else f"{self.method_prefix}_{slot}"
+        self.get_context_resolver = (
+            container._resolver_context._get_bound_resolver_or_none  # noqa: SLF001
+            if container._use_resolver_context and self.method_name is not None  # noqa: SLF001
+            else None
+        )
+        self.root_method = None
+        self.methods_by_class = {}
+        self.graph_revision = revision
+
+    def resolve_root(self) -> Any:
+        method_name = self.method_name
+        if method_name is None:
+            return getattr(self.container, self.method_prefix)(self.dependency)
+        value = getattr(self.root_resolver, method_name)()
+        # Root-cached slots replace themselves with a constant accessor.
+        self.root_method = getattr(self.root_resolver, method_name)
+        return value
+
+    def resolve_scoped(self, resolver: Any) -> Any:
+        method = self.methods_by_class.get(type(resolver))
+        if method is not None:
+            return method(resolver)
+        method_name = self.method_name
+        if method_name is None:
+            return getattr(resolver, self.method_prefix)(self.dependency)
+        if isinstance(resolver, _ResolverBoundResolver):
+            return self.resolve_scoped(resolver._resolver)  # noqa: SLF001
+        resolver_class = type(resolver)
+        if getattr(resolver_class, "_runtime", None) is not self.runtime:
+            # Wrapping resolvers keep their own dispatch.
+            return getattr(resolver, self.method_prefix)(self.dependency)
+        value = getattr(resolver, method_name)()
+        # Fetch after the call so lazily compiled slot methods are cached in final form.
+        self.methods_by_class[resolver_class] = getattr(resolver_class, method_name)
+        return value
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from types import TracebackType
@@ -80,6 +80,17 @@ class _ResolverBoundResolver:
     async def aresolve(self, dependency: Any) -> Any:
         return await self._resolver.aresolve(dependency)
 
+    def resolve_many(self, dependencies: Sequence[Any]) -> tuple[Any, ...]:
+        return self._resolver.resolve_many(dependencies)
+
+    async def aresolve_many(
+        self,
+        dependencies: Sequence[Any],
+        *,
+        concurrent: bool = False,
+    ) -> tuple[Any, ...]:
+        return await self._resolver.aresolve_many(dependencies, concurrent=concurrent)
+
     def enter_scope(
         self,
         scope: BaseScope | None = None,
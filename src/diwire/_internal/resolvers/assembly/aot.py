@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import re
+from collections.abc import Mapping
+from types import CodeType, ModuleType
+from typing import Final
+
+logger = logging.getLogger(__name__)
+
+_AOT_FORMAT_VERSION: Final[int] = 1
+_FUNCTION_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^(?:async )?def (\w+)\(")
+
+
+def render_resolver_module(
+    *,
+    fingerprint: str,
+    source_by_digest: Mapping[str, str],
+    target: str,
+) -> str:
+    """Render an importable module holding generated resolver functions.
+
+    Every function is defined at module level with its exact rendered source, so its code
+    object carries the module file name and real line numbers, and the module bytecode is
+    cached in ``__pycache__`` like any other import. Functions are registered by source
+    digest and never called from the module itself: the compiler rebinds their code to the
+    live provider globals of the container that loads it.
+
+    Args:
+        fingerprint: Source registration graph fingerprint the module is built for.
+        source_by_digest: Rendered function sources keyed by source digest.
+        target: Container factory reference recorded in the module docstring.
+
+    """
+    lines = [
+        "# ruff: noqa",
+        "# mypy: ignore-errors",
+        "# fmt: off",
+        '"""Ahead-of-time compiled diwire resolver code.',
+        "",
+        f"Generated by ``python -m diwire build {target}``. Do not edit.",
+        '"""',
+        "",
+        f"DIWIRE_AOT_FORMAT = {_AOT_FORMAT_VERSION}",
+        f"DIWIRE_GRAPH_FINGERPRINT = {fingerprint!r}",
+        "DIWIRE_CODE_BY_DIGEST = {}",
+    ]
+    for digest, source in source_by_digest.items():
+        name = _function_name(source=source)
+        lines.extend(
+            [
+                "",
+                "",
+                source.rstrip("\n"),
+                "",
+                f"DIWIRE_CODE_BY_DIGEST[{digest!r}] = {name}.__code__",
+                f"del {name}",
+            ],
+        )
+    return "\n".join(lines) + "\n"
+
+
+def load_resolver_module(
+    module: str | ModuleType,
+    *,
+    fingerprint: str,
+) -> dict[str, CodeType] | None:
+    """Return precompiled code from an ahead-of-time module, or ``None`` when it cannot be used.
+
+    Args:
+        module: Generated module or its importable name.
+        fingerprint: Source registration graph fingerprint of the graph being compiled.
+
+    """
+    if isinstance(module, str):
+        try:
+            module = importlib.import_module(module)
+        except ImportError:
+            logger.warning(
+                "Could not import ahead-of-time resolver module %r; compiling resolvers instead.",
+                module,
+                exc_info=True,
+            )
+            return None
+
+    format_version = getattr(module, "DIWIRE_AOT_FORMAT", None)
+    code_by_digest = getattr(module, "DIWIRE_CODE_BY_DIGEST", None)
+    if format_version != _AOT_FORMAT_VERSION or not isinstance(code_by_digest, dict):
+        logger.warning(
+            "Ignoring incompatible ahead-of-time resolver module %r; compiling resolvers instead.",
+            module.__name__,
+        )
+        return None
+    if getattr(module, "DIWIRE_GRAPH_FINGERPRINT", None) != fingerprint:
+        logger.warning(
+            "Ahead-of-time resolver module %r does not match the current registrations; "
+            "compiling resolvers instead. Rebuild it with `python -m diwire build`.",
+            module.__name__,
+        )
+        return None
+    return code_by_digest
+
+
+def _function_name(*, source: str) -> str:
+    match = _FUNCTION_NAME_PATTERN.match(source)
+    if match is None:
+        msg = f"Unable to find the function name of rendered source {source[:40]!r}."
+        raise RuntimeError(msg)
+    return match.group(1)
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import marshal
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+from typing import Any, Final
+
+from diwire._internal.providers import ProviderSpec, ProvidersRegistrations
+from diwire._internal.scope import BaseScope
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION: Final[int] = 1
+_FILE_PREFIX: Final[str] = "resolver-"
+_FILE_SUFFIX: Final[str] = ".marshal"
+_PROVIDER_ATTRIBUTES: Final[tuple[str, ...]] = (
+    "instance",
+    "concrete_type",
+    "factory",
+    "generator",
+    "context_manager",
+)
+_OBJECT_ADDRESS_PATTERN: Final[re.Pattern[str]] = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+@dataclass(slots=True)
+class ResolverCodeStore:
+    """Code objects for generated resolver functions keyed by a digest of their source.
+
+    Lookups match on the exact rendered source, so precompiled code from a stale cache file
+    or ahead-of-time module can only cost a recompilation, never a wrong method.
+    """
+
+    code_by_digest: dict[str, CodeType] = field(default_factory=dict)
+    source_by_digest: dict[str, str] | None = None
+    has_new_code: bool = False
+    previous_code_by_digest: Mapping[str, CodeType] | None = None
+
+    def get(self, *, digest: str) -> CodeType | None:
+        """Return precompiled code for a source digest, if any.
+
+        Code found in ``previous_code_by_digest`` (the store of the build being replaced)
+        is copied into this store, so each store only keeps the code its own build used.
+
+        Args:
+            digest: Digest of the rendered function source from ``source_digest``.
+
+        """
+        code = self.code_by_digest.get(digest)
+        if code is None and self.previous_code_by_digest is not None:
+            code = self.previous_code_by_digest.get(digest)
+            if code is not None:
+                self.code_by_digest[digest] = code
+                self.has_new_code = True
+        return code
+
+    def add(self, *, digest: str, source: str, code: CodeType) -> None:
+        """Record freshly compiled code and, when collecting, its rendered source.
+
+        Args:
+            digest: Digest of the rendered function source from ``source_digest``.
+            source: Rendered function source the code was compiled from.
+            code: Compiled function code object.
+
+        """
+        self.code_by_digest[digest] = code
+        if self.source_by_digest is not None:
+            self.source_by_digest[digest] = source
+        self.has_new_code = True
+
+
+class ResolverCodeCache:
+    """Persist compiled resolver code objects between processes.
+
+    Files are selected by a registration graph fingerprint and map rendered function
+    source digests to marshalled code objects (see ``ResolverCodeStore``). Generated
+    code only references providers through globals, so loaded code objects are rebound to
+    the live provider objects when the compiler builds functions from them.
+
+    Marshalled code is executed on load: point the cache at a directory that only the
+    application can write to.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self._directory = Path(directory)
+
+    def path_for(self, *, fingerprint: str) -> Path:
+        """Return the cache file path used for a graph fingerprint.
+
+        Args:
+            fingerprint: Registration graph fingerprint from ``resolver_graph_fingerprint``.
+
+        """
+        return self._directory / f"{_FILE_PREFIX}{fingerprint}{_FILE_SUFFIX}"
+
+    def load(self, *, fingerprint: str) -> dict[str, CodeType]:
+        """Load cached code objects for a fingerprint, or an empty mapping on any mismatch.
+
+        Args:
+            fingerprint: Registration graph fingerprint from ``resolver_graph_fingerprint``.
+
+        """
+        path = self.path_for(fingerprint=fingerprint)
+        try:
+            payload = marshal.loads(path.read_bytes())  # noqa: S302
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError):
+            logger.warning("Ignoring unreadable resolver code cache file %s.", path)
+            return {}
+
+        code_by_digest = _code_by_digest_from_payload(payload=payload, fingerprint=fingerprint)
+        if code_by_digest is None:
+            logger.warning("Ignoring incompatible resolver code cache file %s.", path)
+            return {}
+        return code_by_digest
+
+    def store(self, *, fingerprint: str, code_by_digest: dict[str, CodeType]) -> None:
+        """Atomically write code objects for a fingerprint; I/O errors are logged, not raised.
+
+        Args:
+            fingerprint: Registration graph fingerprint from ``resolver_graph_fingerprint``.
+            code_by_digest: Compiled function code objects keyed by source digest.
+
+        """
+        path = self.path_for(fingerprint=fingerprint)
+        data = marshal.dumps((_FORMAT_VERSION, fingerprint, code_by_digest))
+        temporary_path: str | None = None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self._directory,
+                prefix=_FILE_PREFIX,
+                suffix=".tmp",
+            )
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            Path(temporary_path).replace(path)
+        except OSError:
+            logger.warning("Could not write resolver code cache file %s.", path, exc_info=True)
+            if temporary_path is not None:
+                with contextlib.suppress(OSError):
+                    Path(temporary_path).unlink()
+
+
+def source_digest(source: str) -> str:
+    """Return the lookup key of a rendered function source.
+
+    Args:
+        source: Rendered function source.
+
+    """
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def resolver_graph_fingerprint(
+    *,
+    root_scope: BaseScope,
+    registrations: ProvidersRegistrations,
+    include_cache_tag: bool = True,
+) -> str:
+    """Return a stable digest of the registration graph that shapes generated resolver code.
+
+    The digest covers dependency keys, slots, provider qualified names, lifetimes, scopes,
+    lock modes, provider dependencies and, by default, the interpreter cache tag.
+
+    Args:
+        root_scope: Root scope the resolver is compiled for.
+        registrations: Provider registrations the resolver is compiled from.
+        include_cache_tag: Include ``sys.implementation.cache_tag`` for artifacts holding
+            interpreter-specific bytecode. Source artifacts leave it out.
+
+    """
+    cache_tag = sys.implementation.cache_tag if include_cache_tag else "source"
+    digest = hashlib.sha256()
+    digest.update(f"{_FORMAT_VERSION}|{cache_tag}|{root_scope.level}\n".encode())
+    for spec in sorted(registrations.values(), key=lambda item: item.slot):
+        digest.update(_spec_fingerprint_line(spec=spec).encode())
+    return digest.hexdigest()
+
+
+def _spec_fingerprint_line(*, spec: ProviderSpec) -> str:
+    provider_attribute = next(
+        attribute for attribute in _PROVIDER_ATTRIBUTES if getattr(spec, attribute) is not None
+    )
+    provider = getattr(spec, provider_attribute)
+    provider_name = (
+        _qualified_name(type(provider))
+        if provider_attribute == "instance"
+        else _qualified_name(provider)
+    )
+    dependencies = ",".join(
+        f"{dependency.parameter.name}:{dependency.parameter.kind.name}:"
+        f"{_stable_repr(dependency.provides)}"
+        for dependency in spec.dependencies
+    )
+    lifetime = spec.lifetime.name if spec.lifetime is not None else "none"
+    lock_mode = spec.lock_mode if isinstance(spec.lock_mode, str) else spec.lock_mode.value
+    return (
+        f"{spec.slot}|{_stable_repr(spec.provides)}|{provider_attribute}|{provider_name}|"
+        f"{lifetime}|{spec.scope.level}|{lock_mode}|{spec.is_async}|"
+        f"{spec.is_any_dependency_async}|{spec.needs_cleanup}|{dependencies}\n"
+    )
+
+
+def _qualified_name(value: Any) -> str:
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is None:
+        return _stable_repr(value)
+    return f"{module}.{qualname}"
+
+
+def _stable_repr(value: Any) -> str:
+    return _OBJECT_ADDRESS_PATTERN.sub("", repr(value))
+
+
+def _code_by_digest_from_payload(
+    *,
+    payload: Any,
+    fingerprint: str,
+) -> dict[str, CodeType] | None:
+    if (
+        not isinstance(payload, tuple)
+        or len(payload) != 3  # noqa: PLR2004
+        or payload[0] != _FORMAT_VERSION
+        or payload[1] != fingerprint
+        or not isinstance(payload[2], dict)
+    ):
+        return None
+    entries: dict[Any, Any] = payload[2]
+    if not all(
+        isinstance(digest, str) and isinstance(code, CodeType) for digest, code in entries.items()
+    ):
+        return None
+    return entries
@@ -3,20 +3,27 @@ from __future__ import annotations
 # ruff: noqa: C901,FBT001,PERF203,PERF401,PLR0911,PLR0912,PLR0913,PLW0108,SLF001,TRY301
 import ast
 import asyncio
+import functools
 import inspect
 import keyword
 import logging
+import os
+import sys
 import threading
+import time
 import types
 from collections.abc import Awaitable, Callable, Mapping, Sequence
-from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
-from types import CodeType, TracebackType
-from typing import Any, Final, Literal, cast
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from types import CodeType, ModuleType, TracebackType
+from typing import Any, Final, Literal, NoReturn, cast
 
 from diwire._internal.injection import INJECT_CONTEXT_KWARG, INJECT_RESOLVER_KWARG
 from diwire._internal.lock_mode import LockMode
 from diwire._internal.markers import (
+    AllMarker,
+    build_annotated_key,
     component_base_key,
     is_all_annotation,
     is_async_provider_annotation,
@@ -30,6 +37,13 @@ from diwire._internal.markers import (
     strip_provider_annotation,
 )
 from diwire._internal.providers import ProviderDependency, ProvidersRegistrations
+from diwire._internal.resolvers.assembly.aot import load_resolver_module, render_resolver_module
+from diwire._internal.resolvers.assembly.code_cache import (
+    ResolverCodeCache,
+    ResolverCodeStore,
+    resolver_graph_fingerprint,
+    source_digest,
+)
 from diwire._internal.resolvers.assembly.planner import (
     ProviderDependencyPlan,
     ProviderWorkflowPlan,
@@ -55,6 +69,20 @@ _FALLBACK_ARGUMENT_EXPRESSION: Final[Any] = object()
 _OMIT_ARGUMENT: Final[Any] = object()
 _FILENAME: Final[str] = "<diwire-resolver>"
 _DISPATCH_CACHE_WORKFLOW_THRESHOLD: Final[int] = 4
+_DISPATCH_CACHE_SIZE: Final[int] = 4
+# Flat ``(dependency, method, ...)`` pairs, swapped as one tuple so readers never see a torn entry.
+_EMPTY_DISPATCH_CACHE: Final[tuple[Any, ...]] = (_MISSING_DEP_SLOT, None) * _DISPATCH_CACHE_SIZE
+_HASHED_DISPATCH_WORKFLOW_THRESHOLD: Final[int] = 32
+_LAZY_SLOT_METHODS_WORKFLOW_THRESHOLD: Final[int] = 512
+_TRANSIENT_INLINE_MAX_DEPTH: Final[int] = 8
+_TRANSIENT_INLINE_MAX_NODES: Final[int] = 32
+_CLEANUP_KIND_SYNC_GENERATOR: Final[int] = 2
+_CLEANUP_KIND_ASYNC_GENERATOR: Final[int] = 3
+_DEFERRED_CLEANUP_MAX_WORKERS: Final[int] = 4
+_SCOPE_RESOLVER_POOL_SIZE: Final[int] = 32
+_SCOPE_CACHE_LOCK_STRIPES: Final[int] = 16
+# Batch methods are memoized per key tuple; the memo is reset once it holds this many.
+_BATCH_METHOD_CACHE_SIZE: Final[int] = 256
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,6 +92,20 @@ class _ArgumentPart:
     name: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _AllCollection:
+    """Members of one ``All[key]`` collection and how many leading members are folded.
+
+    The first ``folded_prefix_length`` members are root-scope cached, so their values are
+    collected once into a tuple stored on the root resolver and shared by later resolutions.
+    """
+
+    index: int
+    key: Any
+    slots: tuple[int, ...]
+    folded_prefix_length: int
+
+
 @dataclass(slots=True)
 class _ResolverRuntime:
     plan: ResolverGenerationPlan
@@ -89,21 +131,517 @@ class _ResolverRuntime:
     next_scope_options_by_level: dict[
         int, tuple[ScopePlan | None, ScopePlan | None, tuple[ScopePlan, ...]]
     ]
+    inlinable_transient_slots: frozenset[int] = frozenset()
+    slot_by_dependency: dict[Any, int] = field(default_factory=dict)
+    frozen_values_by_slot: dict[int, Any] = field(default_factory=dict)
+    concurrent_dependency_indexes_by_slot: dict[int, frozenset[int]] = field(
+        default_factory=dict,
+    )
+    cleanup_dependency_slots_by_slot: dict[int, frozenset[int]] | None = None
+    thread_lock_stripes_by_slot: dict[int, tuple[threading.Lock, ...]] = field(
+        default_factory=dict,
+    )
+    async_lock_stripes_by_slot: dict[int, tuple[asyncio.Lock, ...]] = field(
+        default_factory=dict,
+    )
+    deferred_cleanups: _DeferredCleanups | None = None
+    all_collections: tuple[_AllCollection, ...] = ()
+    all_collection_by_slots: dict[tuple[int, ...], _AllCollection] = field(default_factory=dict)
+    sync_marker_handlers: dict[Any, Callable[[Any], Any]] = field(default_factory=dict)
+    async_marker_handlers: dict[Any, Callable[[Any], Awaitable[Any]]] = field(
+        default_factory=dict,
+    )
+    sync_batch_methods: dict[tuple[Any, ...], Callable[..., Any]] = field(default_factory=dict)
+    async_batch_methods: dict[tuple[bool, tuple[Any, ...]], Callable[..., Any]] = field(
+        default_factory=dict,
+    )
+    code_store: ResolverCodeStore | None = None
+    generated_globals: dict[str, Any] | None = None
+
+
+class _DeferredCleanups:
+    """Cleanup callbacks handed off by scope exits, run off the caller's critical path.
+
+    Sync scope exits submit their callbacks to a bounded thread pool and async scope exits
+    schedule them as event loop tasks. Each submission runs its callbacks in the same order
+    as an immediate exit, and only after the submissions of the deeper scopes that exited
+    before it, so a parent resource is never torn down under a child that depends on it.
+    Errors are kept with the precedence of ``_resolver_exit`` and the first one is raised
+    by the next drain.
+    """
+
+    __slots__ = (
+        "_children_by_parent",
+        "_errors",
+        "_executor",
+        "_lock",
+        "_max_workers",
+        "_pending",
+    )
+
+    def __init__(self, *, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending: set[Future[Any] | asyncio.Future[Any]] = set()
+        self._errors: list[BaseException] = []
+        # Submissions of exited scopes, keyed by the ``id`` of the nearest open ancestor.
+        self._children_by_parent: dict[int, list[Future[Any] | asyncio.Future[Any]]] = {}
+
+    def submit_sync(
+        self,
+        cleanup_callbacks: list[tuple[int, Any]],
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+        *,
+        after: Sequence[Future[Any] | asyncio.Future[Any]] = (),
+    ) -> Future[Any]:
+        # Task completions are bridged here because asyncio callbacks are not thread-safe.
+        after_futures = [_concurrent_future(pending) for pending in after]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="diwire-cleanup",
+                )
+            # Children are always queued ahead of their parent, so waiting never starves
+            # the pool.
+            future = self._executor.submit(
+                _run_deferred_cleanup_callbacks_sync,
+                cleanup_callbacks,
+                exc_type,
+                exc_value,
+                traceback,
+                after=after_futures,
+            )
+            self._pending.add(future)
+        future.add_done_callback(self._finish)
+        return future
+
+    def submit_async(
+        self,
+        cleanup: Awaitable[BaseException | None],
+        *,
+        after: Sequence[Future[Any] | asyncio.Future[Any]] = (),
+    ) -> asyncio.Future[Any]:
+        task = asyncio.ensure_future(_await_deferred_cleanup(cleanup, after=after))
+        with self._lock:
+            self._pending.add(task)
+        task.add_done_callback(self._finish)
+        return task
+
+    def take_children(self, resolver: Any) -> list[Future[Any] | asyncio.Future[Any]]:
+        with self._lock:
+            return self._children_by_parent.pop(id(resolver), [])
+
+    def add_children(
+        self,
+        parent: Any,
+        children: Sequence[Future[Any] | asyncio.Future[Any]],
+    ) -> None:
+        if parent is None or not children:
+            return
+        with self._lock:
+            pending_children = [
+                child for child in self._children_by_parent.get(id(parent), ()) if not child.done()
+            ]
+            pending_children.extend(children)
+            self._children_by_parent[id(parent)] = pending_children
+
+    def drain(self) -> None:
+        while True:
+            with self._lock:
+                futures = [pending for pending in self._pending if isinstance(pending, Future)]
+            if not futures:
+                break
+            wait(futures)
+        self._raise_first_error()
+
+    async def adrain(self) -> None:
+        while True:
+            with self._lock:
+                pending = [
+                    asyncio.wrap_future(pending) if isinstance(pending, Future) else pending
+                    for pending in self._pending
+                ]
+            if not pending:
+                break
+            # ``asyncio.wait`` leaves pending cleanups running if the drain is cancelled.
+            await asyncio.wait(pending)
+        self._raise_first_error()
+
+    def _finish(self, done: Future[Any] | asyncio.Future[Any]) -> None:
+        error = None if done.cancelled() else done.result()
+        with self._lock:
+            self._pending.discard(done)
+            if error is not None:
+                self._errors.append(error)
+
+    def _raise_first_error(self) -> None:
+        with self._lock:
+            errors = self._errors
+            self._errors = []
+        if errors:
+            raise errors[0]
 
 
 class ResolversAssemblyCompiler:
     """Compile runtime resolvers with ``type()`` and AST-compiled methods."""
 
+    def __init__(
+        self,
+        *,
+        share_slot_methods: bool = True,
+        inline_transient_max_depth: int = _TRANSIENT_INLINE_MAX_DEPTH,
+        inline_transient_max_nodes: int = _TRANSIENT_INLINE_MAX_NODES,
+        code_cache_dir: str | os.PathLike[str] | None = None,
+        aot_module: str | ModuleType | None = None,
+        lazy_slot_methods: bool | None = None,
+        concurrent_async_dependencies: bool = False,
+        concurrent_async_cleanup: bool = False,
+        deferred_cleanup: bool = False,
+    ) -> None:
+        """Configure how generated slot methods are compiled.
+
+        Args:
+            share_slot_methods: Compile slot methods whose rendered body does not depend on
+                the owning scope class once per graph and reuse the function object across
+                scope resolver classes. Disable to compile every method per class.
+            inline_transient_max_depth: Maximum nesting depth of a transient dependency
+                subtree fused into a single generated constructor expression.
+            inline_transient_max_nodes: Maximum number of provider calls in a fused transient
+                subtree. Subtrees over either budget are resolved through their own slot
+                method, which fuses its own dependencies. ``0`` disables fusion.
+            code_cache_dir: Directory of an opt-in on-disk cache of compiled code objects
+                keyed by registration graph fingerprint. Cached code is reused on later
+                builds of the same graph and any mismatch falls back to compilation.
+            aot_module: Module (or importable module name) generated by
+                ``python -m diwire build``. Its code is used when the module was built for
+                the same registration graph; on drift the resolver is compiled as usual.
+            lazy_slot_methods: Install a stub for every ``resolve_N``/``aresolve_N`` method
+                that renders and compiles the real method on its first call, so build cost
+                follows the slots a process actually resolves. ``None`` enables it for graphs
+                with at least 512 providers.
+            concurrent_async_dependencies: Await sibling async dependencies of a provider
+                together with ``asyncio.gather`` when they share no cached dependency
+                without an async lock and at most one of them creates cleanup resources.
+            concurrent_async_cleanup: Record the provider slot of every cleanup callback and
+                await cleanups whose providers do not depend on each other together on
+                async scope exit. Dependent cleanups still run before their dependencies.
+            deferred_cleanup: Hand the cleanup callbacks of non-root scopes to a background
+                task (async exit) or a bounded thread pool (sync exit) instead of running
+                them before the scope exit returns. Pending cleanups are awaited and their
+                errors raised by ``drain_deferred_cleanups``/``adrain_deferred_cleanups``.
+
+        """
+        self._share_slot_methods = share_slot_methods
+        self._inline_transient_max_depth = inline_transient_max_depth
+        self._inline_transient_max_nodes = inline_transient_max_nodes
+        self._code_cache = ResolverCodeCache(code_cache_dir) if code_cache_dir is not None else None
+        self._aot_module = aot_module
+        self._lazy_slot_methods = lazy_slot_methods
+        self._concurrent_async_dependencies = concurrent_async_dependencies
+        self._concurrent_async_cleanup = concurrent_async_cleanup
+        self._deferred_cleanups = (
+            _DeferredCleanups(max_workers=_DEFERRED_CLEANUP_MAX_WORKERS)
+            if deferred_cleanup
+            else None
+        )
+
     def build_root_resolver(
         self,
         *,
         root_scope: BaseScope,
         registrations: ProvidersRegistrations,
         cleanup_enabled: bool = True,
+        previous_root_resolver: ResolverProtocol | None = None,
+        frozen_values: Mapping[Any, Any] | None = None,
     ) -> ResolverProtocol:
+        """Build a root resolver, reusing what an earlier build of the same container left.
+
+        Args:
+            root_scope: Root scope used to initialize the resolver.
+            registrations: Provider registrations used to build resolver classes.
+            cleanup_enabled: Whether cleanup-enabled providers register cleanup callbacks.
+            previous_root_resolver: Root resolver this build replaces after a registration
+                mutation. Workflows, compiled slot methods and root singleton caches of
+                slots whose provider and dependency closure are unchanged are carried over,
+                together with pending cleanup callbacks while that resolver is still open.
+            frozen_values: Already-built root singletons by dependency key. Their slot
+                methods return the value directly and dependents reference it as a
+                constant instead of checking the root cache.
+
+        """
+        if self._aot_module is not None or self._code_cache is not None:
+            registrations = registrations.renumbered()
+        previous_runtime: _ResolverRuntime | None = (
+            type(previous_root_resolver)._runtime  # type: ignore[attr-defined]
+            if previous_root_resolver is not None
+            else None
+        )
+        loaded_code_store, cache_fingerprint = self._load_code_store(
+            root_scope=root_scope,
+            registrations=registrations,
+        )
+        code_store = loaded_code_store or ResolverCodeStore()
+        if previous_runtime is not None and previous_runtime.code_store is not None:
+            code_store.previous_code_by_digest = previous_runtime.code_store.code_by_digest
+        runtime = self._assemble_runtime(
+            root_scope=root_scope,
+            registrations=registrations,
+            code_store=code_store,
+            allow_lazy_slot_methods=True,
+            previous_runtime=previous_runtime,
+            frozen_values=frozen_values,
+        )
+        if (
+            self._code_cache is not None
+            and cache_fingerprint is not None
+            and code_store.has_new_code
+        ):
+            self._code_cache.store(
+                fingerprint=cache_fingerprint,
+                code_by_digest=code_store.code_by_digest,
+            )
+
+        root_class = runtime.class_by_level[runtime.root_scope_level]
+        if runtime.has_cleanup:
+            root_resolver = root_class(cleanup_enabled, None, None)
+        else:
+            root_resolver = root_class(None, None)
+        if previous_runtime is not None and previous_root_resolver is not None:
+            _adopt_previous_root_state(
+                runtime=runtime,
+                root_resolver=root_resolver,
+                previous_runtime=previous_runtime,
+                previous_root_resolver=previous_root_resolver,
+            )
+        return cast("ResolverProtocol", root_resolver)
+
+    def build_root_singletons(self, root_resolver: ResolverProtocol) -> dict[Any, Any]:
+        """Build root-scope cached providers synchronously and return their values.
+
+        Providers that require asynchronous resolution are skipped unless they were
+        already resolved.
+
+        Args:
+            root_resolver: Root resolver returned by ``build_root_resolver``.
+
+        Returns:
+            Built root singletons by dependency key.
+
+        """
+        runtime: _ResolverRuntime = type(root_resolver)._runtime  # type: ignore[attr-defined]
+        for slot in _root_singleton_slots(runtime=runtime):
+            if (
+                getattr(root_resolver, f"_cache_{slot}") is _MISSING_CACHE
+                and not runtime.workflows_by_slot[slot].requires_async
+            ):
+                getattr(root_resolver, f"resolve_{slot}")()
+        return _built_root_singletons(runtime=runtime, root_resolver=root_resolver)
+
+    async def abuild_root_singletons(self, root_resolver: ResolverProtocol) -> dict[Any, Any]:
+        """Build root-scope cached providers asynchronously and return their values.
+
+        Args:
+            root_resolver: Root resolver returned by ``build_root_resolver``.
+
+        Returns:
+            Built root singletons by dependency key.
+
+        """
+        runtime: _ResolverRuntime = type(root_resolver)._runtime  # type: ignore[attr-defined]
+        for slot in _root_singleton_slots(runtime=runtime):
+            if getattr(root_resolver, f"_cache_{slot}") is _MISSING_CACHE:
+                await getattr(root_resolver, f"aresolve_{slot}")()
+        return _built_root_singletons(runtime=runtime, root_resolver=root_resolver)
+
+    def warm_up_root_singletons(
+        self,
+        root_resolver: ResolverProtocol,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Any, float]:
+        """Build missing sync root singletons, independent subtrees concurrently.
+
+        Root singletons are grouped into layers by dependency depth, and each layer
+        is built on a bounded thread pool once the layers below it are cached. Every
+        slot goes through its own ``resolve_N`` method, so locking follows its lock
+        mode. Providers that require asynchronous resolution are skipped.
+
+        Args:
+            root_resolver: Root resolver returned by ``build_root_resolver``.
+            max_workers: Thread pool size. ``None`` uses the executor default.
+
+        Returns:
+            Build duration in seconds by dependency key for every provider built.
+
+        """
+        runtime: _ResolverRuntime = type(root_resolver)._runtime  # type: ignore[attr-defined]
+        timings: dict[Any, float] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="diwire-warmup",
+        ) as executor:
+            for layer in _root_singleton_layers(runtime=runtime):
+                pending = [
+                    slot
+                    for slot in layer
+                    if _needs_warm_up(runtime=runtime, root_resolver=root_resolver, slot=slot)
+                    and not _warms_up_on_event_loop(runtime.workflows_by_slot[slot])
+                ]
+                durations = executor.map(
+                    functools.partial(_timed_sync_build, root_resolver),
+                    pending,
+                )
+                for slot, duration in zip(pending, durations, strict=True):
+                    timings[runtime.dep_type_by_slot[slot]] = duration
+        return timings
+
+    async def awarm_up_root_singletons(
+        self,
+        root_resolver: ResolverProtocol,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Any, float]:
+        """Build all missing root singletons, independent subtrees concurrently.
+
+        Layers are built in dependency order. Within a layer, async providers are
+        awaited together with ``asyncio.gather`` and sync providers run on a bounded
+        thread pool.
+
+        Args:
+            root_resolver: Root resolver returned by ``build_root_resolver``.
+            max_workers: Thread pool size for sync providers. ``None`` uses the
+                executor default.
+
+        Returns:
+            Build duration in seconds by dependency key for every provider built.
+
+        """
+        runtime: _ResolverRuntime = type(root_resolver)._runtime  # type: ignore[attr-defined]
+        loop = asyncio.get_running_loop()
+        timings: dict[Any, float] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="diwire-warmup",
+        ) as executor:
+            for layer in _root_singleton_layers(runtime=runtime):
+                pending = [
+                    slot
+                    for slot in layer
+                    if _needs_warm_up(runtime=runtime, root_resolver=root_resolver, slot=slot)
+                ]
+                durations = await asyncio.gather(
+                    *(
+                        _timed_async_build(root_resolver, slot)
+                        if _warms_up_on_event_loop(runtime.workflows_by_slot[slot])
+                        else loop.run_in_executor(
+                            executor,
+                            _timed_sync_build,
+                            root_resolver,
+                            slot,
+                        )
+                        for slot in pending
+                    ),
+                )
+                for slot, duration in zip(pending, durations, strict=True):
+                    timings[runtime.dep_type_by_slot[slot]] = duration
+        return timings
+
+    def drain_deferred_cleanups(self) -> None:
+        """Wait for deferred cleanups running on the thread pool and raise their first error.
+
+        Cleanups deferred by async scope exits run as event loop tasks and are only
+        awaited by ``adrain_deferred_cleanups``.
+        """
+        if self._deferred_cleanups is not None:
+            self._deferred_cleanups.drain()
+
+    async def adrain_deferred_cleanups(self) -> None:
+        """Await every deferred cleanup and raise the first cleanup error.
+
+        Cleanups deferred while draining are awaited as well.
+        """
+        if self._deferred_cleanups is not None:
+            await self._deferred_cleanups.adrain()
+
+    def render_aot_module(
+        self,
+        *,
+        root_scope: BaseScope,
+        registrations: ProvidersRegistrations,
+        target: str,
+    ) -> str:
+        """Render the ahead-of-time resolver module source for a registration graph.
+
+        Args:
+            root_scope: Root scope used to initialize the resolver.
+            registrations: Provider registrations used to render resolver code.
+            target: Container factory reference recorded in the module docstring.
+
+        """
+        registrations = registrations.renumbered()
+        source_by_digest: dict[str, str] = {}
+        self._assemble_runtime(
+            root_scope=root_scope,
+            registrations=registrations,
+            code_store=ResolverCodeStore(source_by_digest=source_by_digest),
+            allow_lazy_slot_methods=False,
+        )
+        return render_resolver_module(
+            fingerprint=resolver_graph_fingerprint(
+                root_scope=root_scope,
+                registrations=registrations,
+                include_cache_tag=False,
+            ),
+            source_by_digest=source_by_digest,
+            target=target,
+        )
+
+    def _load_code_store(
+        self,
+        *,
+        root_scope: BaseScope,
+        registrations: ProvidersRegistrations,
+    ) -> tuple[ResolverCodeStore | None, str | None]:
+        if self._aot_module is not None:
+            code_by_digest = load_resolver_module(
+                self._aot_module,
+                fingerprint=resolver_graph_fingerprint(
+                    root_scope=root_scope,
+                    registrations=registrations,
+                    include_cache_tag=False,
+                ),
+            )
+            if code_by_digest is not None:
+                return ResolverCodeStore(code_by_digest=code_by_digest), None
+        if self._code_cache is None:
+            return None, None
+        fingerprint = resolver_graph_fingerprint(
+            root_scope=root_scope,
+            registrations=registrations,
+        )
+        code_store = ResolverCodeStore(
+            code_by_digest=self._code_cache.load(fingerprint=fingerprint)
+        )
+        return code_store, fingerprint
+
+    def _assemble_runtime(
+        self,
+        *,
+        root_scope: BaseScope,
+        registrations: ProvidersRegistrations,
+        code_store: ResolverCodeStore | None,
+        allow_lazy_slot_methods: bool,
+        previous_runtime: _ResolverRuntime | None = None,
+        frozen_values: Mapping[Any, Any] | None = None,
+    ) -> _ResolverRuntime:
         plan = ResolverGenerationPlanner(
             root_scope=root_scope,
             registrations=registrations,
+            previous_plan=previous_runtime.plan if previous_runtime is not None else None,
         ).build()
         self._log_plan_strategy(plan=plan)
 
@@ -112,29 +650,51 @@ class ResolversAssemblyCompiler:
             registrations=registrations,
             root_scope=root_scope,
         )
+        if self._concurrent_async_dependencies:
+            runtime.concurrent_dependency_indexes_by_slot = _concurrent_dependency_indexes_by_slot(
+                runtime=runtime,
+            )
+        if self._concurrent_async_cleanup and runtime.has_cleanup:
+            runtime.cleanup_dependency_slots_by_slot = _cleanup_dependency_slots_by_slot(
+                runtime=runtime,
+            )
+        if runtime.has_cleanup:
+            runtime.deferred_cleanups = self._deferred_cleanups
+        if frozen_values:
+            runtime.frozen_values_by_slot = _frozen_values_by_slot(
+                runtime=runtime,
+                frozen_values=frozen_values,
+            )
+        runtime.code_store = code_store
         generated_globals = self._build_generated_globals(runtime=runtime)
+        runtime.generated_globals = generated_globals
 
-        classes_by_level = self._build_classes(runtime=runtime, generated_globals=generated_globals)
+        lazy_slot_methods = allow_lazy_slot_methods and (
+            self._lazy_slot_methods
+            if self._lazy_slot_methods is not None
+            else len(plan.workflows) >= _LAZY_SLOT_METHODS_WORKFLOW_THRESHOLD
+        )
+        classes_by_level = self._build_classes(
+            runtime=runtime,
+            generated_globals=generated_globals,
+            lazy_slot_methods=lazy_slot_methods,
+            previous_runtime=previous_runtime,
+        )
         runtime.class_by_level = classes_by_level
 
         for scope in runtime.ordered_scopes:
             resolver_class = runtime.class_by_level[scope.scope_level]
             resolver_class._runtime = runtime  # type: ignore[attr-defined]
             resolver_class._class_plan = scope  # type: ignore[attr-defined]
-
-        root_class = runtime.class_by_level[runtime.root_scope_level]
-        if runtime.has_cleanup:
-            root_resolver = root_class(cleanup_enabled, None, None)
-        else:
-            root_resolver = root_class(None, None)
-        return cast("ResolverProtocol", root_resolver)
+        return runtime
 
     def _log_plan_strategy(self, *, plan: ResolverGenerationPlan) -> None:
         effective_mode_counts = dict(plan.effective_mode_counts)
         logger.info(
             (
                 "Resolver assembly strategy: graph_has_async_specs=%s provider_count=%d "
-                "cached_provider_count=%d mode_counts={thread:%d,async:%d,none:%d} "
+                "cached_provider_count=%d "
+                "mode_counts={thread:%d,async:%d,none:%d,optimistic:%d} "
                 "thread_lock_count=%d async_lock_count=%d"
             ),
             plan.has_async_specs,
@@ -143,6 +703,7 @@ class ResolversAssemblyCompiler:
             effective_mode_counts.get(LockMode.THREAD, 0),
             effective_mode_counts.get(LockMode.ASYNC, 0),
             effective_mode_counts.get(LockMode.NONE, 0),
+            effective_mode_counts.get(LockMode.OPTIMISTIC, 0),
             plan.thread_lock_count,
             plan.async_lock_count,
         )
@@ -160,9 +721,9 @@ class ResolversAssemblyCompiler:
         workflows_by_slot = {workflow.slot: workflow for workflow in plan.workflows}
 
         dep_registered_keys: set[Any] = set()
-        all_slots_by_key_mut: dict[Any, list[int]] = {}
         dep_eq_slot_by_key: dict[Any, int] = {}
         dep_type_by_slot: dict[int, Any] = {}
+        slot_by_dependency: dict[Any, int] = {}
         provider_by_slot: dict[int, Any] = {}
         context_key_by_name: dict[str, Any] = {}
 
@@ -170,15 +731,10 @@ class ResolversAssemblyCompiler:
             registration = registrations.get_by_slot(workflow.slot)
             dep_type = registration.provides
             dep_type_by_slot[workflow.slot] = dep_type
+            slot_by_dependency.setdefault(dep_type, workflow.slot)
             provider_by_slot[workflow.slot] = getattr(registration, workflow.provider_attribute)
             dep_registered_keys.add(dep_type)
 
-            normalized_dep_type = strip_non_component_annotation(dep_type)
-            base_key = component_base_key(normalized_dep_type)
-            if base_key is None:
-                base_key = normalized_dep_type
-            all_slots_by_key_mut.setdefault(base_key, []).append(workflow.slot)
-
             if workflow.dispatch_kind == "equality_map":
                 dep_eq_slot_by_key[dep_type] = workflow.slot
 
@@ -196,16 +752,23 @@ class ResolversAssemblyCompiler:
                     ),
                 )
 
-        all_slots_by_key = {key: tuple(slots) for key, slots in all_slots_by_key_mut.items()}
+        all_slots_by_key, component_base_keys = _all_slots_by_base_key(
+            plan=plan,
+            dep_type_by_slot=dep_type_by_slot,
+        )
+        all_collections = _all_collections(
+            plan=plan,
+            workflows_by_slot=workflows_by_slot,
+            all_slots_by_key=all_slots_by_key,
+            component_base_keys=component_base_keys,
+        )
 
-        thread_lock_by_slot = {
-            workflow.slot: threading.Lock()
-            for workflow in plan.workflows
-            if workflow.uses_thread_lock
-        }
-        async_lock_by_slot = {
-            workflow.slot: asyncio.Lock() for workflow in plan.workflows if workflow.uses_async_lock
-        }
+        (
+            thread_lock_by_slot,
+            thread_lock_stripes_by_slot,
+            async_lock_by_slot,
+            async_lock_stripes_by_slot,
+        ) = _cache_locks_by_slot(plan=plan)
 
         cache_slots_by_owner_level_mut: dict[int, list[int]] = {}
         for workflow in plan.workflows:
@@ -266,12 +829,24 @@ class ResolversAssemblyCompiler:
             all_slots_by_key=all_slots_by_key,
             dep_eq_slot_by_key=dep_eq_slot_by_key,
             dep_type_by_slot=dep_type_by_slot,
+            slot_by_dependency=slot_by_dependency,
             provider_by_slot=provider_by_slot,
             context_key_by_name=context_key_by_name,
             thread_lock_by_slot=thread_lock_by_slot,
             async_lock_by_slot=async_lock_by_slot,
+            thread_lock_stripes_by_slot=thread_lock_stripes_by_slot,
+            async_lock_stripes_by_slot=async_lock_stripes_by_slot,
             cache_slots_by_owner_level=cache_slots_by_owner_level,
             next_scope_options_by_level=next_scope_options_by_level,
+            inlinable_transient_slots=_inlinable_transient_slots(
+                workflows_by_slot=workflows_by_slot,
+                max_depth=self._inline_transient_max_depth,
+                max_nodes=self._inline_transient_max_nodes,
+            ),
+            all_collections=all_collections,
+            all_collection_by_slots={
+                collection.slots: collection for collection in all_collections
+            },
         )
 
     def _build_generated_globals(self, *, runtime: _ResolverRuntime) -> dict[str, Any]:
@@ -280,19 +855,33 @@ class ResolversAssemblyCompiler:
             "inspect": inspect,
             "_MISSING_RESOLVER": _MISSING_RESOLVER,
             "_MISSING_CACHE": _MISSING_CACHE,
+            "_getrefcount": _getrefcount,
+            "_POOLED_SCOPE_RESOLVER_FREE_REFCOUNT": _POOLED_SCOPE_RESOLVER_FREE_REFCOUNT,
             "_MISSING_DEP_SLOT": _MISSING_DEP_SLOT,
+            "_EMPTY_DISPATCH_CACHE": _EMPTY_DISPATCH_CACHE,
             "_resolver_init": _resolver_init,
             "_resolver_enter_scope": _resolver_enter_scope,
             "_resolver_resolve_from_context": _resolver_resolve_from_context,
             "_resolver_is_registered_dependency": _resolver_is_registered_dependency,
             "_resolver_exit": _resolver_exit,
             "_resolver_aexit": _resolver_aexit,
+            "_resolver_exit_deferred": _resolver_exit_deferred,
+            "_resolver_aexit_deferred": _resolver_aexit_deferred,
             "_resolve_dispatch_fallback_sync": _resolve_dispatch_fallback_sync,
             "_resolve_dispatch_fallback_async": _resolve_dispatch_fallback_async,
+            "_resolve_marker_dispatch_miss_sync": _resolve_marker_dispatch_miss_sync,
+            "_resolve_marker_dispatch_miss_async": _resolve_marker_dispatch_miss_async,
+            "_sync_marker_dispatch_table": runtime.sync_marker_handlers,
+            "_async_marker_dispatch_table": runtime.async_marker_handlers,
+            "_sync_batch_methods": runtime.sync_batch_methods,
+            "_async_batch_methods": runtime.async_batch_methods,
+            "_compile_batch_method": _compile_batch_method,
+            "_gather": asyncio.gather,
             "_dep_eq_slot_by_key": runtime.dep_eq_slot_by_key,
             "DIWireAsyncDependencyInSyncContextError": DIWireAsyncDependencyInSyncContextError,
             "DIWireDependencyNotRegisteredError": DIWireDependencyNotRegisteredError,
             "DIWireScopeMismatchError": DIWireScopeMismatchError,
+            "_raise_scope_mismatch_for_slot": _raise_scope_mismatch_for_slot,
             "is_async_provider_annotation": is_async_provider_annotation,
             "is_all_annotation": is_all_annotation,
             "is_from_context_annotation": is_from_context_annotation,
@@ -320,6 +909,18 @@ class ResolversAssemblyCompiler:
                 workflow=workflow,
             )
 
+        generated_globals.update(
+            {f"_frozen_{slot}": value for slot, value in runtime.frozen_values_by_slot.items()},
+        )
+        generated_globals.update(
+            {f"_lock_{slot}": lock for slot, lock in runtime.thread_lock_by_slot.items()},
+        )
+        generated_globals.update(
+            {
+                f"_locks_{slot}": locks
+                for slot, locks in runtime.thread_lock_stripes_by_slot.items()
+            },
+        )
         generated_globals.update(
             {f"_scope_obj_{level}": scope for level, scope in runtime.scope_obj_by_level.items()},
         )
@@ -332,8 +933,35 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         generated_globals: dict[str, Any],
+        lazy_slot_methods: bool = False,
+        previous_runtime: _ResolverRuntime | None = None,
     ) -> dict[int, type[Any]]:
         classes_by_level: dict[int, type[Any]] = {}
+        # Workflows the planner carried over unchanged render to the same slot methods, so
+        # their compiled functions are rebound to this build's globals instead of rendered.
+        # Frozen builds fold root singletons into dependents, which changes their bodies.
+        reused_workflows = (
+            tuple(
+                workflow
+                for workflow in runtime.plan.workflows
+                if previous_runtime.workflows_by_slot.get(workflow.slot) is workflow
+            )
+            if previous_runtime is not None and not runtime.frozen_values_by_slot
+            else ()
+        )
+        rebound_methods: dict[CodeType, Callable[..., Any]] = {}
+        shared_slot_methods: dict[tuple[str, ...], Callable[..., Any]] | None = (
+            {} if self._share_slot_methods else None
+        )
+        lazy_methods = (
+            self._lazy_slot_methods_by_name(
+                runtime=runtime,
+                generated_globals=generated_globals,
+                shared_slot_methods=shared_slot_methods,
+            )
+            if lazy_slot_methods
+            else None
+        )
 
         for scope in runtime.ordered_scopes:
             attrs: dict[str, Any] = {
@@ -365,50 +993,63 @@ class ResolversAssemblyCompiler:
                 generated_globals=generated_globals,
                 is_async=True,
             )
+            attrs["resolve_many"] = self._compile_simple_method(
+                runtime=runtime,
+                name="resolve_many",
+                arg_names=("self", "dependencies"),
+                body_lines=[
+                    "if type(dependencies) is not tuple:",
+                    "    dependencies = tuple(dependencies)",
+                    "batch = _sync_batch_methods.get(dependencies)",
+                    "if batch is None:",
+                    "    batch = _compile_batch_method(self, dependencies, False, False)",
+                    "return batch(self, dependencies)",
+                ],
+                generated_globals=generated_globals,
+            )
+            attrs["aresolve_many"] = _compile_function_from_source(
+                name="aresolve_many",
+                arg_names=("self", "dependencies"),
+                kwonly_arg_names=("concurrent",),
+                kwonly_defaults={"concurrent": False},
+                body_lines=[
+                    "if type(dependencies) is not tuple:",
+                    "    dependencies = tuple(dependencies)",
+                    "batch = _async_batch_methods.get((concurrent, dependencies))",
+                    "if batch is None:",
+                    "    batch = _compile_batch_method(self, dependencies, True, concurrent)",
+                    "return await batch(self, dependencies)",
+                ],
+                generated_globals=generated_globals,
+                code_store=runtime.code_store,
+                is_async=True,
+            )
             attrs["_resolve_from_context"] = self._compile_simple_method(
+                runtime=runtime,
                 name="_resolve_from_context",
                 arg_names=("self", "key"),
-                body=[
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id="_resolver_resolve_from_context", ctx=ast.Load()),
-                            args=[
-                                ast.Name(id="self", ctx=ast.Load()),
-                                ast.Name(id="key", ctx=ast.Load()),
-                            ],
-                            keywords=[],
-                        ),
-                    ),
-                ],
+                body_lines=["return _resolver_resolve_from_context(self, key)"],
                 generated_globals=generated_globals,
             )
             attrs["_is_registered_dependency"] = self._compile_simple_method(
+                runtime=runtime,
                 name="_is_registered_dependency",
                 arg_names=("self", "dependency"),
-                body=[
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id="_resolver_is_registered_dependency", ctx=ast.Load()),
-                            args=[
-                                ast.Name(id="self", ctx=ast.Load()),
-                                ast.Name(id="dependency", ctx=ast.Load()),
-                            ],
-                            keywords=[],
-                        ),
-                    ),
-                ],
+                body_lines=["return _resolver_is_registered_dependency(self, dependency)"],
                 generated_globals=generated_globals,
             )
             attrs["__enter__"] = self._compile_simple_method(
+                runtime=runtime,
                 name="__enter__",
                 arg_names=("self",),
-                body=[ast.Return(value=ast.Name(id="self", ctx=ast.Load()))],
+                body_lines=["return self"],
                 generated_globals=generated_globals,
             )
             attrs["__aenter__"] = self._compile_simple_method(
+                runtime=runtime,
                 name="__aenter__",
                 arg_names=("self",),
-                body=[ast.Return(value=ast.Name(id="self", ctx=ast.Load()))],
+                body_lines=["return self"],
                 generated_globals=generated_globals,
                 is_async=True,
             )
@@ -417,29 +1058,67 @@ class ResolversAssemblyCompiler:
                 generated_globals=generated_globals,
                 is_async=False,
                 has_cleanup=runtime.has_cleanup,
+                defers_cleanup=runtime.deferred_cleanups is not None and not scope.is_root,
+                pooled_scope_level=_pooled_scope_level(runtime=runtime, class_plan=scope),
             )
             attrs["__aexit__"] = self._compile_exit_method(
                 runtime=runtime,
                 generated_globals=generated_globals,
                 is_async=True,
                 has_cleanup=runtime.has_cleanup,
+                defers_cleanup=runtime.deferred_cleanups is not None and not scope.is_root,
+                pooled_scope_level=_pooled_scope_level(runtime=runtime, class_plan=scope),
             )
             attrs["close"] = self._compile_close_method(
+                runtime=runtime,
                 generated_globals=generated_globals,
                 is_async=False,
             )
             attrs["aclose"] = self._compile_close_method(
+                runtime=runtime,
                 generated_globals=generated_globals,
                 is_async=True,
             )
 
-            for workflow in runtime.plan.workflows:
+            reused_methods = (
+                _rebound_slot_methods(
+                    workflows=reused_workflows,
+                    previous_runtime=previous_runtime,
+                    class_plan=scope,
+                    generated_globals=generated_globals,
+                    rebound_methods=rebound_methods,
+                )
+                if previous_runtime is not None
+                else {}
+            )
+            if lazy_methods is not None:
+                attrs.update(lazy_methods)
+                attrs.update(reused_methods)
+            for slot in runtime.frozen_values_by_slot:
+                for is_async in (False, True):
+                    method_name = f"aresolve_{slot}" if is_async else f"resolve_{slot}"
+                    attrs[method_name] = self._compile_simple_method(
+                        runtime=runtime,
+                        name=method_name,
+                        arg_names=("self",),
+                        body_lines=[f"return _frozen_{slot}"],
+                        generated_globals=generated_globals,
+                        is_async=is_async,
+                    )
+            for workflow in runtime.plan.workflows if lazy_methods is None else ():
+                if workflow.slot in runtime.frozen_values_by_slot:
+                    continue
+                if f"resolve_{workflow.slot}" in reused_methods:
+                    attrs[f"resolve_{workflow.slot}"] = reused_methods[f"resolve_{workflow.slot}"]
+                    attrs[f"aresolve_{workflow.slot}"] = reused_methods[f"aresolve_{workflow.slot}"]
+                    continue
                 attrs[f"resolve_{workflow.slot}"] = self._compile_slot_method(
                     runtime=runtime,
                     workflow=workflow,
                     class_plan=scope,
                     generated_globals=generated_globals,
                     is_async=False,
+                    shared_slot_methods=shared_slot_methods,
                 )
                 attrs[f"aresolve_{workflow.slot}"] = self._compile_slot_method(
                     runtime=runtime,
@@ -447,15 +1126,49 @@ class ResolversAssemblyCompiler:
                     class_plan=scope,
                     generated_globals=generated_globals,
                     is_async=True,
+                    shared_slot_methods=shared_slot_methods,
                 )
 
+            for collection in runtime.all_collections:
+                for is_async in (False, True):
+                    attrs[_all_collection_method_name(collection=collection, is_async=is_async)] = (
+                        self._compile_all_collection_method(
+                            runtime=runtime,
+                            collection=collection,
+                            class_plan=scope,
+                            generated_globals=generated_globals,
+                            is_async=is_async,
+                            shared_slot_methods=shared_slot_methods,
+                        )
+                    )
+
             resolver_class = type(scope.class_name, (), attrs)
             classes_by_level[scope.scope_level] = resolver_class
 
-        for resolver_class in classes_by_level.values():
-            enter_scope_method = resolver_class.enter_scope
-            for scope_level, scope_class in classes_by_level.items():
-                enter_scope_method.__globals__[f"_scope_ctor_{scope_level}"] = scope_class
+        # Every generated function shares ``generated_globals`` as its namespace, so scope
+        # constructors only need to be published once for all ``enter_scope`` methods.
+        for scope_level, scope_class in classes_by_level.items():
+            generated_globals[f"_scope_ctor_{scope_level}"] = scope_class
+
+        for scope in runtime.ordered_scopes:
+            scope_class = classes_by_level[scope.scope_level]
+            if not _hashed_dispatch_enabled(plan=runtime.plan):
+                if runtime.all_collections:
+                    sync_table, async_table = _all_collection_dispatch_tables(
+                        runtime=runtime,
+                        resolver_class=scope_class,
+                    )
+                    generated_globals[f"_sync_all_dispatch_table_{scope.scope_level}"] = sync_table
+                    generated_globals[f"_async_all_dispatch_table_{scope.scope_level}"] = (
+                        async_table
+                    )
+                continue
+            sync_table, async_table = self._dispatch_tables(
+                runtime=runtime,
+                resolver_class=scope_class,
+            )
+            generated_globals[f"_sync_dispatch_table_{scope.scope_level}"] = sync_table
+            generated_globals[f"_async_dispatch_table_{scope.scope_level}"] = async_table
 
         return classes_by_level
 
@@ -472,19 +1185,29 @@ class ResolversAssemblyCompiler:
             "_owned_scope_resolvers",
             "_active",
         ]
-        if _dispatch_cache_enabled_for_class(plan=runtime.plan, class_plan=class_plan):
+        if _dispatch_cache_enabled(plan=runtime.plan):
             slots.extend(
                 (
-                    "_last_sync_dependency",
-                    "_last_sync_method",
-                    "_last_async_dependency",
-                    "_last_async_method",
+                    "_sync_dispatch_cache",
+                    "_async_dispatch_cache",
                 ),
             )
         if runtime.has_cleanup:
             slots.append("_cleanup_enabled")
         if runtime.has_cleanup:
             slots.append("_cleanup_callbacks")
+        if runtime.cleanup_dependency_slots_by_slot is not None:
+            slots.append("_cleanup_slots")
+        if _uses_scope_resolver_pool(runtime=runtime):
+            slots.extend(
+                (
+                    f"_scope_pool_{scope.scope_level}"
+                    for scope in runtime.ordered_scopes
+                    if not scope.is_root
+                )
+                if class_plan.is_root
+                else ("_scope_pool",),
+            )
         if class_plan.is_root:
             slots.append("__dict__")
 
@@ -505,37 +1228,32 @@ class ResolversAssemblyCompiler:
             f"_cache_{slot}"
             for slot in runtime.cache_slots_by_owner_level.get(class_plan.scope_level, ())
         )
+        if class_plan.is_root:
+            slots.extend(
+                f"_all_cache_{collection.index}"
+                for collection in runtime.all_collections
+                if collection.folded_prefix_length
+            )
 
         return tuple(_unique_ordered(slots))
 
     def _compile_simple_method(
         self,
         *,
+        runtime: _ResolverRuntime,
         name: str,
         arg_names: tuple[str, ...],
-        body: list[ast.stmt],
-        generated_globals: Mapping[str, Any],
+        body_lines: list[str],
+        generated_globals: dict[str, Any],
         is_async: bool = False,
-        defaults: tuple[Any, ...] = (),
-        kwonly_defaults: dict[str, Any] | None = None,
     ) -> Callable[..., Any]:
-        arguments = ast.arguments(
-            posonlyargs=[],
-            args=[ast.arg(arg=arg_name) for arg_name in arg_names],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[ast.Constant(value=None) for _ in defaults],
-        )
-        return _compile_function(
+        return _compile_function_from_source(
             name=name,
-            arguments=arguments,
-            body=body,
+            arg_names=arg_names,
+            body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             is_async=is_async,
-            defaults=defaults,
-            kwonly_defaults=kwonly_defaults,
         )
 
     def _compile_init_method(
@@ -543,7 +1261,7 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
     ) -> Callable[..., Any]:
         specialized = self._compile_specialized_init_method(
             runtime=runtime,
@@ -622,13 +1340,10 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
     ) -> Callable[..., Any] | None:
         non_root_scopes = tuple(scope for scope in runtime.ordered_scopes if not scope.is_root)
-        enable_dispatch_cache = _dispatch_cache_enabled_for_class(
-            plan=runtime.plan,
-            class_plan=class_plan,
-        )
+        enable_dispatch_cache = _dispatch_cache_enabled(plan=runtime.plan)
 
         body_lines: list[str] = [
             f"self._root_resolver = {'self' if class_plan.is_root else 'root_resolver'}",
@@ -640,16 +1355,25 @@ class ResolversAssemblyCompiler:
         if enable_dispatch_cache:
             body_lines.extend(
                 [
-                    "self._last_sync_dependency = _MISSING_DEP_SLOT",
-                    "self._last_sync_method = None",
-                    "self._last_async_dependency = _MISSING_DEP_SLOT",
-                    "self._last_async_method = None",
+                    "self._sync_dispatch_cache = _EMPTY_DISPATCH_CACHE",
+                    "self._async_dispatch_cache = _EMPTY_DISPATCH_CACHE",
                 ],
             )
         if runtime.has_cleanup:
             body_lines.append("self._cleanup_enabled = cleanup_enabled")
         if runtime.has_cleanup:
             body_lines.append("self._cleanup_callbacks = []")
+        if runtime.cleanup_dependency_slots_by_slot is not None:
+            body_lines.append("self._cleanup_slots = []")
+        if _uses_scope_resolver_pool(runtime=runtime):
+            body_lines.extend(
+                [
+                    f"self._scope_pool_{non_root_scope.scope_level} = []"
+                    for non_root_scope in non_root_scopes
+                ]
+                if class_plan.is_root
+                else ["self._scope_pool = None"],
+            )
 
         if class_plan.is_root:
             for non_root_scope in non_root_scopes:
@@ -689,6 +1413,12 @@ class ResolversAssemblyCompiler:
 
         for cache_slot in runtime.cache_slots_by_owner_level.get(class_plan.scope_level, ()):
             body_lines.append(f"self._cache_{cache_slot} = _MISSING_CACHE")
+        if class_plan.is_root:
+            body_lines.extend(
+                f"self._all_cache_{collection.index} = _MISSING_CACHE"
+                for collection in runtime.all_collections
+                if collection.folded_prefix_length
+            )
 
         if class_plan.is_root and (runtime.uses_stateless_scope_reuse or not runtime.has_cleanup):
             for non_root_scope in non_root_scopes:
@@ -717,6 +1447,7 @@ class ResolversAssemblyCompiler:
                 ),
                 body_lines=body_lines,
                 generated_globals=generated_globals,
+                code_store=runtime.code_store,
                 defaults=((True, None, None) if runtime.has_cleanup else (None, None)),
             )
 
@@ -735,6 +1466,7 @@ class ResolversAssemblyCompiler:
             ),
             body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             defaults=((True, None, None) if runtime.has_cleanup else (None, None)),
         )
 
@@ -743,7 +1475,7 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
     ) -> Callable[..., Any]:
         specialized = self._compile_specialized_enter_scope_method(
             runtime=runtime,
@@ -753,33 +1485,12 @@ class ResolversAssemblyCompiler:
         if specialized is not None:
             return specialized
 
-        arguments = ast.arguments(
-            posonlyargs=[],
-            args=[ast.arg(arg="self"), ast.arg(arg="scope"), ast.arg(arg="context")],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[ast.Constant(value=None), ast.Constant(value=None)],
-        )
-        body = [
-            ast.Return(
-                value=ast.Call(
-                    func=ast.Name(id="_resolver_enter_scope", ctx=ast.Load()),
-                    args=[
-                        ast.Name(id="self", ctx=ast.Load()),
-                        ast.Name(id="scope", ctx=ast.Load()),
-                        ast.Name(id="context", ctx=ast.Load()),
-                    ],
-                    keywords=[],
-                ),
-            ),
-        ]
-        return _compile_function(
+        return _compile_function_from_source(
             name="enter_scope",
-            arguments=arguments,
-            body=body,
+            arg_names=("self", "scope", "context"),
+            body_lines=["return _resolver_enter_scope(self, scope, context)"],
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             defaults=(None, None),
         )
 
@@ -788,7 +1499,7 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
     ) -> Callable[..., Any] | None:
         _immediate_next, default_next, _explicit_candidates = (
             runtime.next_scope_options_by_level.get(
@@ -828,6 +1539,35 @@ class ResolversAssemblyCompiler:
                 ],
             )
             transition_lines.extend(pooled_lines)
+        elif class_plan.is_root and _uses_scope_resolver_pool(runtime=runtime):
+            # Exited resolvers return to this free-list; ``list.pop`` hands each one to a single
+            # caller without a lock. A resolver still referenced from outside (a held scope, a
+            # ``Provider[T]`` closure) is dropped rather than reused, so stale references keep
+            # seeing their own scope's state and never the next one's.
+            transition_lines.extend(
+                [
+                    "if context is None and self._context is None and self._parent_context_resolver is None:",
+                    f"    _pool = self._scope_pool_{target_level}",
+                    "    if _pool:",
+                    "        try:",
+                    "            _pooled = _pool.pop()",
+                    "        except IndexError:",
+                    "            pass",
+                    "        else:",
+                    "            if _getrefcount(_pooled) == _POOLED_SCOPE_RESOLVER_FREE_REFCOUNT:",
+                    *(
+                        f"                _pooled._cache_{cache_slot} = _MISSING_CACHE"
+                        for cache_slot in runtime.cache_slots_by_owner_level.get(target_level, ())
+                    ),
+                    "                _pooled._owned_scope_resolvers = ()",
+                    "                _pooled._scope_pool = _pool",
+                    "                _pooled._active = True",
+                    "                return _pooled",
+                    f"    _pooled = _scope_ctor_{target_level}(self, self._cleanup_enabled, None, self)",
+                    "    _pooled._scope_pool = _pool",
+                    "    return _pooled",
+                ],
+            )
         transition_lines.extend(
             [
                 (
@@ -872,6 +1612,7 @@ class ResolversAssemblyCompiler:
             arg_names=("self", "scope", "context"),
             body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             defaults=(None, None),
         )
 
@@ -880,15 +1621,20 @@ class ResolversAssemblyCompiler:
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
         is_async: bool,
     ) -> Callable[..., Any]:
+        if _hashed_dispatch_enabled(plan=runtime.plan):
+            return self._compile_hashed_dispatch_method(
+                runtime=runtime,
+                class_plan=class_plan,
+                generated_globals=generated_globals,
+                is_async=is_async,
+            )
+
         method_name = "aresolve" if is_async else "resolve"
         call_prefix = "aresolve" if is_async else "resolve"
-        cache_dependency_attr_name = (
-            "_last_async_dependency" if is_async else "_last_sync_dependency"
-        )
-        cache_method_attr_name = "_last_async_method" if is_async else "_last_sync_method"
+        cache_attr_name = "_async_dispatch_cache" if is_async else "_sync_dispatch_cache"
         dispatch_workflows = _dispatch_workflows(
             plan=runtime.plan,
             class_plan=class_plan,
@@ -903,16 +1649,36 @@ class ResolversAssemblyCompiler:
 
         body: list[ast.stmt] = []
         if enable_dispatch_cache:
-            body.extend(
-                [
+            # One attribute read snapshots the whole cache; entries are probed by identity.
+            body.append(
+                ast.Assign(
+                    targets=[ast.Name(id="dispatch_cache", ctx=ast.Store())],
+                    value=ast.Attribute(
+                        value=ast.Name(id="self", ctx=ast.Load()),
+                        attr=cache_attr_name,
+                        ctx=ast.Load(),
+                    ),
+                ),
+            )
+            for entry_index in range(_DISPATCH_CACHE_SIZE):
+                cached_entry_call = ast.Call(
+                    func=ast.Subscript(
+                        value=ast.Name(id="dispatch_cache", ctx=ast.Load()),
+                        slice=ast.Constant(value=entry_index * 2 + 1),
+                        ctx=ast.Load(),
+                    ),
+                    args=[],
+                    keywords=[],
+                )
+                body.append(
                     ast.If(
                         test=ast.Compare(
                             left=ast.Name(id="dependency", ctx=ast.Load()),
                             ops=[ast.Is()],
                             comparators=[
-                                ast.Attribute(
-                                    value=ast.Name(id="self", ctx=ast.Load()),
-                                    attr=cache_dependency_attr_name,
+                                ast.Subscript(
+                                    value=ast.Name(id="dispatch_cache", ctx=ast.Load()),
+                                    slice=ast.Constant(value=entry_index * 2),
                                     ctx=ast.Load(),
                                 ),
                             ],
@@ -920,34 +1686,15 @@ class ResolversAssemblyCompiler:
                         body=[
                             ast.Return(
                                 value=(
-                                    ast.Await(
-                                        value=ast.Call(
-                                            func=ast.Attribute(
-                                                value=ast.Name(id="self", ctx=ast.Load()),
-                                                attr=cache_method_attr_name,
-                                                ctx=ast.Load(),
-                                            ),
-                                            args=[],
-                                            keywords=[],
-                                        ),
-                                    )
+                                    ast.Await(value=cached_entry_call)
                                     if is_async
-                                    else ast.Call(
-                                        func=ast.Attribute(
-                                            value=ast.Name(id="self", ctx=ast.Load()),
-                                            attr=cache_method_attr_name,
-                                            ctx=ast.Load(),
-                                        ),
-                                        args=[],
-                                        keywords=[],
-                                    )
+                                    else cached_entry_call
                                 ),
                             ),
                         ],
                         orelse=[],
                     ),
-                ],
-            )
+                )
 
         def _dispatch_return_body(
             *,
@@ -1047,21 +1794,27 @@ class ResolversAssemblyCompiler:
                     targets=[
                         ast.Attribute(
                             value=ast.Name(id="self", ctx=ast.Load()),
-                            attr=cache_dependency_attr_name,
-                            ctx=ast.Store(),
-                        ),
-                    ],
-                    value=cache_dependency,
-                ),
-                ast.Assign(
-                    targets=[
-                        ast.Attribute(
-                            value=ast.Name(id="self", ctx=ast.Load()),
-                            attr=cache_method_attr_name,
+                            attr=cache_attr_name,
                             ctx=ast.Store(),
                         ),
                     ],
-                    value=ast.Name(id="cached_method", ctx=ast.Load()),
+                    value=ast.Tuple(
+                        elts=[
+                            cache_dependency,
+                            ast.Name(id="cached_method", ctx=ast.Load()),
+                            ast.Starred(
+                                value=ast.Subscript(
+                                    value=ast.Name(id="dispatch_cache", ctx=ast.Load()),
+                                    slice=ast.Slice(
+                                        upper=ast.Constant(value=(_DISPATCH_CACHE_SIZE - 1) * 2),
+                                    ),
+                                    ctx=ast.Load(),
+                                ),
+                                ctx=ast.Load(),
+                            ),
+                        ],
+                        ctx=ast.Load(),
+                    ),
                 ),
                 ast.Return(
                     value=ast.Await(value=cached_method_call) if is_async else cached_method_call,
@@ -1138,22 +1891,56 @@ class ResolversAssemblyCompiler:
                 ),
             )
 
-        fallback_function = (
-            "_resolve_dispatch_fallback_async" if is_async else "_resolve_dispatch_fallback_sync"
-        )
-        fallback_call = ast.Call(
-            func=ast.Name(id=fallback_function, ctx=ast.Load()),
-            args=[
-                ast.Name(id="self", ctx=ast.Load()),
-                ast.Name(id="dependency", ctx=ast.Load()),
-            ],
-            keywords=[],
-        )
-        body.append(
-            ast.Return(
-                value=ast.Await(value=fallback_call) if is_async else fallback_call,
-            ),
-        )
+        if runtime.all_collections:
+            # ``All[...]`` keys are rebuilt by callers, so they are matched by equality in a
+            # per-class table published after class creation.
+            all_table_name = (
+                f"_async_all_dispatch_table_{class_plan.scope_level}"
+                if is_async
+                else f"_sync_all_dispatch_table_{class_plan.scope_level}"
+            )
+            all_method_call = ast.Call(
+                func=ast.Name(id="all_method", ctx=ast.Load()),
+                args=[ast.Name(id="self", ctx=ast.Load())],
+                keywords=[],
+            )
+            body.extend(
+                [
+                    ast.Assign(
+                        targets=[ast.Name(id="all_method", ctx=ast.Store())],
+                        value=ast.Call(
+                            func=ast.Attribute(
+                                value=ast.Name(id=all_table_name, ctx=ast.Load()),
+                                attr="get",
+                                ctx=ast.Load(),
+                            ),
+                            args=[ast.Name(id="dependency", ctx=ast.Load())],
+                            keywords=[],
+                        ),
+                    ),
+                    ast.If(
+                        test=ast.Compare(
+                            left=ast.Name(id="all_method", ctx=ast.Load()),
+                            ops=[ast.IsNot()],
+                            comparators=[ast.Constant(value=None)],
+                        ),
+                        body=[
+                            ast.Return(
+                                value=(
+                                    ast.Await(value=all_method_call)
+                                    if is_async
+                                    else all_method_call
+                                ),
+                            ),
+                        ],
+                        orelse=[],
+                    ),
+                ],
+            )
+
+        # Marker keys such as ``Maybe[T]`` are classified once per graph on the first miss and
+        # dispatched to the memoized handler afterwards.
+        body.extend(_marker_dispatch_statements(is_async=is_async))
 
         arguments = ast.arguments(
             posonlyargs=[],
@@ -1172,13 +1959,72 @@ class ResolversAssemblyCompiler:
             is_async=is_async,
         )
 
+    def _compile_hashed_dispatch_method(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        class_plan: ScopePlan,
+        generated_globals: dict[str, Any],
+        is_async: bool,
+    ) -> Callable[..., Any]:
+        # Large graphs look the requested key up in a per-class table instead of walking
+        # one identity test per provider; the table is published after class creation.
+        table_name = (
+            f"_async_dispatch_table_{class_plan.scope_level}"
+            if is_async
+            else f"_sync_dispatch_table_{class_plan.scope_level}"
+        )
+        await_prefix = "await " if is_async else ""
+        marker_table_name, miss_function = _marker_dispatch_names(is_async=is_async)
+        return _compile_function_from_source(
+            name="aresolve" if is_async else "resolve",
+            arg_names=("self", "dependency"),
+            body_lines=[
+                f"method = {table_name}.get(dependency)",
+                "if method is not None:",
+                f"    return {await_prefix}method(self)",
+                f"method = {marker_table_name}.get(dependency)",
+                "if method is not None:",
+                f"    return {await_prefix}method(self)",
+                f"return {await_prefix}{miss_function}(self, dependency)",
+            ],
+            generated_globals=generated_globals,
+            code_store=runtime.code_store,
+            is_async=is_async,
+        )
+
+    def _dispatch_tables(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        resolver_class: type[Any],
+    ) -> tuple[dict[Any, Callable[..., Any]], dict[Any, Callable[..., Any]]]:
+        class_namespace = vars(resolver_class)
+        sync_table: dict[Any, Callable[..., Any]] = {}
+        async_table: dict[Any, Callable[..., Any]] = {}
+        for workflow in runtime.plan.workflows:
+            dependency = runtime.dep_type_by_slot[workflow.slot]
+            sync_table.setdefault(dependency, class_namespace[f"resolve_{workflow.slot}"])
+            async_table.setdefault(dependency, class_namespace[f"aresolve_{workflow.slot}"])
+        all_sync_table, all_async_table = _all_collection_dispatch_tables(
+            runtime=runtime,
+            resolver_class=resolver_class,
+        )
+        for dependency, method in all_sync_table.items():
+            sync_table.setdefault(dependency, method)
+        for dependency, method in all_async_table.items():
+            async_table.setdefault(dependency, method)
+        return sync_table, async_table
+
     def _compile_exit_method(
         self,
         *,
         runtime: _ResolverRuntime,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
         is_async: bool,
         has_cleanup: bool,
+        defers_cleanup: bool = False,
+        pooled_scope_level: int | None = None,
     ) -> Callable[..., Any]:
         name = "__aexit__" if is_async else "__exit__"
         if not has_cleanup:
@@ -1190,36 +2036,30 @@ class ResolversAssemblyCompiler:
             )
 
         function_name = "_resolver_aexit" if is_async else "_resolver_exit"
-        arguments = ast.arguments(
-            posonlyargs=[],
-            args=[
-                ast.arg(arg="self"),
-                ast.arg(arg="exc_type"),
-                ast.arg(arg="exc_value"),
-                ast.arg(arg="traceback"),
-            ],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[],
-        )
-        call = ast.Call(
-            func=ast.Name(id=function_name, ctx=ast.Load()),
-            args=[
-                ast.Name(id="self", ctx=ast.Load()),
-                ast.Name(id="exc_type", ctx=ast.Load()),
-                ast.Name(id="exc_value", ctx=ast.Load()),
-                ast.Name(id="traceback", ctx=ast.Load()),
-            ],
-            keywords=[],
-        )
-        body = [ast.Return(value=ast.Await(value=call) if is_async else call)]
-        return _compile_function(
+        if defers_cleanup:
+            function_name += "_deferred"
+        await_prefix = "await " if is_async else ""
+        arguments = "self, exc_type, exc_value, traceback"
+        if runtime.cleanup_dependency_slots_by_slot is not None:
+            arguments += ", self._cleanup_slots"
+        body_lines = [f"return {await_prefix}{function_name}({arguments})"]
+        if pooled_scope_level is not None:
+            # A resolver whose cleanup raised may hold half-released state, so only a clean
+            # exit hands it back to the free-list.
+            body_lines = [
+                "_pool = self._scope_pool",
+                "self._scope_pool = None",
+                f"_result = {await_prefix}{function_name}({arguments})",
+                f"if _pool is not None and len(_pool) < {_SCOPE_RESOLVER_POOL_SIZE}:",
+                "    _pool.append(self)",
+                "return _result",
+            ]
+        return _compile_function_from_source(
             name=name,
-            arguments=arguments,
-            body=body,
+            arg_names=("self", "exc_type", "exc_value", "traceback"),
+            body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             is_async=is_async,
         )
 
@@ -1227,7 +2067,7 @@ class ResolversAssemblyCompiler:
         self,
         *,
         runtime: _ResolverRuntime,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
         is_async: bool,
         name: str,
     ) -> Callable[..., Any]:
@@ -1240,6 +2080,7 @@ class ResolversAssemblyCompiler:
                 arg_names=("self", "exc_type", "exc_value", "traceback"),
                 body_lines=body_lines,
                 generated_globals=generated_globals,
+                code_store=runtime.code_store,
                 is_async=is_async,
             )
 
@@ -1269,52 +2110,28 @@ class ResolversAssemblyCompiler:
             arg_names=("self", "exc_type", "exc_value", "traceback"),
             body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             is_async=is_async,
         )
 
     def _compile_close_method(
         self,
         *,
-        generated_globals: Mapping[str, Any],
+        runtime: _ResolverRuntime,
+        generated_globals: dict[str, Any],
         is_async: bool,
     ) -> Callable[..., Any]:
         name = "aclose" if is_async else "close"
         delegated_name = "__aexit__" if is_async else "__exit__"
-        arguments = ast.arguments(
-            posonlyargs=[],
-            args=[
-                ast.arg(arg="self"),
-                ast.arg(arg="exc_type"),
-                ast.arg(arg="exc_value"),
-                ast.arg(arg="traceback"),
-            ],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[ast.Constant(value=None), ast.Constant(value=None), ast.Constant(value=None)],
-        )
-        delegated_call = ast.Call(
-            func=ast.Attribute(
-                value=ast.Name(id="self", ctx=ast.Load()),
-                attr=delegated_name,
-                ctx=ast.Load(),
-            ),
-            args=[
-                ast.Name(id="exc_type", ctx=ast.Load()),
-                ast.Name(id="exc_value", ctx=ast.Load()),
-                ast.Name(id="traceback", ctx=ast.Load()),
-            ],
-            keywords=[],
-        )
-        body = [
-            ast.Return(value=ast.Await(value=delegated_call) if is_async else delegated_call),
-        ]
-        return _compile_function(
+        await_prefix = "await " if is_async else ""
+        return _compile_function_from_source(
             name=name,
-            arguments=arguments,
-            body=body,
+            arg_names=("self", "exc_type", "exc_value", "traceback"),
+            body_lines=[
+                f"return {await_prefix}self.{delegated_name}(exc_type, exc_value, traceback)"
+            ],
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             is_async=is_async,
             defaults=(None, None, None),
         )
@@ -1325,136 +2142,266 @@ class ResolversAssemblyCompiler:
         runtime: _ResolverRuntime,
         workflow: ProviderWorkflowPlan,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
+        generated_globals: dict[str, Any],
         is_async: bool,
+        shared_slot_methods: dict[tuple[str, ...], Callable[..., Any]] | None = None,
     ) -> Callable[..., Any]:
-        if not is_async:
-            specialized_sync = self._compile_specialized_sync_slot_method(
-                runtime=runtime,
-                workflow=workflow,
-                class_plan=class_plan,
+        method_name = f"aresolve_{workflow.slot}" if is_async else f"resolve_{workflow.slot}"
+        body_lines = self._slot_method_body_lines(
+            runtime=runtime,
+            workflow=workflow,
+            class_plan=class_plan,
+            is_async=is_async,
+        )
+        if shared_slot_methods is None:
+            return _compile_function_from_source(
+                name=method_name,
+                arg_names=("self",),
+                body_lines=body_lines,
                 generated_globals=generated_globals,
+                code_store=runtime.code_store,
+                is_async=is_async,
             )
-            if specialized_sync is not None:
-                return specialized_sync
 
-        method_name = f"aresolve_{workflow.slot}" if is_async else f"resolve_{workflow.slot}"
-        global_name = f"_async_slot_{workflow.slot}" if is_async else f"_sync_slot_{workflow.slot}"
-        arguments = ast.arguments(
-            posonlyargs=[],
-            args=[ast.arg(arg="self")],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[],
-        )
-        call = ast.Call(
-            func=ast.Name(id=global_name, ctx=ast.Load()),
-            args=[ast.Name(id="self", ctx=ast.Load())],
-            keywords=[],
-        )
-        body: list[ast.stmt] = []
-        if workflow.is_cached and workflow.cache_owner_scope_level == class_plan.scope_level:
-            body.extend(
-                [
-                    ast.Assign(
-                        targets=[ast.Name(id="cached_value", ctx=ast.Store())],
-                        value=ast.Attribute(
-                            value=ast.Name(id="self", ctx=ast.Load()),
-                            attr=f"_cache_{workflow.slot}",
-                            ctx=ast.Load(),
-                        ),
-                    ),
-                    ast.If(
-                        test=ast.Compare(
-                            left=ast.Name(id="cached_value", ctx=ast.Load()),
-                            ops=[ast.IsNot()],
-                            comparators=[ast.Name(id="_MISSING_CACHE", ctx=ast.Load())],
-                        ),
-                        body=[ast.Return(value=ast.Name(id="cached_value", ctx=ast.Load()))],
-                        orelse=[],
-                    ),
-                ],
+        # Mismatch stubs, delegations and generic bodies render identically for every scope
+        # class they appear on, so identical sources are compiled once per graph.
+        shared_key = (method_name, *body_lines)
+        method = shared_slot_methods.get(shared_key)
+        if method is None:
+            method = _compile_function_from_source(
+                name=method_name,
+                arg_names=("self",),
+                body_lines=body_lines,
+                generated_globals=generated_globals,
+                code_store=runtime.code_store,
+                is_async=is_async,
             )
+            shared_slot_methods[shared_key] = method
+        return method
 
-        body.append(ast.Return(value=ast.Await(value=call) if is_async else call))
-        return _compile_function(
+    def _compile_all_collection_method(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        collection: _AllCollection,
+        class_plan: ScopePlan,
+        generated_globals: dict[str, Any],
+        is_async: bool,
+        shared_slot_methods: dict[tuple[str, ...], Callable[..., Any]] | None = None,
+    ) -> Callable[..., Any]:
+        method_name = _all_collection_method_name(collection=collection, is_async=is_async)
+        body_lines = self._all_collection_body_lines(
+            runtime=runtime,
+            collection=collection,
+            class_plan=class_plan,
+            is_async=is_async,
+        )
+        shared_key = (method_name, *body_lines)
+        if shared_slot_methods is not None and shared_key in shared_slot_methods:
+            return shared_slot_methods[shared_key]
+        method = _compile_function_from_source(
             name=method_name,
-            arguments=arguments,
-            body=body,
+            arg_names=("self",),
+            body_lines=body_lines,
             generated_globals=generated_globals,
+            code_store=runtime.code_store,
             is_async=is_async,
         )
+        if shared_slot_methods is not None:
+            shared_slot_methods[shared_key] = method
+        return method
 
-    def _compile_specialized_sync_slot_method(
+    def _all_collection_body_lines(
         self,
         *,
         runtime: _ResolverRuntime,
-        workflow: ProviderWorkflowPlan,
+        collection: _AllCollection,
         class_plan: ScopePlan,
-        generated_globals: Mapping[str, Any],
-    ) -> Callable[..., Any] | None:
-        if workflow.uses_thread_lock:
-            return None
-        if workflow.provider_is_inject_wrapper:
-            return None
-
-        method_name = f"resolve_{workflow.slot}"
-        class_scope_level = class_plan.scope_level
-        lines: list[str] = []
-
-        owner_scope_level = workflow.cache_owner_scope_level
-        if (
-            workflow.is_cached
-            and owner_scope_level is not None
-            and owner_scope_level != class_scope_level
-        ):
-            if owner_scope_level > class_scope_level:
-                lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
-            else:
-                lines.extend(
-                    _delegate_scope_lines_for_source(
-                        runtime=runtime,
-                        workflow=workflow,
-                        scope_level=owner_scope_level,
-                    ),
-                )
-            return _compile_function_from_source(
-                name=method_name,
-                arg_names=("self",),
-                body_lines=lines,
-                generated_globals=generated_globals,
-            )
-
-        if workflow.scope_level > class_scope_level:
-            lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
-            return _compile_function_from_source(
-                name=method_name,
-                arg_names=("self",),
-                body_lines=lines,
-                generated_globals=generated_globals,
+        is_async: bool,
+    ) -> list[str]:
+        folded_slots = collection.slots[: collection.folded_prefix_length]
+        remaining_slots = collection.slots[collection.folded_prefix_length :]
+        if is_async:
+            remaining_expressions = _all_member_async_expressions(
+                runtime=runtime,
+                resolver_expression="self",
+                slots=remaining_slots,
             )
-
-        if (
-            workflow.scope_level < class_scope_level
-            and workflow.max_required_scope_level <= workflow.scope_level
-        ):
-            lines.extend(
-                _delegate_scope_lines_for_source(
-                    runtime=runtime,
-                    workflow=workflow,
-                    scope_level=workflow.scope_level,
-                ),
+        else:
+            remaining_expressions = self._all_member_sync_expressions(
+                runtime=runtime,
+                class_plan=class_plan,
+                slots=remaining_slots,
             )
-            return _compile_function_from_source(
-                name=method_name,
-                arg_names=("self",),
-                body_lines=lines,
-                generated_globals=generated_globals,
+        if not folded_slots:
+            return [f"return {_tuple_expression(remaining_expressions)}"]
+
+        # Root-cached members never change for the lifetime of the root resolver, so their
+        # values are collected once into a tuple shared by every later resolution.
+        root_expression = "self" if class_plan.is_root else "self._root_resolver"
+        folded_expressions = (
+            _all_member_async_expressions(
+                runtime=runtime,
+                resolver_expression=root_expression,
+                slots=folded_slots,
             )
+            if is_async
+            else [f"{root_expression}.resolve_{slot}()" for slot in folded_slots]
+        )
+        lines = [
+            f"folded = {root_expression}._all_cache_{collection.index}",
+            "if folded is _MISSING_CACHE:",
+            f"    folded = {_tuple_expression(folded_expressions)}",
+            f"    {root_expression}._all_cache_{collection.index} = folded",
+        ]
+        if remaining_expressions:
+            lines.append(f"return folded + {_tuple_expression(remaining_expressions)}")
+        else:
+            lines.append("return folded")
+        return lines
 
-        if workflow.scope_level != class_scope_level:
+    def _all_member_sync_expressions(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        class_plan: ScopePlan,
+        slots: tuple[int, ...],
+    ) -> list[str]:
+        return [
+            f"_frozen_{slot}"
+            if slot in runtime.frozen_values_by_slot
+            else self._inlined_transient_expression(
+                runtime=runtime,
+                class_plan=class_plan,
+                dependency_slot=slot,
+            )
+            or f"self.resolve_{slot}()"
+            for slot in slots
+        ]
+
+    def _lazy_slot_methods_by_name(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        generated_globals: dict[str, Any],
+        shared_slot_methods: dict[tuple[str, ...], Callable[..., Any]] | None,
+    ) -> dict[str, Callable[..., Any]]:
+        # One stub per slot method name is shared by every scope class. Its first call on a
+        # class renders and compiles the real methods of its dependency closure for that class
+        # and installs them there.
+        compile_method = functools.partial(
+            self._compile_slot_method,
+            runtime=runtime,
+            generated_globals=generated_globals,
+            shared_slot_methods=shared_slot_methods,
+        )
+        lock = threading.Lock()
+        methods: dict[str, Callable[..., Any]] = {}
+        for workflow in runtime.plan.workflows:
+            for is_async in (False, True):
+                method_name = (
+                    f"aresolve_{workflow.slot}" if is_async else f"resolve_{workflow.slot}"
+                )
+                methods[method_name] = _build_lazy_slot_method(
+                    method_name=method_name,
+                    slot=workflow.slot,
+                    is_async=is_async,
+                    runtime=runtime,
+                    compile_method=compile_method,
+                    generated_globals=generated_globals,
+                    lock=lock,
+                    lazy_methods=methods,
+                )
+        return methods
+
+    def _slot_method_body_lines(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        workflow: ProviderWorkflowPlan,
+        class_plan: ScopePlan,
+        is_async: bool,
+    ) -> list[str]:
+        specialized_lines = (
+            self._specialized_async_slot_body_lines(
+                runtime=runtime,
+                workflow=workflow,
+                class_plan=class_plan,
+            )
+            if is_async
+            else self._specialized_sync_slot_body_lines(
+                runtime=runtime,
+                workflow=workflow,
+                class_plan=class_plan,
+            )
+        )
+        if specialized_lines is not None:
+            return specialized_lines
+
+        lines: list[str] = []
+        if workflow.is_cached and workflow.cache_owner_scope_level == class_plan.scope_level:
+            lines.extend(
+                [
+                    f"cached_value = self._cache_{workflow.slot}",
+                    "if cached_value is not _MISSING_CACHE:",
+                    "    return cached_value",
+                ],
+            )
+        if is_async:
+            lines.append(f"return await _async_slot_{workflow.slot}(self)")
+        else:
+            lines.append(f"return _sync_slot_{workflow.slot}(self)")
+        return lines
+
+    def _specialized_sync_slot_body_lines(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        workflow: ProviderWorkflowPlan,
+        class_plan: ScopePlan,
+    ) -> list[str] | None:
+        if workflow.provider_is_inject_wrapper:
+            return None
+
+        class_scope_level = class_plan.scope_level
+        lines: list[str] = []
+
+        owner_scope_level = workflow.cache_owner_scope_level
+        if (
+            workflow.is_cached
+            and owner_scope_level is not None
+            and owner_scope_level != class_scope_level
+        ):
+            if owner_scope_level > class_scope_level:
+                lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
+            else:
+                lines.extend(
+                    _delegate_scope_lines_for_source(
+                        runtime=runtime,
+                        workflow=workflow,
+                        scope_level=owner_scope_level,
+                    ),
+                )
+            return lines
+
+        if workflow.scope_level > class_scope_level:
+            lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
+            return lines
+
+        if (
+            workflow.scope_level < class_scope_level
+            and workflow.max_required_scope_level <= workflow.scope_level
+        ):
+            lines.extend(
+                _delegate_scope_lines_for_source(
+                    runtime=runtime,
+                    workflow=workflow,
+                    scope_level=workflow.scope_level,
+                ),
+            )
+            return lines
+
+        if workflow.scope_level != class_scope_level:
             return None
 
         if workflow.requires_async:
@@ -1464,15 +2411,7 @@ class ResolversAssemblyCompiler:
                     "raise DIWireAsyncDependencyInSyncContextError(msg)",
                 ],
             )
-            return _compile_function_from_source(
-                name=method_name,
-                arg_names=("self",),
-                body_lines=lines,
-                generated_globals=generated_globals,
-            )
-
-        if workflow.provider_attribute not in {"instance", "concrete_type", "factory"}:
-            return None
+            return lines
 
         if workflow.is_cached:
             lines.extend(
@@ -1483,25 +2422,24 @@ class ResolversAssemblyCompiler:
                 ],
             )
 
-        value_expression: str
         if workflow.provider_attribute == "instance":
-            value_expression = f"_provider_{workflow.slot}"
+            build_lines = [f"value = _provider_{workflow.slot}"]
         else:
-            optimized_arguments = self._optimized_sync_arguments(
+            optimized_arguments = self._optimized_arguments(
                 runtime=runtime,
                 class_plan=class_plan,
                 workflow=workflow,
+                is_async=False,
             )
-            arguments = ", ".join(argument for argument in optimized_arguments if argument)
-            value_expression = (
-                f"_provider_{workflow.slot}({arguments})"
-                if arguments
-                else f"_provider_{workflow.slot}()"
+            build_lines = _provider_value_lines_for_source(
+                workflow=workflow,
+                arguments=", ".join(argument for argument in optimized_arguments if argument),
+                is_async=False,
+                records_cleanup_slot=runtime.cleanup_dependency_slots_by_slot is not None,
             )
-        lines.append(f"value = {value_expression}")
 
         if workflow.is_provider_async:
-            lines.extend(
+            build_lines.extend(
                 [
                     "if inspect.isawaitable(value):",
                     f'    msg = "Provider slot {workflow.slot} requires asynchronous resolution."',
@@ -1510,28 +2448,166 @@ class ResolversAssemblyCompiler:
             )
 
         if workflow.is_cached:
-            lines.append(f"self._cache_{workflow.slot} = value")
+            store_lines = [f"self._cache_{workflow.slot} = value"]
             if workflow.cache_owner_scope_level == runtime.root_scope_level:
-                lines.append(f"self.resolve_{workflow.slot} = lambda: value")
+                store_lines.append(f"self.resolve_{workflow.slot} = lambda: value")
+            build_lines.extend(
+                _optimistic_publish_lines_for_source(
+                    runtime=runtime,
+                    workflow=workflow,
+                    store_lines=store_lines,
+                )
+                if workflow.uses_optimistic_publish
+                else store_lines,
+            )
+
+        if workflow.uses_thread_lock:
+            lock_expression = f"_lock_{workflow.slot}"
+            if workflow.slot in runtime.thread_lock_stripes_by_slot:
+                lock_expression = _lock_stripe_expression_for_source(workflow=workflow)
+            # Double-checked locking: the unlocked read above serves the steady state and the
+            # second read under the lock keeps concurrent first calls from building twice.
+            lines.extend(
+                [
+                    f"with {lock_expression}:",
+                    f"    cached_value = self._cache_{workflow.slot}",
+                    "    if cached_value is not _MISSING_CACHE:",
+                    "        return cached_value",
+                    *(f"    {line}" for line in build_lines),
+                ],
+            )
+        else:
+            lines.extend(build_lines)
 
         lines.append("return value")
-        return _compile_function_from_source(
-            name=method_name,
-            arg_names=("self",),
-            body_lines=lines,
-            generated_globals=generated_globals,
+        return lines
+
+    def _specialized_async_slot_body_lines(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        workflow: ProviderWorkflowPlan,
+        class_plan: ScopePlan,
+    ) -> list[str] | None:
+        if not workflow.requires_async:
+            return [f"return self.resolve_{workflow.slot}()"]
+        if workflow.uses_async_lock:
+            return None
+        if workflow.provider_is_inject_wrapper:
+            return None
+
+        class_scope_level = class_plan.scope_level
+        lines: list[str] = []
+
+        owner_scope_level = workflow.cache_owner_scope_level
+        if (
+            workflow.is_cached
+            and owner_scope_level is not None
+            and owner_scope_level != class_scope_level
+        ):
+            if owner_scope_level > class_scope_level:
+                lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
+            else:
+                lines.extend(
+                    _delegate_scope_lines_for_source(
+                        runtime=runtime,
+                        workflow=workflow,
+                        scope_level=owner_scope_level,
+                        is_async=True,
+                    ),
+                )
+            return lines
+
+        if workflow.scope_level > class_scope_level:
+            lines.extend(_scope_mismatch_lines_for_source(workflow=workflow))
+            return lines
+
+        if (
+            workflow.scope_level < class_scope_level
+            and workflow.max_required_scope_level <= workflow.scope_level
+        ):
+            lines.extend(
+                _delegate_scope_lines_for_source(
+                    runtime=runtime,
+                    workflow=workflow,
+                    scope_level=workflow.scope_level,
+                    is_async=True,
+                ),
+            )
+            return lines
+
+        if workflow.scope_level != class_scope_level:
+            return None
+
+        if workflow.is_cached:
+            lines.extend(
+                [
+                    f"cached_value = self._cache_{workflow.slot}",
+                    "if cached_value is not _MISSING_CACHE:",
+                    "    return cached_value",
+                ],
+            )
+
+        gathered_calls, gathered_expressions = _gathered_dependency_calls(
+            runtime=runtime,
+            workflow=workflow,
+        )
+        optimized_arguments = self._optimized_arguments(
+            runtime=runtime,
+            class_plan=class_plan,
+            workflow=workflow,
+            is_async=True,
+            gathered_expressions=gathered_expressions,
+        )
+        # Fallback arguments await every dependency themselves, so gathering would resolve
+        # them twice.
+        if gathered_calls and optimized_arguments is not workflow.async_arguments:
+            lines.append(f"gathered = await _gather({', '.join(gathered_calls)})")
+        lines.extend(
+            _provider_value_lines_for_source(
+                workflow=workflow,
+                arguments=", ".join(argument for argument in optimized_arguments if argument),
+                is_async=True,
+                records_cleanup_slot=runtime.cleanup_dependency_slots_by_slot is not None,
+            ),
         )
 
-    def _optimized_sync_arguments(
+        if workflow.is_cached:
+            store_lines = [f"self._cache_{workflow.slot} = value"]
+            if workflow.cache_owner_scope_level == runtime.root_scope_level:
+                store_lines.extend(
+                    [
+                        "async def _cached():",
+                        "    return value",
+                        f"self.aresolve_{workflow.slot} = _cached",
+                    ],
+                )
+            lines.extend(
+                _optimistic_publish_lines_for_source(
+                    runtime=runtime,
+                    workflow=workflow,
+                    store_lines=store_lines,
+                )
+                if workflow.uses_optimistic_publish
+                else store_lines,
+            )
+
+        lines.append("return value")
+        return lines
+
+    def _optimized_arguments(
         self,
         *,
         runtime: _ResolverRuntime,
         class_plan: ScopePlan,
         workflow: ProviderWorkflowPlan,
+        is_async: bool,
+        gathered_expressions: Mapping[int, str] | None = None,
     ) -> tuple[str, ...]:
         dependency_plans = workflow.dependency_plans
         if not dependency_plans:
             return ()
+        fallback_arguments = workflow.async_arguments if is_async else workflow.sync_arguments
 
         resolver_expression = (
             "self" if class_plan.scope_level == runtime.root_scope_level else "self._root_resolver"
@@ -1547,16 +2623,26 @@ class ResolversAssemblyCompiler:
             if skip_positional_only and parameter_kind is inspect.Parameter.POSITIONAL_ONLY:
                 continue
 
-            expression = self._optimized_sync_dependency_expression(
-                runtime=runtime,
-                class_plan=class_plan,
-                dependency_plan=dependency_plan,
-                resolver_expression=resolver_expression,
-            )
+            expression: str | object | None
+            if gathered_expressions and dependency_plan.dependency_index in gathered_expressions:
+                expression = gathered_expressions[dependency_plan.dependency_index]
+            elif is_async and dependency_plan.dependency_requires_async:
+                expression = self._optimized_async_dependency_expression(
+                    runtime=runtime,
+                    dependency_plan=dependency_plan,
+                    resolver_expression=resolver_expression,
+                )
+            else:
+                expression = self._optimized_sync_dependency_expression(
+                    runtime=runtime,
+                    class_plan=class_plan,
+                    dependency_plan=dependency_plan,
+                    resolver_expression=resolver_expression,
+                )
             if expression is _FALLBACK_ARGUMENT_EXPRESSION:
-                return workflow.sync_arguments
+                return fallback_arguments
             if expression is not None and not isinstance(expression, str):
-                return workflow.sync_arguments
+                return fallback_arguments
 
             if expression is None or expression == "":
                 if parameter_kind in {
@@ -1583,7 +2669,7 @@ class ResolversAssemblyCompiler:
 
             parameter_name = dependency.parameter.name
             if not parameter_name.isidentifier() or keyword.iskeyword(parameter_name):
-                return workflow.sync_arguments
+                return fallback_arguments
             optimized_arguments.append(f"{parameter_name}={expression}")
 
         if workflow.provider_is_inject_wrapper:
@@ -1627,13 +2713,23 @@ class ResolversAssemblyCompiler:
             slots = dependency_plan.all_slots
             if not slots:
                 return "()"
-            if len(slots) == 1:
-                return f"(self.resolve_{slots[0]}(),)"
-            return "(" + ", ".join(f"self.resolve_{slot}()" for slot in slots) + ")"
+            collection = runtime.all_collection_by_slots.get(slots)
+            if collection is not None and collection.folded_prefix_length:
+                method_name = _all_collection_method_name(collection=collection, is_async=False)
+                return f"self.{method_name}()"
+            return _tuple_expression(
+                self._all_member_sync_expressions(
+                    runtime=runtime,
+                    class_plan=class_plan,
+                    slots=slots,
+                ),
+            )
 
         dependency_slot = dependency_plan.dependency_slot
         if dependency_slot is None:
             return _FALLBACK_ARGUMENT_EXPRESSION
+        if dependency_slot in runtime.frozen_values_by_slot:
+            return f"_frozen_{dependency_slot}"
         dependency_workflow = runtime.workflows_by_slot[dependency_slot]
         expression = f"self.resolve_{dependency_slot}()"
         if (
@@ -1643,19 +2739,24 @@ class ResolversAssemblyCompiler:
             if dependency_workflow.scope_level == runtime.root_scope_level:
                 expression = f"self._root_resolver.resolve_{dependency_slot}()"
             else:
-                owner_scope = runtime.scopes_by_level[dependency_workflow.scope_level]
-                expression = f"self.{owner_scope.resolver_attr_name}.resolve_{dependency_slot}()"
+                # A skipped intermediate scope leaves the owner attribute unset, which must
+                # surface as a scope mismatch rather than an attribute error on the sentinel.
+                owner_attribute = runtime.scopes_by_level[
+                    dependency_workflow.scope_level
+                ].resolver_attr_name
+                expression = (
+                    f"(self.{owner_attribute} if self.{owner_attribute} is not _MISSING_RESOLVER "
+                    f"else _raise_scope_mismatch_for_slot({dependency_slot}, "
+                    f"{dependency_workflow.scope_level})).resolve_{dependency_slot}()"
+                )
 
-        if (
-            dependency_workflow.scope_level == class_plan.scope_level
-            and not dependency_workflow.is_cached
-            and not dependency_workflow.requires_async
-            and dependency_workflow.provider_attribute in {"concrete_type", "factory"}
-            and not dependency_workflow.provider_is_inject_wrapper
-            and not dependency_workflow.dependencies
-            and not dependency_workflow.dependency_plans
-        ):
-            expression = f"_provider_{dependency_slot}()"
+        inlined_expression = self._inlined_transient_expression(
+            runtime=runtime,
+            class_plan=class_plan,
+            dependency_slot=dependency_slot,
+        )
+        if inlined_expression is not None:
+            expression = inlined_expression
 
         if (
             dependency_workflow.is_cached
@@ -1668,32 +2769,95 @@ class ResolversAssemblyCompiler:
             )
         return expression
 
+    def _inlined_transient_expression(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        class_plan: ScopePlan,
+        dependency_slot: int,
+    ) -> str | None:
+        dependency_workflow = runtime.workflows_by_slot[dependency_slot]
+        if (
+            dependency_slot not in runtime.inlinable_transient_slots
+            or dependency_workflow.scope_level != class_plan.scope_level
+        ):
+            return None
 
-def _compile_function(
-    *,
-    name: str,
-    arguments: ast.arguments,
-    body: Sequence[ast.stmt],
-    generated_globals: Mapping[str, Any],
-    is_async: bool = False,
-    defaults: tuple[Any, ...] = (),
-    kwonly_defaults: dict[str, Any] | None = None,
-) -> Callable[..., Any]:
-    function_definition: ast.FunctionDef | ast.AsyncFunctionDef
-    if is_async:
-        function_definition = ast.AsyncFunctionDef(
-            name=name,
-            args=arguments,
-            body=list(body),
-            decorator_list=[],
-            returns=None,
-            type_comment=None,
+        # The fused subtree lives in the same scope class, so the dependency's own optimized
+        # arguments are valid here and recursively fuse its inlinable transient dependencies.
+        optimized_arguments = self._optimized_arguments(
+            runtime=runtime,
+            class_plan=class_plan,
+            workflow=dependency_workflow,
+            is_async=False,
         )
-    else:
-        function_definition = ast.FunctionDef(
-            name=name,
-            args=arguments,
-            body=list(body),
+        arguments = ", ".join(argument for argument in optimized_arguments if argument)
+        return f"_provider_{dependency_slot}({arguments})"
+
+    def _optimized_async_dependency_expression(
+        self,
+        *,
+        runtime: _ResolverRuntime,
+        dependency_plan: ProviderDependencyPlan,
+        resolver_expression: str,
+    ) -> str | object:
+        if dependency_plan.kind == "all":
+            collection = runtime.all_collection_by_slots.get(dependency_plan.all_slots)
+            if collection is not None and collection.folded_prefix_length:
+                method_name = _all_collection_method_name(collection=collection, is_async=True)
+                return f"(await self.{method_name}())"
+            return _tuple_expression(
+                _all_member_async_expressions(
+                    runtime=runtime,
+                    resolver_expression="self",
+                    slots=dependency_plan.all_slots,
+                ),
+            )
+
+        dependency_slot = dependency_plan.dependency_slot
+        if dependency_plan.kind != "provider" or dependency_slot is None:
+            return _FALLBACK_ARGUMENT_EXPRESSION
+        if dependency_slot in runtime.frozen_values_by_slot:
+            return f"_frozen_{dependency_slot}"
+        dependency_workflow = runtime.workflows_by_slot[dependency_slot]
+        expression = f"(await self.aresolve_{dependency_slot}())"
+        if (
+            dependency_workflow.is_cached
+            and dependency_workflow.cache_owner_scope_level == runtime.root_scope_level
+        ):
+            expression = (
+                f"({resolver_expression}._cache_{dependency_slot} if "
+                f"{resolver_expression}._cache_{dependency_slot} is not _MISSING_CACHE else "
+                f"await self.aresolve_{dependency_slot}())"
+            )
+        return expression
+
+
+def _compile_function(
+    *,
+    name: str,
+    arguments: ast.arguments,
+    body: Sequence[ast.stmt],
+    generated_globals: dict[str, Any],
+    is_async: bool = False,
+    defaults: tuple[Any, ...] = (),
+    kwonly_defaults: dict[str, Any] | None = None,
+) -> Callable[..., Any]:
+    function_definition: ast.FunctionDef | ast.AsyncFunctionDef
+    if is_async:
+        function_definition = ast.AsyncFunctionDef(
+            name=name,
+            args=arguments,
+            body=list(body),
+            decorator_list=[],
+            returns=None,
+            type_comment=None,
+        )
+    else:
+        function_definition = ast.FunctionDef(
+            name=name,
+            args=arguments,
+            body=list(body),
             decorator_list=[],
             returns=None,
             type_comment=None,
@@ -1703,7 +2867,7 @@ def _compile_function(
     ast.fix_missing_locations(module)
     module_code = compile(module, filename=_FILENAME, mode="exec")
     function_code = _extract_function_code(module_code=module_code, name=name)
-    function = types.FunctionType(function_code, dict(generated_globals), name=name)
+    function = types.FunctionType(function_code, generated_globals, name=name)
     if defaults:
         function.__defaults__ = defaults
     if kwonly_defaults is not None:
@@ -1711,13 +2875,341 @@ def _compile_function(
     return function
 
 
+def _root_singleton_slots(*, runtime: _ResolverRuntime) -> tuple[int, ...]:
+    return runtime.cache_slots_by_owner_level.get(runtime.root_scope_level, ())
+
+
+def _root_singleton_layers(*, runtime: _ResolverRuntime) -> tuple[tuple[int, ...], ...]:
+    """Group root singletons so each layer only depends on singletons in earlier layers.
+
+    Transient and uncached dependencies are walked through, since building them builds
+    every singleton they reach. ``Provider[...]`` handles resolve lazily and add no edge.
+    """
+    singleton_slots = set(_root_singleton_slots(runtime=runtime))
+    # Layer a slot's value is first available in: singletons sit one layer above the
+    # deepest singleton they reach, other slots share the layer of what they reach.
+    layer_by_slot: dict[int, int] = {}
+    for root_slot in sorted(singleton_slots):
+        stack: list[tuple[int, bool]] = [(root_slot, False)]
+        visiting: set[int] = set()
+        while stack:
+            slot, expanded = stack.pop()
+            if slot in layer_by_slot:
+                continue
+            dependency_slots = _warm_up_dependency_slots(runtime.workflows_by_slot[slot])
+            if not expanded:
+                visiting.add(slot)
+                stack.append((slot, True))
+                stack.extend(
+                    (dependency_slot, False)
+                    for dependency_slot in dependency_slots
+                    if dependency_slot not in layer_by_slot and dependency_slot not in visiting
+                )
+                continue
+            visiting.discard(slot)
+            reached = max(
+                (layer_by_slot.get(dependency_slot, -1) for dependency_slot in dependency_slots),
+                default=-1,
+            )
+            layer_by_slot[slot] = reached + 1 if slot in singleton_slots else reached
+
+    layers: dict[int, list[int]] = {}
+    for slot in sorted(singleton_slots):
+        layers.setdefault(layer_by_slot[slot], []).append(slot)
+    return tuple(tuple(layers[layer]) for layer in sorted(layers))
+
+
+def _warm_up_dependency_slots(workflow: ProviderWorkflowPlan) -> tuple[int, ...]:
+    dependency_slots: list[int] = []
+    for dependency_plan in _dependency_plans_for_workflow(workflow=workflow):
+        if dependency_plan.kind == "all":
+            dependency_slots.extend(dependency_plan.all_slots)
+        elif dependency_plan.kind == "provider" and dependency_plan.dependency_slot is not None:
+            dependency_slots.append(dependency_plan.dependency_slot)
+    return tuple(dependency_slots)
+
+
+def _needs_warm_up(*, runtime: _ResolverRuntime, root_resolver: Any, slot: int) -> bool:
+    return (
+        runtime.workflows_by_slot[slot].provider_attribute != "instance"
+        and getattr(root_resolver, f"_cache_{slot}") is _MISSING_CACHE
+    )
+
+
+def _warms_up_on_event_loop(workflow: ProviderWorkflowPlan) -> bool:
+    # Async-locked slots stay on the loop so their ``asyncio.Lock`` keeps guarding them.
+    return workflow.requires_async or workflow.uses_async_lock
+
+
+def _timed_sync_build(root_resolver: Any, slot: int) -> float:
+    started = time.perf_counter()
+    getattr(root_resolver, f"resolve_{slot}")()
+    return time.perf_counter() - started
+
+
+async def _timed_async_build(root_resolver: Any, slot: int) -> float:
+    started = time.perf_counter()
+    await getattr(root_resolver, f"aresolve_{slot}")()
+    return time.perf_counter() - started
+
+
+def _built_root_singletons(*, runtime: _ResolverRuntime, root_resolver: Any) -> dict[Any, Any]:
+    values: dict[Any, Any] = {}
+    for slot in _root_singleton_slots(runtime=runtime):
+        value = getattr(root_resolver, f"_cache_{slot}")
+        if value is not _MISSING_CACHE:
+            values[runtime.dep_type_by_slot[slot]] = value
+    return values
+
+
+def _frozen_values_by_slot(
+    *,
+    runtime: _ResolverRuntime,
+    frozen_values: Mapping[Any, Any],
+) -> dict[int, Any]:
+    return {
+        slot: frozen_values[runtime.dep_type_by_slot[slot]]
+        for slot in _root_singleton_slots(runtime=runtime)
+        if runtime.dep_type_by_slot[slot] in frozen_values
+    }
+
+
+def _inlinable_transient_slots(
+    *,
+    workflows_by_slot: Mapping[int, ProviderWorkflowPlan],
+    max_depth: int,
+    max_nodes: int,
+) -> frozenset[int]:
+    """Return slots whose transient subtree fits the fusion budget.
+
+    A fused subtree only contains uncached, sync, wrapper-free constructor or factory
+    providers that share one scope, so it never crosses a cache, async, scope or cleanup
+    boundary. Nodes reached through several paths are counted once per path because the
+    rendered expression repeats them.
+    """
+    subtree_size_by_slot: dict[int, tuple[int, int] | None] = {}
+
+    def subtree_size(slot: int) -> tuple[int, int] | None:
+        if slot in subtree_size_by_slot:
+            return subtree_size_by_slot[slot]
+
+        workflow = workflows_by_slot[slot]
+        size: tuple[int, int] | None = None
+        if (
+            not workflow.is_cached
+            and not workflow.requires_async
+            and not workflow.is_provider_async
+            and not workflow.provider_is_inject_wrapper
+            and workflow.provider_attribute in {"concrete_type", "factory"}
+        ):
+            node_count = 1
+            depth = 1
+            for dependency_plan in workflow.dependency_plans:
+                if (
+                    dependency_plan.kind == "provider"
+                    and dependency_plan.dependency_slot is not None
+                ):
+                    child_slots: tuple[int, ...] = (dependency_plan.dependency_slot,)
+                elif dependency_plan.kind == "all":
+                    child_slots = dependency_plan.all_slots
+                else:
+                    continue
+                for child_slot in child_slots:
+                    child_size = subtree_size(child_slot)
+                    if (
+                        child_size is None
+                        or workflows_by_slot[child_slot].scope_level != workflow.scope_level
+                    ):
+                        continue
+                    node_count += child_size[0]
+                    depth = max(depth, child_size[1] + 1)
+            size = (node_count, depth)
+
+        subtree_size_by_slot[slot] = size
+        return size
+
+    inlinable_slots: set[int] = set()
+    for slot in workflows_by_slot:
+        size = subtree_size(slot)
+        if size is not None and size[0] <= max_nodes and size[1] <= max_depth:
+            inlinable_slots.add(slot)
+    return frozenset(inlinable_slots)
+
+
+def _all_slots_by_base_key(
+    *,
+    plan: ResolverGenerationPlan,
+    dep_type_by_slot: Mapping[int, Any],
+) -> tuple[dict[Any, tuple[int, ...]], set[Any]]:
+    """Group slots by the key ``All[...]`` collects them under.
+
+    Component-qualified registrations are grouped under their base key, which is also
+    returned in the set of component base keys.
+    """
+    all_slots_by_key: dict[Any, list[int]] = {}
+    component_base_keys: set[Any] = set()
+    for workflow in plan.workflows:
+        normalized_dep_type = strip_non_component_annotation(dep_type_by_slot[workflow.slot])
+        base_key = component_base_key(normalized_dep_type)
+        if base_key is None:
+            base_key = normalized_dep_type
+        else:
+            component_base_keys.add(base_key)
+        all_slots_by_key.setdefault(base_key, []).append(workflow.slot)
+    return {key: tuple(slots) for key, slots in all_slots_by_key.items()}, component_base_keys
+
+
+def _all_collections(
+    *,
+    plan: ResolverGenerationPlan,
+    workflows_by_slot: Mapping[int, ProviderWorkflowPlan],
+    all_slots_by_key: Mapping[Any, tuple[int, ...]],
+    component_base_keys: set[Any],
+) -> tuple[_AllCollection, ...]:
+    """Return the ``All[...]`` collections that get compiled resolution methods.
+
+    Collections are built for keys injected as ``All[...]`` somewhere in the graph and for
+    keys with several or component-qualified implementations. Plain single-registration
+    keys requested directly as ``All[T]`` keep resolving through the dispatch fallback.
+    """
+    injected_slots = {
+        dependency_plan.all_slots
+        for workflow in plan.workflows
+        for dependency_plan in workflow.dependency_plans
+        if dependency_plan.kind == "all" and dependency_plan.all_slots
+    }
+    collections: list[_AllCollection] = []
+    for key, slots in all_slots_by_key.items():
+        if len(slots) == 1 and key not in component_base_keys and slots not in injected_slots:
+            continue
+        folded_prefix_length = 0
+        for slot in slots:
+            workflow = workflows_by_slot[slot]
+            if not (
+                workflow.is_cached and workflow.cache_owner_scope_level == plan.root_scope_level
+            ):
+                break
+            folded_prefix_length += 1
+        collections.append(
+            _AllCollection(
+                index=len(collections),
+                key=key,
+                slots=slots,
+                folded_prefix_length=folded_prefix_length,
+            ),
+        )
+    return tuple(collections)
+
+
+def _all_collection_method_name(*, collection: _AllCollection, is_async: bool) -> str:
+    return f"aresolve_all_{collection.index}" if is_async else f"resolve_all_{collection.index}"
+
+
+def _all_collection_dispatch_tables(
+    *,
+    runtime: _ResolverRuntime,
+    resolver_class: type[Any],
+) -> tuple[dict[Any, Callable[..., Any]], dict[Any, Callable[..., Any]]]:
+    class_namespace = vars(resolver_class)
+    sync_table: dict[Any, Callable[..., Any]] = {}
+    async_table: dict[Any, Callable[..., Any]] = {}
+    for collection in runtime.all_collections:
+        all_key = build_annotated_key(
+            (collection.key, AllMarker(dependency_key=collection.key)),
+        )
+        sync_table[all_key] = class_namespace[
+            _all_collection_method_name(collection=collection, is_async=False)
+        ]
+        async_table[all_key] = class_namespace[
+            _all_collection_method_name(collection=collection, is_async=True)
+        ]
+    return sync_table, async_table
+
+
+def _all_member_async_expressions(
+    *,
+    runtime: _ResolverRuntime,
+    resolver_expression: str,
+    slots: tuple[int, ...],
+) -> list[str]:
+    return [
+        f"_frozen_{slot}"
+        if slot in runtime.frozen_values_by_slot
+        else f"(await {resolver_expression}.aresolve_{slot}())"
+        if runtime.workflows_by_slot[slot].requires_async
+        else f"{resolver_expression}.resolve_{slot}()"
+        for slot in slots
+    ]
+
+
+def _tuple_expression(expressions: Sequence[str]) -> str:
+    if not expressions:
+        return "()"
+    if len(expressions) == 1:
+        return f"({expressions[0]},)"
+    return "(" + ", ".join(expressions) + ")"
+
+
+def _provider_value_lines_for_source(
+    *,
+    workflow: ProviderWorkflowPlan,
+    arguments: str,
+    is_async: bool,
+    records_cleanup_slot: bool = False,
+) -> list[str]:
+    # Instances never reach this helper: they need no call and never require async resolution.
+    provider_call = f"_provider_{workflow.slot}({arguments})"
+    provider_is_async = is_async and workflow.is_provider_async
+    cleanup_slot_lines = (
+        [f"    self._cleanup_slots.append({workflow.slot})"] if records_cleanup_slot else []
+    )
+
+    if workflow.provider_attribute == "generator":
+        # Generators are registered directly with their own cleanup kind so each resolution
+        # avoids allocating a ``contextmanager`` wrapper around the provider.
+        next_call, stop_error, cleanup_kind = (
+            ("await anext(generator)", "StopAsyncIteration", _CLEANUP_KIND_ASYNC_GENERATOR)
+            if provider_is_async
+            else ("next(generator)", "StopIteration", _CLEANUP_KIND_SYNC_GENERATOR)
+        )
+        return [
+            f"generator = {provider_call}",
+            "try:",
+            f"    value = {next_call}",
+            f"except {stop_error}:",
+            '    raise RuntimeError("generator didn\'t yield") from None',
+            "if self._cleanup_enabled:",
+            f"    self._cleanup_callbacks.append(({cleanup_kind}, generator))",
+            *cleanup_slot_lines,
+        ]
+
+    if workflow.provider_attribute == "context_manager":
+        enter_call, exit_attribute, cleanup_kind = (
+            ("await manager.__aenter__()", "__aexit__", 1)
+            if provider_is_async
+            else ("manager.__enter__()", "__exit__", 0)
+        )
+        return [
+            f"manager = {provider_call}",
+            f"value = {enter_call}",
+            "if self._cleanup_enabled:",
+            f"    self._cleanup_callbacks.append(({cleanup_kind}, manager.{exit_attribute}))",
+            *cleanup_slot_lines,
+        ]
+
+    if provider_is_async:
+        return [f"value = await {provider_call}"]
+    return [f"value = {provider_call}"]
+
+
 def _compile_function_from_source(
     *,
     name: str,
     arg_names: tuple[str, ...],
     kwonly_arg_names: tuple[str, ...] = (),
     body_lines: Sequence[str],
-    generated_globals: Mapping[str, Any],
+    generated_globals: dict[str, Any],
+    code_store: ResolverCodeStore | None = None,
     is_async: bool = False,
     defaults: tuple[Any, ...] = (),
     kwonly_defaults: dict[str, Any] | None = None,
@@ -1730,9 +3222,17 @@ def _compile_function_from_source(
     function_keyword = "async def" if is_async else "def"
     rendered_body = "\n".join(f"    {line}" for line in body_lines) if body_lines else "    pass"
     source = f"{function_keyword} {name}({signature}):\n{rendered_body}\n"
-    module_code = compile(source, filename=_FILENAME, mode="exec")
-    function_code = _extract_function_code(module_code=module_code, name=name)
-    function = types.FunctionType(function_code, dict(generated_globals), name=name)
+    digest: str | None = None
+    function_code: CodeType | None = None
+    if code_store is not None:
+        digest = source_digest(source)
+        function_code = code_store.get(digest=digest)
+    if function_code is None:
+        module_code = compile(source, filename=_FILENAME, mode="exec")
+        function_code = _extract_function_code(module_code=module_code, name=name)
+        if code_store is not None and digest is not None:
+            code_store.add(digest=digest, source=source, code=function_code)
+    function = types.FunctionType(function_code, generated_globals, name=name)
     if defaults:
         function.__defaults__ = defaults
     if kwonly_defaults is not None:
@@ -1765,17 +3265,20 @@ def _delegate_scope_lines_for_source(
     runtime: _ResolverRuntime,
     workflow: ProviderWorkflowPlan,
     scope_level: int,
+    is_async: bool = False,
 ) -> list[str]:
     scope = runtime.scopes_by_level[scope_level]
+    call_prefix = "await " if is_async else ""
+    method_name = f"aresolve_{workflow.slot}" if is_async else f"resolve_{workflow.slot}"
     if scope.is_root:
-        return [f"return self.{scope.resolver_attr_name}.resolve_{workflow.slot}()"]
+        return [f"return {call_prefix}self.{scope.resolver_attr_name}.{method_name}()"]
 
     return [
         f"owner_resolver = self.{scope.resolver_attr_name}",
         "if owner_resolver is _MISSING_RESOLVER:",
         f'    msg = "Provider slot {workflow.slot} requires opened scope level {workflow.scope_level}."',
         "    raise DIWireScopeMismatchError(msg)",
-        f"return owner_resolver.resolve_{workflow.slot}()",
+        f"return {call_prefix}owner_resolver.{method_name}()",
     ]
 
 
@@ -1797,14 +3300,16 @@ def _resolver_init(
     self._context = context
     self._parent_context_resolver = parent_context_resolver
     self._active = True
-    if hasattr(self, "_last_sync_dependency"):
-        self._last_sync_dependency = _MISSING_DEP_SLOT
-        self._last_sync_method = None
-        self._last_async_dependency = _MISSING_DEP_SLOT
-        self._last_async_method = None
+    if hasattr(self, "_sync_dispatch_cache"):
+        self._sync_dispatch_cache = _EMPTY_DISPATCH_CACHE
+        self._async_dispatch_cache = _EMPTY_DISPATCH_CACHE
     if runtime.has_cleanup:
         self._cleanup_enabled = cleanup_enabled
         self._cleanup_callbacks = []
+    if runtime.cleanup_dependency_slots_by_slot is not None:
+        self._cleanup_slots = []
+    if _uses_scope_resolver_pool(runtime=runtime):
+        _reset_scope_resolver_pool(self, runtime=runtime, class_plan=class_plan)
     self._owned_scope_resolvers = ()
 
     for scope in runtime.ordered_scopes:
@@ -1837,27 +3342,54 @@ def _resolver_init(
 
     for cache_slot in runtime.cache_slots_by_owner_level.get(class_plan.scope_level, ()):
         setattr(self, f"_cache_{cache_slot}", _MISSING_CACHE)
+    if class_plan.is_root:
+        for collection in runtime.all_collections:
+            if collection.folded_prefix_length:
+                setattr(self, f"_all_cache_{collection.index}", _MISSING_CACHE)
 
     if class_plan.is_root and (runtime.uses_stateless_scope_reuse or not runtime.has_cleanup):
+        _init_reusable_scope_resolvers(self, runtime=runtime, cleanup_enabled=cleanup_enabled)
+
+
+def _init_reusable_scope_resolvers(
+    self: Any,
+    *,
+    runtime: _ResolverRuntime,
+    cleanup_enabled: bool,
+) -> None:
+    for scope in runtime.ordered_scopes:
+        if scope.is_root:
+            continue
+        scope_class = runtime.class_by_level[scope.scope_level]
+        if runtime.has_cleanup:
+            scope_resolver = scope_class(
+                self,
+                cleanup_enabled,
+                None,
+                None,
+            )
+        else:
+            scope_resolver = scope_class(
+                self,
+                None,
+                None,
+            )
+        scope_resolver._active = False
+        setattr(self, f"_scope_resolver_{scope.scope_level}", scope_resolver)
+
+
+def _reset_scope_resolver_pool(
+    self: Any,
+    *,
+    runtime: _ResolverRuntime,
+    class_plan: ScopePlan,
+) -> None:
+    if class_plan.is_root:
         for scope in runtime.ordered_scopes:
-            if scope.is_root:
-                continue
-            scope_class = runtime.class_by_level[scope.scope_level]
-            if runtime.has_cleanup:
-                scope_resolver = scope_class(
-                    self,
-                    cleanup_enabled,
-                    None,
-                    None,
-                )
-            else:
-                scope_resolver = scope_class(
-                    self,
-                    None,
-                    None,
-                )
-            scope_resolver._active = False
-            setattr(self, f"_scope_resolver_{scope.scope_level}", scope_resolver)
+            if not scope.is_root:
+                setattr(self, f"_scope_pool_{scope.scope_level}", [])
+    else:
+        self._scope_pool = None
 
 
 def _resolver_enter_scope(
@@ -2087,194 +3619,1203 @@ def _resolver_exit(
     exc_type: type[BaseException] | None,
     exc_value: BaseException | None,
     traceback: TracebackType | None,
+    cleanup_slots: list[int | None] | None = None,
+) -> None:
+    if cleanup_slots:
+        cleanup_slots.clear()
+    cleanup_error = _run_cleanup_callbacks_sync(
+        self._cleanup_callbacks,
+        exc_type,
+        exc_value,
+        traceback,
+    )
+
+    if self._owned_scope_resolvers:
+        for owned_scope_resolver in reversed(self._owned_scope_resolvers):
+            try:
+                owned_scope_resolver.__exit__(exc_type, exc_value, traceback)
+            except BaseException as error:  # noqa: BLE001
+                if exc_type is None and cleanup_error is None:
+                    cleanup_error = error
+
+    self._active = False
+    if exc_type is None and cleanup_error is not None:
+        raise cleanup_error
+
+
+def _resolver_aexit(
+    self: Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+    cleanup_slots: list[int | None] | None = None,
+) -> Awaitable[None]:
+    async def _run() -> None:
+        cleanup_error = await _run_cleanup_callbacks_async(
+            self._cleanup_callbacks,
+            cleanup_slots=cleanup_slots,
+            cleanup_dependency_slots_by_slot=(
+                type(self)._runtime.cleanup_dependency_slots_by_slot if cleanup_slots else None
+            ),
+            exc_type=exc_type,
+            exc_value=exc_value,
+            traceback=traceback,
+        )
+
+        if self._owned_scope_resolvers:
+            for owned_scope_resolver in reversed(self._owned_scope_resolvers):
+                try:
+                    await owned_scope_resolver.__aexit__(exc_type, exc_value, traceback)
+                except BaseException as error:  # noqa: BLE001
+                    if exc_type is None and cleanup_error is None:
+                        cleanup_error = error
+
+        self._active = False
+        if exc_type is None and cleanup_error is not None:
+            raise cleanup_error
+
+    return _run()
+
+
+def _resolver_exit_deferred(
+    self: Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+    cleanup_slots: list[int | None] | None = None,
 ) -> None:
+    deferred_cleanups = type(self)._runtime.deferred_cleanups
+    children = deferred_cleanups.take_children(self)
+    cleanup_callbacks = self._cleanup_callbacks
+    if cleanup_callbacks:
+        self._cleanup_callbacks = []
+        children = [
+            deferred_cleanups.submit_sync(
+                cleanup_callbacks,
+                exc_type,
+                exc_value,
+                traceback,
+                after=children,
+            ),
+        ]
+    deferred_cleanups.add_children(_deferred_cleanup_parent(self), children)
+    _resolver_exit(self, exc_type, exc_value, traceback, cleanup_slots)
+
+
+def _resolver_aexit_deferred(
+    self: Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+    cleanup_slots: list[int | None] | None = None,
+) -> Awaitable[None]:
+    runtime = type(self)._runtime
+    deferred_cleanups = runtime.deferred_cleanups
+    children = deferred_cleanups.take_children(self)
+    cleanup_callbacks = self._cleanup_callbacks
+    if cleanup_callbacks:
+        self._cleanup_callbacks = []
+        if cleanup_slots is not None:
+            self._cleanup_slots = []
+        children = [
+            deferred_cleanups.submit_async(
+                _run_cleanup_callbacks_async(
+                    cleanup_callbacks,
+                    cleanup_slots=cleanup_slots,
+                    cleanup_dependency_slots_by_slot=runtime.cleanup_dependency_slots_by_slot,
+                    exc_type=exc_type,
+                    exc_value=exc_value,
+                    traceback=traceback,
+                ),
+                after=children,
+            ),
+        ]
+        cleanup_slots = None
+    deferred_cleanups.add_children(_deferred_cleanup_parent(self), children)
+    return _resolver_aexit(self, exc_type, exc_value, traceback, cleanup_slots)
+
+
+def _deferred_cleanup_parent(resolver: Any) -> Any | None:
+    """Return the nearest open non-root ancestor whose deferred cleanup must wait on ours."""
+    runtime = type(resolver)._runtime
+    scope_level = type(resolver)._class_plan.scope_level
+    for scope in reversed(runtime.ordered_scopes):
+        if scope.is_root or scope.scope_level >= scope_level:
+            continue
+        ancestor_resolver = getattr(resolver, scope.resolver_attr_name)
+        if ancestor_resolver is not _MISSING_RESOLVER:
+            return ancestor_resolver
+    return None
+
+
+def _concurrent_future(pending: Future[Any] | asyncio.Future[Any]) -> Future[Any]:
+    if isinstance(pending, Future):
+        return pending
+    bridge: Future[Any] = Future()
+    pending.add_done_callback(lambda _: bridge.set_result(None))
+    return bridge
+
+
+def _run_deferred_cleanup_callbacks_sync(
+    cleanup_callbacks: list[tuple[int, Any]],
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+    *,
+    after: Sequence[Future[Any]],
+) -> BaseException | None:
+    if after:
+        wait(after)
+    return _run_cleanup_callbacks_sync(cleanup_callbacks, exc_type, exc_value, traceback)
+
+
+async def _await_deferred_cleanup(
+    cleanup: Awaitable[BaseException | None],
+    *,
+    after: Sequence[Future[Any] | asyncio.Future[Any]],
+) -> BaseException | None:
+    if after:
+        await asyncio.wait(
+            [
+                asyncio.wrap_future(pending) if isinstance(pending, Future) else pending
+                for pending in after
+            ],
+        )
+    return await cleanup
+
+
+def _run_cleanup_callbacks_sync(
+    cleanup_callbacks: list[tuple[int, Any]],
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> BaseException | None:
     cleanup_error: BaseException | None = None
 
-    while self._cleanup_callbacks:
-        cleanup_kind, cleanup = self._cleanup_callbacks.pop()
-        try:
-            if cleanup_kind == 0:
-                cleanup(exc_type, exc_value, traceback)
-            else:
-                msg = "Cannot execute async cleanup in sync context. Use 'async with'."
-                raise DIWireAsyncDependencyInSyncContextError(msg)
-        except BaseException as error:  # noqa: BLE001
-            if exc_type is None and cleanup_error is None:
-                cleanup_error = error
+    while cleanup_callbacks:
+        cleanup_kind, cleanup = cleanup_callbacks.pop()
+        try:
+            if cleanup_kind == 0:
+                cleanup(exc_type, exc_value, traceback)
+            elif cleanup_kind == _CLEANUP_KIND_SYNC_GENERATOR:
+                _exit_generator(cleanup, exc_type, exc_value, traceback)
+            else:
+                msg = "Cannot execute async cleanup in sync context. Use 'async with'."
+                raise DIWireAsyncDependencyInSyncContextError(msg)
+        except BaseException as error:  # noqa: BLE001
+            if exc_type is None and cleanup_error is None:
+                cleanup_error = error
+    return cleanup_error
+
+
+async def _run_cleanup_callbacks_async(
+    cleanup_callbacks: list[tuple[int, Any]],
+    *,
+    cleanup_slots: list[int | None] | None,
+    cleanup_dependency_slots_by_slot: Mapping[int, frozenset[int]] | None,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> BaseException | None:
+    cleanup_error: BaseException | None = None
+    if cleanup_slots and cleanup_dependency_slots_by_slot is not None:
+        cleanup_error = await _run_concurrent_cleanups(
+            cleanup_callbacks,
+            cleanup_slots=cleanup_slots,
+            cleanup_dependency_slots_by_slot=cleanup_dependency_slots_by_slot,
+            exc_type=exc_type,
+            exc_value=exc_value,
+            traceback=traceback,
+        )
+
+    while cleanup_callbacks:
+        cleanup_kind, cleanup = cleanup_callbacks.pop()
+        try:
+            if cleanup_kind == 0:
+                cleanup(exc_type, exc_value, traceback)
+            elif cleanup_kind == 1:
+                await cleanup(exc_type, exc_value, traceback)
+            elif cleanup_kind == _CLEANUP_KIND_SYNC_GENERATOR:
+                _exit_generator(cleanup, exc_type, exc_value, traceback)
+            else:
+                await _exit_async_generator(cleanup, exc_type, exc_value, traceback)
+        except BaseException as error:  # noqa: BLE001
+            if exc_type is None and cleanup_error is None:
+                cleanup_error = error
+    return cleanup_error
+
+
+async def _run_concurrent_cleanups(
+    cleanup_callbacks: list[tuple[int, Any]],
+    *,
+    cleanup_slots: list[int | None],
+    cleanup_dependency_slots_by_slot: Mapping[int, frozenset[int]],
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> BaseException | None:
+    pending_callbacks = cleanup_callbacks[:]
+    cleanup_callbacks.clear()
+    waves = _cleanup_waves(
+        cleanup_dependency_slots_by_slot=cleanup_dependency_slots_by_slot,
+        cleanup_slots=cleanup_slots,
+    )
+    cleanup_slots.clear()
+    cleanup_error: BaseException | None = None
+    for wave in waves:
+        wave_errors: list[BaseException | None]
+        if len(wave) == 1:
+            wave_errors = [
+                await _run_cleanup(pending_callbacks[wave[0]], exc_type, exc_value, traceback),
+            ]
+        else:
+            try:
+                wave_errors = await asyncio.gather(
+                    *(
+                        _run_cleanup(pending_callbacks[index], exc_type, exc_value, traceback)
+                        for index in wave
+                    ),
+                )
+            except BaseException as gather_error:  # noqa: BLE001
+                wave_errors = [gather_error]
+        # Waves list callbacks newest first, so the first error matches sequential teardown.
+        for wave_error in wave_errors:
+            if wave_error is not None and exc_type is None and cleanup_error is None:
+                cleanup_error = wave_error
+    return cleanup_error
+
+
+def _cleanup_waves(
+    *,
+    cleanup_dependency_slots_by_slot: Mapping[int, frozenset[int]],
+    cleanup_slots: Sequence[int | None],
+) -> list[list[int]]:
+    """Group cleanup callback indexes into waves that may run concurrently.
+
+    A callback runs in a later wave than every newer callback whose provider depends on its
+    provider, shares its slot, or has no recorded slot. Waves list indexes newest first.
+    """
+    wave_by_index: list[int] = [0] * len(cleanup_slots)
+    waves: list[list[int]] = []
+    for index in range(len(cleanup_slots) - 1, -1, -1):
+        slot = cleanup_slots[index]
+        wave_index = 0
+        for newer_index in range(index + 1, len(cleanup_slots)):
+            newer_slot = cleanup_slots[newer_index]
+            if wave_by_index[newer_index] >= wave_index and (
+                slot is None
+                or newer_slot is None
+                or slot == newer_slot
+                or slot in cleanup_dependency_slots_by_slot.get(newer_slot, ())
+            ):
+                wave_index = wave_by_index[newer_index] + 1
+        wave_by_index[index] = wave_index
+        if wave_index == len(waves):
+            waves.append([])
+        waves[wave_index].append(index)
+    return waves
+
+
+async def _run_cleanup(
+    cleanup_callback: tuple[int, Any],
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> BaseException | None:
+    cleanup_kind, cleanup = cleanup_callback
+    try:
+        if cleanup_kind == 0:
+            cleanup(exc_type, exc_value, traceback)
+        elif cleanup_kind == 1:
+            await cleanup(exc_type, exc_value, traceback)
+        elif cleanup_kind == _CLEANUP_KIND_SYNC_GENERATOR:
+            _exit_generator(cleanup, exc_type, exc_value, traceback)
+        else:
+            await _exit_async_generator(cleanup, exc_type, exc_value, traceback)
+    except BaseException as error:  # noqa: BLE001
+        return error
+    return None
+
+
+def _register_cleanup(
+    scope_resolver: Any,
+    cleanup_callback: tuple[int, Any],
+    *,
+    slot: int,
+) -> None:
+    scope_resolver._cleanup_callbacks.append(cleanup_callback)
+    # Only resolvers built with concurrent async cleanup track the slot of each callback.
+    cleanup_slots = getattr(scope_resolver, "_cleanup_slots", None)
+    if cleanup_slots is not None:
+        cleanup_slots.append(slot)
+
+
+def _exit_generator(
+    generator: Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> None:
+    # Mirrors ``contextmanager.__exit__`` for generators registered directly by generated
+    # slot methods, which skip the per-call context-manager wrapper.
+    if exc_type is None:
+        try:
+            next(generator)
+        except StopIteration:
+            return
+        msg = "generator didn't stop"
+        raise RuntimeError(msg)
+
+    error = exc_value if exc_value is not None else exc_type()
+    try:
+        generator.throw(error)
+    except StopIteration:
+        return
+    except BaseException as thrown:
+        if thrown is error:
+            thrown.__traceback__ = traceback
+            return
+        raise
+    msg = "generator didn't stop after throw()"
+    raise RuntimeError(msg)
+
+
+async def _exit_async_generator(
+    generator: Any,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> None:
+    # Async counterpart of ``_exit_generator`` for directly registered async generators.
+    if exc_type is None:
+        try:
+            await anext(generator)
+        except StopAsyncIteration:
+            return
+        msg = "generator didn't stop"
+        raise RuntimeError(msg)
+
+    error = exc_value if exc_value is not None else exc_type()
+    try:
+        await generator.athrow(error)
+    except StopAsyncIteration:
+        return
+    except BaseException as thrown:
+        if thrown is error:
+            thrown.__traceback__ = traceback
+            return
+        raise
+    msg = "generator didn't stop after athrow()"
+    raise RuntimeError(msg)
+
+
+def _resolve_dispatch_fallback_sync(self: Any, dependency: Any) -> Any:
+    if is_maybe_annotation(dependency):
+        inner = strip_maybe_annotation(dependency)
+        if is_provider_annotation(inner):
+            provider_inner = strip_provider_annotation(inner)
+            if is_async_provider_annotation(inner):
+                return lambda: self.aresolve(provider_inner)
+            return lambda: self.resolve(provider_inner)
+
+        if is_from_context_annotation(inner):
+            key = strip_non_component_annotation(strip_from_context_annotation(inner))
+            try:
+                return self._resolve_from_context(key)
+            except DIWireDependencyNotRegisteredError:
+                return None
+
+        if not self._is_registered_dependency(inner):
+            return None
+        try:
+            return self.resolve(inner)
+        except DIWireDependencyNotRegisteredError:
+            normalized_inner = strip_non_component_annotation(inner)
+            if normalized_inner is inner:
+                return None
+            try:
+                return self.resolve(normalized_inner)
+            except DIWireDependencyNotRegisteredError:
+                return None
+
+    if is_provider_annotation(dependency):
+        inner = strip_provider_annotation(dependency)
+        if is_async_provider_annotation(dependency):
+            return lambda: self.aresolve(inner)
+        return lambda: self.resolve(inner)
+
+    if is_from_context_annotation(dependency):
+        key = strip_non_component_annotation(strip_from_context_annotation(dependency))
+        return self._resolve_from_context(key)
+
+    if is_all_annotation(dependency):
+        runtime = type(self)._runtime
+        inner = strip_non_component_annotation(strip_all_annotation(dependency))
+        slots = runtime.all_slots_by_key.get(inner, ())
+        if not slots:
+            return ()
+
+        results: list[Any] = []
+        for slot in slots:
+            results.append(getattr(self, f"resolve_{slot}")())
+        return tuple(results)
+
+    normalized_dependency = strip_non_component_annotation(dependency)
+    if normalized_dependency is not dependency:
+        try:
+            return self.resolve(normalized_dependency)
+        except DIWireDependencyNotRegisteredError:
+            pass
+
+    msg = f"Dependency {dependency!r} is not registered."
+    raise DIWireDependencyNotRegisteredError(msg)
+
+
+def _resolve_dispatch_fallback_async(self: Any, dependency: Any) -> Awaitable[Any]:
+    async def _run() -> Any:
+        if is_maybe_annotation(dependency):
+            inner = strip_maybe_annotation(dependency)
+            if is_provider_annotation(inner):
+                provider_inner = strip_provider_annotation(inner)
+                if is_async_provider_annotation(inner):
+                    return lambda: self.aresolve(provider_inner)
+                return lambda: self.resolve(provider_inner)
+
+            if is_from_context_annotation(inner):
+                key = strip_non_component_annotation(strip_from_context_annotation(inner))
+                try:
+                    return self._resolve_from_context(key)
+                except DIWireDependencyNotRegisteredError:
+                    return None
+
+            if not self._is_registered_dependency(inner):
+                return None
+            try:
+                return await self.aresolve(inner)
+            except DIWireDependencyNotRegisteredError:
+                normalized_inner = strip_non_component_annotation(inner)
+                if normalized_inner is inner:
+                    return None
+                try:
+                    return await self.aresolve(normalized_inner)
+                except DIWireDependencyNotRegisteredError:
+                    return None
+
+        if is_provider_annotation(dependency):
+            inner = strip_provider_annotation(dependency)
+            if is_async_provider_annotation(dependency):
+                return lambda: self.aresolve(inner)
+            return lambda: self.resolve(inner)
+
+        if is_from_context_annotation(dependency):
+            key = strip_non_component_annotation(strip_from_context_annotation(dependency))
+            return self._resolve_from_context(key)
+
+        if is_all_annotation(dependency):
+            runtime = type(self)._runtime
+            inner = strip_non_component_annotation(strip_all_annotation(dependency))
+            slots = runtime.all_slots_by_key.get(inner, ())
+            if not slots:
+                return ()
+
+            results: list[Any] = []
+            for slot in slots:
+                results.append(await getattr(self, f"aresolve_{slot}")())
+            return tuple(results)
+
+        normalized_dependency = strip_non_component_annotation(dependency)
+        if normalized_dependency is not dependency:
+            try:
+                return await self.aresolve(normalized_dependency)
+            except DIWireDependencyNotRegisteredError:
+                pass
+
+        msg = f"Dependency {dependency!r} is not registered."
+        raise DIWireDependencyNotRegisteredError(msg)
+
+    return _run()
+
+
+def _marker_dispatch_names(*, is_async: bool) -> tuple[str, str]:
+    if is_async:
+        return "_async_marker_dispatch_table", "_resolve_marker_dispatch_miss_async"
+    return "_sync_marker_dispatch_table", "_resolve_marker_dispatch_miss_sync"
+
+
+def _marker_dispatch_statements(*, is_async: bool) -> list[ast.stmt]:
+    marker_table_name, miss_function = _marker_dispatch_names(is_async=is_async)
+    marker_handler_call = ast.Call(
+        func=ast.Name(id="marker_handler", ctx=ast.Load()),
+        args=[ast.Name(id="self", ctx=ast.Load())],
+        keywords=[],
+    )
+    miss_call = ast.Call(
+        func=ast.Name(id=miss_function, ctx=ast.Load()),
+        args=[
+            ast.Name(id="self", ctx=ast.Load()),
+            ast.Name(id="dependency", ctx=ast.Load()),
+        ],
+        keywords=[],
+    )
+    return [
+        ast.Assign(
+            targets=[ast.Name(id="marker_handler", ctx=ast.Store())],
+            value=ast.Call(
+                func=ast.Attribute(
+                    value=ast.Name(id=marker_table_name, ctx=ast.Load()),
+                    attr="get",
+                    ctx=ast.Load(),
+                ),
+                args=[ast.Name(id="dependency", ctx=ast.Load())],
+                keywords=[],
+            ),
+        ),
+        ast.If(
+            test=ast.Compare(
+                left=ast.Name(id="marker_handler", ctx=ast.Load()),
+                ops=[ast.IsNot()],
+                comparators=[ast.Constant(value=None)],
+            ),
+            body=[
+                ast.Return(
+                    value=(
+                        ast.Await(value=marker_handler_call) if is_async else marker_handler_call
+                    ),
+                ),
+            ],
+            orelse=[],
+        ),
+        ast.Return(
+            value=ast.Await(value=miss_call) if is_async else miss_call,
+        ),
+    ]
+
+
+def _resolve_marker_dispatch_miss_sync(self: Any, dependency: Any) -> Any:
+    runtime = type(self)._runtime
+    handlers = _marker_key_handlers(runtime=runtime, dependency=dependency)
+    if handlers is None:
+        return _resolve_dispatch_fallback_sync(self, dependency)
+    sync_handler, async_handler = handlers
+    runtime.sync_marker_handlers[dependency] = sync_handler
+    runtime.async_marker_handlers[dependency] = async_handler
+    return sync_handler(self)
+
+
+def _resolve_marker_dispatch_miss_async(self: Any, dependency: Any) -> Awaitable[Any]:
+    runtime = type(self)._runtime
+    handlers = _marker_key_handlers(runtime=runtime, dependency=dependency)
+    if handlers is None:
+        return _resolve_dispatch_fallback_async(self, dependency)
+    sync_handler, async_handler = handlers
+    runtime.sync_marker_handlers[dependency] = sync_handler
+    runtime.async_marker_handlers[dependency] = async_handler
+    return async_handler(self)
+
+
+def _compile_batch_method(
+    self: Any,
+    dependencies: tuple[Any, ...],
+    is_async: bool,
+    concurrent: bool,
+) -> Callable[..., Any]:
+    """Compile and memoize the ``resolve_many`` body for one tuple of dependency keys.
+
+    Registered keys call their slot methods directly; any other key goes through the regular
+    dispatch. With ``concurrent`` set, async slots picked by ``_independent_async_positions``
+    are awaited together. The memo is cleared once it reaches ``_BATCH_METHOD_CACHE_SIZE``
+    entries, so dynamically built key tuples recompile instead of growing it without bound.
+    """
+    runtime = type(self)._runtime
+    slots = tuple(runtime.slot_by_dependency.get(dependency) for dependency in dependencies)
+
+    gathered_positions = (
+        _independent_async_positions(runtime=runtime, slots=slots) if concurrent else set()
+    )
+    gathered_calls: list[str] = []
+    gathered_index_by_position: dict[int, int] = {}
+    for position, slot in enumerate(slots):
+        if position in gathered_positions:
+            gathered_index_by_position[position] = len(gathered_calls)
+            gathered_calls.append(f"self.aresolve_{slot}()")
+    if len(gathered_calls) < 2:  # noqa: PLR2004
+        gathered_index_by_position = {}
+
+    body_lines: list[str] = []
+    if gathered_index_by_position:
+        body_lines.append(f"gathered = await _gather({', '.join(gathered_calls)})")
+    expressions: list[str] = []
+    for position, slot in enumerate(slots):
+        if position in gathered_index_by_position:
+            expressions.append(f"gathered[{gathered_index_by_position[position]}]")
+        elif slot is None:
+            expressions.append(
+                f"(await self.aresolve(dependencies[{position}]))"
+                if is_async
+                else f"self.resolve(dependencies[{position}])",
+            )
+        else:
+            expressions.append(
+                f"(await self.aresolve_{slot}())" if is_async else f"self.resolve_{slot}()",
+            )
+    body_lines.append(f"return {_tuple_expression(expressions)}")
+
+    batch_method = _compile_function_from_source(
+        name="aresolve_batch" if is_async else "resolve_batch",
+        arg_names=("self", "dependencies"),
+        body_lines=body_lines,
+        generated_globals=cast("dict[str, Any]", runtime.generated_globals),
+        is_async=is_async,
+    )
+    if is_async:
+        if len(runtime.async_batch_methods) >= _BATCH_METHOD_CACHE_SIZE:
+            runtime.async_batch_methods.clear()
+        runtime.async_batch_methods[(concurrent, dependencies)] = batch_method
+    else:
+        if len(runtime.sync_batch_methods) >= _BATCH_METHOD_CACHE_SIZE:
+            runtime.sync_batch_methods.clear()
+        runtime.sync_batch_methods[dependencies] = batch_method
+    return batch_method
+
+
+def _independent_async_positions(
+    *,
+    runtime: _ResolverRuntime,
+    slots: Sequence[int | None],
+) -> set[int]:
+    """Pick the positions of async slots that may be awaited together.
+
+    Gathered slots must not share a cached dependency without an async lock, and at most one
+    of them may create cleanup resources so cleanup callbacks keep a deterministic order.
+    """
+    claimed_slots: set[int] = set()
+    has_cleanup_member = False
+    independent_positions: set[int] = set()
+    for position, slot in enumerate(slots):
+        if slot is None or not runtime.workflows_by_slot[slot].requires_async:
+            continue
+        shared_slots = _unlocked_cached_closure(runtime=runtime, slot=slot)
+        needs_cleanup = any(
+            runtime.workflows_by_slot[closure_slot].needs_cleanup
+            for closure_slot in _dependency_closure(runtime=runtime, slot=slot)
+        )
+        if shared_slots & claimed_slots or (needs_cleanup and has_cleanup_member):
+            continue
+        claimed_slots |= shared_slots
+        has_cleanup_member = has_cleanup_member or needs_cleanup
+        independent_positions.add(position)
+    return independent_positions
+
+
+def _unlocked_cached_closure(*, runtime: _ResolverRuntime, slot: int) -> set[int]:
+    # Cached providers without an async lock could be built twice if two tasks reach them.
+    return {
+        closure_slot
+        for closure_slot in _dependency_closure(runtime=runtime, slot=slot)
+        if runtime.workflows_by_slot[closure_slot].is_cached
+        and not runtime.workflows_by_slot[closure_slot].uses_async_lock
+    }
+
+
+def _dependency_closure(*, runtime: _ResolverRuntime, slot: int) -> set[int]:
+    pending = [slot]
+    visited: set[int] = set()
+    while pending:
+        current_slot = pending.pop()
+        if current_slot in visited:
+            continue
+        visited.add(current_slot)
+        workflow = runtime.workflows_by_slot[current_slot]
+        pending.extend(
+            dependency_slot
+            for dependency_slot in workflow.dependency_slots
+            if dependency_slot is not None and dependency_slot >= 0
+        )
+        for dependency_plan in workflow.dependency_plans:
+            pending.extend(dependency_plan.all_slots)
+    return visited
+
+
+def _concurrent_dependency_indexes_by_slot(
+    *,
+    runtime: _ResolverRuntime,
+) -> dict[int, frozenset[int]]:
+    """Pick, per provider, the sibling async dependencies that may be awaited together."""
+    indexes_by_slot: dict[int, frozenset[int]] = {}
+    for workflow in runtime.plan.workflows:
+        if not workflow.requires_async:
+            continue
+        dependency_plans = _dependency_plans_for_workflow(workflow=workflow)
+        gathered_positions = _independent_async_positions(
+            runtime=runtime,
+            slots=[
+                dependency_plan.dependency_slot
+                if dependency_plan.kind == "provider" and dependency_plan.dependency_requires_async
+                else None
+                for dependency_plan in dependency_plans
+            ],
+        )
+        if len(gathered_positions) > 1:
+            indexes_by_slot[workflow.slot] = frozenset(
+                dependency_plans[position].dependency_index for position in gathered_positions
+            )
+    return indexes_by_slot
+
+
+def _uses_scope_resolver_pool(*, runtime: _ResolverRuntime) -> bool:
+    # Graphs without cleanup keep one reusable resolver per scope; stateless graphs share it.
+    return runtime.has_cleanup and not runtime.uses_stateless_scope_reuse
+
+
+def _unreferenced_pooled_refcount() -> int:
+    # Mirrors the generated hand-out: a local bound from ``list.pop`` passed to
+    # ``_getrefcount``, so the count matches whatever the interpreter borrows or owns.
+    pool = [object()]
+    pooled = pool.pop()
+    return _getrefcount(pooled)
+
+
+_getrefcount = sys.getrefcount
+# A pooled scope resolver also references itself through its own scope attribute.
+_POOLED_SCOPE_RESOLVER_FREE_REFCOUNT: Final[int] = _unreferenced_pooled_refcount() + 1
+
+
+def _cache_locks_by_slot(
+    *,
+    plan: ResolverGenerationPlan,
+) -> tuple[
+    dict[int, threading.Lock],
+    dict[int, tuple[threading.Lock, ...]],
+    dict[int, asyncio.Lock],
+    dict[int, tuple[asyncio.Lock, ...]],
+]:
+    # Caches owned by deeper scopes get a stripe of locks picked by resolver identity, so
+    # concurrent scopes rarely contend unless they share a cache.
+    thread_lock_by_slot: dict[int, threading.Lock] = {}
+    thread_lock_stripes_by_slot: dict[int, tuple[threading.Lock, ...]] = {}
+    async_lock_by_slot: dict[int, asyncio.Lock] = {}
+    async_lock_stripes_by_slot: dict[int, tuple[asyncio.Lock, ...]] = {}
+    for workflow in plan.workflows:
+        is_root_cache = workflow.cache_owner_scope_level == plan.root_scope_level
+        # Optimistic sync publication of a scope cache compares and sets under the stripe.
+        publishes_under_stripe = (
+            workflow.uses_optimistic_publish and not workflow.requires_async and not is_root_cache
+        )
+        if workflow.uses_thread_lock and is_root_cache:
+            thread_lock_by_slot[workflow.slot] = threading.Lock()
+        elif workflow.uses_thread_lock or publishes_under_stripe:
+            thread_lock_stripes_by_slot[workflow.slot] = tuple(
+                threading.Lock() for _ in range(_SCOPE_CACHE_LOCK_STRIPES)
+            )
+        if workflow.uses_async_lock and is_root_cache:
+            async_lock_by_slot[workflow.slot] = asyncio.Lock()
+        elif workflow.uses_async_lock:
+            async_lock_stripes_by_slot[workflow.slot] = tuple(
+                asyncio.Lock() for _ in range(_SCOPE_CACHE_LOCK_STRIPES)
+            )
+    return (
+        thread_lock_by_slot,
+        thread_lock_stripes_by_slot,
+        async_lock_by_slot,
+        async_lock_stripes_by_slot,
+    )
+
+
+def _lock_stripe_index(resolver: Any) -> int:
+    # Resolvers are at least 16-byte aligned, so the low address bits carry no information.
+    return id(resolver) >> 4 & (_SCOPE_CACHE_LOCK_STRIPES - 1)
+
+
+def _lock_stripe_expression_for_source(*, workflow: ProviderWorkflowPlan) -> str:
+    # Inlined ``_lock_stripe_index(self)``.
+    return f"_locks_{workflow.slot}[id(self) >> 4 & {_SCOPE_CACHE_LOCK_STRIPES - 1}]"
+
+
+def _optimistic_publish_lines_for_source(
+    *,
+    runtime: _ResolverRuntime,
+    workflow: ProviderWorkflowPlan,
+    store_lines: list[str],
+) -> list[str]:
+    if workflow.cache_owner_scope_level == runtime.root_scope_level:
+        # ``dict.setdefault`` is the compare-and-set: the first value stored under the key is
+        # returned to every racing builder, so the slot writes below all store the winner.
+        return [
+            f'value = self.__dict__.setdefault("_published_{workflow.slot}", value)',
+            *store_lines,
+        ]
+    compare_and_set_lines = [
+        f"cached_value = self._cache_{workflow.slot}",
+        "if cached_value is not _MISSING_CACHE:",
+        "    return cached_value",
+        *store_lines,
+    ]
+    if workflow.slot not in runtime.thread_lock_stripes_by_slot:
+        # Async scope caches are published without an await between the check and the store.
+        return compare_and_set_lines
+    return [
+        f"with {_lock_stripe_expression_for_source(workflow=workflow)}:",
+        *(f"    {line}" for line in compare_and_set_lines),
+    ]
+
+
+def _publish_optimistic_value(
+    *,
+    runtime: _ResolverRuntime,
+    resolver: Any,
+    workflow: ProviderWorkflowPlan,
+    value: Any,
+) -> Any:
+    """Publish ``value`` to the cache of ``workflow`` unless another build got there first.
+
+    Returns the published value, which callers use in place of their own build.
+    """
+    if workflow.cache_owner_scope_level == runtime.root_scope_level:
+        return resolver.__dict__.setdefault(f"_published_{workflow.slot}", value)
+    cache_attr = f"_cache_{workflow.slot}"
+    lock_stripes = runtime.thread_lock_stripes_by_slot.get(workflow.slot)
+    lock = nullcontext() if lock_stripes is None else lock_stripes[_lock_stripe_index(resolver)]
+    with lock:
+        cached_value = getattr(resolver, cache_attr)
+        if cached_value is not _MISSING_CACHE:
+            return cached_value
+        setattr(resolver, cache_attr, value)
+    return value
+
+
+def _cache_lock_for_workflow(
+    *,
+    resolver: Any,
+    workflow: ProviderWorkflowPlan,
+    lock_by_slot: Mapping[int, Any],
+    lock_stripes_by_slot: Mapping[int, tuple[Any, ...]],
+) -> Any:
+    lock = lock_by_slot.get(workflow.slot)
+    if lock is not None:
+        return lock
+    return lock_stripes_by_slot[workflow.slot][_lock_stripe_index(resolver)]
+
+
+def _pooled_scope_level(*, runtime: _ResolverRuntime, class_plan: ScopePlan) -> int | None:
+    # Only resolvers handed out by the root ``enter_scope`` fast path carry a pool.
+    if class_plan.is_root or not _uses_scope_resolver_pool(runtime=runtime):
+        return None
+    return class_plan.scope_level
+
+
+def _cleanup_dependency_slots_by_slot(
+    *,
+    runtime: _ResolverRuntime,
+) -> dict[int, frozenset[int]]:
+    # A cleanup must run before the cleanups of every provider it was built from.
+    return {
+        workflow.slot: frozenset(
+            closure_slot
+            for closure_slot in _dependency_closure(runtime=runtime, slot=workflow.slot)
+            if closure_slot != workflow.slot
+            and runtime.workflows_by_slot[closure_slot].needs_cleanup
+        )
+        for workflow in runtime.plan.workflows
+        if workflow.needs_cleanup
+    }
+
+
+def _gathered_dependency_calls(
+    *,
+    runtime: _ResolverRuntime,
+    workflow: ProviderWorkflowPlan,
+) -> tuple[list[str], dict[int, str]]:
+    gathered_indexes = runtime.concurrent_dependency_indexes_by_slot.get(workflow.slot, ())
+    gathered_calls: list[str] = []
+    gathered_expressions: dict[int, str] = {}
+    for dependency_plan in workflow.dependency_plans:
+        dependency_slot = dependency_plan.dependency_slot
+        if (
+            dependency_plan.dependency_index not in gathered_indexes
+            or dependency_slot is None
+            or dependency_slot in runtime.frozen_values_by_slot
+        ):
+            continue
+        gathered_expressions[dependency_plan.dependency_index] = f"gathered[{len(gathered_calls)}]"
+        gathered_calls.append(f"self.aresolve_{dependency_slot}()")
+    if len(gathered_calls) < 2:  # noqa: PLR2004
+        return [], {}
+    return gathered_calls, gathered_expressions
+
+
+def _marker_key_handlers(
+    *,
+    runtime: _ResolverRuntime,
+    dependency: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]] | None:
+    """Classify a marker key once and build the handlers that replace the dispatch fallback.
+
+    Returns ``None`` for keys the fallback must keep handling on every call, such as keys
+    that are simply not registered.
+    """
+    if is_maybe_annotation(dependency):
+        inner = strip_maybe_annotation(dependency)
+        if is_provider_annotation(inner):
+            return _provider_marker_handlers(dependency=inner)
+        if is_from_context_annotation(inner):
+            return _from_context_marker_handlers(dependency=inner, optional=True)
+        return _maybe_marker_handlers(runtime=runtime, inner=inner)
+
+    if is_provider_annotation(dependency):
+        return _provider_marker_handlers(dependency=dependency)
+
+    if is_from_context_annotation(dependency):
+        return _from_context_marker_handlers(dependency=dependency, optional=False)
+
+    if is_all_annotation(dependency):
+        inner = strip_non_component_annotation(strip_all_annotation(dependency))
+        return _all_marker_handlers(slots=runtime.all_slots_by_key.get(inner, ()))
 
-    if self._owned_scope_resolvers:
-        for owned_scope_resolver in reversed(self._owned_scope_resolvers):
-            try:
-                owned_scope_resolver.__exit__(exc_type, exc_value, traceback)
-            except BaseException as error:  # noqa: BLE001
-                if exc_type is None and cleanup_error is None:
-                    cleanup_error = error
+    normalized_dependency = strip_non_component_annotation(dependency)
+    if (
+        normalized_dependency is dependency
+        or normalized_dependency not in runtime.dep_registered_keys
+    ):
+        return None
+    return _normalized_marker_handlers(
+        dependency=dependency,
+        normalized_dependency=normalized_dependency,
+    )
 
-    self._active = False
-    if exc_type is None and cleanup_error is not None:
-        raise cleanup_error
 
+def _provider_marker_handlers(
+    *,
+    dependency: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]]:
+    inner = strip_provider_annotation(dependency)
+    method_name = "aresolve" if is_async_provider_annotation(dependency) else "resolve"
 
-def _resolver_aexit(
-    self: Any,
-    exc_type: type[BaseException] | None,
-    exc_value: BaseException | None,
-    traceback: TracebackType | None,
-) -> Awaitable[None]:
-    async def _run() -> None:
-        cleanup_error: BaseException | None = None
+    def _provide(self: Any) -> Any:
+        method = getattr(self, method_name)
+        return lambda: method(inner)
 
-        while self._cleanup_callbacks:
-            cleanup_kind, cleanup = self._cleanup_callbacks.pop()
-            try:
-                if cleanup_kind == 0:
-                    cleanup(exc_type, exc_value, traceback)
-                else:
-                    await cleanup(exc_type, exc_value, traceback)
-            except BaseException as error:  # noqa: BLE001
-                if exc_type is None and cleanup_error is None:
-                    cleanup_error = error
+    async def _aprovide(self: Any) -> Any:
+        return _provide(self)
 
-        if self._owned_scope_resolvers:
-            for owned_scope_resolver in reversed(self._owned_scope_resolvers):
-                try:
-                    await owned_scope_resolver.__aexit__(exc_type, exc_value, traceback)
-                except BaseException as error:  # noqa: BLE001
-                    if exc_type is None and cleanup_error is None:
-                        cleanup_error = error
+    return _provide, _aprovide
 
-        self._active = False
-        if exc_type is None and cleanup_error is not None:
-            raise cleanup_error
 
-    return _run()
+def _from_context_marker_handlers(
+    *,
+    dependency: Any,
+    optional: bool,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]]:
+    key = strip_non_component_annotation(strip_from_context_annotation(dependency))
 
+    def _resolve(self: Any) -> Any:
+        if not optional:
+            return self._resolve_from_context(key)
+        try:
+            return self._resolve_from_context(key)
+        except DIWireDependencyNotRegisteredError:
+            return None
 
-def _resolve_dispatch_fallback_sync(self: Any, dependency: Any) -> Any:
-    if is_maybe_annotation(dependency):
-        inner = strip_maybe_annotation(dependency)
-        if is_provider_annotation(inner):
-            provider_inner = strip_provider_annotation(inner)
-            if is_async_provider_annotation(inner):
-                return lambda: self.aresolve(provider_inner)
-            return lambda: self.resolve(provider_inner)
+    async def _aresolve(self: Any) -> Any:
+        return _resolve(self)
 
-        if is_from_context_annotation(inner):
-            key = strip_non_component_annotation(strip_from_context_annotation(inner))
-            try:
-                return self._resolve_from_context(key)
-            except DIWireDependencyNotRegisteredError:
-                return None
+    return _resolve, _aresolve
 
-        if not self._is_registered_dependency(inner):
+
+def _maybe_marker_handlers(
+    *,
+    runtime: _ResolverRuntime,
+    inner: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]]:
+    if inner in runtime.dep_registered_keys:
+        target = inner
+    else:
+        target = strip_non_component_annotation(inner)
+        if target is inner or target not in runtime.dep_registered_keys:
+            return _missing_maybe_resolve, _missing_maybe_aresolve
+
+    def _resolve(self: Any) -> Any:
+        try:
+            return self.resolve(target)
+        except DIWireDependencyNotRegisteredError:
             return None
+
+    async def _aresolve(self: Any) -> Any:
         try:
-            return self.resolve(inner)
+            return await self.aresolve(target)
         except DIWireDependencyNotRegisteredError:
-            normalized_inner = strip_non_component_annotation(inner)
-            if normalized_inner is inner:
-                return None
-            try:
-                return self.resolve(normalized_inner)
-            except DIWireDependencyNotRegisteredError:
-                return None
+            return None
 
-    if is_provider_annotation(dependency):
-        inner = strip_provider_annotation(dependency)
-        if is_async_provider_annotation(dependency):
-            return lambda: self.aresolve(inner)
-        return lambda: self.resolve(inner)
+    return _resolve, _aresolve
 
-    if is_from_context_annotation(dependency):
-        key = strip_non_component_annotation(strip_from_context_annotation(dependency))
-        return self._resolve_from_context(key)
 
-    if is_all_annotation(dependency):
-        runtime = type(self)._runtime
-        inner = strip_non_component_annotation(strip_all_annotation(dependency))
-        slots = runtime.all_slots_by_key.get(inner, ())
-        if not slots:
-            return ()
+def _missing_maybe_resolve(_self: Any) -> None:
+    return None
+
+
+async def _missing_maybe_aresolve(_self: Any) -> None:
+    return None
 
+
+def _all_marker_handlers(
+    *,
+    slots: tuple[int, ...],
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]]:
+    sync_method_names = tuple(f"resolve_{slot}" for slot in slots)
+    async_method_names = tuple(f"aresolve_{slot}" for slot in slots)
+
+    def _resolve(self: Any) -> tuple[Any, ...]:
+        return tuple(getattr(self, method_name)() for method_name in sync_method_names)
+
+    async def _aresolve(self: Any) -> tuple[Any, ...]:
         results: list[Any] = []
-        for slot in slots:
-            results.append(getattr(self, f"resolve_{slot}")())
+        for method_name in async_method_names:
+            results.append(await getattr(self, method_name)())
         return tuple(results)
 
-    normalized_dependency = strip_non_component_annotation(dependency)
-    if normalized_dependency is not dependency:
+    return _resolve, _aresolve
+
+
+def _normalized_marker_handlers(
+    *,
+    dependency: Any,
+    normalized_dependency: Any,
+) -> tuple[Callable[[Any], Any], Callable[[Any], Awaitable[Any]]]:
+    msg = f"Dependency {dependency!r} is not registered."
+
+    def _resolve(self: Any) -> Any:
         try:
             return self.resolve(normalized_dependency)
         except DIWireDependencyNotRegisteredError:
-            pass
-
-    msg = f"Dependency {dependency!r} is not registered."
-    raise DIWireDependencyNotRegisteredError(msg)
+            raise DIWireDependencyNotRegisteredError(msg) from None
 
+    async def _aresolve(self: Any) -> Any:
+        try:
+            return await self.aresolve(normalized_dependency)
+        except DIWireDependencyNotRegisteredError:
+            raise DIWireDependencyNotRegisteredError(msg) from None
 
-def _resolve_dispatch_fallback_async(self: Any, dependency: Any) -> Awaitable[Any]:
-    async def _run() -> Any:
-        if is_maybe_annotation(dependency):
-            inner = strip_maybe_annotation(dependency)
-            if is_provider_annotation(inner):
-                provider_inner = strip_provider_annotation(inner)
-                if is_async_provider_annotation(inner):
-                    return lambda: self.aresolve(provider_inner)
-                return lambda: self.resolve(provider_inner)
+    return _resolve, _aresolve
 
-            if is_from_context_annotation(inner):
-                key = strip_non_component_annotation(strip_from_context_annotation(inner))
-                try:
-                    return self._resolve_from_context(key)
-                except DIWireDependencyNotRegisteredError:
-                    return None
 
-            if not self._is_registered_dependency(inner):
-                return None
-            try:
-                return await self.aresolve(inner)
-            except DIWireDependencyNotRegisteredError:
-                normalized_inner = strip_non_component_annotation(inner)
-                if normalized_inner is inner:
-                    return None
-                try:
-                    return await self.aresolve(normalized_inner)
-                except DIWireDependencyNotRegisteredError:
-                    return None
+def _build_lazy_slot_method(
+    *,
+    method_name: str,
+    slot: int,
+    is_async: bool,
+    runtime: _ResolverRuntime,
+    compile_method: Callable[..., Callable[..., Any]],
+    generated_globals: dict[str, Any],
+    lock: threading.Lock,
+    lazy_methods: Mapping[str, Callable[..., Any]],
+) -> Callable[[Any], Any]:
+    def _compile_on_first_call(self: Any) -> Any:
+        resolver_class = type(self)
+        with lock:
+            if vars(resolver_class)[method_name] is _compile_on_first_call:
+                _install_lazy_closure_methods(
+                    resolver_class=resolver_class,
+                    slot=slot,
+                    is_async=is_async,
+                    runtime=runtime,
+                    compile_method=compile_method,
+                    generated_globals=generated_globals,
+                    lazy_methods=lazy_methods,
+                )
+        return vars(resolver_class)[method_name](self)
 
-        if is_provider_annotation(dependency):
-            inner = strip_provider_annotation(dependency)
-            if is_async_provider_annotation(dependency):
-                return lambda: self.aresolve(inner)
-            return lambda: self.resolve(inner)
+    _compile_on_first_call.__name__ = method_name
+    _compile_on_first_call.__qualname__ = method_name
+    return _compile_on_first_call
 
-        if is_from_context_annotation(dependency):
-            key = strip_non_component_annotation(strip_from_context_annotation(dependency))
-            return self._resolve_from_context(key)
 
-        if is_all_annotation(dependency):
-            runtime = type(self)._runtime
-            inner = strip_non_component_annotation(strip_all_annotation(dependency))
-            slots = runtime.all_slots_by_key.get(inner, ())
-            if not slots:
-                return ()
+def _install_lazy_closure_methods(
+    *,
+    resolver_class: type[Any],
+    slot: int,
+    is_async: bool,
+    runtime: _ResolverRuntime,
+    compile_method: Callable[..., Callable[..., Any]],
+    generated_globals: dict[str, Any],
+    lazy_methods: Mapping[str, Callable[..., Any]],
+) -> None:
+    # Compiling the whole closure up front keeps a cold resolve of a deep chain at one frame
+    # per level; compiling only the called slot would stack a stub frame under every method.
+    class_plan = resolver_class._class_plan
+    method_prefix = "aresolve_" if is_async else "resolve_"
+    dispatch_table = generated_globals.get(
+        f"{'_async_dispatch_table_' if is_async else '_sync_dispatch_table_'}"
+        f"{class_plan.scope_level}",
+    )
+    for closure_slot in sorted(_dependency_closure(runtime=runtime, slot=slot)):
+        method_name = f"{method_prefix}{closure_slot}"
+        stub = lazy_methods.get(method_name)
+        if stub is None or vars(resolver_class).get(method_name) is not stub:
+            continue
+        method = compile_method(
+            workflow=runtime.workflows_by_slot[closure_slot],
+            class_plan=class_plan,
+            is_async=is_async,
+        )
+        setattr(resolver_class, method_name, method)
+        dependency = runtime.dep_type_by_slot[closure_slot]
+        if dispatch_table is not None and dispatch_table.get(dependency) is stub:
+            dispatch_table[dependency] = method
 
-            results: list[Any] = []
-            for slot in slots:
-                results.append(await getattr(self, f"aresolve_{slot}")())
-            return tuple(results)
 
-        normalized_dependency = strip_non_component_annotation(dependency)
-        if normalized_dependency is not dependency:
-            try:
-                return await self.aresolve(normalized_dependency)
-            except DIWireDependencyNotRegisteredError:
-                pass
+def _rebound_slot_methods(
+    *,
+    workflows: tuple[ProviderWorkflowPlan, ...],
+    previous_runtime: _ResolverRuntime,
+    class_plan: ScopePlan,
+    generated_globals: dict[str, Any],
+    rebound_methods: dict[CodeType, Callable[..., Any]],
+) -> dict[str, Callable[..., Any]]:
+    previous_namespace = vars(previous_runtime.class_by_level[class_plan.scope_level])
+    methods: dict[str, Callable[..., Any]] = {}
+    for workflow in workflows:
+        for method_name in (f"resolve_{workflow.slot}", f"aresolve_{workflow.slot}"):
+            previous_method = previous_namespace[method_name]
+            if previous_method.__globals__ is not previous_runtime.generated_globals:
+                # Still a lazy stub in the previous build: nothing compiled to carry over.
+                continue
+            method = rebound_methods.get(previous_method.__code__)
+            if method is None:
+                method = types.FunctionType(
+                    previous_method.__code__,
+                    generated_globals,
+                    name=method_name,
+                )
+                rebound_methods[previous_method.__code__] = method
+            methods[method_name] = method
+    return methods
 
-        msg = f"Dependency {dependency!r} is not registered."
-        raise DIWireDependencyNotRegisteredError(msg)
 
-    return _run()
+def _adopt_previous_root_state(
+    *,
+    runtime: _ResolverRuntime,
+    root_resolver: Any,
+    previous_runtime: _ResolverRuntime,
+    previous_root_resolver: Any,
+) -> None:
+    if not previous_root_resolver._active:
+        return
+    for slot in runtime.cache_slots_by_owner_level.get(runtime.root_scope_level, ()):
+        if previous_runtime.workflows_by_slot.get(slot) is runtime.workflows_by_slot[slot]:
+            cache_attr = f"_cache_{slot}"
+            setattr(root_resolver, cache_attr, getattr(previous_root_resolver, cache_attr))
+    # Resources created by the replaced resolver are released when this one closes, even
+    # when their slot changed and its cached value is not carried over.
+    if runtime.has_cleanup and previous_runtime.has_cleanup:
+        if runtime.cleanup_dependency_slots_by_slot is not None:
+            # Slots of the replaced graph do not match this one, so adopted callbacks keep
+            # their sequential order.
+            root_resolver._cleanup_slots.extend(
+                [None] * len(previous_root_resolver._cleanup_callbacks),
+            )
+        root_resolver._cleanup_callbacks.extend(previous_root_resolver._cleanup_callbacks)
+        previous_root_resolver._cleanup_callbacks.clear()
+        if previous_runtime.cleanup_dependency_slots_by_slot is not None:
+            previous_root_resolver._cleanup_slots.clear()
 
 
 def _build_sync_slot_impl(*, workflow: ProviderWorkflowPlan) -> Callable[[Any], Any]:
@@ -2327,7 +4868,12 @@ def _build_sync_slot_impl(*, workflow: ProviderWorkflowPlan) -> Callable[[Any],
             if cached_value is not _MISSING_CACHE:
                 return cached_value
 
-            lock = runtime.thread_lock_by_slot[workflow.slot]
+            lock = _cache_lock_for_workflow(
+                resolver=self,
+                workflow=workflow,
+                lock_by_slot=runtime.thread_lock_by_slot,
+                lock_stripes_by_slot=runtime.thread_lock_stripes_by_slot,
+            )
             with lock:
                 cached_value = getattr(self, cache_attr)
                 if cached_value is not _MISSING_CACHE:
@@ -2357,6 +4903,13 @@ def _build_sync_slot_impl(*, workflow: ProviderWorkflowPlan) -> Callable[[Any],
                     workflow=workflow,
                     provider_scope_resolver=provider_scope_resolver,
                 )
+                if workflow.uses_optimistic_publish:
+                    value = _publish_optimistic_value(
+                        runtime=runtime,
+                        resolver=self,
+                        workflow=workflow,
+                        value=value,
+                    )
                 _replace_sync_cache(
                     runtime=runtime,
                     resolver=self,
@@ -2432,7 +4985,12 @@ def _build_async_slot_impl(*, workflow: ProviderWorkflowPlan) -> Callable[[Any],
             if cached_value is not _MISSING_CACHE:
                 return cached_value
 
-            lock = runtime.async_lock_by_slot[workflow.slot]
+            lock = _cache_lock_for_workflow(
+                resolver=self,
+                workflow=workflow,
+                lock_by_slot=runtime.async_lock_by_slot,
+                lock_stripes_by_slot=runtime.async_lock_stripes_by_slot,
+            )
             async with lock:
                 cached_value = getattr(self, cache_attr)
                 if cached_value is not _MISSING_CACHE:
@@ -2462,6 +5020,13 @@ def _build_async_slot_impl(*, workflow: ProviderWorkflowPlan) -> Callable[[Any],
                     workflow=workflow,
                     provider_scope_resolver=provider_scope_resolver,
                 )
+                if workflow.uses_optimistic_publish:
+                    value = _publish_optimistic_value(
+                        runtime=runtime,
+                        resolver=self,
+                        workflow=workflow,
+                        value=value,
+                    )
                 _replace_async_cache(
                     runtime=runtime,
                     resolver=self,
@@ -2537,7 +5102,11 @@ def _build_local_value_sync(
                 argument_parts=argument_parts,
             )
             value = provider_cm.__enter__()
-            provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+            _register_cleanup(
+                provider_scope_resolver,
+                (0, provider_cm.__exit__),
+                slot=workflow.slot,
+            )
             return value
 
         provider_gen = _call_provider(callable_obj=provider, argument_parts=argument_parts)
@@ -2557,7 +5126,11 @@ def _build_local_value_sync(
 
         value = provider_cm.__enter__()
         if resolver._cleanup_enabled:
-            provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+            _register_cleanup(
+                provider_scope_resolver,
+                (0, provider_cm.__exit__),
+                slot=workflow.slot,
+            )
         return value
 
     msg = f"Unsupported provider attribute {workflow.provider_attribute!r}."
@@ -2612,7 +5185,11 @@ def _build_local_value_async(
                         argument_parts=argument_parts,
                     )
                     value = await provider_cm.__aenter__()
-                    provider_scope_resolver._cleanup_callbacks.append((1, provider_cm.__aexit__))
+                    _register_cleanup(
+                        provider_scope_resolver,
+                        (1, provider_cm.__aexit__),
+                        slot=workflow.slot,
+                    )
                     return value
 
                 provider_gen = _call_provider(callable_obj=provider, argument_parts=argument_parts)
@@ -2624,7 +5201,11 @@ def _build_local_value_async(
                     argument_parts=argument_parts,
                 )
                 value = provider_cm.__enter__()
-                provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+                _register_cleanup(
+                    provider_scope_resolver,
+                    (0, provider_cm.__exit__),
+                    slot=workflow.slot,
+                )
                 return value
 
             provider_gen = _call_provider(callable_obj=provider, argument_parts=argument_parts)
@@ -2638,12 +5219,20 @@ def _build_local_value_async(
             if workflow.is_provider_async:
                 value = await provider_cm.__aenter__()
                 if resolver._cleanup_enabled:
-                    provider_scope_resolver._cleanup_callbacks.append((1, provider_cm.__aexit__))
+                    _register_cleanup(
+                        provider_scope_resolver,
+                        (1, provider_cm.__aexit__),
+                        slot=workflow.slot,
+                    )
                 return value
 
             value = provider_cm.__enter__()
             if resolver._cleanup_enabled:
-                provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+                _register_cleanup(
+                    provider_scope_resolver,
+                    (0, provider_cm.__exit__),
+                    slot=workflow.slot,
+                )
             return value
 
         msg = f"Unsupported provider attribute {workflow.provider_attribute!r}."
@@ -2682,7 +5271,11 @@ def _build_local_value_sync_no_arguments(
         if resolver._cleanup_enabled:
             provider_cm = contextmanager(provider)()
             value = provider_cm.__enter__()
-            provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+            _register_cleanup(
+                provider_scope_resolver,
+                (0, provider_cm.__exit__),
+                slot=workflow.slot,
+            )
             return value
 
         provider_gen = provider()
@@ -2700,7 +5293,11 @@ def _build_local_value_sync_no_arguments(
             raise DIWireAsyncDependencyInSyncContextError(msg)
         value = provider_cm.__enter__()
         if resolver._cleanup_enabled:
-            provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+            _register_cleanup(
+                provider_scope_resolver,
+                (0, provider_cm.__exit__),
+                slot=workflow.slot,
+            )
         return value
 
     msg = f"Unsupported provider attribute {workflow.provider_attribute!r}."
@@ -2729,8 +5326,10 @@ def _build_local_value_async_no_arguments(
                 if resolver._cleanup_enabled:
                     provider_async_cm = asynccontextmanager(provider)()
                     value = await provider_async_cm.__aenter__()
-                    provider_scope_resolver._cleanup_callbacks.append(
-                        (1, provider_async_cm.__aexit__)
+                    _register_cleanup(
+                        provider_scope_resolver,
+                        (1, provider_async_cm.__aexit__),
+                        slot=workflow.slot,
                     )
                     return value
                 provider_async_gen = provider()
@@ -2739,7 +5338,11 @@ def _build_local_value_async_no_arguments(
             if resolver._cleanup_enabled:
                 provider_sync_cm = contextmanager(provider)()
                 value = provider_sync_cm.__enter__()
-                provider_scope_resolver._cleanup_callbacks.append((0, provider_sync_cm.__exit__))
+                _register_cleanup(
+                    provider_scope_resolver,
+                    (0, provider_sync_cm.__exit__),
+                    slot=workflow.slot,
+                )
                 return value
 
             provider_sync_gen = provider()
@@ -2753,12 +5356,20 @@ def _build_local_value_async_no_arguments(
             if workflow.is_provider_async:
                 value = await provider_cm.__aenter__()
                 if resolver._cleanup_enabled:
-                    provider_scope_resolver._cleanup_callbacks.append((1, provider_cm.__aexit__))
+                    _register_cleanup(
+                        provider_scope_resolver,
+                        (1, provider_cm.__aexit__),
+                        slot=workflow.slot,
+                    )
                 return value
 
             value = provider_cm.__enter__()
             if resolver._cleanup_enabled:
-                provider_scope_resolver._cleanup_callbacks.append((0, provider_cm.__exit__))
+                _register_cleanup(
+                    provider_scope_resolver,
+                    (0, provider_cm.__exit__),
+                    slot=workflow.slot,
+                )
             return value
 
         msg = f"Unsupported provider attribute {workflow.provider_attribute!r}."
@@ -2842,6 +5453,12 @@ def _build_argument_parts_async(
         argument_parts: list[_ArgumentPart] = []
         prefer_positional = workflow.dependency_order_is_signature_order
         skip_positional_only = False
+        gathered_values = await _gather_dependency_values_async(
+            runtime=runtime,
+            resolver=resolver,
+            workflow=workflow,
+            dependency_plans=dependency_plans,
+        )
 
         for dependency_plan in dependency_plans:
             dependency = dependency_plan.dependency
@@ -2850,11 +5467,14 @@ def _build_argument_parts_async(
             if skip_positional_only and parameter_kind is inspect.Parameter.POSITIONAL_ONLY:
                 continue
 
-            value = await _resolve_dependency_value_async(
-                runtime=runtime,
-                resolver=resolver,
-                dependency_plan=dependency_plan,
-            )
+            if dependency_plan.dependency_index in gathered_values:
+                value = gathered_values[dependency_plan.dependency_index]
+            else:
+                value = await _resolve_dependency_value_async(
+                    runtime=runtime,
+                    resolver=resolver,
+                    dependency_plan=dependency_plan,
+                )
 
             if value is _OMIT_ARGUMENT:
                 if parameter_kind in {
@@ -2884,6 +5504,37 @@ def _build_argument_parts_async(
     return _run()
 
 
+async def _gather_dependency_values_async(
+    *,
+    runtime: _ResolverRuntime,
+    resolver: Any,
+    workflow: ProviderWorkflowPlan,
+    dependency_plans: tuple[ProviderDependencyPlan, ...],
+) -> dict[int, Any]:
+    gathered_indexes = runtime.concurrent_dependency_indexes_by_slot.get(workflow.slot)
+    if not gathered_indexes:
+        return {}
+    gathered_plans = [
+        dependency_plan
+        for dependency_plan in dependency_plans
+        if dependency_plan.dependency_index in gathered_indexes
+    ]
+    values = await asyncio.gather(
+        *(
+            _resolve_dependency_value_async(
+                runtime=runtime,
+                resolver=resolver,
+                dependency_plan=dependency_plan,
+            )
+            for dependency_plan in gathered_plans
+        ),
+    )
+    return {
+        dependency_plan.dependency_index: value
+        for dependency_plan, value in zip(gathered_plans, values, strict=True)
+    }
+
+
 def _resolve_dependency_value_sync(
     *,
     runtime: _ResolverRuntime,
@@ -2917,6 +5568,10 @@ def _resolve_dependency_value_sync(
     if dependency_plan.kind == "all":
         if not dependency_plan.all_slots:
             return ()
+        collection = runtime.all_collection_by_slots.get(dependency_plan.all_slots)
+        if collection is not None and collection.folded_prefix_length:
+            method_name = _all_collection_method_name(collection=collection, is_async=False)
+            return getattr(resolver, method_name)()
 
         values: list[Any] = []
         for slot in dependency_plan.all_slots:
@@ -2976,6 +5631,10 @@ def _resolve_dependency_value_async(
         if dependency_plan.kind == "all":
             if not dependency_plan.all_slots:
                 return ()
+            collection = runtime.all_collection_by_slots.get(dependency_plan.all_slots)
+            if collection is not None and collection.folded_prefix_length:
+                method_name = _all_collection_method_name(collection=collection, is_async=True)
+                return await getattr(resolver, method_name)()
 
             values: list[Any] = []
             for slot in dependency_plan.all_slots:
@@ -3248,7 +5907,11 @@ def _owner_resolver_for_scope(
 
 
 def _raise_scope_mismatch(*, workflow: ProviderWorkflowPlan) -> None:
-    msg = f"Provider slot {workflow.slot} requires opened scope level {workflow.scope_level}."
+    _raise_scope_mismatch_for_slot(workflow.slot, workflow.scope_level)
+
+
+def _raise_scope_mismatch_for_slot(slot: int, scope_level: int) -> NoReturn:
+    msg = f"Provider slot {slot} requires opened scope level {scope_level}."
     raise DIWireScopeMismatchError(msg)
 
 
@@ -3302,17 +5965,17 @@ def _dispatch_workflows(
     )
 
 
-def _dispatch_cache_enabled_for_class(
-    *,
-    plan: ResolverGenerationPlan,
-    class_plan: ScopePlan,
-) -> bool:
+def _dispatch_cache_enabled(*, plan: ResolverGenerationPlan) -> bool:
+    workflow_count = len(plan.workflows)
     return (
-        len(_dispatch_workflows(plan=plan, class_plan=class_plan))
-        >= _DISPATCH_CACHE_WORKFLOW_THRESHOLD
+        _DISPATCH_CACHE_WORKFLOW_THRESHOLD <= workflow_count < (_HASHED_DISPATCH_WORKFLOW_THRESHOLD)
     )
 
 
+def _hashed_dispatch_enabled(*, plan: ResolverGenerationPlan) -> bool:
+    return len(plan.workflows) >= _HASHED_DISPATCH_WORKFLOW_THRESHOLD
+
+
 def _unique_ordered(values: list[str]) -> list[str]:
     seen: set[str] = set()
     unique_values: list[str] = []
@@ -196,6 +196,7 @@ class ProviderWorkflowPlan:
     async_arguments: tuple[str, ...]
     provider_is_inject_wrapper: bool = False
     dependency_plans: tuple[ProviderDependencyPlan, ...] = ()
+    uses_optimistic_publish: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -224,12 +225,24 @@ class ResolverGenerationPlanner:
         *,
         root_scope: BaseScope,
         registrations: ProvidersRegistrations,
+        previous_plan: ResolverGenerationPlan | None = None,
     ) -> None:
+        """Collect provider specs and the graph-wide facts their workflows depend on.
+
+        Args:
+            root_scope: Root scope the resolver is planned for.
+            registrations: Provider registrations to plan.
+            previous_plan: Plan of an earlier build of the same container. Workflows whose
+                spec and transitive dependencies are unchanged are reused as-is.
+
+        """
         self._root_scope = root_scope
         self._registrations = registrations
         self._managed_scopes = validate_resolver_assembly_managed_scopes(root_scope=root_scope)
         self._work_specs = self._collect_specs()
+        self._has_async_specs = any(spec.is_async for spec in self._work_specs)
         self._all_slots_by_key = self._build_all_slots_by_key()
+        self._reusable_workflows = self._collect_reusable_workflows(previous_plan=previous_plan)
         self._requires_async_by_slot = self._build_requires_async_by_slot()
         self._max_required_scope_level_by_slot = self._build_max_required_scope_level_by_slot()
 
@@ -241,10 +254,11 @@ class ResolverGenerationPlanner:
         # - hot path avoids reflective dispatch or dynamic attribute lookup helpers.
         scopes = self._build_scope_plans()
         scope_by_level = {scope.scope_level: scope for scope in scopes}
-        has_async_specs = any(spec.is_async for spec in self._work_specs)
+        has_async_specs = self._has_async_specs
 
         workflows = tuple(
-            self._build_workflow_plan(
+            self._reusable_workflows.get(spec.slot)
+            or self._build_workflow_plan(
                 spec=spec,
                 scope_by_level=scope_by_level,
                 has_async_specs=has_async_specs,
@@ -260,7 +274,7 @@ class ResolverGenerationPlanner:
         effective_mode_counter = Counter(workflow.effective_lock_mode for workflow in workflows)
         effective_mode_counts = tuple(
             (mode, effective_mode_counter.get(mode, 0))
-            for mode in (LockMode.THREAD, LockMode.ASYNC, LockMode.NONE)
+            for mode in (LockMode.THREAD, LockMode.ASYNC, LockMode.NONE, LockMode.OPTIMISTIC)
         )
         identity_dispatch_slots = tuple(
             workflow.slot for workflow in workflows if workflow.dispatch_kind == "identity"
@@ -292,6 +306,89 @@ class ResolverGenerationPlanner:
         ]
         return tuple(sorted(specs, key=lambda item: item.slot))
 
+    def _collect_reusable_workflows(
+        self,
+        *,
+        previous_plan: ResolverGenerationPlan | None,
+    ) -> dict[int, ProviderWorkflowPlan]:
+        if (
+            previous_plan is None
+            or previous_plan.root_scope_level != self._root_scope.level
+            or previous_plan.has_async_specs != self._has_async_specs
+        ):
+            return {}
+
+        spec_by_slot = {spec.slot: spec for spec in self._work_specs}
+        candidates: dict[int, ProviderWorkflowPlan] = {}
+        for workflow in previous_plan.workflows:
+            spec = spec_by_slot.get(workflow.slot)
+            if (
+                spec is not None
+                and self._workflow_matches_spec(workflow=workflow, spec=spec)
+                and all(
+                    self._dependency_plan_is_current(spec=spec, dependency_plan=dependency_plan)
+                    for dependency_plan in workflow.dependency_plans
+                )
+            ):
+                candidates[workflow.slot] = workflow
+
+        # A workflow embeds facts about its whole dependency closure (async-ness, scope
+        # depth, fused constructor expressions), so staleness spreads to every dependent.
+        dependents_by_slot: dict[int, list[int]] = {}
+        for workflow in candidates.values():
+            for dependency_slot in _planned_dependency_slots(workflow=workflow):
+                dependents_by_slot.setdefault(dependency_slot, []).append(workflow.slot)
+        stale_slots = [
+            workflow.slot for workflow in previous_plan.workflows if workflow.slot not in candidates
+        ]
+        while stale_slots:
+            stale_slots.extend(
+                dependent_slot
+                for dependent_slot in dependents_by_slot.pop(stale_slots.pop(), ())
+                if candidates.pop(dependent_slot, None) is not None
+            )
+        return candidates
+
+    def _workflow_matches_spec(self, *, workflow: ProviderWorkflowPlan, spec: ProviderSpec) -> bool:
+        return (
+            workflow.provider_attribute == self._resolve_provider_attribute(spec=spec)
+            and workflow.provider_reference is getattr(spec, workflow.provider_attribute)
+            and workflow.provides == spec.provides
+            and workflow.lifetime is spec.lifetime
+            and workflow.scope_level == spec.scope.level
+            and workflow.lock_mode == spec.lock_mode
+            and workflow.is_provider_async == spec.is_async
+            and workflow.needs_cleanup == spec.needs_cleanup
+            and workflow.dependencies == tuple(spec.dependencies)
+        )
+
+    def _dependency_plan_is_current(
+        self,
+        *,
+        spec: ProviderSpec,
+        dependency_plan: ProviderDependencyPlan,
+    ) -> bool:
+        dependency = dependency_plan.dependency
+        if dependency_plan.kind == "context":
+            return True
+        if dependency_plan.kind == "provider_handle":
+            _, dependency_key = self._split_maybe_dependency(dependency.provides)
+            inner_spec = self._find_registered_dependency_spec(
+                strip_provider_annotation(dependency_key),
+            )
+            return inner_spec is not None and inner_spec.slot == dependency_plan.provider_inner_slot
+        planned_slots = (
+            dependency_plan.all_slots
+            if dependency_plan.kind == "all"
+            else (dependency_plan.dependency_slot,)
+            if dependency_plan.dependency_slot is not None
+            else ()
+        )
+        return planned_slots == self._dependency_slots_for_graph(
+            dependency=dependency,
+            requiring_provider=spec.provides,
+        )
+
     def _build_scope_plans(self) -> tuple[ScopePlan, ...]:
         ordered_scopes = sorted(self._managed_scopes, key=lambda scope: scope.level)
 
@@ -360,6 +457,13 @@ class ResolverGenerationPlanner:
             lock_mode=spec.lock_mode,
             has_async_specs=has_async_specs,
         )
+        if effective_lock_mode is LockMode.OPTIMISTIC and spec.needs_cleanup:
+            # A discarded build would leave a resource nobody cleans up.
+            effective_lock_mode = self._resolve_effective_lock_mode(
+                lock_mode="auto",
+                has_async_specs=has_async_specs,
+            )
+        uses_optimistic_publish = is_cached and effective_lock_mode is LockMode.OPTIMISTIC
         uses_thread_lock = (
             is_cached and effective_lock_mode is LockMode.THREAD and not requires_async
         )
@@ -399,6 +503,7 @@ class ResolverGenerationPlanner:
                 getattr(provider_reference, INJECT_WRAPPER_MARKER, False),
             ),
             dependency_plans=tuple(dependency_plans),
+            uses_optimistic_publish=uses_optimistic_publish,
         )
 
     def _plan_dependency(
@@ -690,7 +795,9 @@ class ResolverGenerationPlanner:
 
     def _build_requires_async_by_slot(self) -> dict[int, bool]:
         by_slot = {spec.slot: spec for spec in self._work_specs}
-        requires_async_by_slot: dict[int, bool] = {}
+        requires_async_by_slot = {
+            slot: workflow.requires_async for slot, workflow in self._reusable_workflows.items()
+        }
         in_progress: set[int] = set()
 
         for slot in by_slot:
@@ -879,7 +986,10 @@ class ResolverGenerationPlanner:
 
     def _build_max_required_scope_level_by_slot(self) -> dict[int, int]:
         by_slot = {spec.slot: spec for spec in self._work_specs}
-        max_scope_level_by_slot: dict[int, int] = {}
+        max_scope_level_by_slot = {
+            slot: workflow.max_required_scope_level
+            for slot, workflow in self._reusable_workflows.items()
+        }
         in_progress: set[int] = set()
 
         for slot in by_slot:
@@ -963,3 +1073,14 @@ class ResolverGenerationPlanner:
                 base_key = normalized_key
             slots_by_key.setdefault(base_key, []).append(spec.slot)
         return {key: tuple(slots) for key, slots in slots_by_key.items()}
+
+
+def _planned_dependency_slots(*, workflow: ProviderWorkflowPlan) -> tuple[int, ...]:
+    slots: list[int] = []
+    for dependency_plan in workflow.dependency_plans:
+        if dependency_plan.dependency_slot is not None:
+            slots.append(dependency_plan.dependency_slot)
+        if dependency_plan.provider_inner_slot is not None:
+            slots.append(dependency_plan.provider_inner_slot)
+        slots.extend(dependency_plan.all_slots)
+    return tuple(slots)
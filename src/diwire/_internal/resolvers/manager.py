@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from types import ModuleType
+from typing import Any
+
 from diwire._internal.providers import ProvidersRegistrations
 from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
 from diwire._internal.resolvers.assembly.planner import validate_resolver_assembly_managed_scopes
@@ -8,13 +15,29 @@ from diwire._internal.scope import BaseScope
 class ResolversManager:
     """Manager for dependency resolvers."""
 
-    def __init__(self) -> None:
-        self._assembly_compiler = ResolversAssemblyCompiler()
+    def __init__(
+        self,
+        *,
+        compile_cache_dir: str | os.PathLike[str] | None = None,
+        aot_module: str | ModuleType | None = None,
+        concurrent_async_dependencies: bool = False,
+        concurrent_async_cleanup: bool = False,
+        deferred_cleanup: bool = False,
+    ) -> None:
+        self._assembly_compiler = ResolversAssemblyCompiler(
+            code_cache_dir=compile_cache_dir,
+            aot_module=aot_module,
+            concurrent_async_dependencies=concurrent_async_dependencies,
+            concurrent_async_cleanup=concurrent_async_cleanup,
+            deferred_cleanup=deferred_cleanup,
+        )
 
     def build_root_resolver(
         self,
         root_scope: BaseScope,
         registrations: ProvidersRegistrations,
+        previous_root_resolver: ResolverProtocol | None = None,
+        frozen_values: Mapping[Any, Any] | None = None,
     ) -> ResolverProtocol:
         """Get the root resolver for the given registrations.
 
@@ -23,10 +46,100 @@ class ResolversManager:
         Args:
             root_scope: Root scope used to initialize the resolver.
             registrations: Provider registrations used to build resolver instances or generated code.
+            previous_root_resolver: Root resolver built by this manager that the new one
+                replaces. Unchanged slots keep its compiled methods and singleton caches.
+            frozen_values: Built root singletons by dependency key to fold into the
+                generated code as constants.
 
         """
         validate_resolver_assembly_managed_scopes(root_scope=root_scope)
         return self._assembly_compiler.build_root_resolver(
             root_scope=root_scope,
             registrations=registrations,
+            previous_root_resolver=previous_root_resolver,
+            frozen_values=frozen_values,
+        )
+
+    def build_root_singletons(self, root_resolver: ResolverProtocol) -> dict[Any, Any]:
+        """Build sync root-scope cached providers and return built values by key.
+
+        Args:
+            root_resolver: Root resolver built by this manager.
+
+        """
+        return self._assembly_compiler.build_root_singletons(root_resolver)
+
+    async def abuild_root_singletons(self, root_resolver: ResolverProtocol) -> dict[Any, Any]:
+        """Build all root-scope cached providers and return built values by key.
+
+        Args:
+            root_resolver: Root resolver built by this manager.
+
+        """
+        return await self._assembly_compiler.abuild_root_singletons(root_resolver)
+
+    def warm_up_root_singletons(
+        self,
+        root_resolver: ResolverProtocol,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Any, float]:
+        """Build missing sync root singletons concurrently and return build timings.
+
+        Args:
+            root_resolver: Root resolver built by this manager.
+            max_workers: Thread pool size. ``None`` uses the executor default.
+
+        """
+        return self._assembly_compiler.warm_up_root_singletons(
+            root_resolver,
+            max_workers=max_workers,
+        )
+
+    async def awarm_up_root_singletons(
+        self,
+        root_resolver: ResolverProtocol,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[Any, float]:
+        """Build all missing root singletons concurrently and return build timings.
+
+        Args:
+            root_resolver: Root resolver built by this manager.
+            max_workers: Thread pool size for sync providers. ``None`` uses the
+                executor default.
+
+        """
+        return await self._assembly_compiler.awarm_up_root_singletons(
+            root_resolver,
+            max_workers=max_workers,
+        )
+
+    def drain_deferred_cleanups(self) -> None:
+        """Wait for deferred sync scope cleanups and raise the first cleanup error."""
+        self._assembly_compiler.drain_deferred_cleanups()
+
+    async def adrain_deferred_cleanups(self) -> None:
+        """Await all deferred scope cleanups and raise the first cleanup error."""
+        await self._assembly_compiler.adrain_deferred_cleanups()
+
+    def render_aot_module(
+        self,
+        root_scope: BaseScope,
+        registrations: ProvidersRegistrations,
+        target: str,
+    ) -> str:
+        """Render an ahead-of-time resolver module for the given registrations.
+
+        Args:
+            root_scope: Root scope used to initialize the resolver.
+            registrations: Provider registrations used to render resolver code.
+            target: Container factory reference recorded in the generated module.
+
+        """
+        validate_resolver_assembly_managed_scopes(root_scope=root_scope)
+        return self._assembly_compiler.render_aot_module(
+            root_scope=root_scope,
+            registrations=registrations,
+            target=target,
         )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
@@ -44,6 +44,28 @@ class ResolverProtocol(Protocol):
 
         """
 
+    def resolve_many(self, dependencies: Sequence[Any]) -> tuple[Any, ...]:
+        """Resolve several dependencies in order and return their instances as a tuple.
+
+        Args:
+            dependencies: Dependency keys to resolve.
+
+        """
+
+    async def aresolve_many(
+        self,
+        dependencies: Sequence[Any],
+        *,
+        concurrent: bool = False,
+    ) -> tuple[Any, ...]:
+        """Resolve several dependencies asynchronously and return their instances as a tuple.
+
+        Args:
+            dependencies: Dependency keys to resolve.
+            concurrent: Await independent async dependencies together instead of in order.
+
+        """
+
     def enter_scope(
         self,
         scope: BaseScope | None = None,
@@ -4,7 +4,15 @@ from __future__ import annotations
 
 from typing import Any
 
-from dishka import BaseScope, Container, Provider, make_container, new_scope
+from dishka import (
+    AsyncContainer,
+    BaseScope,
+    Container,
+    Provider,
+    make_async_container,
+    make_container,
+    new_scope,
+)
 
 
 class DishkaBenchmarkScope(BaseScope):
@@ -23,3 +31,16 @@ def make_dishka_benchmark_container(
         skip_validation=True,
         context=context,
     )
+
+
+def make_dishka_async_benchmark_container(
+    *providers: Provider,
+    context: dict[Any, Any] | None = None,
+) -> AsyncContainer:
+    return make_async_container(
+        *providers,
+        scopes=DishkaBenchmarkScope,
+        lock_factory=None,
+        skip_validation=True,
+        context=context,
+    )
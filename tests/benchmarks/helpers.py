@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from diwire import Container, DependencyRegistrationPolicy, LockMode, MissingPolicy
@@ -8,6 +10,9 @@ from diwire import Container, DependencyRegistrationPolicy, LockMode, MissingPol
 BENCHMARK_ITERATIONS = 100_000
 BENCHMARK_WARMUP_ROUNDS = 3
 BENCHMARK_ROUNDS = 5
+ASYNC_BENCHMARK_BATCH_SIZE = 100
+THREADED_BENCHMARK_THREADS = 4
+THREADED_BENCHMARK_BATCH_SIZE = 1_000
 
 
 def make_diwire_benchmark_container() -> Container:
@@ -31,3 +36,56 @@ def run_benchmark(
         rounds=BENCHMARK_ROUNDS,
         iterations=iterations,
     )
+
+
+def run_async_benchmark(
+    benchmark: Any,
+    target: Callable[[], Awaitable[None]],
+    *,
+    iterations: int = BENCHMARK_ITERATIONS,
+) -> None:
+    # One benchmark iteration awaits a batch of targets so event-loop entry does not dominate.
+    loop = asyncio.new_event_loop()
+
+    async def run_batch() -> None:
+        for _ in range(ASYNC_BENCHMARK_BATCH_SIZE):
+            await target()
+
+    def run() -> None:
+        loop.run_until_complete(run_batch())
+
+    try:
+        run_benchmark(
+            benchmark,
+            run,
+            iterations=max(1, iterations // ASYNC_BENCHMARK_BATCH_SIZE),
+        )
+    finally:
+        loop.close()
+
+
+def run_threaded_benchmark(
+    benchmark: Any,
+    target: Callable[[int], None],
+    *,
+    iterations: int = BENCHMARK_ITERATIONS,
+    threads: int = THREADED_BENCHMARK_THREADS,
+) -> None:
+    # One benchmark iteration runs a batch of targets on every worker thread at once.
+    executor = ThreadPoolExecutor(max_workers=threads)
+
+    def run_batch(thread_index: int) -> None:
+        for _ in range(THREADED_BENCHMARK_BATCH_SIZE):
+            target(thread_index)
+
+    def run() -> None:
+        list(executor.map(run_batch, range(threads)))
+
+    try:
+        run_benchmark(
+            benchmark,
+            run,
+            iterations=max(1, iterations // (THREADED_BENCHMARK_BATCH_SIZE * threads)),
+        )
+    finally:
+        executor.shutdown(wait=True)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from diwire import Container, Lifetime, Scope
+from tests.benchmarks.helpers import make_diwire_benchmark_container
+
+STARTUP_PROVIDER_COUNTS = (100, 1_000, 10_000)
+STARTUP_WARMUP_ROUNDS = 1
+STARTUP_ROUNDS = 3
+
+# Providers form chains where every link depends on the previous one. Scope levels never
+# decrease along a chain, so each generated graph is valid while still mixing root singletons,
+# root transients, request-scoped and request transient providers.
+_CHAIN_LENGTH = 10
+_CHAIN_LAYOUT: tuple[tuple[Scope, Lifetime], ...] = (
+    (Scope.APP, Lifetime.SCOPED),
+    (Scope.APP, Lifetime.SCOPED),
+    (Scope.APP, Lifetime.SCOPED),
+    (Scope.APP, Lifetime.TRANSIENT),
+    (Scope.APP, Lifetime.TRANSIENT),
+    (Scope.REQUEST, Lifetime.SCOPED),
+    (Scope.REQUEST, Lifetime.SCOPED),
+    (Scope.REQUEST, Lifetime.SCOPED),
+    (Scope.REQUEST, Lifetime.TRANSIENT),
+    (Scope.REQUEST, Lifetime.TRANSIENT),
+)
+
+StartupGraph = tuple[tuple[type[Any], Scope, Lifetime], ...]
+
+
+def _init_with_dependency(dependency_type: type[Any]) -> Any:
+    def init(self: Any, dependency: Any) -> None:
+        self.dependency = dependency
+
+    init.__annotations__ = {"dependency": dependency_type, "return": None}
+    return init
+
+
+def build_startup_graph(*, provider_count: int) -> StartupGraph:
+    graph: list[tuple[type[Any], Scope, Lifetime]] = []
+    previous: type[Any] | None = None
+    for index in range(provider_count):
+        position = index % _CHAIN_LENGTH
+        namespace: dict[str, Any] = {"__module__": __name__}
+        if position and previous is not None:
+            namespace["__init__"] = _init_with_dependency(previous)
+        provider_type = type(f"_StartupService{index}", (), namespace)
+        scope, lifetime = _CHAIN_LAYOUT[position]
+        graph.append((provider_type, scope, lifetime))
+        previous = provider_type
+    return tuple(graph)
+
+
+def register_startup_graph(container: Container, graph: StartupGraph) -> Container:
+    for provider_type, scope, lifetime in graph:
+        container.add(provider_type, scope=scope, lifetime=lifetime)
+    return container
+
+
+def make_startup_container(graph: StartupGraph) -> Container:
+    return register_startup_graph(make_diwire_benchmark_container(), graph)
+
+
+def measure_peak_memory_bytes(target: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        target()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_startup_benchmark(
+    benchmark: Any,
+    target: Callable[[], object],
+    *,
+    setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]]] | None = None,
+) -> None:
+    # Peak memory is measured in a separate untimed run because tracemalloc slows allocation.
+    if setup is None:
+        benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory_bytes(target)
+    else:
+        args, kwargs = setup()
+        benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory_bytes(
+            lambda: target(*args, **kwargs),
+        )
+    benchmark.pedantic(
+        target=target,
+        setup=setup,
+        warmup_rounds=STARTUP_WARMUP_ROUNDS,
+        rounds=STARTUP_ROUNDS,
+        iterations=1,
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from diwire import Scope
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+from tests.benchmarks.startup.helpers import (
+    STARTUP_PROVIDER_COUNTS,
+    build_startup_graph,
+    make_startup_container,
+    run_startup_benchmark,
+)
+
+
+@pytest.mark.parametrize("provider_count", STARTUP_PROVIDER_COUNTS, ids=lambda count: f"n{count}")
+def test_benchmark_diwire_startup_compile(benchmark: Any, provider_count: int) -> None:
+    graph = build_startup_graph(provider_count=provider_count)
+    container = make_startup_container(graph)
+    registrations = container._providers_registrations
+
+    def compile_root_resolver() -> Any:
+        return ResolversAssemblyCompiler().build_root_resolver(
+            root_scope=Scope.APP,
+            registrations=registrations,
+        )
+
+    run_startup_benchmark(benchmark, compile_root_resolver)
+
+    root_resolver = compile_root_resolver()
+    last_type, last_scope, _ = graph[-1]
+    with root_resolver.enter_scope(last_scope) as request_scope:
+        assert isinstance(request_scope.resolve(last_type), last_type)
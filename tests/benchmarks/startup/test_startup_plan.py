@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from diwire import Scope
+from diwire._internal.resolvers.assembly.planner import ResolverGenerationPlanner
+from tests.benchmarks.startup.helpers import (
+    STARTUP_PROVIDER_COUNTS,
+    build_startup_graph,
+    make_startup_container,
+    run_startup_benchmark,
+)
+
+
+@pytest.mark.parametrize("provider_count", STARTUP_PROVIDER_COUNTS, ids=lambda count: f"n{count}")
+def test_benchmark_diwire_startup_plan(benchmark: Any, provider_count: int) -> None:
+    container = make_startup_container(build_startup_graph(provider_count=provider_count))
+    registrations = container._providers_registrations
+
+    def plan() -> Any:
+        return ResolverGenerationPlanner(root_scope=Scope.APP, registrations=registrations).build()
+
+    run_startup_benchmark(benchmark, plan)
+
+    assert len(plan().workflows) == provider_count
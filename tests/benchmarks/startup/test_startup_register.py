@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tests.benchmarks.helpers import make_diwire_benchmark_container
+from tests.benchmarks.startup.helpers import (
+    STARTUP_PROVIDER_COUNTS,
+    StartupGraph,
+    build_startup_graph,
+    register_startup_graph,
+    run_startup_benchmark,
+)
+
+
+@pytest.mark.parametrize("provider_count", STARTUP_PROVIDER_COUNTS, ids=lambda count: f"n{count}")
+def test_benchmark_diwire_startup_register(benchmark: Any, provider_count: int) -> None:
+    graph = build_startup_graph(provider_count=provider_count)
+
+    def setup() -> tuple[tuple[Any, StartupGraph], dict[str, Any]]:
+        return (make_diwire_benchmark_container(), graph), {}
+
+    run_startup_benchmark(benchmark, register_startup_graph, setup=setup)
+
+    container = register_startup_graph(make_diwire_benchmark_container(), graph)
+    assert len(container._providers_registrations) == provider_count
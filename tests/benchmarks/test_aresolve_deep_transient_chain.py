@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import rodi
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Lifetime
+from tests.benchmarks.dishka_helpers import (
+    DishkaBenchmarkScope,
+    make_dishka_async_benchmark_container,
+)
+from tests.benchmarks.helpers import make_diwire_benchmark_container, run_async_benchmark
+from tests.benchmarks.wireup_helpers import make_wireup_async_benchmark_container
+
+
+class _Dep0:
+    pass
+
+
+@injectable(lifetime="transient")
+async def _make_dep_0() -> _Dep0:
+    return _Dep0()
+
+
+@injectable(lifetime="transient")
+class _Dep1:
+    def __init__(self, dep_0: _Dep0) -> None:
+        self.dep_0 = dep_0
+
+
+@injectable(lifetime="transient")
+class _Dep2:
+    def __init__(self, dep_1: _Dep1) -> None:
+        self.dep_1 = dep_1
+
+
+@injectable(lifetime="transient")
+class _Dep3:
+    def __init__(self, dep_2: _Dep2) -> None:
+        self.dep_2 = dep_2
+
+
+@injectable(lifetime="transient")
+class _Dep4:
+    def __init__(self, dep_3: _Dep3) -> None:
+        self.dep_3 = dep_3
+
+
+@injectable(lifetime="transient")
+class _Root:
+    def __init__(self, dep_4: _Dep4) -> None:
+        self.dep_4 = dep_4
+
+
+def _assert_distinct_chains(first: _Root, second: _Root) -> None:
+    assert first is not second
+    assert first.dep_4 is not second.dep_4
+    assert first.dep_4.dep_3.dep_2.dep_1.dep_0 is not second.dep_4.dep_3.dep_2.dep_1.dep_0
+
+
+def test_benchmark_diwire_aresolve_deep_transient_chain(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    container.add_factory(_make_dep_0, provides=_Dep0, lifetime=Lifetime.TRANSIENT)
+    container.add(_Dep1, lifetime=Lifetime.TRANSIENT)
+    container.add(_Dep2, lifetime=Lifetime.TRANSIENT)
+    container.add(_Dep3, lifetime=Lifetime.TRANSIENT)
+    container.add(_Dep4, lifetime=Lifetime.TRANSIENT)
+    container.add(_Root, lifetime=Lifetime.TRANSIENT)
+    container.compile()
+
+    async def check() -> None:
+        _assert_distinct_chains(
+            await container.aresolve(_Root),
+            await container.aresolve(_Root),
+        )
+
+    asyncio.run(check())
+
+    async def bench_diwire_deep_chain() -> None:
+        _ = await container.aresolve(_Root)
+
+    run_async_benchmark(benchmark, bench_diwire_deep_chain, iterations=25_000)
+
+
+def test_benchmark_rodi_aresolve_deep_transient_chain(benchmark: Any) -> None:
+    # rodi has no async factories or async resolution; resolve synchronously inside the loop.
+    rodi_container = rodi.Container()
+    rodi_container.add_transient(_Dep0)
+    rodi_container.add_transient(_Dep1)
+    rodi_container.add_transient(_Dep2)
+    rodi_container.add_transient(_Dep3)
+    rodi_container.add_transient(_Dep4)
+    rodi_container.add_transient(_Root)
+    services = rodi_container.build_provider()
+    _assert_distinct_chains(services.get(_Root), services.get(_Root))
+
+    async def bench_rodi_deep_chain() -> None:
+        _ = services.get(_Root)
+
+    run_async_benchmark(benchmark, bench_rodi_deep_chain, iterations=25_000)
+
+
+def test_benchmark_dishka_aresolve_deep_transient_chain(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    provider.provide(_make_dep_0, provides=_Dep0, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Dep1, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Dep2, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Dep3, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Dep4, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Root, scope=DishkaBenchmarkScope.APP, cache=False)
+    container = make_dishka_async_benchmark_container(provider)
+
+    async def check() -> None:
+        _assert_distinct_chains(await container.get(_Root), await container.get(_Root))
+
+    asyncio.run(check())
+
+    async def bench_dishka_deep_chain() -> None:
+        _ = await container.get(_Root)
+
+    run_async_benchmark(benchmark, bench_dishka_deep_chain, iterations=25_000)
+
+
+def test_benchmark_wireup_aresolve_deep_transient_chain(benchmark: Any) -> None:
+    container = make_wireup_async_benchmark_container(
+        _make_dep_0,
+        _Dep1,
+        _Dep2,
+        _Dep3,
+        _Dep4,
+        _Root,
+    )
+    scope = container.enter_scope()
+
+    async def check() -> None:
+        _assert_distinct_chains(await scope.get(_Root), await scope.get(_Root))
+
+    asyncio.run(check())
+
+    async def bench_wireup_deep_chain() -> None:
+        _ = await scope.get(_Root)
+
+    run_async_benchmark(benchmark, bench_wireup_deep_chain, iterations=25_000)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import rodi
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Lifetime, Scope
+from tests.benchmarks.dishka_helpers import (
+    DishkaBenchmarkScope,
+    make_dishka_async_benchmark_container,
+)
+from tests.benchmarks.helpers import make_diwire_benchmark_container, run_async_benchmark
+from tests.benchmarks.wireup_helpers import make_wireup_async_benchmark_container
+
+
+class _ScopedService:
+    pass
+
+
+@injectable(lifetime="scoped")
+async def _make_scoped_service() -> _ScopedService:
+    return _ScopedService()
+
+
+def test_benchmark_diwire_aresolve_scoped(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    container.add_factory(
+        _make_scoped_service,
+        provides=_ScopedService,
+        lifetime=Lifetime.SCOPED,
+        scope=Scope.REQUEST,
+    )
+    container.compile()
+
+    async def check() -> None:
+        async with container.enter_scope(Scope.REQUEST) as first_scope:
+            first = await first_scope.aresolve(_ScopedService)
+            second = await first_scope.aresolve(_ScopedService)
+        async with container.enter_scope(Scope.REQUEST) as second_scope:
+            third = await second_scope.aresolve(_ScopedService)
+        assert first is second
+        assert first is not third
+
+    asyncio.run(check())
+
+    async def bench_diwire_scoped() -> None:
+        async with container.enter_scope(Scope.REQUEST) as scope:
+            _ = await scope.aresolve(_ScopedService)
+
+    run_async_benchmark(benchmark, bench_diwire_scoped)
+
+
+def test_benchmark_rodi_aresolve_scoped(benchmark: Any) -> None:
+    # rodi has no async factories or async resolution; resolve synchronously inside the loop.
+    rodi_container = rodi.Container()
+    rodi_container.add_scoped(_ScopedService)
+    services = rodi_container.build_provider()
+    with services.create_scope() as first_scope:
+        first = first_scope.get(_ScopedService)
+        second = first_scope.get(_ScopedService)
+    with services.create_scope() as second_scope:
+        third = second_scope.get(_ScopedService)
+    assert first is second
+    assert first is not third
+
+    async def bench_rodi_scoped() -> None:
+        with services.create_scope() as scope:
+            _ = scope.get(_ScopedService)
+
+    run_async_benchmark(benchmark, bench_rodi_scoped)
+
+
+def test_benchmark_dishka_aresolve_scoped(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    provider.provide(
+        _make_scoped_service,
+        provides=_ScopedService,
+        scope=DishkaBenchmarkScope.REQUEST,
+    )
+    container = make_dishka_async_benchmark_container(provider)
+
+    async def check() -> None:
+        async with container(scope=DishkaBenchmarkScope.REQUEST) as first_scope:
+            first = await first_scope.get(_ScopedService)
+            second = await first_scope.get(_ScopedService)
+        async with container(scope=DishkaBenchmarkScope.REQUEST) as second_scope:
+            third = await second_scope.get(_ScopedService)
+        assert first is second
+        assert first is not third
+
+    asyncio.run(check())
+
+    async def bench_dishka_scoped() -> None:
+        async with container(scope=DishkaBenchmarkScope.REQUEST) as scope:
+            _ = await scope.get(_ScopedService)
+
+    run_async_benchmark(benchmark, bench_dishka_scoped)
+
+
+def test_benchmark_wireup_aresolve_scoped(benchmark: Any) -> None:
+    container = make_wireup_async_benchmark_container(_make_scoped_service)
+
+    async def check() -> None:
+        async with container.enter_scope() as first_scope:
+            first = await first_scope.get(_ScopedService)
+            second = await first_scope.get(_ScopedService)
+        async with container.enter_scope() as second_scope:
+            third = await second_scope.get(_ScopedService)
+        assert first is second
+        assert first is not third
+
+    asyncio.run(check())
+
+    async def bench_wireup_scoped() -> None:
+        async with container.enter_scope() as scope:
+            _ = await scope.get(_ScopedService)
+
+    run_async_benchmark(benchmark, bench_wireup_scoped)
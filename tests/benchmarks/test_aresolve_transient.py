@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import rodi
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Lifetime
+from tests.benchmarks.dishka_helpers import (
+    DishkaBenchmarkScope,
+    make_dishka_async_benchmark_container,
+)
+from tests.benchmarks.helpers import make_diwire_benchmark_container, run_async_benchmark
+from tests.benchmarks.wireup_helpers import make_wireup_async_benchmark_container
+
+
+class _TransientService:
+    pass
+
+
+@injectable(lifetime="transient")
+async def _make_transient_service() -> _TransientService:
+    return _TransientService()
+
+
+def test_benchmark_diwire_aresolve_transient(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    container.add_factory(
+        _make_transient_service,
+        provides=_TransientService,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.compile()
+
+    async def check() -> None:
+        first = await container.aresolve(_TransientService)
+        second = await container.aresolve(_TransientService)
+        assert first is not second
+
+    asyncio.run(check())
+
+    async def bench_diwire_transient() -> None:
+        _ = await container.aresolve(_TransientService)
+
+    run_async_benchmark(benchmark, bench_diwire_transient)
+
+
+def test_benchmark_rodi_aresolve_transient(benchmark: Any) -> None:
+    # rodi has no async factories or async resolution; resolve synchronously inside the loop.
+    rodi_container = rodi.Container()
+    rodi_container.add_transient(_TransientService)
+    services = rodi_container.build_provider()
+    first = services.get(_TransientService)
+    second = services.get(_TransientService)
+    assert first is not second
+
+    async def bench_rodi_transient() -> None:
+        _ = services.get(_TransientService)
+
+    run_async_benchmark(benchmark, bench_rodi_transient)
+
+
+def test_benchmark_dishka_aresolve_transient(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    provider.provide(
+        _make_transient_service,
+        provides=_TransientService,
+        scope=DishkaBenchmarkScope.APP,
+        cache=False,
+    )
+    container = make_dishka_async_benchmark_container(provider)
+
+    async def check() -> None:
+        first = await container.get(_TransientService)
+        second = await container.get(_TransientService)
+        assert first is not second
+
+    asyncio.run(check())
+
+    async def bench_dishka_transient() -> None:
+        _ = await container.get(_TransientService)
+
+    run_async_benchmark(benchmark, bench_dishka_transient)
+
+
+def test_benchmark_wireup_aresolve_transient(benchmark: Any) -> None:
+    container = make_wireup_async_benchmark_container(_make_transient_service)
+    scope = container.enter_scope()
+
+    async def check() -> None:
+        first = await scope.get(_TransientService)
+        second = await scope.get(_TransientService)
+        assert first is not second
+
+    asyncio.run(check())
+
+    async def bench_wireup_transient() -> None:
+        _ = await scope.get(_TransientService)
+
+    run_async_benchmark(benchmark, bench_wireup_transient)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import rodi
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Lifetime
+from tests.benchmarks.dishka_helpers import (
+    DishkaBenchmarkScope,
+    make_dishka_async_benchmark_container,
+)
+from tests.benchmarks.helpers import make_diwire_benchmark_container, run_async_benchmark
+from tests.benchmarks.wireup_helpers import make_wireup_async_benchmark_container
+
+
+class _DepA:
+    pass
+
+
+class _DepB:
+    pass
+
+
+class _DepC:
+    pass
+
+
+@injectable(lifetime="transient")
+async def _make_dep_a() -> _DepA:
+    return _DepA()
+
+
+@injectable(lifetime="transient")
+async def _make_dep_b() -> _DepB:
+    return _DepB()
+
+
+@injectable(lifetime="transient")
+async def _make_dep_c() -> _DepC:
+    return _DepC()
+
+
+@injectable(lifetime="transient")
+class _DepD:
+    pass
+
+
+@injectable(lifetime="transient")
+class _DepE:
+    pass
+
+
+@injectable(lifetime="transient")
+class _Root:
+    def __init__(
+        self,
+        dep_a: _DepA,
+        dep_b: _DepB,
+        dep_c: _DepC,
+        dep_d: _DepD,
+        dep_e: _DepE,
+    ) -> None:
+        self.dep_a = dep_a
+        self.dep_b = dep_b
+        self.dep_c = dep_c
+        self.dep_d = dep_d
+        self.dep_e = dep_e
+
+
+def _assert_distinct_graphs(first: _Root, second: _Root) -> None:
+    assert first is not second
+    assert first.dep_a is not second.dep_a
+    assert first.dep_b is not second.dep_b
+    assert first.dep_c is not second.dep_c
+    assert first.dep_d is not second.dep_d
+    assert first.dep_e is not second.dep_e
+
+
+def test_benchmark_diwire_aresolve_wide_transient_graph(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    container.add_factory(_make_dep_a, provides=_DepA, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(_make_dep_b, provides=_DepB, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(_make_dep_c, provides=_DepC, lifetime=Lifetime.TRANSIENT)
+    container.add(_DepD, lifetime=Lifetime.TRANSIENT)
+    container.add(_DepE, lifetime=Lifetime.TRANSIENT)
+    container.add(_Root, lifetime=Lifetime.TRANSIENT)
+    container.compile()
+
+    async def check() -> None:
+        _assert_distinct_graphs(
+            await container.aresolve(_Root),
+            await container.aresolve(_Root),
+        )
+
+    asyncio.run(check())
+
+    async def bench_diwire_wide_graph() -> None:
+        _ = await container.aresolve(_Root)
+
+    run_async_benchmark(benchmark, bench_diwire_wide_graph, iterations=25_000)
+
+
+def test_benchmark_rodi_aresolve_wide_transient_graph(benchmark: Any) -> None:
+    # rodi has no async factories or async resolution; resolve synchronously inside the loop.
+    rodi_container = rodi.Container()
+    rodi_container.add_transient(_DepA)
+    rodi_container.add_transient(_DepB)
+    rodi_container.add_transient(_DepC)
+    rodi_container.add_transient(_DepD)
+    rodi_container.add_transient(_DepE)
+    rodi_container.add_transient(_Root)
+    services = rodi_container.build_provider()
+    _assert_distinct_graphs(services.get(_Root), services.get(_Root))
+
+    async def bench_rodi_wide_graph() -> None:
+        _ = services.get(_Root)
+
+    run_async_benchmark(benchmark, bench_rodi_wide_graph, iterations=25_000)
+
+
+def test_benchmark_dishka_aresolve_wide_transient_graph(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    provider.provide(_make_dep_a, provides=_DepA, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_make_dep_b, provides=_DepB, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_make_dep_c, provides=_DepC, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_DepD, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_DepE, scope=DishkaBenchmarkScope.APP, cache=False)
+    provider.provide(_Root, scope=DishkaBenchmarkScope.APP, cache=False)
+    container = make_dishka_async_benchmark_container(provider)
+
+    async def check() -> None:
+        _assert_distinct_graphs(await container.get(_Root), await container.get(_Root))
+
+    asyncio.run(check())
+
+    async def bench_dishka_wide_graph() -> None:
+        _ = await container.get(_Root)
+
+    run_async_benchmark(benchmark, bench_dishka_wide_graph, iterations=25_000)
+
+
+def test_benchmark_wireup_aresolve_wide_transient_graph(benchmark: Any) -> None:
+    container = make_wireup_async_benchmark_container(
+        _make_dep_a,
+        _make_dep_b,
+        _make_dep_c,
+        _DepD,
+        _DepE,
+        _Root,
+    )
+    scope = container.enter_scope()
+
+    async def check() -> None:
+        _assert_distinct_graphs(await scope.get(_Root), await scope.get(_Root))
+
+    asyncio.run(check())
+
+    async def bench_wireup_wide_graph() -> None:
+        _ = await scope.get(_Root)
+
+    run_async_benchmark(benchmark, bench_wireup_wide_graph, iterations=25_000)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Scope
+from tests.benchmarks.dishka_helpers import DishkaBenchmarkScope, make_dishka_benchmark_container
+from tests.benchmarks.helpers import make_diwire_benchmark_container, run_benchmark
+from tests.benchmarks.wireup_helpers import make_wireup_benchmark_container
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+def _make_session() -> Iterator[_Session]:
+    session = _Session()
+    yield session
+    session.closed = True
+
+
+@injectable(lifetime="scoped")
+def _make_wireup_session() -> Iterator[_Session]:
+    session = _Session()
+    yield session
+    session.closed = True
+
+
+def test_benchmark_diwire_enter_close_scope_resolve_generator(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    container.add_generator(_make_session, provides=_Session, scope=Scope.REQUEST)
+    container.compile()
+    with container.enter_scope(Scope.REQUEST) as first_scope:
+        first = first_scope.resolve(_Session)
+        assert first_scope.resolve(_Session) is first
+    with container.enter_scope(Scope.REQUEST) as second_scope:
+        second = second_scope.resolve(_Session)
+    assert first.closed
+    assert second.closed
+    assert first is not second
+
+    def bench_diwire_enter_close_scope_resolve_generator() -> None:
+        with container.enter_scope(Scope.REQUEST) as scope:
+            _ = scope.resolve(_Session)
+
+    run_benchmark(benchmark, bench_diwire_enter_close_scope_resolve_generator)
+
+
+def test_benchmark_dishka_enter_close_scope_resolve_generator(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    provider.provide(_make_session, provides=_Session, scope=DishkaBenchmarkScope.REQUEST)
+    container = make_dishka_benchmark_container(provider)
+    with container(scope=DishkaBenchmarkScope.REQUEST) as first_scope:
+        first = first_scope.get(_Session)
+        assert first_scope.get(_Session) is first
+    with container(scope=DishkaBenchmarkScope.REQUEST) as second_scope:
+        second = second_scope.get(_Session)
+    assert first.closed
+    assert second.closed
+    assert first is not second
+
+    def bench_dishka_enter_close_scope_resolve_generator() -> None:
+        with container(scope=DishkaBenchmarkScope.REQUEST) as scope:
+            _ = scope.get(_Session)
+
+    run_benchmark(benchmark, bench_dishka_enter_close_scope_resolve_generator)
+
+
+def test_benchmark_wireup_enter_close_scope_resolve_generator(benchmark: Any) -> None:
+    container = make_wireup_benchmark_container(_make_wireup_session)
+    with container.enter_scope() as first_scope:
+        first = first_scope.get(_Session)
+        assert first_scope.get(_Session) is first
+    with container.enter_scope() as second_scope:
+        second = second_scope.get(_Session)
+    assert first.closed
+    assert second.closed
+    assert first is not second
+
+    def bench_wireup_enter_close_scope_resolve_generator() -> None:
+        with container.enter_scope() as scope:
+            _ = scope.get(_Session)
+
+    run_benchmark(benchmark, bench_wireup_enter_close_scope_resolve_generator)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import pytest
+
+from diwire import Container, DependencyRegistrationPolicy, LockMode, MissingPolicy, Scope
+from tests.benchmarks.helpers import run_threaded_benchmark
+
+
+class _Session:
+    pass
+
+
+class _UnitOfWork:
+    def __init__(self, session: _Session) -> None:
+        self.session = session
+
+
+def _make_locked_diwire_container() -> Container:
+    # Scoped caches keep their double-checked locks, so threads building their own request
+    # scope show whether they contend on locks they do not share.
+    return Container(
+        lock_mode=LockMode.THREAD,
+        missing_policy=MissingPolicy.ERROR,
+        dependency_registration_policy=DependencyRegistrationPolicy.IGNORE,
+        use_resolver_context=False,
+    )
+
+
+@pytest.mark.parametrize("threads", [1, 4, 8])
+def test_benchmark_diwire_enter_close_scope_resolve_scoped_threaded(
+    benchmark: Any,
+    threads: int,
+) -> None:
+    container = _make_locked_diwire_container()
+    container.add(_Session, scope=Scope.REQUEST)
+    container.add(_UnitOfWork, scope=Scope.REQUEST)
+    container.compile()
+    with container.enter_scope(Scope.REQUEST) as scope:
+        unit_of_work = scope.resolve(_UnitOfWork)
+        assert scope.resolve(_UnitOfWork) is unit_of_work
+        assert unit_of_work.session is scope.resolve(_Session)
+
+    def bench_diwire_enter_close_scope_resolve_scoped_threaded(_thread_index: int) -> None:
+        with container.enter_scope(Scope.REQUEST) as scope:
+            _ = scope.resolve(_UnitOfWork)
+
+    run_threaded_benchmark(
+        benchmark,
+        bench_diwire_enter_close_scope_resolve_scoped_threaded,
+        threads=threads,
+    )
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    benchmark.extra_info["gil_enabled"] = True if is_gil_enabled is None else is_gil_enabled()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import rodi
+from dishka import Provider
+from wireup import injectable
+
+from diwire import Lifetime
+from tests.benchmarks.dishka_helpers import DishkaBenchmarkScope, make_dishka_benchmark_container
+from tests.benchmarks.helpers import (
+    THREADED_BENCHMARK_THREADS,
+    make_diwire_benchmark_container,
+    run_threaded_benchmark,
+)
+from tests.benchmarks.wireup_helpers import make_wireup_benchmark_container
+
+# Enough registrations for the inline dispatch cache, with fewer hot keys than cache entries.
+REGISTERED_SERVICE_COUNT = 8
+HOT_SERVICE_COUNT = 4
+HIT_RATE_SAMPLE_SIZE = 10_000
+
+
+def _make_service_class(index: int) -> type[Any]:
+    return injectable(lifetime="transient")(
+        type(f"_AlternatingService{index}", (), {"__module__": __name__}),
+    )
+
+
+_SERVICE_TYPES = tuple(_make_service_class(index) for index in range(REGISTERED_SERVICE_COUNT))
+_HOT_SERVICE_TYPES = _SERVICE_TYPES[:HOT_SERVICE_COUNT]
+
+
+def _alternating_target(resolve: Any) -> Any:
+    # Each thread walks the hot keys from its own offset, so threads ask for different keys.
+    positions = list(range(THREADED_BENCHMARK_THREADS))
+
+    def target(thread_index: int) -> None:
+        position = positions[thread_index]
+        _ = resolve(_HOT_SERVICE_TYPES[position % HOT_SERVICE_COUNT])
+        positions[thread_index] = position + 1
+
+    return target
+
+
+def _measure_dispatch_cache_hit_rate(resolver: Any) -> float:
+    samples_per_thread = HIT_RATE_SAMPLE_SIZE // THREADED_BENCHMARK_THREADS
+
+    def count_hits(thread_index: int) -> int:
+        hits = 0
+        for index in range(thread_index, thread_index + samples_per_thread):
+            service_type = _HOT_SERVICE_TYPES[index % HOT_SERVICE_COUNT]
+            if service_type in resolver._sync_dispatch_cache[0::2]:
+                hits += 1
+            _ = resolver.resolve(service_type)
+        return hits
+
+    with ThreadPoolExecutor(max_workers=THREADED_BENCHMARK_THREADS) as executor:
+        hits = sum(executor.map(count_hits, range(THREADED_BENCHMARK_THREADS)))
+    return hits / (samples_per_thread * THREADED_BENCHMARK_THREADS)
+
+
+def test_benchmark_diwire_resolve_alternating_keys_threaded(benchmark: Any) -> None:
+    container = make_diwire_benchmark_container()
+    for service_type in _SERVICE_TYPES:
+        container.add(service_type, lifetime=Lifetime.TRANSIENT)
+    resolver = container.compile()
+    for service_type in _HOT_SERVICE_TYPES:
+        assert isinstance(container.resolve(service_type), service_type)
+
+    run_threaded_benchmark(benchmark, _alternating_target(container.resolve))
+    benchmark.extra_info["dispatch_cache_hit_rate"] = _measure_dispatch_cache_hit_rate(resolver)
+
+
+def test_benchmark_rodi_resolve_alternating_keys_threaded(benchmark: Any) -> None:
+    rodi_container = rodi.Container()
+    for service_type in _SERVICE_TYPES:
+        rodi_container.add_transient(service_type)
+    services = rodi_container.build_provider()
+    for service_type in _HOT_SERVICE_TYPES:
+        assert isinstance(services.get(service_type), service_type)
+
+    run_threaded_benchmark(benchmark, _alternating_target(services.get))
+
+
+def test_benchmark_dishka_resolve_alternating_keys_threaded(benchmark: Any) -> None:
+    provider = Provider(scope=DishkaBenchmarkScope.APP)
+    for service_type in _SERVICE_TYPES:
+        provider.provide(service_type, scope=DishkaBenchmarkScope.APP, cache=False)
+    container = make_dishka_benchmark_container(provider)
+    for service_type in _HOT_SERVICE_TYPES:
+        assert isinstance(container.get(service_type), service_type)
+
+    run_threaded_benchmark(benchmark, _alternating_target(container.get))
+
+
+def test_benchmark_wireup_resolve_alternating_keys_threaded(benchmark: Any) -> None:
+    container = make_wireup_benchmark_container(*_SERVICE_TYPES)
+    for service_type in _HOT_SERVICE_TYPES:
+        assert isinstance(container.get(service_type), service_type)
+
+    run_threaded_benchmark(benchmark, _alternating_target(container.get))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import pytest
+
+from diwire import Container, DependencyRegistrationPolicy, LockMode, MissingPolicy
+from tests.benchmarks.helpers import run_threaded_benchmark
+
+
+class _Engine:
+    pass
+
+
+def _make_diwire_container(lock_mode: LockMode) -> Container:
+    return Container(
+        lock_mode=lock_mode,
+        missing_policy=MissingPolicy.ERROR,
+        dependency_registration_policy=DependencyRegistrationPolicy.IGNORE,
+        use_resolver_context=False,
+    )
+
+
+@pytest.mark.parametrize("lock_mode", [LockMode.THREAD, LockMode.OPTIMISTIC])
+@pytest.mark.parametrize("threads", [1, 8, 32])
+def test_benchmark_diwire_resolve_singleton_threaded(
+    benchmark: Any,
+    lock_mode: LockMode,
+    threads: int,
+) -> None:
+    container = _make_diwire_container(lock_mode)
+    container.add(_Engine)
+    container.compile()
+    engine = container.resolve(_Engine)
+    assert container.resolve(_Engine) is engine
+
+    def bench_diwire_resolve_singleton_threaded(_thread_index: int) -> None:
+        _ = container.resolve(_Engine)
+
+    run_threaded_benchmark(benchmark, bench_diwire_resolve_singleton_threaded, threads=threads)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    benchmark.extra_info["gil_enabled"] = True if is_gil_enabled is None else is_gil_enabled()
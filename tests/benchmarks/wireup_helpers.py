@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from wireup import SyncContainer, create_sync_container
+from wireup import AsyncContainer, SyncContainer, create_async_container, create_sync_container
 
 
 def make_wireup_benchmark_container(*injectables: Any) -> SyncContainer:
@@ -10,3 +10,10 @@ def make_wireup_benchmark_container(*injectables: Any) -> SyncContainer:
         injectables=list(injectables),
         concurrent_scoped_access=False,
     )
+
+
+def make_wireup_async_benchmark_container(*injectables: Any) -> AsyncContainer:
+    return create_async_container(
+        injectables=list(injectables),
+        concurrent_scoped_access=False,
+    )
@@ -7,6 +7,7 @@ from typing import Annotated, Any, Protocol, TypeAlias, cast
 import pytest
 
 from diwire import All, Component, Container, Injected, Lifetime, Scope, resolver_context
+from diwire._internal.resolvers.assembly import compiler as compiler_module
 from diwire.exceptions import DIWireInvalidProviderSpecError
 
 
@@ -212,3 +213,105 @@ def test_assembly_all_dependency_covers_async_and_inline_root_branches() -> None
     )
 
     container.compile()
+
+
+def test_all_of_root_singletons_resolves_one_shared_tuple() -> None:
+    container = Container()
+    container.add_factory(
+        lambda: _Handler("logging"),
+        provides=LoggingHandler,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.add_factory(
+        lambda: _Handler("metrics"),
+        provides=MetricsHandler,
+        lifetime=Lifetime.SCOPED,
+    )
+
+    def build_consumer(handlers: All[EventHandler]) -> _AllConsumer:
+        return _AllConsumer(handlers=handlers)
+
+    container.add_factory(
+        build_consumer,
+        provides=_AllConsumer,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.compile()
+
+    direct = container.resolve(All[EventHandler])
+    assert direct == (_Handler("logging"), _Handler("metrics"))
+    assert container.resolve(All[EventHandler]) is direct
+    with container.enter_scope() as first_scope:
+        first_handlers = first_scope.resolve(_AllConsumer).handlers
+    with container.enter_scope() as second_scope:
+        second_handlers = second_scope.resolve(_AllConsumer).handlers
+    assert first_handlers is direct
+    assert second_handlers is direct
+
+
+def test_all_with_mixed_scopes_folds_root_cached_prefix() -> None:
+    container = Container()
+    container.add_factory(
+        lambda: _Handler("logging"),
+        provides=LoggingHandler,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.add_factory(
+        lambda: _Handler("request"),
+        provides=RequestHandler,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.compile()
+
+    with container.enter_scope() as first_scope:
+        first = first_scope.resolve(All[EventHandler])
+        assert first_scope.resolve(All[EventHandler]) == first
+    with container.enter_scope() as second_scope:
+        second = second_scope.resolve(All[EventHandler])
+
+    assert first == (_Handler("logging"), _Handler("request"))
+    assert first[0] is second[0]
+    assert first[1] is not second[1]
+
+
+def test_direct_all_resolution_uses_compiled_dispatch_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _unexpected_fallback(self: Any, dependency: Any) -> Any:
+        msg = f"fallback dispatch used for {dependency!r}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(
+        compiler_module,
+        "_resolve_dispatch_fallback_sync",
+        _unexpected_fallback,
+    )
+    container = Container()
+    container.add_factory(lambda: _Handler("logging"), provides=LoggingHandler)
+    container.add_factory(lambda: _Handler("metrics"), provides=MetricsHandler)
+    container.compile()
+
+    assert container.resolve(All[EventHandler]) == (_Handler("logging"), _Handler("metrics"))
+
+
+async def test_aresolve_all_of_root_singletons_shares_tuple_with_sync_resolution() -> None:
+    container = Container()
+
+    async def provide_logging() -> EventHandler:
+        return _Handler("logging")
+
+    container.add_factory(provide_logging, provides=LoggingHandler, lifetime=Lifetime.SCOPED)
+    container.add_factory(
+        lambda: _Handler("metrics"),
+        provides=MetricsHandler,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.compile()
+
+    resolved = await container.aresolve(All[EventHandler])
+
+    assert resolved == (_Handler("logging"), _Handler("metrics"))
+    assert await container.aresolve(All[EventHandler]) is resolved
+    assert container.resolve(All[EventHandler]) is resolved
@@ -11,7 +11,9 @@ from tools.benchmark_reporting import (
     load_raw_benchmark_json,
     main,
     normalize_benchmark_report,
+    normalize_startup_report,
     render_benchmark_markdown,
+    render_startup_markdown,
     write_benchmark_outputs,
 )
 
@@ -119,6 +121,36 @@ def _raw_payload() -> dict[str, object]:
     }
 
 
+def _startup_entry(
+    scenario: str,
+    provider_count: int,
+    *,
+    mean: float,
+    peak_memory_bytes: int,
+) -> dict[str, object]:
+    name = f"test_benchmark_diwire_{scenario}[n{provider_count}]"
+    return {
+        "name": name,
+        "fullname": f"tests/benchmarks/startup/test_{scenario}.py::{name}",
+        "param": f"n{provider_count}",
+        "stats": {"mean": mean, "ops": 1 / mean},
+        "extra_info": {"peak_memory_bytes": peak_memory_bytes},
+    }
+
+
+def _raw_startup_payload() -> dict[str, object]:
+    return {
+        "datetime": "2026-02-09T12:14:14+00:00",
+        "commit_info": {"id": "abc123", "branch": "main"},
+        "machine_info": {"python_version": "3.14.0"},
+        "benchmarks": [
+            _startup_entry("startup_plan", 100, mean=0.002, peak_memory_bytes=4_096),
+            _startup_entry("startup_plan", 1_000, mean=0.02, peak_memory_bytes=40_960),
+            _startup_entry("startup_compile", 100, mean=0.005, peak_memory_bytes=8_192),
+        ],
+    }
+
+
 def test_normalize_benchmark_report_builds_expected_matrix() -> None:
     report = normalize_benchmark_report(
         _raw_payload(),
@@ -518,3 +550,111 @@ def test_main_generates_report_files(tmp_path: Path) -> None:
     assert markdown_path.exists()
     assert json_path.exists()
     assert comment_path.exists()
+
+
+def test_normalize_startup_report_builds_rows_per_provider_count() -> None:
+    report = normalize_startup_report(
+        _raw_startup_payload(),
+        source_raw_file="benchmark-results/raw-benchmark-startup.json",
+    )
+
+    assert report.scenarios == ("startup_compile", "startup_plan")
+    assert report.provider_counts == (100, 1_000)
+    assert report.files["startup_plan"] == "tests/benchmarks/startup/test_startup_plan.py"
+    assert report.mean_seconds["startup_plan"] == {100: 0.002, 1_000: 0.02}
+    assert report.mean_seconds["startup_compile"] == {100: 0.005, 1_000: None}
+    assert report.peak_memory_bytes["startup_plan"] == {100: 4_096, 1_000: 40_960}
+
+    report_json = report.as_json_dict()
+    assert report_json["provider_counts"] == [100, 1_000]
+    assert report_json["peak_memory_bytes"] == {
+        "startup_compile": {"100": 8_192, "1000": "-"},
+        "startup_plan": {"100": 4_096, "1000": 40_960},
+    }
+
+
+def test_render_startup_markdown_renders_milliseconds_and_kibibytes() -> None:
+    report = normalize_startup_report(_raw_startup_payload(), source_raw_file="raw.json")
+
+    markdown = render_startup_markdown(report)
+
+    assert "## Startup Benchmark Results" in markdown
+    assert "| startup_plan | 1,000 | 20.00 | 40 |" in markdown
+    assert "| startup_compile | 1,000 | - | - |" in markdown
+
+
+def test_normalize_startup_report_raises_for_duplicate_provider_count() -> None:
+    payload = _raw_startup_payload()
+    benchmarks = payload["benchmarks"]
+    assert isinstance(benchmarks, list)
+    benchmarks.append(_startup_entry("startup_plan", 100, mean=0.003, peak_memory_bytes=1))
+
+    with pytest.raises(BenchmarkReportError, match="Duplicate startup benchmark entry"):
+        normalize_startup_report(payload, source_raw_file="raw.json")
+
+
+def test_normalize_startup_report_raises_for_unexpected_param() -> None:
+    payload = _raw_startup_payload()
+    benchmarks = payload["benchmarks"]
+    assert isinstance(benchmarks, list)
+    benchmarks[0]["param"] = "large"
+
+    with pytest.raises(BenchmarkReportError, match="Unexpected startup benchmark parameter"):
+        normalize_startup_report(payload, source_raw_file="raw.json")
+
+
+def test_normalize_startup_report_raises_for_non_diwire_entry() -> None:
+    payload = _raw_startup_payload()
+    benchmarks = payload["benchmarks"]
+    assert isinstance(benchmarks, list)
+    benchmarks[0]["name"] = "test_benchmark_rodi_startup_plan[n100]"
+
+    with pytest.raises(BenchmarkReportError, match="only support diwire"):
+        normalize_startup_report(payload, source_raw_file="raw.json")
+
+
+def test_normalize_startup_report_raises_when_peak_memory_is_not_integer() -> None:
+    payload = _raw_startup_payload()
+    benchmarks = payload["benchmarks"]
+    assert isinstance(benchmarks, list)
+    benchmarks[0]["extra_info"] = {"peak_memory_bytes": 1.5}
+
+    with pytest.raises(BenchmarkReportError, match="'peak_memory_bytes' to be an integer"):
+        normalize_startup_report(payload, source_raw_file="raw.json")
+
+
+def test_normalize_startup_report_raises_for_no_benchmark_results() -> None:
+    payload = _raw_startup_payload()
+    payload["benchmarks"] = []
+
+    with pytest.raises(BenchmarkReportError, match="No benchmark results"):
+        normalize_startup_report(payload, source_raw_file="raw.json")
+
+
+def test_main_generates_startup_report_files(tmp_path: Path) -> None:
+    input_path = tmp_path / "raw-benchmark-startup.json"
+    input_path.write_text(json.dumps(_raw_startup_payload()), encoding="utf-8")
+    markdown_path = tmp_path / "benchmark-table-startup.md"
+    json_path = tmp_path / "benchmark-table-startup.json"
+    comment_path = tmp_path / "pr-comment-startup.md"
+
+    exit_code = main(
+        [
+            "--kind",
+            "startup",
+            "--input",
+            str(input_path),
+            "--markdown",
+            str(markdown_path),
+            "--json",
+            str(json_path),
+            "--comment",
+            str(comment_path),
+        ],
+    )
+
+    assert exit_code == 0
+    assert "Startup Benchmark Results" in markdown_path.read_text(encoding="utf-8")
+    assert comment_path.read_text(encoding="utf-8") == markdown_path.read_text(encoding="utf-8")
+    report_json = json.loads(json_path.read_text(encoding="utf-8"))
+    assert report_json["mean_seconds"]["startup_plan"]["1000"] == 0.02
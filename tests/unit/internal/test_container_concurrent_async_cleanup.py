@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from typing import Any, cast
+
+import pytest
+
+from diwire import Container, LockMode, Scope
+from diwire._internal.resolvers.assembly.compiler import _cleanup_waves
+
+
+class _Session:
+    pass
+
+
+class _Client:
+    pass
+
+
+class _UnitOfWork:
+    def __init__(self, session: _Session, client: _Client) -> None:
+        self.session = session
+        self.client = client
+
+
+def test_cleanup_waves_order_dependent_cleanups_before_their_dependencies() -> None:
+    waves = _cleanup_waves(
+        cleanup_dependency_slots_by_slot={1: frozenset(), 2: frozenset(), 3: frozenset({1, 2})},
+        cleanup_slots=[1, 2, 3, 2, None, 1],
+    )
+
+    assert waves == [[5], [4], [3, 2], [1, 0]]
+
+
+def test_concurrent_async_cleanup_is_opt_in() -> None:
+    def make_session() -> Generator[_Session, None, None]:
+        yield _Session()
+
+    container = Container()
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        request_scope.resolve(_Session)
+        assert not hasattr(request_scope, "_cleanup_slots")
+
+
+def test_concurrent_async_cleanup_keeps_sync_exit_order() -> None:
+    events: list[str] = []
+
+    def make_session() -> Generator[_Session, None, None]:
+        yield _Session()
+        events.append("session:close")
+
+    def make_client() -> Generator[_Client, None, None]:
+        yield _Client()
+        events.append("client:close")
+
+    container = Container(concurrent_async_cleanup=True)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.REQUEST)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        request_scope.resolve(_Session)
+        request_scope.resolve(_Client)
+        assert len(cast("Any", request_scope)._cleanup_slots) == 2
+
+    assert events == ["client:close", "session:close"]
+    assert cast("Any", request_scope)._cleanup_slots == []
+
+
+@pytest.mark.parametrize("lock_mode", ["auto", LockMode.NONE])
+async def test_concurrent_async_cleanup_awaits_independent_cleanups_together(
+    lock_mode: LockMode | str,
+) -> None:
+    events: list[str] = []
+    session_closing = asyncio.Event()
+    client_closing = asyncio.Event()
+
+    async def make_session() -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        session_closing.set()
+        await client_closing.wait()
+        events.append("session:close")
+
+    async def make_client() -> AsyncGenerator[_Client, None]:
+        yield _Client()
+        client_closing.set()
+        await session_closing.wait()
+        events.append("client:close")
+
+    async def make_unit_of_work(
+        session: _Session,
+        client: _Client,
+    ) -> AsyncGenerator[_UnitOfWork, None]:
+        yield _UnitOfWork(session, client)
+        events.append("unit-of-work:close")
+
+    container = Container(concurrent_async_cleanup=True, lock_mode=cast("Any", lock_mode))
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.REQUEST)
+    container.add_generator(make_unit_of_work, provides=_UnitOfWork, scope=Scope.REQUEST)
+
+    async def _use_request_scope() -> None:
+        async with container.enter_scope(Scope.REQUEST) as request_scope:
+            await request_scope.aresolve(_UnitOfWork)
+
+    await asyncio.wait_for(_use_request_scope(), timeout=5)
+
+    assert events[0] == "unit-of-work:close"
+    assert set(events[1:]) == {"session:close", "client:close"}
+
+
+async def test_concurrent_async_cleanup_raises_first_error_in_sequential_order() -> None:
+    async def make_session() -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        raise ValueError("session")
+
+    async def make_client() -> AsyncGenerator[_Client, None]:
+        yield _Client()
+        raise ValueError("client")
+
+    container = Container(concurrent_async_cleanup=True)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.REQUEST)
+
+    with pytest.raises(ValueError, match="client"):
+        async with container.enter_scope(Scope.REQUEST) as request_scope:
+            await request_scope.aresolve(_Session)
+            await request_scope.aresolve(_Client)
+
+    with pytest.raises(RuntimeError, match="original"):
+        async with container.enter_scope(Scope.REQUEST) as request_scope:
+            await request_scope.aresolve(_Session)
+            await request_scope.aresolve(_Client)
+            raise RuntimeError("original")
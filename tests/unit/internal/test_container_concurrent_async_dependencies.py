@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any, cast
+
+from diwire import Container, Lifetime, LockMode, Scope
+
+
+class _Pool:
+    pass
+
+
+class _Cache:
+    pass
+
+
+class _Flags:
+    pass
+
+
+class _Shared:
+    pass
+
+
+class _Service:
+    def __init__(self, pool: _Pool, cache: _Cache, flags: _Flags) -> None:
+        self.pool = pool
+        self.cache = cache
+        self.flags = flags
+
+
+def _gathered_dependency_names(container: Container, dependency: Any) -> set[str]:
+    container.compile()
+    runtime = cast("Any", type(container._generated_root_resolver))._runtime
+    slot = runtime.slot_by_dependency[dependency]
+    workflow = runtime.workflows_by_slot[slot]
+    gathered_indexes = runtime.concurrent_dependency_indexes_by_slot.get(slot, frozenset())
+    return {workflow.dependencies[index].parameter.name for index in gathered_indexes}
+
+
+def _register_waiting_providers(container: Container, *, scope: Scope) -> None:
+    pool_started = asyncio.Event()
+    cache_started = asyncio.Event()
+
+    async def make_pool() -> _Pool:
+        pool_started.set()
+        await cache_started.wait()
+        return _Pool()
+
+    async def make_cache() -> _Cache:
+        cache_started.set()
+        await pool_started.wait()
+        return _Cache()
+
+    async def make_flags() -> _Flags:
+        return _Flags()
+
+    container.add_factory(make_pool, provides=_Pool, scope=scope)
+    container.add_factory(make_cache, provides=_Cache, scope=scope)
+    container.add_factory(make_flags, provides=_Flags, lifetime=Lifetime.TRANSIENT)
+    container.add(_Service, scope=scope)
+
+
+def test_concurrent_async_dependencies_are_opt_in() -> None:
+    container = Container()
+    _register_waiting_providers(container, scope=Scope.REQUEST)
+
+    assert _gathered_dependency_names(container, _Service) == set()
+
+
+def test_concurrent_async_dependencies_skip_siblings_sharing_unlocked_cache() -> None:
+    async def make_shared() -> _Shared:
+        return _Shared()
+
+    async def make_pool(shared: _Shared) -> _Pool:
+        return _Pool()
+
+    async def make_cache(shared: _Shared) -> _Cache:
+        return _Cache()
+
+    async def make_flags() -> _Flags:
+        return _Flags()
+
+    container = Container(concurrent_async_dependencies=True, lock_mode=LockMode.NONE)
+    container.add_factory(make_shared, provides=_Shared, scope=Scope.REQUEST)
+    container.add_factory(make_pool, provides=_Pool, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(make_cache, provides=_Cache, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(make_flags, provides=_Flags, lifetime=Lifetime.TRANSIENT)
+    container.add(_Service, scope=Scope.REQUEST)
+
+    assert _gathered_dependency_names(container, _Service) == {"pool", "flags"}
+
+
+def test_concurrent_async_dependencies_gather_at_most_one_cleanup_sibling() -> None:
+    async def make_pool() -> AsyncGenerator[_Pool, None]:
+        yield _Pool()
+
+    async def make_cache() -> AsyncGenerator[_Cache, None]:
+        yield _Cache()
+
+    async def make_flags() -> _Flags:
+        return _Flags()
+
+    container = Container(concurrent_async_dependencies=True)
+    container.add_generator(make_pool, provides=_Pool, scope=Scope.REQUEST)
+    container.add_generator(make_cache, provides=_Cache, scope=Scope.REQUEST)
+    container.add_factory(make_flags, provides=_Flags, lifetime=Lifetime.TRANSIENT)
+    container.add(_Service, scope=Scope.REQUEST)
+
+    assert _gathered_dependency_names(container, _Service) == {"pool", "flags"}
+
+
+async def test_concurrent_async_dependencies_await_siblings_together() -> None:
+    for lock_mode in ("auto", LockMode.NONE):
+        container = Container(concurrent_async_dependencies=True, lock_mode=lock_mode)
+        _register_waiting_providers(container, scope=Scope.REQUEST)
+
+        async with container.enter_scope(Scope.REQUEST) as request_scope:
+            service = await asyncio.wait_for(request_scope.aresolve(_Service), timeout=5)
+
+            assert service.pool is await request_scope.aresolve(_Pool)
+            assert service.cache is await request_scope.aresolve(_Cache)
+
+
+async def test_concurrent_async_dependencies_keep_cleanup_order() -> None:
+    events: list[str] = []
+
+    async def make_pool() -> AsyncGenerator[_Pool, None]:
+        events.append("pool:open")
+        yield _Pool()
+        events.append("pool:close")
+
+    async def make_cache() -> AsyncGenerator[_Cache, None]:
+        events.append("cache:open")
+        yield _Cache()
+        events.append("cache:close")
+
+    async def make_flags() -> _Flags:
+        await asyncio.sleep(0)
+        return _Flags()
+
+    container = Container(concurrent_async_dependencies=True)
+    container.add_generator(make_pool, provides=_Pool, scope=Scope.REQUEST)
+    container.add_generator(make_cache, provides=_Cache, scope=Scope.REQUEST)
+    container.add_factory(make_flags, provides=_Flags, lifetime=Lifetime.TRANSIENT)
+    container.add(_Service, scope=Scope.REQUEST)
+
+    async with container.enter_scope(Scope.REQUEST) as request_scope:
+        await request_scope.aresolve(_Service)
+
+    assert events == ["pool:open", "cache:open", "cache:close", "pool:close"]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from diwire import Container, Scope
+
+
+class _Session:
+    pass
+
+
+class _Client:
+    pass
+
+
+class _Engine:
+    pass
+
+
+def test_deferred_cleanup_returns_from_sync_scope_exit_before_cleanup_runs() -> None:
+    release = threading.Event()
+    cleanup_threads: list[str] = []
+
+    def make_session() -> Generator[_Session, None, None]:
+        yield _Session()
+        release.wait(timeout=5)
+        cleanup_threads.append(threading.current_thread().name)
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        request_scope.resolve(_Session)
+
+    assert cleanup_threads == []
+    release.set()
+    container.drain_cleanups()
+    assert len(cleanup_threads) == 1
+    assert cleanup_threads[0].startswith("diwire-cleanup")
+
+
+def test_deferred_cleanup_raises_cleanup_errors_on_drain() -> None:
+    def make_session() -> Generator[_Session, None, None]:
+        yield _Session()
+        raise ValueError("session")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        request_scope.resolve(_Session)
+
+    with pytest.raises(ValueError, match="session"):
+        container.drain_cleanups()
+    container.drain_cleanups()
+
+
+def test_deferred_cleanup_keeps_root_scope_cleanup_immediate() -> None:
+    events: list[str] = []
+
+    def make_engine() -> Generator[_Engine, None, None]:
+        yield _Engine()
+        events.append("engine:close")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_engine, provides=_Engine)
+
+    container.resolve(_Engine)
+    container.close()
+
+    assert events == ["engine:close"]
+
+
+async def test_deferred_cleanup_schedules_async_scope_cleanup_as_task() -> None:
+    events: list[str] = []
+    release = asyncio.Event()
+
+    async def make_session() -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        await release.wait()
+        events.append("session:close")
+
+    async def make_client(session: _Session) -> AsyncGenerator[_Client, None]:
+        yield _Client()
+        events.append("client:close")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.REQUEST)
+
+    async with container.enter_scope(Scope.REQUEST) as request_scope:
+        await request_scope.aresolve(_Client)
+
+    assert events == []
+    release.set()
+    await asyncio.wait_for(container.adrain_cleanups(), timeout=5)
+    assert events == ["client:close", "session:close"]
+
+
+async def test_deferred_cleanup_drains_before_closing_root_resources() -> None:
+    events: list[str] = []
+
+    async def make_engine() -> AsyncGenerator[_Engine, None]:
+        yield _Engine()
+        events.append("engine:close")
+
+    async def make_session(engine: _Engine) -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        await asyncio.sleep(0.01)
+        events.append("session:close")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_engine, provides=_Engine)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+
+    async with container.enter_scope(Scope.REQUEST) as request_scope:
+        await request_scope.aresolve(_Session)
+    await container.aclose()
+
+    assert events == ["session:close", "engine:close"]
+
+
+def test_deferred_cleanup_keeps_lifo_order_across_nested_scopes() -> None:
+    events: list[str] = []
+
+    def make_engine() -> Generator[_Engine, None, None]:
+        yield _Engine()
+        events.append("engine:close")
+
+    def make_session(engine: _Engine) -> Generator[_Session, None, None]:
+        yield _Session()
+        events.append("session:close")
+
+    def make_client(session: _Session) -> Generator[_Client, None, None]:
+        yield _Client()
+        time.sleep(0.01)
+        events.append("client:close")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_engine, provides=_Engine, scope=Scope.SESSION)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.ACTION)
+
+    with container.enter_scope(Scope.SESSION) as session_scope:
+        with session_scope.enter_scope(Scope.REQUEST) as request_scope:
+            request_scope.resolve(_Session)
+        container.drain_cleanups()
+        with session_scope.enter_scope(Scope.ACTION) as action_scope:
+            action_scope.resolve(_Client)
+
+    container.drain_cleanups()
+    assert events == ["session:close", "client:close", "session:close", "engine:close"]
+
+
+async def test_deferred_cleanup_keeps_lifo_order_across_async_and_sync_scopes() -> None:
+    events: list[str] = []
+
+    def make_engine() -> Generator[_Engine, None, None]:
+        yield _Engine()
+        events.append("engine:close")
+
+    async def make_session(engine: _Engine) -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        await asyncio.sleep(0.01)
+        events.append("session:close")
+
+    async def make_client(session: _Session) -> AsyncGenerator[_Client, None]:
+        yield _Client()
+        await asyncio.sleep(0.01)
+        events.append("client:close")
+
+    container = Container(deferred_cleanup=True)
+    container.add_generator(make_engine, provides=_Engine, scope=Scope.SESSION)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add_generator(make_client, provides=_Client, scope=Scope.ACTION)
+
+    with container.enter_scope(Scope.SESSION) as session_scope:
+        async with session_scope.enter_scope(Scope.ACTION) as action_scope:
+            await action_scope.aresolve(_Client)
+
+    await asyncio.wait_for(container.adrain_cleanups(), timeout=5)
+    assert events == ["client:close", "session:close", "engine:close"]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import gc
+from typing import Any, cast
+
+import pytest
+
+from diwire import All, Container, Lifetime, MissingPolicy, Scope
+from diwire.exceptions import (
+    DIWireDependencyNotRegisteredError,
+    DIWireInvalidRegistrationError,
+)
+
+
+class _Config:
+    pass
+
+
+class _Repository:
+    def __init__(self, config: _Config) -> None:
+        self.config = config
+
+
+class _Service:
+    def __init__(self, config: _Config, repository: _Repository) -> None:
+        self.config = config
+        self.repository = repository
+
+
+class _RequestHandler:
+    def __init__(self, service: _Service) -> None:
+        self.service = service
+
+
+class _Unregistered:
+    pass
+
+
+def _runtime(container: Container) -> Any:
+    return cast("Any", type(container._generated_root_resolver))._runtime
+
+
+def test_freeze_folds_root_singletons_into_dependents() -> None:
+    container = Container(missing_policy=MissingPolicy.ERROR, use_resolver_context=False)
+    container.add(_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+    container.add(_Service)
+    container.add(_RequestHandler, scope=Scope.REQUEST)
+    config = container.resolve(_Config)
+
+    container.freeze()
+
+    runtime = _runtime(container)
+    service = container.resolve(_Service)
+    assert set(runtime.frozen_values_by_slot.values()) == {config, service}
+    assert container.resolve(_Config) is config
+    assert service.config is config
+    assert container.resolve(_Repository).config is config
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        assert request_scope.resolve(_RequestHandler).service is service
+
+
+def test_freeze_rejects_registration_mutations() -> None:
+    container = Container()
+    container.add(_Config)
+    container.freeze()
+
+    with pytest.raises(DIWireInvalidRegistrationError, match="frozen"):
+        container.add(_Repository)
+    with pytest.raises(DIWireInvalidRegistrationError, match="frozen"):
+        container.add_instance(_Config(), provides=_Config)
+
+
+def test_freeze_disables_resolve_time_autoregistration() -> None:
+    container = Container()
+    container.add(_Config)
+    container.freeze()
+
+    with pytest.raises(DIWireDependencyNotRegisteredError):
+        container.resolve(_Unregistered)
+
+
+def test_freeze_folds_root_singleton_all_members() -> None:
+    container = Container()
+    container.add_instance(1, provides=int)
+
+    container.freeze()
+
+    assert container.resolve(All[int]) == (1,)
+
+
+def test_freeze_is_idempotent_and_can_freeze_gc() -> None:
+    container = Container()
+    container.add(_Config)
+    container.freeze()
+    root_resolver = container._generated_root_resolver
+
+    try:
+        container.freeze(gc_freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert container._generated_root_resolver is root_resolver
+
+
+def test_freeze_leaves_unresolved_async_root_singletons_to_cache() -> None:
+    async def make_config() -> _Config:
+        return _Config()
+
+    container = Container()
+    container.add_factory(make_config, provides=_Config)
+
+    container.freeze()
+
+    assert _runtime(container).frozen_values_by_slot == {}
+
+
+async def test_afreeze_builds_async_root_singletons() -> None:
+    async def make_config() -> _Config:
+        return _Config()
+
+    container = Container()
+    container.add_factory(make_config, provides=_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+
+    await container.afreeze()
+
+    config = next(iter(_runtime(container).frozen_values_by_slot.values()))
+    assert await container.aresolve(_Config) is config
+    assert (await container.aresolve(_Repository)).config is config
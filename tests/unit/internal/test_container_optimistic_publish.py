@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+import pytest
+
+from diwire import Container, LockMode, Scope
+
+_THREAD_WORKERS = 32
+
+
+class _Engine:
+    pass
+
+
+def _workflow(container: Container, dependency: Any) -> Any:
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+    return runtime.workflows_by_slot[runtime.slot_by_dependency[dependency]]
+
+
+@pytest.mark.parametrize("scope", [Scope.APP, Scope.REQUEST])
+def test_optimistic_publish_stress_keeps_first_published_value(scope: Scope) -> None:
+    calls = 0
+    calls_lock = threading.Lock()
+    # Every worker must be inside the provider at once, which a build-time lock would prevent.
+    all_building = threading.Barrier(_THREAD_WORKERS)
+
+    def make_engine() -> _Engine:
+        nonlocal calls
+        with calls_lock:
+            calls += 1
+        all_building.wait(timeout=5)
+        return _Engine()
+
+    container = Container(lock_mode=LockMode.OPTIMISTIC, use_resolver_context=False)
+    container.add_factory(make_engine, provides=_Engine, scope=scope)
+    root_resolver = container.compile()
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        resolver = root_resolver if scope is Scope.APP else request_scope
+        with ThreadPoolExecutor(max_workers=_THREAD_WORKERS) as pool:
+            futures = [pool.submit(resolver.resolve, _Engine) for _ in range(_THREAD_WORKERS)]
+            results = [future.result(timeout=10) for future in futures]
+
+        assert calls == _THREAD_WORKERS
+        assert len({id(result) for result in results}) == 1
+        assert resolver.resolve(_Engine) is results[0]
+
+
+@pytest.mark.parametrize("scope", [Scope.APP, Scope.REQUEST])
+async def test_optimistic_publish_keeps_first_published_async_value(scope: Scope) -> None:
+    calls = 0
+    all_building = asyncio.Event()
+    tasks = 8
+
+    async def make_engine() -> _Engine:
+        nonlocal calls
+        calls += 1
+        if calls == tasks:
+            all_building.set()
+        await all_building.wait()
+        return _Engine()
+
+    container = Container(lock_mode=LockMode.OPTIMISTIC, use_resolver_context=False)
+    container.add_factory(make_engine, provides=_Engine, scope=scope)
+    root_resolver = container.compile()
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        resolver = root_resolver if scope is Scope.APP else request_scope
+        results = await asyncio.wait_for(
+            asyncio.gather(*(resolver.aresolve(_Engine) for _ in range(tasks))),
+            timeout=5,
+        )
+
+        assert calls == tasks
+        assert len({id(result) for result in results}) == 1
+        assert await resolver.aresolve(_Engine) is results[0]
+
+
+def test_optimistic_publish_falls_back_to_locks_for_cleanup_providers() -> None:
+    def make_engine() -> Generator[_Engine, None, None]:
+        yield _Engine()
+
+    container = Container(lock_mode=LockMode.OPTIMISTIC, use_resolver_context=False)
+    container.add_generator(make_engine, provides=_Engine)
+
+    workflow = _workflow(container, _Engine)
+
+    assert workflow.effective_lock_mode is LockMode.THREAD
+    assert workflow.uses_thread_lock
+    assert not workflow.uses_optimistic_publish
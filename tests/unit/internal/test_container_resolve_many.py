@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from typing import Any, cast
+
+import pytest
+
+from diwire import (
+    Container,
+    Lifetime,
+    LockMode,
+    Maybe,
+    MissingPolicy,
+    Provider,
+    Scope,
+)
+from diwire._internal.resolvers.assembly import compiler as compiler_module
+from diwire.exceptions import DIWireDependencyNotRegisteredError, DIWireScopeMismatchError
+
+
+class _Config:
+    pass
+
+
+class _Repository:
+    def __init__(self, config: _Config) -> None:
+        self.config = config
+
+
+class _RequestSession:
+    pass
+
+
+class _Unregistered:
+    pass
+
+
+def _strict_container() -> Container:
+    return Container(missing_policy=MissingPolicy.ERROR, use_resolver_context=False)
+
+
+def test_resolve_many_returns_values_in_requested_order() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+
+    repository, config, maybe_missing = container.resolve_many(
+        (_Repository, _Config, Maybe[_Unregistered]),
+    )
+
+    assert isinstance(repository, _Repository)
+    assert config is repository.config
+    assert maybe_missing is None
+    assert container.resolve_many([_Config]) == (config,)
+    assert container.resolve_many(()) == ()
+
+
+def test_resolve_many_memoizes_one_batch_method_per_key_tuple() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+
+    first = root_resolver.resolve_many((_Config, _Repository))
+    second = root_resolver.resolve_many((_Config, _Repository))
+    root_resolver.resolve_many((_Repository,))
+
+    assert first[0] is second[0]
+    assert first[1] is not second[1]
+    assert set(runtime.sync_batch_methods) == {(_Config, _Repository), (_Repository,)}
+
+
+def test_resolve_many_shares_batch_methods_across_scopes() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    container.add(_RequestSession, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with pytest.raises(DIWireScopeMismatchError):
+        root_resolver.resolve_many((_Config, _RequestSession))
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        config, session = request_scope.resolve_many((_Config, _RequestSession))
+        assert config is root_resolver.resolve(_Config)
+        assert session is request_scope.resolve(_RequestSession)
+
+
+def test_resolve_many_raises_for_unregistered_keys_in_strict_mode() -> None:
+    container = _strict_container()
+    container.add(_Config)
+
+    with pytest.raises(DIWireDependencyNotRegisteredError):
+        container.resolve_many((_Config, _Unregistered))
+
+
+def test_resolve_many_autoregisters_missing_keys_like_resolve() -> None:
+    container = Container()
+
+    repository, provider = container.resolve_many((_Repository, Provider[_Config]))
+
+    assert isinstance(repository, _Repository)
+    assert provider() is repository.config
+
+
+def test_resolve_many_builds_each_key_once_when_autoregistering() -> None:
+    built: list[str] = []
+
+    def make_session() -> Generator[_RequestSession, None, None]:
+        built.append("session")
+        yield _RequestSession()
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_RequestSession, lifetime=Lifetime.TRANSIENT)
+
+    session, repository, maybe_missing = container.resolve_many(
+        (_RequestSession, _Repository, Maybe[_Unregistered]),
+    )
+
+    assert isinstance(session, _RequestSession)
+    assert isinstance(repository, _Repository)
+    assert maybe_missing is None
+    assert built == ["session"]
+
+
+def test_resolve_many_bounds_memoized_batch_methods(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compiler_module, "_BATCH_METHOD_CACHE_SIZE", 2)
+    container = _strict_container()
+    container.add(_Config)
+    container.add(_RequestSession)
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+
+    root_resolver.resolve_many((_Config,))
+    root_resolver.resolve_many((_RequestSession,))
+    root_resolver.resolve_many((_Config, _RequestSession))
+
+    assert set(runtime.sync_batch_methods) == {(_Config, _RequestSession)}
+
+
+def test_compiled_strict_container_binds_batch_entrypoints() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    root_resolver = container.compile()
+
+    assert container.resolve_many == root_resolver.resolve_many
+    assert container.aresolve_many == root_resolver.aresolve_many
+
+    container.add(_Repository)
+
+    assert container.resolve_many != root_resolver.resolve_many
+
+
+async def test_aresolve_many_resolves_async_providers_in_order() -> None:
+    async def make_config() -> _Config:
+        return _Config()
+
+    container = _strict_container()
+    container.add_factory(make_config, provides=_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+
+    repository, config = await container.aresolve_many((_Repository, _Config))
+
+    assert config is repository.config
+
+
+async def test_aresolve_many_concurrent_awaits_independent_async_providers_together() -> None:
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    async def make_int() -> int:
+        first_started.set()
+        await second_started.wait()
+        return 1
+
+    async def make_str() -> str:
+        second_started.set()
+        await first_started.wait()
+        return "value"
+
+    container = _strict_container()
+    container.add_factory(make_int, provides=int, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(make_str, provides=str, lifetime=Lifetime.TRANSIENT)
+
+    result = await asyncio.wait_for(
+        container.aresolve_many((int, str), concurrent=True),
+        timeout=1,
+    )
+
+    assert result == (1, "value")
+
+
+async def test_aresolve_many_concurrent_keeps_unlocked_shared_dependencies_sequential() -> None:
+    created: list[_Config] = []
+
+    async def make_config() -> _Config:
+        await asyncio.sleep(0)
+        config = _Config()
+        created.append(config)
+        return config
+
+    async def make_int(config: _Config) -> int:
+        return id(config)
+
+    async def make_str(config: _Config) -> str:
+        return str(id(config))
+
+    container = Container(
+        missing_policy=MissingPolicy.ERROR,
+        use_resolver_context=False,
+        lock_mode=LockMode.NONE,
+    )
+    container.add_factory(make_config, provides=_Config)
+    container.add_factory(make_int, provides=int, lifetime=Lifetime.TRANSIENT)
+    container.add_factory(make_str, provides=str, lifetime=Lifetime.TRANSIENT)
+
+    first, second = await container.aresolve_many((int, str), concurrent=True)
+
+    assert len(created) == 1
+    assert str(first) == second
+
+
+async def test_aresolve_many_concurrent_keeps_cleanup_providers_in_teardown_order() -> None:
+    events: list[str] = []
+
+    async def make_int() -> AsyncGenerator[int, None]:
+        await asyncio.sleep(0.01)
+        yield 1
+        events.append("int:close")
+
+    async def make_str() -> AsyncGenerator[str, None]:
+        yield "value"
+        events.append("str:close")
+
+    container = _strict_container()
+    container.add_generator(make_int, provides=int, scope=Scope.REQUEST)
+    container.add_generator(make_str, provides=str, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert await request_scope.aresolve_many((int, str), concurrent=True) == (1, "value")
+
+    assert events == ["str:close", "int:close"]
+
+
+async def test_aresolve_many_builds_each_key_once_when_autoregistering() -> None:
+    built: list[str] = []
+
+    async def make_session() -> AsyncGenerator[_RequestSession, None]:
+        built.append("session")
+        yield _RequestSession()
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_RequestSession, lifetime=Lifetime.TRANSIENT)
+
+    session, repository = await container.aresolve_many((_RequestSession, _Repository))
+
+    assert isinstance(session, _RequestSession)
+    assert isinstance(repository, _Repository)
+    assert built == ["session"]
+
+
+async def test_aresolve_many_bounds_memoized_batch_methods(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(compiler_module, "_BATCH_METHOD_CACHE_SIZE", 1)
+    container = _strict_container()
+    container.add(_Config)
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+
+    await root_resolver.aresolve_many((_Config,))
+    await root_resolver.aresolve_many((_Config,), concurrent=True)
+
+    assert set(runtime.async_batch_methods) == {(True, (_Config,))}
+
+
+async def test_aresolve_many_goes_through_resolver_context_wrapper() -> None:
+    container = Container()
+    container.add(_Config)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        assert request_scope.resolve_many((_Config,)) == (container.resolve(_Config),)
+        assert await request_scope.aresolve_many((_Config,), concurrent=True) == (
+            container.resolve(_Config),
+        )
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+
+from diwire import (
+    Container,
+    Lifetime,
+    Maybe,
+    MissingPolicy,
+    ResolutionHandle,
+    Scope,
+)
+from diwire.exceptions import DIWireScopeMismatchError
+
+
+class _Config:
+    pass
+
+
+class _Repository:
+    def __init__(self, config: _Config) -> None:
+        self.config = config
+
+
+class _RequestSession:
+    pass
+
+
+class _Unregistered:
+    pass
+
+
+def _strict_container() -> Container:
+    return Container(missing_policy=MissingPolicy.ERROR, use_resolver_context=False)
+
+
+def test_resolver_for_returns_handle_resolving_root_dependencies() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+
+    get_config = container.resolver_for(_Config)
+    get_repository = container.resolver_for(_Repository)
+
+    assert isinstance(get_config, ResolutionHandle)
+    assert get_config.dependency is _Config
+    config = get_config()
+    assert get_config() is config
+    assert config is container.resolve(_Config)
+    repository = get_repository()
+    assert repository is not get_repository()
+    assert repository.config is config
+
+
+def test_resolver_for_skips_resolve_dispatch() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    root_resolver = container.compile()
+    get_config = container.resolver_for(_Config)
+    get_config()
+
+    def _fail_resolve(dependency: Any) -> Any:
+        msg = f"dispatch should be skipped for {dependency!r}"
+        raise AssertionError(msg)
+
+    cast("Any", root_resolver).resolve = _fail_resolve
+
+    assert get_config() is get_config()
+
+
+def test_resolver_for_resolves_from_explicit_scope_resolver() -> None:
+    container = _strict_container()
+    container.add(_RequestSession, scope=Scope.REQUEST)
+    get_session = container.resolver_for(_RequestSession)
+
+    with pytest.raises(DIWireScopeMismatchError):
+        get_session()
+
+    with container.enter_scope(Scope.REQUEST) as first_scope:
+        first = get_session(first_scope)
+        assert get_session(first_scope) is first
+        assert first is first_scope.resolve(_RequestSession)
+    with container.enter_scope(Scope.REQUEST) as second_scope:
+        assert get_session(second_scope) is not first
+
+
+def test_resolver_for_rebinds_after_registration_mutation() -> None:
+    container = _strict_container()
+    container.add(_Config)
+    get_config = container.resolver_for(_Config).resolve
+    first = get_config()
+
+    replacement = _Config()
+    container.add_instance(replacement, provides=_Config)
+
+    assert first is not replacement
+    assert get_config() is replacement
+    assert get_config() is replacement
+
+
+def test_resolver_for_routes_keys_without_slot_through_container() -> None:
+    container = Container()
+    get_maybe = container.resolver_for(Maybe[_Unregistered])
+    get_repository = container.resolver_for(_Repository)
+
+    assert get_maybe() is None
+    repository = get_repository()
+    assert isinstance(repository, _Repository)
+    assert get_repository() is repository
+
+
+def test_resolver_for_follows_resolver_context_scope() -> None:
+    container = Container()
+    container.add(_RequestSession, scope=Scope.REQUEST)
+    get_session = container.resolver_for(_RequestSession)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        session = get_session()
+        assert session is request_scope.resolve(_RequestSession)
+        assert get_session(request_scope) is session
+
+
+async def test_resolver_for_aresolve_resolves_async_providers() -> None:
+    async def make_config() -> _Config:
+        return _Config()
+
+    container = _strict_container()
+    container.add_factory(make_config, provides=_Config)
+    container.add(_RequestSession, scope=Scope.REQUEST)
+    get_config = container.resolver_for(_Config)
+    get_session = container.resolver_for(_RequestSession)
+
+    config = await get_config.aresolve()
+
+    assert await get_config.aresolve() is config
+    async with container.enter_scope(Scope.REQUEST) as request_scope:
+        session = await get_session.aresolve(request_scope)
+        assert await get_session.aresolve(request_scope) is session
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, cast
+
+from diwire import Container, LockMode, Scope
+from diwire._internal.resolvers.assembly.compiler import (
+    _SCOPE_CACHE_LOCK_STRIPES,
+    _lock_stripe_index,
+)
+
+
+class _Engine:
+    pass
+
+
+class _UnitOfWork:
+    pass
+
+
+def _slot(container: Container, dependency: Any) -> int:
+    return container._providers_registrations.get_by_type(dependency).slot
+
+
+def _enter_scopes_on_different_stripes(stack: ExitStack, root_resolver: Any) -> tuple[Any, Any]:
+    first_scope = stack.enter_context(root_resolver.enter_scope(Scope.REQUEST))
+    while True:
+        second_scope = stack.enter_context(root_resolver.enter_scope(Scope.REQUEST))
+        if _lock_stripe_index(second_scope) != _lock_stripe_index(first_scope):
+            return first_scope, second_scope
+
+
+def test_scope_cache_locks_are_striped_per_slot() -> None:
+    container = Container(lock_mode=LockMode.THREAD, use_resolver_context=False)
+    container.add(_Engine)
+    container.add(_UnitOfWork, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+    engine_slot = _slot(container, _Engine)
+    unit_of_work_slot = _slot(container, _UnitOfWork)
+
+    assert set(runtime.thread_lock_by_slot) == {engine_slot}
+    assert set(runtime.thread_lock_stripes_by_slot) == {unit_of_work_slot}
+    lock_stripes = runtime.thread_lock_stripes_by_slot[unit_of_work_slot]
+    assert len(set(map(id, lock_stripes))) == _SCOPE_CACHE_LOCK_STRIPES
+
+
+def test_scope_cache_locks_do_not_serialize_independent_scopes() -> None:
+    first_building = threading.Event()
+    second_built = threading.Event()
+
+    def make_unit_of_work() -> _UnitOfWork:
+        if not first_building.is_set():
+            first_building.set()
+            assert second_built.wait(timeout=5)
+        return _UnitOfWork()
+
+    container = Container(lock_mode=LockMode.THREAD, use_resolver_context=False)
+    container.add_factory(make_unit_of_work, provides=_UnitOfWork, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with ExitStack() as stack, ThreadPoolExecutor(max_workers=2) as pool:
+        first_scope, second_scope = _enter_scopes_on_different_stripes(stack, root_resolver)
+        first = pool.submit(first_scope.resolve, _UnitOfWork)
+        assert first_building.wait(timeout=5)
+        second = pool.submit(second_scope.resolve, _UnitOfWork).result(timeout=5)
+        second_built.set()
+
+        assert first.result(timeout=5) is not second
+
+
+def test_scope_cache_locks_build_shared_scope_cache_once() -> None:
+    calls = 0
+    workers = 12
+    all_waiting = threading.Barrier(workers)
+
+    def make_unit_of_work() -> _UnitOfWork:
+        nonlocal calls
+        calls += 1
+        return _UnitOfWork()
+
+    container = Container(lock_mode=LockMode.THREAD)
+    container.add_factory(make_unit_of_work, provides=_UnitOfWork, scope=Scope.REQUEST)
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+
+        def resolve_together() -> _UnitOfWork:
+            all_waiting.wait(timeout=5)
+            return request_scope.resolve(_UnitOfWork)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(resolve_together) for _ in range(workers)]
+            results = [future.result(timeout=5) for future in futures]
+
+    assert calls == 1
+    assert len({id(result) for result in results}) == 1
+
+
+async def test_scope_cache_async_locks_do_not_serialize_independent_scopes() -> None:
+    first_building = asyncio.Event()
+    second_built = asyncio.Event()
+
+    async def make_unit_of_work() -> _UnitOfWork:
+        if not first_building.is_set():
+            first_building.set()
+            await second_built.wait()
+        return _UnitOfWork()
+
+    container = Container(lock_mode=LockMode.ASYNC, use_resolver_context=False)
+    container.add_factory(make_unit_of_work, provides=_UnitOfWork, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with ExitStack() as stack:
+        first_scope, second_scope = _enter_scopes_on_different_stripes(stack, root_resolver)
+        first = asyncio.ensure_future(first_scope.aresolve(_UnitOfWork))
+        await asyncio.wait_for(first_building.wait(), timeout=5)
+        second = await asyncio.wait_for(second_scope.aresolve(_UnitOfWork), timeout=5)
+        second_built.set()
+
+        assert await asyncio.wait_for(first, timeout=5) is not second
+        assert await second_scope.aresolve(_UnitOfWork) is second
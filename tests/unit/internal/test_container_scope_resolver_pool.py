@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Generator
+from contextlib import ExitStack
+from typing import Any
+
+import pytest
+
+from diwire import Container, Provider, Scope
+from diwire._internal.resolvers.assembly.compiler import _SCOPE_RESOLVER_POOL_SIZE
+
+
+class _Session:
+    pass
+
+
+class _UnitOfWork:
+    def __init__(self, session: _Session) -> None:
+        self.session = session
+
+
+def _request_scope_pool(root_resolver: Any) -> list[Any]:
+    return getattr(root_resolver, f"_scope_pool_{Scope.REQUEST.level}")
+
+
+def _container_with_cleanup(events: list[str]) -> Container:
+    def make_session() -> Generator[_Session, None, None]:
+        events.append("session:open")
+        yield _Session()
+        events.append("session:close")
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    container.add(_UnitOfWork, scope=Scope.REQUEST)
+    return container
+
+
+def _resolve_in_request_scope(root_resolver: Any, dependency: Any) -> tuple[int, Any]:
+    # The scope is only referenced from this frame, so it is free for reuse once we return.
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        return id(request_scope), request_scope.resolve(dependency)
+
+
+def test_scope_resolver_pool_reuses_exited_resolvers_with_reset_caches() -> None:
+    events: list[str] = []
+    container = _container_with_cleanup(events)
+    root_resolver = container.compile()
+
+    first_scope_id, first_unit_of_work = _resolve_in_request_scope(root_resolver, _UnitOfWork)
+    second_scope_id, second_unit_of_work = _resolve_in_request_scope(root_resolver, _UnitOfWork)
+
+    assert second_scope_id == first_scope_id
+    assert second_unit_of_work is not first_unit_of_work
+    assert second_unit_of_work.session is not first_unit_of_work.session
+    assert events == ["session:open", "session:close"] * 2
+
+
+def test_scope_resolver_pool_hands_out_distinct_resolvers_to_open_scopes() -> None:
+    container = _container_with_cleanup([])
+    root_resolver = container.compile()
+    scope_pool = _request_scope_pool(root_resolver)
+
+    def open_two_scopes() -> set[int]:
+        with (
+            root_resolver.enter_scope(Scope.REQUEST) as first_scope,
+            root_resolver.enter_scope(Scope.REQUEST) as second_scope,
+        ):
+            assert first_scope is not second_scope
+            assert first_scope.resolve(_Session) is not second_scope.resolve(_Session)
+        first_scope.__exit__(None, None, None)
+        return {id(first_scope), id(second_scope)}
+
+    first_scope_ids = open_two_scopes()
+    assert len(scope_pool) == 2
+    assert open_two_scopes() == first_scope_ids
+    assert len(scope_pool) == 2
+
+
+def test_scope_resolver_pool_does_not_reuse_a_held_scope() -> None:
+    container = _container_with_cleanup([])
+    root_resolver = container.compile()
+
+    with root_resolver.enter_scope(Scope.REQUEST) as held_scope:
+        held_session = held_scope.resolve(_Session)
+    with root_resolver.enter_scope(Scope.REQUEST) as next_scope:
+        next_session = next_scope.resolve(_Session)
+
+        assert next_scope is not held_scope
+        assert held_scope.resolve(_Session) is held_session
+        assert next_session is not held_session
+
+
+def test_scope_resolver_pool_stale_provider_does_not_see_next_scope_cache() -> None:
+    class _SessionUser:
+        def __init__(self, session: Provider[_Session]) -> None:
+            self.session = session
+
+    container = _container_with_cleanup([])
+    container.add(_SessionUser, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    def resolve_session_user() -> tuple[_SessionUser, _Session]:
+        with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+            session_user = request_scope.resolve(_SessionUser)
+            return session_user, session_user.session()
+
+    stale_session_user, stale_session = resolve_session_user()
+    with root_resolver.enter_scope(Scope.REQUEST) as next_scope:
+        next_session = next_scope.resolve(_Session)
+
+        assert next_session is not stale_session
+        assert stale_session_user.session() is stale_session
+
+
+def test_scope_resolver_pool_is_bounded() -> None:
+    container = _container_with_cleanup([])
+    root_resolver = container.compile()
+
+    with ExitStack() as stack:
+        for _ in range(_SCOPE_RESOLVER_POOL_SIZE + 8):
+            stack.enter_context(root_resolver.enter_scope(Scope.REQUEST)).resolve(_Session)
+
+    assert len(_request_scope_pool(root_resolver)) == _SCOPE_RESOLVER_POOL_SIZE
+
+
+def test_scope_resolver_pool_skips_scopes_entered_with_context() -> None:
+    container = _container_with_cleanup([])
+    root_resolver = container.compile()
+
+    with root_resolver.enter_scope(Scope.REQUEST, context={int: 1}) as request_scope:
+        request_scope.resolve(_Session)
+
+    assert _request_scope_pool(root_resolver) == []
+
+
+def test_scope_resolver_pool_drops_resolvers_whose_cleanup_raised() -> None:
+    def make_session() -> Generator[_Session, None, None]:
+        yield _Session()
+        msg = "close failed"
+        raise RuntimeError(msg)
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        with root_resolver.enter_scope(Scope.REQUEST) as failed_scope:
+            failed_scope.resolve(_Session)
+
+    assert _request_scope_pool(root_resolver) == []
+    with pytest.raises(RuntimeError, match="close failed"):
+        with root_resolver.enter_scope(Scope.REQUEST) as next_scope:
+            assert next_scope is not failed_scope
+            next_scope.resolve(_Session)
+
+
+async def test_scope_resolver_pool_drops_resolvers_whose_async_cleanup_raised() -> None:
+    async def make_session() -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        msg = "close failed"
+        raise RuntimeError(msg)
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        async with root_resolver.enter_scope(Scope.REQUEST) as failed_scope:
+            await failed_scope.aresolve(_Session)
+
+    assert _request_scope_pool(root_resolver) == []
+
+
+async def test_scope_resolver_pool_reuses_resolvers_after_async_exit() -> None:
+    events: list[str] = []
+
+    async def make_session() -> AsyncGenerator[_Session, None]:
+        yield _Session()
+        events.append("session:close")
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(make_session, provides=_Session, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    async def resolve_in_request_scope() -> tuple[int, _Session]:
+        async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+            return id(request_scope), await request_scope.aresolve(_Session)
+
+    first_scope_id, first_session = await resolve_in_request_scope()
+    second_scope_id, second_session = await resolve_in_request_scope()
+
+    assert second_scope_id == first_scope_id
+    assert second_session is not first_session
+    assert events == ["session:close", "session:close"]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, cast
+
+from diwire import Container, Lifetime, LockMode
+from diwire._internal.resolvers.assembly.compiler import _root_singleton_layers
+
+
+class _Config:
+    pass
+
+
+class _Client:
+    pass
+
+
+class _Service:
+    def __init__(self, config: _Config, client: _Client) -> None:
+        self.config = config
+        self.client = client
+
+
+class _Handler:
+    def __init__(self, service: _Service) -> None:
+        self.service = service
+
+
+class _Endpoint:
+    def __init__(self, handler: _Handler) -> None:
+        self.handler = handler
+
+
+def test_root_singleton_layers_walk_through_transient_dependencies() -> None:
+    container = Container()
+    container.add(_Config)
+    container.add(_Client)
+    container.add(_Service)
+    container.add(_Handler, lifetime=Lifetime.TRANSIENT)
+    container.add(_Endpoint)
+    container.compile()
+    runtime = cast("Any", type(container._generated_root_resolver))._runtime
+
+    layers = _root_singleton_layers(runtime=runtime)
+
+    assert [{runtime.dep_type_by_slot[slot] for slot in layer} for layer in layers] == [
+        {_Config, _Client},
+        {_Service},
+        {_Endpoint},
+    ]
+
+
+def test_warmup_builds_independent_singletons_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def make_config() -> _Config:
+        barrier.wait()
+        return _Config()
+
+    def make_client() -> _Client:
+        barrier.wait()
+        return _Client()
+
+    container = Container()
+    container.add_factory(make_config, provides=_Config)
+    container.add_factory(make_client, provides=_Client)
+    container.add(_Service)
+
+    timings = container.warmup(max_workers=2)
+
+    assert set(timings) == {_Config, _Client, _Service}
+    assert all(duration >= 0 for duration in timings.values())
+    service = container.resolve(_Service)
+    assert service.config is container.resolve(_Config)
+    assert container.warmup() == {}
+
+
+def test_warmup_skips_async_root_singletons() -> None:
+    async def make_client() -> _Client:
+        return _Client()
+
+    container = Container()
+    container.add(_Config)
+    container.add_factory(make_client, provides=_Client)
+
+    assert set(container.warmup()) == {_Config}
+
+
+def test_warmup_respects_thread_lock_under_concurrent_resolution() -> None:
+    created: list[_Config] = []
+    started = threading.Event()
+
+    def make_config() -> _Config:
+        started.set()
+        time.sleep(0.05)
+        config = _Config()
+        created.append(config)
+        return config
+
+    container = Container(lock_mode=LockMode.THREAD)
+    container.add_factory(make_config, provides=_Config)
+    container.compile()
+    resolved: list[_Config] = []
+
+    def resolve_when_started() -> None:
+        started.wait(timeout=5)
+        resolved.append(container.resolve(_Config))
+
+    request = threading.Thread(target=resolve_when_started)
+
+    request.start()
+    container.warmup()
+    request.join(timeout=5)
+
+    assert len(created) == 1
+    assert resolved == created
+
+
+async def test_awarmup_awaits_independent_async_singletons_together() -> None:
+    config_started = asyncio.Event()
+    client_started = asyncio.Event()
+
+    async def make_config() -> _Config:
+        config_started.set()
+        await client_started.wait()
+        return _Config()
+
+    async def make_client() -> _Client:
+        client_started.set()
+        await config_started.wait()
+        return _Client()
+
+    container = Container()
+    container.add_factory(make_config, provides=_Config)
+    container.add_factory(make_client, provides=_Client)
+    container.add(_Service)
+    container.add_instance(1, provides=int)
+
+    timings = await asyncio.wait_for(container.awarmup(), timeout=5)
+
+    assert set(timings) == {_Config, _Client, _Service}
+    service = await container.aresolve(_Service)
+    assert service.client is await container.aresolve(_Client)
@@ -159,6 +159,16 @@ def test_maybe_helpers_detect_and_strip_marker() -> None:
     assert strip_maybe_annotation(int) is int
 
 
+def test_stateless_marker_keys_are_value_based_and_hashable() -> None:
+    assert Maybe[Database] == Maybe[Database]
+    assert hash(Maybe[Database]) == hash(Maybe[Database])
+    assert FromContext[int] == FromContext[int]
+    assert Injected[Database] == Injected[Database]
+    assert MaybeMarker() != FromContextMarker()
+    assert Maybe[Database] != FromContext[Database]
+    assert len({Maybe[int], Maybe[int], FromContext[int], Injected[int]}) == 3
+
+
 def test_provider_wraps_dependency_with_provider_marker() -> None:
     dependency = Provider[Database]
 
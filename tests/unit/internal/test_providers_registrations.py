@@ -62,3 +62,21 @@ def test_add_override_removes_previous_slot_registration() -> None:
     assert registrations.get_by_slot(second_spec.slot) is second_spec
     with pytest.raises(KeyError):
         registrations.get_by_slot(first_spec.slot)
+
+
+def test_renumbered_copies_specs_with_dense_slots_in_registration_order() -> None:
+    registrations = ProvidersRegistrations()
+    first_type = type("FirstService", (), {})
+    second_type = type("SecondService", (), {})
+    registrations.add(_provider_spec(provides=second_type, scope_level=Scope.APP))
+    registrations.add(_provider_spec(provides=first_type, scope_level=Scope.REQUEST))
+    original_second_spec = registrations.get_by_type(second_type)
+
+    renumbered = registrations.renumbered()
+
+    assert [spec.slot for spec in renumbered.values()] == [1, 2]
+    assert renumbered.get_by_slot(1).provides is second_type
+    assert renumbered.get_by_type(first_type).scope is Scope.REQUEST
+    assert renumbered.get_by_slot(1).instance is original_second_spec.instance
+    assert registrations.get_by_type(second_type) is original_second_spec
+    assert renumbered.get_by_slot(1) is not original_second_spec
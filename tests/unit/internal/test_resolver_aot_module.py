@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import runpy
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from diwire import Container, FromContext, Lifetime, Scope
+from diwire._internal.cli import main
+from diwire._internal.resolvers.assembly import compiler as compiler_module
+from diwire._internal.resolvers.assembly.aot import load_resolver_module, render_resolver_module
+
+_TARGET = f"{__name__}:build_container"
+
+
+class _Config:
+    pass
+
+
+class _Repository:
+    def __init__(self, config: _Config, tenant: FromContext[int]) -> None:
+        self.config = config
+        self.tenant = tenant
+
+
+class _Service:
+    def __init__(self, repository: _Repository) -> None:
+        self.repository = repository
+
+
+def build_container(**kwargs: Any) -> Container:
+    container = Container(use_resolver_context=False, **kwargs)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Repository, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    container.add(_Service, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    return container
+
+
+prebuilt_container = build_container()
+not_a_container = object()
+
+
+def _import_module_from_path(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location("_diwire_aot_resolvers", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _count_source_compilations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    compiled_sources: list[str] = []
+
+    def _compile(source: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(source, str):
+            compiled_sources.append(source)
+        return compile(source, *args, **kwargs)
+
+    monkeypatch.setattr(compiler_module, "compile", _compile, raising=False)
+    return compiled_sources
+
+
+def _assert_resolves(container: Container) -> None:
+    with container.enter_scope(Scope.REQUEST, context={int: 7}) as request_scope:
+        service = request_scope.resolve(_Service)
+        assert service.repository is request_scope.resolve(_Repository)
+        assert service.repository.config is container.resolve(_Config)
+        assert service.repository.tenant == 7
+
+
+def test_build_writes_module_whose_code_replaces_resolver_compilation(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output = tmp_path / "resolvers.py"
+    assert main(["build", _TARGET, "--output", str(output)]) == 0
+    module = _import_module_from_path(output)
+
+    compiled_sources = _count_source_compilations(monkeypatch)
+    container = build_container(aot_module=module)
+    _assert_resolves(container)
+
+    assert compiled_sources == []
+    assert {code.co_filename for code in module.DIWIRE_CODE_BY_DIGEST.values()} == {str(output)}
+    assert not any(name in vars(module) for name in ("__enter__", "resolve", "aresolve"))
+
+
+def test_aot_module_is_imported_by_name(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output = tmp_path / "named_aot_resolvers.py"
+    assert main(["build", f"{__name__}:prebuilt_container", "-o", str(output)]) == 0
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "named_aot_resolvers", raising=False)
+
+    compiled_sources = _count_source_compilations(monkeypatch)
+    _assert_resolves(build_container(aot_module="named_aot_resolvers"))
+
+    assert compiled_sources == []
+
+
+def test_aot_module_drift_falls_back_to_compilation(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    output = tmp_path / "resolvers.py"
+    assert main(["build", _TARGET, "--output", str(output)]) == 0
+    container = build_container(aot_module=_import_module_from_path(output))
+    container.add(_Service, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+
+    compiled_sources = _count_source_compilations(monkeypatch)
+    with caplog.at_level(logging.WARNING):
+        _assert_resolves(container)
+
+    assert compiled_sources
+    assert "does not match the current registrations" in caplog.text
+
+
+def test_unusable_aot_modules_are_ignored_with_a_warning(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    incompatible = ModuleType("incompatible_resolvers")
+    incompatible.DIWIRE_AOT_FORMAT = 0  # type: ignore[attr-defined]
+
+    with caplog.at_level(logging.WARNING):
+        assert load_resolver_module("missing_diwire_aot_resolvers", fingerprint="fp") is None
+        assert load_resolver_module(incompatible, fingerprint="fp") is None
+        _assert_resolves(build_container(aot_module="missing_diwire_aot_resolvers"))
+
+    assert "Could not import ahead-of-time resolver module" in caplog.text
+    assert "Ignoring incompatible ahead-of-time resolver module" in caplog.text
+
+
+def test_build_check_reports_missing_and_stale_modules(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    output = tmp_path / "generated" / "resolvers.py"
+    assert main(["build", _TARGET, "--output", str(output), "--check"]) == 1
+    assert not output.exists()
+
+    assert main(["build", _TARGET, "--output", str(output)]) == 0
+    assert main(["build", _TARGET, "--output", str(output), "--check"]) == 0
+
+    output.write_text(output.read_text() + "# edited\n")
+    assert main(["build", _TARGET, "--output", str(output), "--check"]) == 1
+    assert "is out of date" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("target", "message"),
+    [
+        ("no_attribute_separator", "Expected a 'module:attribute' target"),
+        (f"{__name__}:not_a_container", "is not a Container"),
+        (f"{__name__}:missing_attribute", "missing_attribute"),
+        ("missing_diwire_build_module:factory", "missing_diwire_build_module"),
+    ],
+)
+def test_build_rejects_invalid_targets(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    target: str,
+    message: str,
+) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(["build", target, "--output", str(tmp_path / "resolvers.py")])
+
+    assert exc_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_python_dash_m_diwire_runs_the_cli(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output = tmp_path / "resolvers.py"
+    monkeypatch.setattr(sys, "argv", ["diwire", "build", _TARGET, "--output", str(output)])
+
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("diwire", run_name="__main__")
+
+    assert exc_info.value.code == 0
+    assert output.is_file()
+
+
+def test_render_resolver_module_rejects_non_function_sources() -> None:
+    with pytest.raises(RuntimeError, match="Unable to find the function name"):
+        render_resolver_module(
+            fingerprint="fp",
+            source_by_digest={"digest": "value = 1\n"},
+            target="app:container",
+        )
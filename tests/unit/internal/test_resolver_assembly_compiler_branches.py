@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import inspect
 import threading
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager, suppress
 from dataclasses import replace
 from types import SimpleNamespace
 from typing import Annotated, Any, cast
@@ -227,6 +228,11 @@ def _runtime(
         },
         cache_slots_by_owner_level=cache_slots_by_owner_level,
         next_scope_options_by_level=next_scope_options_by_level,
+        inlinable_transient_slots=compiler_module._inlinable_transient_slots(
+            workflows_by_slot={workflow.slot: workflow for workflow in workflows},
+            max_depth=compiler_module._TRANSIENT_INLINE_MAX_DEPTH,
+            max_nodes=compiler_module._TRANSIENT_INLINE_MAX_NODES,
+        ),
     )
 
 
@@ -531,11 +537,46 @@ def test_call_provider_and_cache_replace_branches() -> None:
             ],
         )
 
+    assert compiler_module._call_provider(callable_obj=lambda: 1, argument_parts=[]) == 1
+    assert compiler_module._call_provider(
+        callable_obj=lambda *args, **kwargs: (args, kwargs),
+        argument_parts=[
+            compiler_module._ArgumentPart(kind="star", value=[1, 2]),
+            compiler_module._ArgumentPart(kind="kw", name="x", value=3),
+            compiler_module._ArgumentPart(kind="starstar", value={"y": 4}),
+        ],
+    ) == ((1, 2), {"x": 3, "y": 4})
+    assert (
+        compiler_module._literal_value_for_plan(
+            dependency_plan=ProviderDependencyPlan(
+                kind="literal",
+                dependency=_dependency(),
+                dependency_index=0,
+                literal_expression="()",
+            ),
+        )
+        == ()
+    )
+
     root_scope = _scope_plan(level=1, name="app")
     workflow = _workflow_plan(slot=1, is_cached=True)
     runtime = _runtime(scopes=(root_scope,), workflows=(workflow,))
     resolver = SimpleNamespace()
 
+    assert (
+        compiler_module._resolve_dependency_value_sync(
+            runtime=runtime,
+            resolver=resolver,
+            dependency_plan=ProviderDependencyPlan(
+                kind="all",
+                dependency=_dependency(),
+                dependency_index=0,
+                all_slots=(),
+            ),
+        )
+        == ()
+    )
+
     compiler_module._replace_sync_cache(
         runtime=runtime,
         resolver=resolver,
@@ -1089,6 +1130,74 @@ async def test_async_slot_cached_fast_returns_without_lock() -> None:
     assert await compiler_module._build_async_slot_impl(workflow=uncached_lockless)(resolver) == 22
 
 
+def _optimistic_resolver(*, runtime: Any, class_plan: ScopePlan) -> Any:
+    resolver_type = type("Resolver", (), {"_runtime": runtime, "_class_plan": class_plan})
+    resolver = resolver_type()
+    resolver._root_resolver = resolver
+    resolver._cleanup_enabled = True
+    resolver._context = None
+    resolver._parent_context_resolver = None
+    resolver._cache_1 = compiler_module._MISSING_CACHE
+    return resolver
+
+
+def test_sync_slot_optimistic_publish_returns_first_published_value() -> None:
+    root_scope = _scope_plan(level=1, name="app")
+    workflow = replace(
+        _workflow_plan(slot=1, provider_attribute="instance", provides=int),
+        uses_optimistic_publish=True,
+    )
+    runtime = _runtime(scopes=(root_scope,), workflows=(workflow,), provider_by_slot={1: 10})
+    resolver = _optimistic_resolver(runtime=runtime, class_plan=root_scope)
+    resolver._published_1 = 42
+
+    assert compiler_module._build_sync_slot_impl(workflow=workflow)(resolver) == 42
+    assert resolver._cache_1 == 42
+
+
+@pytest.mark.asyncio
+async def test_async_slot_optimistic_publish_returns_first_published_value() -> None:
+    root_scope = _scope_plan(level=1, name="app")
+    workflow = replace(
+        _workflow_plan(slot=1, provider_attribute="instance", provides=int, requires_async=True),
+        uses_optimistic_publish=True,
+    )
+    runtime = _runtime(scopes=(root_scope,), workflows=(workflow,), provider_by_slot={1: 10})
+    resolver = _optimistic_resolver(runtime=runtime, class_plan=root_scope)
+
+    assert await compiler_module._build_async_slot_impl(workflow=workflow)(resolver) == 10
+    resolver._cache_1 = compiler_module._MISSING_CACHE
+    assert await compiler_module._build_async_slot_impl(workflow=workflow)(resolver) == 10
+    assert resolver._published_1 == 10
+
+
+def test_publish_optimistic_value_compares_and_sets_scope_caches() -> None:
+    root_scope = _scope_plan(level=1, name="app")
+    request_scope = _scope_plan(level=2, name="request")
+    workflow = replace(
+        _workflow_plan(
+            slot=1,
+            scope_level=2,
+            cache_owner_scope_level=2,
+            provider_attribute="instance",
+        ),
+        uses_optimistic_publish=True,
+    )
+    runtime = _runtime(scopes=(root_scope, request_scope), workflows=(workflow,))
+    resolver = _optimistic_resolver(runtime=runtime, class_plan=request_scope)
+
+    publish = compiler_module._publish_optimistic_value
+    assert publish(runtime=runtime, resolver=resolver, workflow=workflow, value=1) == 1
+    assert publish(runtime=runtime, resolver=resolver, workflow=workflow, value=2) == 1
+
+    runtime.thread_lock_stripes_by_slot[1] = tuple(
+        threading.Lock() for _ in range(compiler_module._SCOPE_CACHE_LOCK_STRIPES)
+    )
+    resolver._cache_1 = compiler_module._MISSING_CACHE
+    assert publish(runtime=runtime, resolver=resolver, workflow=workflow, value=3) == 3
+    assert resolver._cache_1 == 3
+
+
 @pytest.mark.asyncio
 async def test_resolve_dependency_value_async_remaining_branches() -> None:
     dependency = _dependency()
@@ -1916,7 +2025,8 @@ def test_optimized_sync_dependency_expression_additional_branches() -> None:
             ),
             resolver_expression="self",
         )
-        == "self._request_resolver.resolve_2()"
+        == "(self._request_resolver if self._request_resolver is not _MISSING_RESOLVER "
+        "else _raise_scope_mismatch_for_slot(2, 3)).resolve_2()"
     )
     assert (
         compiler._optimized_sync_dependency_expression(
@@ -1934,6 +2044,94 @@ def test_optimized_sync_dependency_expression_additional_branches() -> None:
     )
 
 
+def test_specialized_sync_slot_body_guards_async_provider_results() -> None:
+    compiler = compiler_module.ResolversAssemblyCompiler()
+    root_scope = _scope_plan(level=1, name="app")
+    workflow = _workflow_plan(
+        slot=1,
+        scope_level=1,
+        is_cached=False,
+        provider_attribute="factory",
+        is_provider_async=True,
+        max_required_scope_level=1,
+    )
+    runtime = _runtime(scopes=(root_scope,), workflows=(workflow,))
+
+    body_lines = compiler._specialized_sync_slot_body_lines(
+        runtime=runtime,
+        workflow=workflow,
+        class_plan=root_scope,
+    )
+
+    assert body_lines is not None
+    assert "if inspect.isawaitable(value):" in body_lines
+
+
+@pytest.mark.asyncio
+async def test_specialized_async_slot_body_fallback_branches() -> None:
+    compiler = compiler_module.ResolversAssemblyCompiler()
+    root_scope = _scope_plan(level=1, name="app")
+    request_scope = _scope_plan(level=3, name="request")
+    inject_workflow = _workflow_plan(
+        slot=1,
+        provider_attribute="factory",
+        is_cached=False,
+        requires_async=True,
+        provider_is_inject_wrapper=True,
+    )
+    deep_requirement_workflow = _workflow_plan(
+        slot=2,
+        provider_attribute="factory",
+        is_cached=False,
+        requires_async=True,
+        max_required_scope_level=3,
+    )
+    runtime = _runtime(
+        scopes=(root_scope, request_scope),
+        workflows=(inject_workflow, deep_requirement_workflow),
+        provider_by_slot={1: object(), 2: object()},
+    )
+
+    assert (
+        compiler._specialized_async_slot_body_lines(
+            runtime=runtime,
+            workflow=inject_workflow,
+            class_plan=root_scope,
+        )
+        is None
+    )
+    assert (
+        compiler._specialized_async_slot_body_lines(
+            runtime=runtime,
+            workflow=deep_requirement_workflow,
+            class_plan=request_scope,
+        )
+        is None
+    )
+    assert (
+        compiler._optimized_async_dependency_expression(
+            runtime=runtime,
+            dependency_plan=ProviderDependencyPlan(
+                kind="provider",
+                dependency=_dependency(),
+                dependency_index=0,
+                dependency_requires_async=True,
+            ),
+            resolver_expression="self",
+        )
+        is compiler_module._FALLBACK_ARGUMENT_EXPRESSION
+    )
+
+    sync_only_workflow = _workflow_plan(slot=3, provider_attribute="instance")
+    resolver_type = type(
+        "RootResolver",
+        (),
+        {"_runtime": runtime, "_class_plan": root_scope, "resolve_3": lambda _self: 33},
+    )
+    resolver = resolver_type()
+    assert await compiler_module._build_async_slot_impl(workflow=sync_only_workflow)(resolver) == 33
+
+
 def test_resolver_init_additional_branches() -> None:
     root_scope = _scope_plan(level=1, name="app")
     request_scope = _scope_plan(level=3, name="request")
@@ -1962,10 +2160,8 @@ def test_resolver_init_additional_branches() -> None:
     class _RootResolver:
         _runtime = root_runtime
         _class_plan = root_scope
-        _last_sync_dependency = compiler_module._MISSING_DEP_SLOT
-        _last_sync_method: Any | None = None
-        _last_async_dependency = compiler_module._MISSING_DEP_SLOT
-        _last_async_method: Any | None = None
+        _sync_dispatch_cache: tuple[Any, ...] = ()
+        _async_dispatch_cache: tuple[Any, ...] = ()
 
     root_resolver = _RootResolver()
     root_resolver_any = cast("Any", root_resolver)
@@ -1978,10 +2174,8 @@ def test_resolver_init_additional_branches() -> None:
     )
     assert root_resolver_any._root_resolver is root_resolver
     assert root_resolver_any._cache_70 is compiler_module._MISSING_CACHE
-    assert root_resolver_any._last_sync_dependency is compiler_module._MISSING_DEP_SLOT
-    assert root_resolver_any._last_sync_method is None
-    assert root_resolver_any._last_async_dependency is compiler_module._MISSING_DEP_SLOT
-    assert root_resolver_any._last_async_method is None
+    assert root_resolver_any._sync_dispatch_cache is compiler_module._EMPTY_DISPATCH_CACHE
+    assert root_resolver_any._async_dispatch_cache is compiler_module._EMPTY_DISPATCH_CACHE
     assert root_resolver_any._cleanup_callbacks == []
     assert root_resolver_any._scope_resolver_3._active is False
 
@@ -2739,3 +2933,272 @@ def test_resolve_dependency_value_sync_async_provider_handle_branch() -> None:
 def test_resolver_scope_level_branch() -> None:
     resolver_type = type("ScopedResolver", (), {"_class_plan": SimpleNamespace(scope_level=9)})
     assert compiler_module._resolver_scope_level(resolver_type()) == 9
+
+
+class _ParityConfig:
+    pass
+
+
+class _ParityPlugin:
+    pass
+
+
+class _ParityMissing:
+    pass
+
+
+class _ParityService:
+    def __init__(
+        self,
+        config: _ParityConfig,
+        /,
+        *plugins: All[_ParityPlugin],
+        handle: Provider[_ParityConfig],
+        tenant: FromContext[int],
+        missing: Maybe[_ParityMissing],
+        defaulted: Maybe[_ParityMissing] = None,
+        **options: Maybe[_ParityMissing],
+    ) -> None:
+        self.config = config
+        self.plugins = plugins
+        self.handle = handle
+        self.tenant = tenant
+        self.missing = missing
+        self.defaulted = defaulted
+        self.options = options
+
+
+class _ParityRoot:
+    def __init__(self, config: _ParityConfig) -> None:
+        self.config = config
+
+
+class _ParityRequestService:
+    def __init__(self, service: _ParityService, config: _ParityConfig) -> None:
+        self.service = service
+        self.config = config
+
+
+def test_generic_sync_slot_impls_match_generated_thread_locked_slots() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_ParityConfig, lifetime=Lifetime.SCOPED, lock_mode=LockMode.THREAD)
+    container.add(_ParityPlugin, lifetime=Lifetime.TRANSIENT)
+    container.add(_ParityRoot, lifetime=Lifetime.SCOPED, lock_mode=LockMode.THREAD)
+    container.add(
+        _ParityService,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+        lock_mode=LockMode.THREAD,
+    )
+    container.add(
+        _ParityRequestService,
+        scope=Scope.ACTION,
+        lifetime=Lifetime.SCOPED,
+        lock_mode=LockMode.THREAD,
+    )
+    root_resolver = container.compile()
+    runtime = cast("Any", type(root_resolver))._runtime
+    generated_globals = type(root_resolver).resolve.__globals__
+
+    with root_resolver.enter_scope(Scope.REQUEST, context={int: 7}) as request_scope:
+        with request_scope.enter_scope(Scope.ACTION) as action_scope:
+            for resolver in (root_resolver, request_scope, action_scope):
+                for workflow in runtime.plan.workflows:
+                    generic_impl = generated_globals[f"_sync_slot_{workflow.slot}"]
+                    generated_method = getattr(resolver, f"resolve_{workflow.slot}")
+                    try:
+                        actual = generic_impl(resolver)
+                    except DIWireScopeMismatchError:
+                        with pytest.raises(DIWireScopeMismatchError):
+                            generated_method()
+                        continue
+                    expected = generated_method()
+                    assert type(actual) is type(expected)
+                    if workflow.is_cached:
+                        assert actual is expected
+
+            service = action_scope.resolve(_ParityService)
+            assert service.config is root_resolver.resolve(_ParityConfig)
+            assert len(service.plugins) == 1
+            assert service.handle() is service.config
+            assert service.tenant == 7
+            assert service.missing is None
+            assert service.defaulted is None
+            assert service.options == {}
+
+
+def test_exit_generator_mirrors_contextmanager_exit_semantics() -> None:
+    def _yield_once() -> Any:
+        yield 1
+
+    def _yield_twice() -> Any:
+        yield 1
+        yield 2
+
+    def _swallow() -> Any:
+        with suppress(ValueError):
+            yield 1
+
+    def _keep_yielding() -> Any:
+        try:
+            yield 1
+        except ValueError:
+            yield 2
+
+    def _replace_error() -> Any:
+        try:
+            yield 1
+        except ValueError as error:
+            raise KeyError("replaced") from error
+
+    def _started(generator_function: Any) -> Any:
+        generator = generator_function()
+        next(generator)
+        return generator
+
+    compiler_module._exit_generator(_started(_yield_once), None, None, None)
+    with pytest.raises(RuntimeError, match="didn't stop"):
+        compiler_module._exit_generator(_started(_yield_twice), None, None, None)
+
+    error = ValueError("boom")
+    compiler_module._exit_generator(_started(_swallow), ValueError, error, None)
+    compiler_module._exit_generator(_started(_yield_once), ValueError, None, None)
+    compiler_module._exit_generator(_started(_yield_once), ValueError, error, None)
+    with pytest.raises(RuntimeError, match="didn't stop after throw"):
+        compiler_module._exit_generator(_started(_keep_yielding), ValueError, error, None)
+    with pytest.raises(KeyError, match="replaced"):
+        compiler_module._exit_generator(_started(_replace_error), ValueError, error, None)
+
+
+@pytest.mark.asyncio
+async def test_exit_async_generator_mirrors_asynccontextmanager_exit_semantics() -> None:
+    async def _yield_once() -> Any:
+        yield 1
+
+    async def _yield_twice() -> Any:
+        yield 1
+        yield 2
+
+    async def _swallow() -> Any:
+        with suppress(ValueError):
+            yield 1
+
+    async def _keep_yielding() -> Any:
+        try:
+            yield 1
+        except ValueError:
+            yield 2
+
+    async def _replace_error() -> Any:
+        try:
+            yield 1
+        except ValueError as error:
+            raise KeyError("replaced") from error
+
+    async def _started(generator_function: Any) -> Any:
+        generator = generator_function()
+        await anext(generator)
+        return generator
+
+    exit_async_generator = compiler_module._exit_async_generator
+    await exit_async_generator(await _started(_yield_once), None, None, None)
+    with pytest.raises(RuntimeError, match="didn't stop"):
+        await exit_async_generator(await _started(_yield_twice), None, None, None)
+
+    error = ValueError("boom")
+    await exit_async_generator(await _started(_swallow), ValueError, error, None)
+    await exit_async_generator(await _started(_yield_once), ValueError, None, None)
+    await exit_async_generator(await _started(_yield_once), ValueError, error, None)
+    with pytest.raises(RuntimeError, match="didn't stop after athrow"):
+        await exit_async_generator(await _started(_keep_yielding), ValueError, error, None)
+    with pytest.raises(KeyError, match="replaced"):
+        await exit_async_generator(await _started(_replace_error), ValueError, error, None)
+
+
+@pytest.mark.asyncio
+async def test_generated_generator_slots_reject_generators_that_do_not_yield() -> None:
+    def _empty_generator() -> Generator[_ParityConfig, None, None]:
+        yield from ()
+
+    async def _empty_async_generator() -> AsyncGenerator[_ParityPlugin, None]:
+        plugins: tuple[_ParityPlugin, ...] = ()
+        for plugin in plugins:
+            yield plugin
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(_empty_generator, provides=_ParityConfig, scope=Scope.REQUEST)
+    container.add_generator(_empty_async_generator, provides=_ParityPlugin, scope=Scope.REQUEST)
+    root_resolver = container.compile()
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        with pytest.raises(RuntimeError, match="didn't yield"):
+            request_scope.resolve(_ParityConfig)
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        with pytest.raises(RuntimeError, match="didn't yield"):
+            await request_scope.aresolve(_ParityPlugin)
+
+
+@pytest.mark.asyncio
+async def test_generic_slot_impls_match_generated_generator_and_context_manager_slots() -> None:
+    exits: list[str] = []
+
+    def _provide_config() -> Generator[_ParityConfig, None, None]:
+        yield _ParityConfig()
+        exits.append("config")
+
+    @contextmanager
+    def _provide_missing() -> Generator[_ParityMissing, None, None]:
+        yield _ParityMissing()
+        exits.append("missing")
+
+    async def _provide_plugin() -> AsyncGenerator[_ParityPlugin, None]:
+        yield _ParityPlugin()
+        exits.append("plugin")
+
+    container = Container(lock_mode=LockMode.NONE, use_resolver_context=False)
+    container.add_generator(
+        _provide_config,
+        provides=_ParityConfig,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.add_context_manager(
+        _provide_missing,
+        provides=_ParityMissing,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.add_generator(
+        _provide_plugin,
+        provides=_ParityPlugin,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    root_resolver = container.compile()
+    registrations = container._providers_registrations
+    generated_globals = type(root_resolver).resolve.__globals__
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        for dependency in (_ParityConfig, _ParityMissing):
+            slot = registrations.get_by_type(dependency).slot
+            assert isinstance(generated_globals[f"_sync_slot_{slot}"](request_scope), dependency)
+        for async_dependency in (_ParityConfig, _ParityMissing, _ParityPlugin):
+            slot = registrations.get_by_type(async_dependency).slot
+            value = await generated_globals[f"_async_slot_{slot}"](request_scope)
+            assert isinstance(value, async_dependency)
+            assert isinstance(await request_scope.aresolve(async_dependency), async_dependency)
+
+    assert sorted(exits) == ["config"] * 3 + ["missing"] * 3 + ["plugin"]
+
+    exits.clear()
+    uncleaned_root_resolver = compiler_module.ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+        cleanup_enabled=False,
+    )
+    generated_globals = type(uncleaned_root_resolver).resolve.__globals__
+    with uncleaned_root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        for dependency in (_ParityConfig, _ParityMissing):
+            slot = registrations.get_by_type(dependency).slot
+            assert isinstance(generated_globals[f"_sync_slot_{slot}"](request_scope), dependency)
+    assert exits == []
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import logging
+import marshal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from diwire import Container, FromContext, Lifetime, Maybe, Scope
+from diwire._internal.resolvers.assembly import compiler as compiler_module
+from diwire._internal.resolvers.assembly.code_cache import (
+    ResolverCodeCache,
+    resolver_graph_fingerprint,
+)
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+
+
+class _Config:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _Service:
+    def __init__(self, config: _Config, tenant: Maybe[FromContext[int]] = None) -> None:
+        self.config = config
+        self.tenant = tenant
+
+
+class _Handler:
+    def __init__(self, service: _Service) -> None:
+        self.service = service
+
+
+class _ConfigFactory:
+    def __call__(self) -> _Config:
+        return _Config("callable")
+
+
+def _make_config() -> _Config:
+    return _Config("first")
+
+
+def _build_container(*, config_factory: Any = _make_config, **kwargs: Any) -> Container:
+    container = Container(use_resolver_context=False, **kwargs)
+    container.add_factory(config_factory, provides=_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Service, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    container.add(_Handler, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    return container
+
+
+def _count_source_compilations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    compiled_sources: list[str] = []
+
+    def _compile(source: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(source, str):
+            compiled_sources.append(source)
+        return compile(source, *args, **kwargs)
+
+    monkeypatch.setattr(compiler_module, "compile", _compile, raising=False)
+    return compiled_sources
+
+
+def _cache_files(directory: Path) -> list[Path]:
+    return sorted(directory.glob("resolver-*.marshal"))
+
+
+def test_compile_cache_reuses_code_objects_for_the_same_graph(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registrations = _build_container()._providers_registrations
+    cold_resolver = ResolversAssemblyCompiler(code_cache_dir=tmp_path).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    cache_files = _cache_files(tmp_path)
+    assert len(cache_files) == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+    compiled_sources = _count_source_compilations(monkeypatch)
+    warm_resolver = ResolversAssemblyCompiler(code_cache_dir=tmp_path).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+
+    assert compiled_sources == []
+    assert cache_files[0].stat().st_mtime_ns == _cache_files(tmp_path)[0].stat().st_mtime_ns
+    assert warm_resolver.resolve(_Config) is not cold_resolver.resolve(_Config)
+    with warm_resolver.enter_scope(Scope.REQUEST, context={int: 3}) as request_scope:
+        handler = request_scope.resolve(_Handler)
+        assert handler.service is request_scope.resolve(_Service)
+        assert handler.service.config is warm_resolver.resolve(_Config)
+        assert handler.service.tenant == 3
+
+
+def test_compile_cache_rebinds_cached_code_to_live_providers(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cold_container = _build_container(compile_cache_dir=tmp_path)
+    assert cold_container.resolve(_Config).name == "first"
+
+    def _make_config() -> _Config:
+        return _Config("second")
+
+    _make_config.__qualname__ = "_make_config"
+    _make_config.__module__ = __name__
+    _build_container()
+    compiled_sources = _count_source_compilations(monkeypatch)
+    warm_container = _build_container(config_factory=_make_config, compile_cache_dir=tmp_path)
+
+    assert warm_container.resolve(_Config).name == "second"
+    assert compiled_sources == []
+
+
+def test_compile_cache_writes_a_new_file_when_the_graph_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _build_container(compile_cache_dir=tmp_path).compile()
+
+    compiled_sources = _count_source_compilations(monkeypatch)
+    container = _build_container(compile_cache_dir=tmp_path)
+    container.add(_Handler, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    container.compile()
+
+    assert compiled_sources
+    assert len(_cache_files(tmp_path)) == 2
+
+
+def test_graph_fingerprint_is_stable_and_tracks_registration_shape() -> None:
+    container = _build_container()
+    registrations = container._providers_registrations
+    fingerprint = resolver_graph_fingerprint(root_scope=Scope.APP, registrations=registrations)
+
+    assert fingerprint == resolver_graph_fingerprint(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    assert fingerprint != resolver_graph_fingerprint(
+        root_scope=Scope.SESSION,
+        registrations=registrations,
+    )
+
+    container.add_factory(_ConfigFactory(), provides=_Config)
+    callable_fingerprint = resolver_graph_fingerprint(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    container.add_instance(_Config("instance"), provides=_Config)
+    assert len({fingerprint, callable_fingerprint}) == 2
+    assert callable_fingerprint != resolver_graph_fingerprint(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not marshal data",
+        marshal.dumps(["unexpected"]),
+        marshal.dumps((1, "other-fingerprint", {})),
+        marshal.dumps((1, "fingerprint", {"def f():\n    pass\n": "not code"})),
+    ],
+)
+def test_code_cache_ignores_unreadable_or_incompatible_files(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    payload: bytes,
+) -> None:
+    cache = ResolverCodeCache(tmp_path)
+    cache.path_for(fingerprint="fingerprint").write_bytes(payload)
+
+    with caplog.at_level(logging.WARNING):
+        assert cache.load(fingerprint="fingerprint") == {}
+    assert "resolver code cache file" in caplog.text
+
+
+def test_code_cache_logs_and_cleans_up_when_writing_fails(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    code_by_digest = {"digest": compile("pass", "<test>", "exec")}
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    blocked_cache = ResolverCodeCache(not_a_directory)
+    cache = ResolverCodeCache(tmp_path)
+    cache.path_for(fingerprint="fingerprint").mkdir()
+
+    with caplog.at_level(logging.WARNING):
+        blocked_cache.store(fingerprint="fingerprint", code_by_digest=code_by_digest)
+        cache.store(fingerprint="fingerprint", code_by_digest=code_by_digest)
+
+    assert caplog.text.count("Could not write resolver code cache file") == 2
+    assert not list(tmp_path.glob("*.tmp"))
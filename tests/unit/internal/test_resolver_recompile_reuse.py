@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Annotated, Any, Protocol, TypeAlias, cast
+
+import pytest
+
+from diwire import (
+    All,
+    Component,
+    Container,
+    FromContext,
+    Lifetime,
+    LockMode,
+    Maybe,
+    Provider,
+    Scope,
+)
+from diwire._internal.resolvers.assembly import compiler as compiler_module
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+
+
+class _Config:
+    pass
+
+
+class _Repository:
+    def __init__(self, config: _Config) -> None:
+        self.config = config
+
+
+class _Unrelated:
+    pass
+
+
+class _Other:
+    pass
+
+
+class _Greeter(Protocol):
+    def greet(self) -> str: ...
+
+
+class _EnglishGreeter:
+    def greet(self) -> str:
+        return "hello"
+
+
+class _FrenchGreeter:
+    def greet(self) -> str:
+        return "bonjour"
+
+
+EnglishGreeter: TypeAlias = Annotated[_Greeter, Component("english")]
+FrenchGreeter: TypeAlias = Annotated[_Greeter, Component("french")]
+
+
+class _OptionalConsumer:
+    def __init__(self, config: Maybe[_Config] = None) -> None:
+        self.config = config
+
+
+class _AllConsumer:
+    def __init__(self, greeters: All[_Greeter]) -> None:
+        self.greeters = greeters
+
+
+class _ProviderConsumer:
+    def __init__(self, config: Provider[_Config]) -> None:
+        self.config = config
+
+
+class _ContextConsumer:
+    def __init__(self, tenant: FromContext[int]) -> None:
+        self.tenant = tenant
+
+
+def _root_resolver(container: Container) -> Any:
+    container.compile()
+    return container._generated_root_resolver
+
+
+def _count_source_compilations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    compiled_sources: list[str] = []
+
+    def _compile(source: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(source, str):
+            compiled_sources.append(source)
+        return compile(source, *args, **kwargs)
+
+    monkeypatch.setattr(compiler_module, "compile", _compile, raising=False)
+    return compiled_sources
+
+
+def test_autoregistration_keeps_root_singletons_of_unchanged_slots() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Repository, lifetime=Lifetime.SCOPED)
+    repository = container.resolve(_Repository)
+
+    assert isinstance(container.resolve(_Unrelated), _Unrelated)
+
+    assert container.resolve(_Repository) is repository
+    assert container.resolve(_Config) is repository.config
+
+
+def test_recompile_reuses_unchanged_workflows_and_compiled_slot_methods(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Repository, lifetime=Lifetime.TRANSIENT)
+    previous_class = type(_root_resolver(container))
+    slot = container._providers_registrations.get_by_type(_Repository).slot
+
+    container.add(_Unrelated, lifetime=Lifetime.TRANSIENT)
+    compiled_sources = _count_source_compilations(monkeypatch)
+    root_class = type(_root_resolver(container))
+
+    previous_runtime = cast("Any", previous_class)._runtime
+    runtime = cast("Any", root_class)._runtime
+    assert runtime.workflows_by_slot[slot] is previous_runtime.workflows_by_slot[slot]
+    assert vars(root_class)[f"resolve_{slot}"].__code__ is (
+        vars(previous_class)[f"resolve_{slot}"].__code__
+    )
+    assert vars(root_class)[f"resolve_{slot}"].__globals__ is runtime.generated_globals
+    new_slot = container._providers_registrations.get_by_type(_Unrelated).slot
+    assert compiled_sources
+    assert all(f"resolve_{new_slot}(self)" in source.splitlines()[0] for source in compiled_sources)
+
+
+def test_replacing_a_registration_rebuilds_its_dependents_only() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Repository, lifetime=Lifetime.SCOPED)
+    container.add(_Unrelated, lifetime=Lifetime.SCOPED)
+    repository = container.resolve(_Repository)
+    unrelated = container.resolve(_Unrelated)
+    replacement_config = _Config()
+
+    container.add_instance(replacement_config, provides=_Config)
+
+    assert container.resolve(_Repository) is not repository
+    assert container.resolve(_Repository).config is replacement_config
+    assert container.resolve(_Unrelated) is unrelated
+
+
+def test_registering_a_maybe_dependency_replans_its_consumer() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_OptionalConsumer, lifetime=Lifetime.SCOPED)
+    assert container.resolve(_OptionalConsumer).config is None
+
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+
+    assert container.resolve(_OptionalConsumer).config is container.resolve(_Config)
+
+
+def test_registering_an_all_component_replans_its_consumer() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_EnglishGreeter, provides=EnglishGreeter, lifetime=Lifetime.SCOPED)
+    container.add(_AllConsumer, lifetime=Lifetime.SCOPED)
+    assert [greeter.greet() for greeter in container.resolve(_AllConsumer).greeters] == ["hello"]
+
+    container.add(_FrenchGreeter, provides=FrenchGreeter, lifetime=Lifetime.SCOPED)
+
+    greeters = container.resolve(_AllConsumer).greeters
+    assert [greeter.greet() for greeter in greeters] == ["hello", "bonjour"]
+
+
+def test_replacing_a_provider_handle_target_replans_its_consumer() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_ProviderConsumer, lifetime=Lifetime.SCOPED)
+    previous_config = container.resolve(_ProviderConsumer).config()
+    replacement_config = _Config()
+
+    container.add_instance(replacement_config, provides=_Config)
+
+    assert container.resolve(_ProviderConsumer).config() is replacement_config
+    assert replacement_config is not previous_config
+
+
+def test_context_dependencies_do_not_force_replanning() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_ContextConsumer, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    previous_runtime = cast("Any", type(_root_resolver(container)))._runtime
+    slot = container._providers_registrations.get_by_type(_ContextConsumer).slot
+
+    container.add(_Unrelated, lifetime=Lifetime.TRANSIENT)
+    runtime = cast("Any", type(_root_resolver(container)))._runtime
+
+    assert runtime.workflows_by_slot[slot] is previous_runtime.workflows_by_slot[slot]
+    with container.enter_scope(Scope.REQUEST, context={int: 3}) as request_scope:
+        assert request_scope.resolve(_ContextConsumer).tenant == 3
+
+
+def test_pending_cleanups_move_to_the_recompiled_root_resolver() -> None:
+    events: list[str] = []
+
+    def _provide_config() -> Generator[_Config, None, None]:
+        events.append("open")
+        yield _Config()
+        events.append("close")
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(_provide_config, provides=_Config, lifetime=Lifetime.SCOPED)
+    config = container.resolve(_Config)
+    previous_root = _root_resolver(container)
+
+    container.add(_Unrelated, lifetime=Lifetime.SCOPED)
+    assert container.resolve(_Config) is config
+    container.close()
+    previous_root.close()
+
+    assert events == ["open", "close"]
+
+
+def test_closed_root_resolver_state_is_not_carried_over() -> None:
+    def _provide_config() -> Generator[_Config, None, None]:
+        yield _Config()
+
+    container = Container(use_resolver_context=False)
+    container.add_generator(_provide_config, provides=_Config, lifetime=Lifetime.SCOPED)
+    config = container.resolve(_Config)
+    container.close()
+
+    container.add(_Unrelated, lifetime=Lifetime.TRANSIENT)
+
+    assert container.resolve(_Config) is not config
+
+
+def test_lazy_recompile_carries_compiled_methods_and_keeps_stubs_lazy() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    container.add(_Other, lifetime=Lifetime.SCOPED)
+    compiler = ResolversAssemblyCompiler(lazy_slot_methods=True)
+    registrations = container._providers_registrations
+    previous_root = cast(
+        "Any",
+        compiler.build_root_resolver(root_scope=Scope.APP, registrations=registrations),
+    )
+    config = previous_root.resolve(_Config)
+    config_slot = registrations.get_by_type(_Config).slot
+    other_slot = registrations.get_by_type(_Other).slot
+
+    container.add(_Unrelated, lifetime=Lifetime.TRANSIENT)
+    root_resolver = cast(
+        "Any",
+        compiler.build_root_resolver(
+            root_scope=Scope.APP,
+            registrations=registrations,
+            previous_root_resolver=previous_root,
+        ),
+    )
+    root_namespace = vars(type(root_resolver))
+
+    assert root_namespace[f"resolve_{config_slot}"].__code__ is (
+        vars(type(previous_root))[f"resolve_{config_slot}"].__code__
+    )
+    assert root_namespace[f"resolve_{other_slot}"].__name__ == f"resolve_{other_slot}"
+    assert root_namespace[f"resolve_{other_slot}"].__globals__ is vars(compiler_module)
+    assert root_resolver.resolve(_Config) is config
+    assert isinstance(root_resolver.resolve(_Other), _Other)
+
+
+def test_async_graph_change_replans_every_workflow() -> None:
+    async def _provide_other() -> _Other:
+        return _Other()
+
+    container = Container(use_resolver_context=False)
+    container.add(_Config, lifetime=Lifetime.SCOPED)
+    previous_runtime = cast("Any", type(_root_resolver(container)))._runtime
+    slot = container._providers_registrations.get_by_type(_Config).slot
+
+    container.add_factory(_provide_other, provides=_Other, lifetime=Lifetime.SCOPED)
+    runtime = cast("Any", type(_root_resolver(container)))._runtime
+
+    assert runtime.workflows_by_slot[slot] is not previous_runtime.workflows_by_slot[slot]
+    assert runtime.workflows_by_slot[slot].effective_lock_mode is LockMode.ASYNC
@@ -5,7 +5,7 @@ import inspect
 import threading
 from collections.abc import AsyncGenerator, Callable, Generator
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Annotated, Any, Generic, TypeVar, cast
@@ -13,6 +13,7 @@ from typing import Annotated, Any, Generic, TypeVar, cast
 import pytest
 
 from diwire import (
+    All,
     Component,
     Container,
     DependencyRegistrationPolicy,
@@ -20,11 +21,14 @@ from diwire import (
     Injected,
     Lifetime,
     LockMode,
+    Maybe,
     MissingPolicy,
+    Provider,
     Scope,
     resolver_context,
 )
 from diwire._internal.providers import ProviderSpec
+from diwire._internal.resolvers.assembly import compiler as compiler_module
 from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
 from diwire.exceptions import (
     DIWireAsyncDependencyInSyncContextError,
@@ -222,6 +226,57 @@ def test_sync_singleton_uses_lambda_method_replacement_cache() -> None:
     assert cached_method.__name__ == "<lambda>"
 
 
+def test_thread_locked_cached_slots_use_generated_double_checked_locking() -> None:
+    calls = 0
+    release_build = threading.Event()
+
+    def build_service() -> _SingletonService:
+        nonlocal calls
+        calls += 1
+        release_build.wait(timeout=2)
+        return _SingletonService()
+
+    container = Container(use_resolver_context=False)
+    container.add_factory(
+        build_service,
+        provides=_SingletonService,
+        lifetime=Lifetime.SCOPED,
+        lock_mode=LockMode.THREAD,
+    )
+    container.add(
+        _RequestService,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+        lock_mode=LockMode.THREAD,
+    )
+    root_resolver = container.compile()
+    registrations = container._providers_registrations
+    singleton_slot = registrations.get_by_type(_SingletonService).slot
+    request_slot = registrations.get_by_type(_RequestService).slot
+    runtime = cast("Any", type(root_resolver))._runtime
+
+    for slot, lock_name in (
+        (singleton_slot, f"_lock_{singleton_slot}"),
+        (request_slot, f"_locks_{request_slot}"),
+    ):
+        owner_class = runtime.class_by_level[runtime.workflows_by_slot[slot].scope_level]
+        code_names = vars(owner_class)[f"resolve_{slot}"].__code__.co_names
+        assert lock_name in code_names
+        assert f"_sync_slot_{slot}" not in code_names
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(root_resolver.resolve, _SingletonService) for _ in range(8)]
+        release_build.set()
+        results = [future.result() for future in futures]
+
+    assert calls == 1
+    assert len({id(result) for result in results}) == 1
+    assert getattr(root_resolver, f"resolve_{singleton_slot}").__name__ == "<lambda>"
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert request_scope.resolve(_RequestService) is request_scope.resolve(_RequestService)
+
+
 @pytest.mark.asyncio
 async def test_async_singleton_uses_async_cached_method_replacement() -> None:
     calls = 0
@@ -610,6 +665,51 @@ def test_scope_resolution_requires_explicit_opened_scope_chain() -> None:
             assert from_request is from_action
 
 
+def _build_request_service(session_service: _SessionService) -> _RequestService:
+    return _RequestService()
+
+
+def _yield_request_service(
+    session_service: _SessionService,
+) -> Generator[_RequestService, None, None]:
+    yield _RequestService()
+
+
+@contextmanager
+def _manage_request_service(
+    session_service: _SessionService,
+) -> Generator[_RequestService, None, None]:
+    yield _RequestService()
+
+
+@pytest.mark.parametrize("provider_kind", ["factory", "generator", "context_manager"])
+def test_skipped_owner_scope_of_dependency_raises_scope_mismatch(provider_kind: str) -> None:
+    container = Container()
+    container.add(_SessionService, scope=Scope.SESSION)
+    if provider_kind == "factory":
+        container.add_factory(
+            _build_request_service,
+            provides=_RequestService,
+            scope=Scope.REQUEST,
+        )
+    elif provider_kind == "generator":
+        container.add_generator(
+            _yield_request_service,
+            provides=_RequestService,
+            scope=Scope.REQUEST,
+        )
+    else:
+        container.add_context_manager(
+            _manage_request_service,
+            provides=_RequestService,
+            scope=Scope.REQUEST,
+        )
+
+    with container.enter_scope(Scope.REQUEST) as request_scope:
+        with pytest.raises(DIWireScopeMismatchError, match="requires opened scope level 2"):
+            request_scope.resolve(_RequestService)
+
+
 def test_resolver_context_dependency_is_resolved_and_missing_value_errors() -> None:
     def build_consumer(value: FromContext[int]) -> _ContextValueConsumer:
         return _ContextValueConsumer(value=value)
@@ -2365,3 +2465,868 @@ def test_build_root_resolver_rebind_loop_preserves_each_existing_resolver_cache(
             assert resolver.resolve(_Resource) is expected
     finally:
         ProviderSpec.SLOT_COUNTER = slot_counter
+
+
+def _slot_methods_by_class(root_resolver: Any) -> dict[str, dict[str, Any]]:
+    runtime = cast("Any", type(root_resolver))._runtime
+    return {
+        resolver_class.__name__: {
+            name: value
+            for name, value in vars(resolver_class).items()
+            if name.startswith(("resolve_", "aresolve_"))
+        }
+        for resolver_class in runtime.class_by_level.values()
+    }
+
+
+def _build_shared_slot_methods_container() -> Container:
+    container = Container(use_resolver_context=False)
+    container.add(_SingletonService, lifetime=Lifetime.SCOPED)
+    container.add(_TransientService, lifetime=Lifetime.TRANSIENT)
+    container.add(_SessionService, scope=Scope.SESSION, lifetime=Lifetime.SCOPED)
+    container.add(_RequestService, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    return container
+
+
+def test_build_root_resolver_shares_class_independent_slot_methods_across_scope_classes() -> None:
+    container = _build_shared_slot_methods_container()
+    root_resolver = ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+    methods_by_class = _slot_methods_by_class(root_resolver)
+    request_slot = container._providers_registrations.get_by_type(_RequestService).slot
+    singleton_slot = container._providers_registrations.get_by_type(_SingletonService).slot
+
+    # Root-cached delegation is identical for every non-root scope class.
+    non_root_singleton_methods = {
+        id(methods[f"resolve_{singleton_slot}"])
+        for class_name, methods in methods_by_class.items()
+        if class_name != "RootResolver"
+    }
+    assert len(non_root_singleton_methods) == 1
+
+    # Scope-mismatch stubs are identical for every shallower scope class.
+    mismatch_methods = {
+        id(methods_by_class[class_name][f"resolve_{request_slot}"])
+        for class_name in ("RootResolver", "_SessionResolver")
+    }
+    assert len(mismatch_methods) == 1
+    assert (
+        methods_by_class["_RequestResolver"][f"resolve_{request_slot}"]
+        is not methods_by_class["RootResolver"][f"resolve_{request_slot}"]
+    )
+
+    with root_resolver.enter_scope(Scope.SESSION) as session_scope:
+        with pytest.raises(DIWireScopeMismatchError):
+            session_scope.resolve(_RequestService)
+        with session_scope.enter_scope(Scope.REQUEST) as request_scope:
+            assert request_scope.resolve(_SingletonService) is root_resolver.resolve(
+                _SingletonService,
+            )
+            assert request_scope.resolve(_RequestService) is request_scope.resolve(
+                _RequestService,
+            )
+
+
+def test_build_root_resolver_can_compile_slot_methods_per_scope_class() -> None:
+    container = _build_shared_slot_methods_container()
+    shared_resolver = ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+    per_class_resolver = ResolversAssemblyCompiler(share_slot_methods=False).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+
+    def _distinct_method_count(root_resolver: Any) -> int:
+        return len(
+            {
+                id(method)
+                for methods in _slot_methods_by_class(root_resolver).values()
+                for method in methods.values()
+            },
+        )
+
+    per_class_methods = _slot_methods_by_class(per_class_resolver)
+    total_method_count = sum(len(methods) for methods in per_class_methods.values())
+    assert _distinct_method_count(per_class_resolver) == total_method_count
+    assert _distinct_method_count(shared_resolver) < total_method_count
+
+    with per_class_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert isinstance(request_scope.resolve(_RequestService), _RequestService)
+        assert request_scope.resolve(_SingletonService) is per_class_resolver.resolve(
+            _SingletonService,
+        )
+
+
+def test_compile_shares_one_globals_namespace_across_generated_functions() -> None:
+    container = _build_shared_slot_methods_container()
+    root_resolver = container.compile()
+
+    runtime = cast("Any", type(root_resolver))._runtime
+    generated_functions = [
+        value
+        for resolver_class in runtime.class_by_level.values()
+        for value in vars(resolver_class).values()
+        if inspect.isfunction(value)
+    ]
+    assert generated_functions
+    assert len({id(function.__globals__) for function in generated_functions}) == 1
+
+    namespace = generated_functions[0].__globals__
+    for scope_level, resolver_class in runtime.class_by_level.items():
+        assert namespace[f"_scope_ctor_{scope_level}"] is resolver_class
+
+    with root_resolver.enter_scope(Scope.SESSION) as session_scope:
+        with session_scope.enter_scope(Scope.REQUEST) as request_scope:
+            assert isinstance(request_scope.resolve(_RequestService), _RequestService)
+
+
+def _build_dispatch_cache_container() -> tuple[Container, tuple[type[Any], ...]]:
+    container = Container(use_resolver_context=False)
+    service_types = tuple(type(f"_DispatchCacheService{index}", (), {}) for index in range(8))
+    for service_type in service_types:
+        container.add(service_type, lifetime=Lifetime.TRANSIENT)
+    return container, service_types
+
+
+def test_generated_dispatch_cache_keeps_several_alternating_keys() -> None:
+    container, service_types = _build_dispatch_cache_container()
+    root_resolver = cast("Any", container.compile())
+    hot_types = service_types[: compiler_module._DISPATCH_CACHE_SIZE]
+
+    assert root_resolver._sync_dispatch_cache is compiler_module._EMPTY_DISPATCH_CACHE
+    for service_type in hot_types:
+        assert isinstance(root_resolver.resolve(service_type), service_type)
+    dispatch_cache = root_resolver._sync_dispatch_cache
+    assert set(dispatch_cache[0::2]) == set(hot_types)
+
+    for _ in range(3):
+        for service_type in hot_types:
+            assert isinstance(root_resolver.resolve(service_type), service_type)
+    assert root_resolver._sync_dispatch_cache is dispatch_cache
+
+    assert isinstance(root_resolver.resolve(service_types[-1]), service_types[-1])
+    assert root_resolver._sync_dispatch_cache[0] is service_types[-1]
+    assert len(root_resolver._sync_dispatch_cache) == len(compiler_module._EMPTY_DISPATCH_CACHE)
+
+
+def test_generated_dispatch_cache_stays_consistent_across_threads() -> None:
+    container, service_types = _build_dispatch_cache_container()
+    root_resolver = container.compile()
+    mismatches: list[type[Any]] = []
+
+    def resolve_alternating(offset: int) -> None:
+        for index in range(2_000):
+            service_type = service_types[(index + offset) % len(service_types)]
+            if type(root_resolver.resolve(service_type)) is not service_type:
+                mismatches.append(service_type)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(resolve_alternating, range(4)))
+
+    assert mismatches == []
+
+
+async def test_generated_async_dispatch_cache_keeps_several_alternating_keys() -> None:
+    container, service_types = _build_dispatch_cache_container()
+    root_resolver = cast("Any", container.compile())
+    hot_types = service_types[: compiler_module._DISPATCH_CACHE_SIZE]
+
+    for _ in range(2):
+        for service_type in hot_types:
+            assert isinstance(await root_resolver.aresolve(service_type), service_type)
+
+    assert set(root_resolver._async_dispatch_cache[0::2]) == set(hot_types)
+    assert root_resolver._sync_dispatch_cache is compiler_module._EMPTY_DISPATCH_CACHE
+
+
+def _count_marker_classifications(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    classified: list[Any] = []
+    marker_key_handlers = compiler_module._marker_key_handlers
+
+    def _counting_marker_key_handlers(**kwargs: Any) -> Any:
+        classified.append(kwargs["dependency"])
+        return marker_key_handlers(**kwargs)
+
+    monkeypatch.setattr(compiler_module, "_marker_key_handlers", _counting_marker_key_handlers)
+    return classified
+
+
+@pytest.mark.parametrize("service_count", [0, 40])
+def test_generated_dispatch_memoizes_marker_key_handlers(
+    monkeypatch: pytest.MonkeyPatch,
+    service_count: int,
+) -> None:
+    container = Container(use_resolver_context=False)
+    for index in range(service_count):
+        container.add(type(f"_MarkerDispatchService{index}", (), {}), lifetime=Lifetime.TRANSIENT)
+    container.add(_TransientService, lifetime=Lifetime.TRANSIENT)
+    container.add(_RequestService, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    root_resolver = container.compile()
+    classified = _count_marker_classifications(monkeypatch)
+
+    with root_resolver.enter_scope(Scope.REQUEST, context={int: 7}) as request_scope:
+        for _ in range(3):
+            assert isinstance(request_scope.resolve(Maybe[_TransientService]), _TransientService)
+            assert request_scope.resolve(Maybe[_SingletonService]) is None
+            assert request_scope.resolve(FromContext[int]) == 7
+            assert request_scope.resolve(Maybe[FromContext[str]]) is None
+            provider = request_scope.resolve(Provider[_RequestService])
+            assert provider() is request_scope.resolve(_RequestService)
+
+    assert classified == [
+        Maybe[_TransientService],
+        Maybe[_SingletonService],
+        FromContext[int],
+        Maybe[FromContext[str]],
+        Provider[_RequestService],
+    ]
+    runtime = cast("Any", type(root_resolver))._runtime
+    assert set(runtime.sync_marker_handlers) == set(classified)
+    assert set(runtime.async_marker_handlers) == set(classified)
+
+
+async def test_generated_async_dispatch_shares_memoized_marker_key_handlers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_TransientService, lifetime=Lifetime.TRANSIENT)
+    root_resolver = container.compile()
+    classified = _count_marker_classifications(monkeypatch)
+
+    assert isinstance(root_resolver.resolve(Maybe[_TransientService]), _TransientService)
+    assert isinstance(await root_resolver.aresolve(Maybe[_TransientService]), _TransientService)
+    assert await root_resolver.aresolve(Maybe[_SingletonService]) is None
+    assert root_resolver.resolve(Maybe[_SingletonService]) is None
+
+    assert classified == [Maybe[_TransientService], Maybe[_SingletonService]]
+
+
+def test_generated_dispatch_does_not_memoize_unregistered_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_TransientService, lifetime=Lifetime.TRANSIENT)
+    root_resolver = container.compile()
+    classified = _count_marker_classifications(monkeypatch)
+
+    for _ in range(2):
+        with pytest.raises(DIWireDependencyNotRegisteredError):
+            root_resolver.resolve(_SingletonService)
+
+    assert classified == [_SingletonService, _SingletonService]
+    assert cast("Any", type(root_resolver))._runtime.sync_marker_handlers == {}
+
+
+def _build_hashed_dispatch_container() -> tuple[Container, tuple[type[Any], ...]]:
+    container = Container(use_resolver_context=False)
+    service_types = tuple(type(f"_HashedDispatchService{index}", (), {}) for index in range(40))
+    for service_type in service_types:
+        container.add(service_type, lifetime=Lifetime.TRANSIENT)
+    container.add(_SingletonService, lifetime=Lifetime.SCOPED)
+    container.add(_RequestService, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    container.add_instance(42, provides=_new_list_int_alias())
+    return container, service_types
+
+
+def test_generated_dispatch_uses_hashed_table_for_large_graphs() -> None:
+    container, service_types = _build_hashed_dispatch_container()
+    root_resolver = container.compile()
+
+    assert "_sync_dispatch_cache" not in cast("Any", type(root_resolver)).__slots__
+    for service_type in service_types:
+        assert isinstance(root_resolver.resolve(service_type), service_type)
+    assert root_resolver.resolve(_SingletonService) is root_resolver.resolve(_SingletonService)
+    assert root_resolver.resolve(_new_list_int_alias()) == 42
+    with pytest.raises(DIWireScopeMismatchError):
+        root_resolver.resolve(_RequestService)
+    with pytest.raises(DIWireDependencyNotRegisteredError):
+        root_resolver.resolve(_TransientService)
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert request_scope.resolve(_RequestService) is request_scope.resolve(_RequestService)
+        assert request_scope.resolve(_SingletonService) is root_resolver.resolve(
+            _SingletonService,
+        )
+        assert isinstance(request_scope.resolve(service_types[-1]), service_types[-1])
+
+
+@pytest.mark.asyncio
+async def test_generated_aresolve_uses_hashed_table_for_large_graphs() -> None:
+    container, service_types = _build_hashed_dispatch_container()
+    root_resolver = container.compile()
+
+    for service_type in service_types:
+        assert isinstance(await root_resolver.aresolve(service_type), service_type)
+    assert await root_resolver.aresolve(_new_list_int_alias()) == 42
+    with pytest.raises(DIWireDependencyNotRegisteredError):
+        await root_resolver.aresolve(_TransientService)
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert await request_scope.aresolve(_RequestService) is await request_scope.aresolve(
+            _RequestService,
+        )
+
+
+def _is_lazy_stub(method: Any) -> bool:
+    return method.__code__.co_name == "_compile_on_first_call"
+
+
+def test_lazy_slot_methods_compile_on_first_call_per_scope_class() -> None:
+    container, service_types = _build_hashed_dispatch_container()
+    registrations = container._providers_registrations
+    root_resolver = ResolversAssemblyCompiler(lazy_slot_methods=True).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    root_class = cast("Any", type(root_resolver))
+    first_slot = registrations.get_by_type(service_types[0]).slot
+    second_slot = registrations.get_by_type(service_types[1]).slot
+    sync_table = root_class.resolve.__globals__["_sync_dispatch_table_1"]
+
+    assert _is_lazy_stub(vars(root_class)[f"resolve_{first_slot}"])
+    assert sync_table[service_types[0]] is vars(root_class)[f"resolve_{first_slot}"]
+    assert isinstance(root_resolver.resolve(service_types[0]), service_types[0])
+
+    stale_stub = vars(root_class)[f"resolve_{second_slot}"]
+    assert isinstance(stale_stub(root_resolver), service_types[1])
+    assert isinstance(stale_stub(root_resolver), service_types[1])
+    installed_method = vars(root_class)[f"resolve_{first_slot}"]
+    assert not _is_lazy_stub(installed_method)
+    assert sync_table[service_types[0]] is installed_method
+    assert not _is_lazy_stub(vars(root_class)[f"resolve_{second_slot}"])
+    assert _is_lazy_stub(vars(root_class)[f"aresolve_{first_slot}"])
+    assert root_resolver.resolve(_SingletonService) is root_resolver.resolve(_SingletonService)
+    with pytest.raises(DIWireScopeMismatchError):
+        root_resolver.resolve(_RequestService)
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        request_class = cast("Any", type(request_scope))
+        assert _is_lazy_stub(vars(request_class)[f"resolve_{first_slot}"])
+        assert isinstance(request_scope.resolve(service_types[0]), service_types[0])
+        assert not _is_lazy_stub(vars(request_class)[f"resolve_{first_slot}"])
+        assert request_scope.resolve(_RequestService) is request_scope.resolve(_RequestService)
+        assert request_scope.resolve(_SingletonService) is root_resolver.resolve(
+            _SingletonService,
+        )
+
+
+@pytest.mark.asyncio
+async def test_lazy_async_slot_methods_compile_on_first_await() -> None:
+    container, service_types = _build_hashed_dispatch_container()
+    registrations = container._providers_registrations
+    root_resolver = ResolversAssemblyCompiler(lazy_slot_methods=True).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    root_class = cast("Any", type(root_resolver))
+    slot = registrations.get_by_type(service_types[0]).slot
+    untouched_slot = registrations.get_by_type(service_types[1]).slot
+
+    assert isinstance(await root_resolver.aresolve(service_types[0]), service_types[0])
+    assert not _is_lazy_stub(vars(root_class)[f"aresolve_{slot}"])
+    assert _is_lazy_stub(vars(root_class)[f"aresolve_{untouched_slot}"])
+    assert await root_resolver.aresolve(_new_list_int_alias()) == 42
+
+
+def test_lazy_slot_methods_are_compiled_once_under_concurrent_first_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container, _service_types = _build_hashed_dispatch_container()
+    root_resolver = ResolversAssemblyCompiler(lazy_slot_methods=True).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+    compiled_names: list[str] = []
+
+    def _compile(source: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(source, str):
+            compiled_names.append(source.split("(", 1)[0])
+        return compile(source, *args, **kwargs)
+
+    monkeypatch.setattr(compiler_module, "compile", _compile, raising=False)
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    def _resolve_singleton() -> _SingletonService:
+        barrier.wait()
+        return root_resolver.resolve(_SingletonService)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda _: _resolve_singleton(), range(workers)))
+
+    assert len({id(result) for result in results}) == 1
+    assert len(compiled_names) == 1
+
+
+def test_lazy_slot_methods_work_without_hashed_dispatch_tables() -> None:
+    container = Container(use_resolver_context=False)
+    container.add(_SingletonService, lifetime=Lifetime.SCOPED)
+    container.add(_RequestService, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    root_resolver = ResolversAssemblyCompiler(lazy_slot_methods=True).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+
+    assert root_resolver.resolve(_SingletonService) is root_resolver.resolve(_SingletonService)
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        assert request_scope.resolve(_RequestService) is request_scope.resolve(_RequestService)
+
+
+def test_lazy_slot_methods_default_to_large_graphs_only() -> None:
+    small_container, _service_types = _build_hashed_dispatch_container()
+    large_container = Container(use_resolver_context=False)
+    large_service_types = tuple(type(f"_LazyService{index}", (), {}) for index in range(512))
+    for service_type in large_service_types:
+        large_container.add(service_type, lifetime=Lifetime.TRANSIENT)
+
+    small_resolver = ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=small_container._providers_registrations,
+    )
+    large_resolver = ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=large_container._providers_registrations,
+    )
+    eager_resolver = ResolversAssemblyCompiler(lazy_slot_methods=False).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=large_container._providers_registrations,
+    )
+    small_slot = small_container._providers_registrations.get_by_type(_SingletonService).slot
+    large_slot = large_container._providers_registrations.get_by_type(
+        large_service_types[0],
+    ).slot
+
+    assert not _is_lazy_stub(vars(type(small_resolver))[f"resolve_{small_slot}"])
+    assert _is_lazy_stub(vars(type(large_resolver))[f"resolve_{large_slot}"])
+    assert not _is_lazy_stub(vars(type(eager_resolver))[f"resolve_{large_slot}"])
+    assert isinstance(large_resolver.resolve(large_service_types[0]), large_service_types[0])
+
+
+def _transient_chain_types(depth: int) -> list[type[Any]]:
+    chain_types: list[type[Any]] = [type("_ChainLink0", (), {})]
+    for index in range(1, depth):
+
+        def init(self: Any, dependency: Any) -> None:
+            self.dependency = dependency
+
+        init.__annotations__ = {"dependency": chain_types[-1], "return": None}
+        chain_types.append(type(f"_ChainLink{index}", (), {"__init__": init}))
+    return chain_types
+
+
+def test_lazy_slot_methods_resolve_deep_chains_just_above_the_threshold() -> None:
+    chain_types = _transient_chain_types(compiler_module._LAZY_SLOT_METHODS_WORKFLOW_THRESHOLD + 8)
+    container = Container(use_resolver_context=False)
+    for chain_type in chain_types:
+        container.add(chain_type, lifetime=Lifetime.TRANSIENT)
+    root_resolver = ResolversAssemblyCompiler().build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=container._providers_registrations,
+    )
+    top_slot = container._providers_registrations.get_by_type(chain_types[-1]).slot
+    assert _is_lazy_stub(vars(type(root_resolver))[f"resolve_{top_slot}"])
+
+    resolved = root_resolver.resolve(chain_types[-1])
+
+    depth = 1
+    while hasattr(resolved, "dependency"):
+        resolved = resolved.dependency
+        depth += 1
+    assert depth == len(chain_types)
+    assert isinstance(resolved, chain_types[0])
+
+
+class _AsyncConfig:
+    pass
+
+
+class _AsyncSessionState:
+    pass
+
+
+class _AsyncRepository:
+    def __init__(self, config: _AsyncConfig, session_state: _AsyncSessionState) -> None:
+        self.config = config
+        self.session_state = session_state
+
+
+class _AsyncPlugin:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+_AsyncPrimaryPlugin = Annotated[_AsyncPlugin, Component("primary")]
+_SyncSecondaryPlugin = Annotated[_AsyncPlugin, Component("secondary")]
+
+
+class _AsyncHandler:
+    def __init__(
+        self,
+        repository: _AsyncRepository,
+        plugins: tuple[_AsyncPlugin, ...],
+    ) -> None:
+        self.repository = repository
+        self.plugins = plugins
+
+
+async def _make_async_config() -> _AsyncConfig:
+    await asyncio.sleep(0)
+    return _AsyncConfig()
+
+
+async def _make_async_session_state() -> _AsyncSessionState:
+    await asyncio.sleep(0)
+    return _AsyncSessionState()
+
+
+async def _make_primary_plugin() -> _AsyncPlugin:
+    await asyncio.sleep(0)
+    return _AsyncPlugin("primary")
+
+
+async def _make_async_handler(
+    repository: _AsyncRepository,
+    plugins: All[_AsyncPlugin],
+) -> _AsyncHandler:
+    await asyncio.sleep(0)
+    return _AsyncHandler(repository=repository, plugins=plugins)
+
+
+def _build_specialized_async_container() -> Container:
+    container = Container(lock_mode=LockMode.NONE, use_resolver_context=False)
+    container.add_factory(_make_async_config, provides=_AsyncConfig, lifetime=Lifetime.SCOPED)
+    container.add_factory(
+        _make_async_session_state,
+        provides=_AsyncSessionState,
+        scope=Scope.SESSION,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.add(
+        _AsyncRepository,
+        scope=Scope.SESSION,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.add_factory(
+        _make_primary_plugin,
+        provides=_AsyncPrimaryPlugin,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.add_factory(
+        lambda: _AsyncPlugin("secondary"),
+        provides=_SyncSecondaryPlugin,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    container.add_factory(
+        _make_async_handler,
+        provides=_AsyncHandler,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    return container
+
+
+@pytest.mark.asyncio
+async def test_async_slot_methods_are_generated_without_generic_slot_impl() -> None:
+    container = _build_specialized_async_container()
+    root_resolver = container.compile()
+    registrations = container._providers_registrations
+    handler_slot = registrations.get_by_type(_AsyncHandler).slot
+    config_slot = registrations.get_by_type(_AsyncConfig).slot
+    runtime = cast("Any", type(root_resolver))._runtime
+    request_class = runtime.class_by_level[Scope.REQUEST.level]
+
+    for slot in (handler_slot, config_slot):
+        aresolve_method = vars(request_class)[f"aresolve_{slot}"]
+        assert f"_async_slot_{slot}" not in aresolve_method.__code__.co_names
+
+    config = await root_resolver.aresolve(_AsyncConfig)
+    assert await root_resolver.aresolve(_AsyncConfig) is config
+    with pytest.raises(DIWireScopeMismatchError):
+        await root_resolver.aresolve(_AsyncHandler)
+
+    async with root_resolver.enter_scope(Scope.SESSION) as session_scope:
+        async with session_scope.enter_scope(Scope.REQUEST) as request_scope:
+            handler = await request_scope.aresolve(_AsyncHandler)
+            assert await request_scope.aresolve(_AsyncHandler) is handler
+            assert await request_scope.aresolve(_AsyncConfig) is config
+            assert handler.repository.config is config
+            assert handler.repository.session_state is await request_scope.aresolve(
+                _AsyncSessionState,
+            )
+            assert [plugin.name for plugin in handler.plugins] == ["primary", "secondary"]
+            assert isinstance(request_scope.resolve(_SyncSecondaryPlugin), _AsyncPlugin)
+            assert (await request_scope.aresolve(_SyncSecondaryPlugin)).name == "secondary"
+
+
+@pytest.mark.asyncio
+async def test_specialized_async_slot_builds_uncached_root_singleton_dependency() -> None:
+    container = _build_specialized_async_container()
+    root_resolver = container.compile()
+
+    async with root_resolver.enter_scope(Scope.SESSION) as session_scope:
+        repository = await session_scope.aresolve(_AsyncRepository)
+
+    assert repository.config is await root_resolver.aresolve(_AsyncConfig)
+
+
+@pytest.mark.asyncio
+async def test_cached_async_generator_without_lock_uses_generated_async_slot() -> None:
+    exits: list[str] = []
+
+    async def _make_session_state() -> AsyncGenerator[_AsyncSessionState, None]:
+        try:
+            yield _AsyncSessionState()
+        finally:
+            exits.append("session_state")
+
+    container = Container(lock_mode=LockMode.NONE, use_resolver_context=False)
+    container.add_generator(
+        _make_session_state,
+        provides=_AsyncSessionState,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    root_resolver = container.compile()
+    slot = container._providers_registrations.get_by_type(_AsyncSessionState).slot
+    request_class = cast("Any", type(root_resolver))._runtime.class_by_level[Scope.REQUEST.level]
+    aresolve_method = vars(request_class)[f"aresolve_{slot}"]
+    assert f"_async_slot_{slot}" not in aresolve_method.__code__.co_names
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        first = await request_scope.aresolve(_AsyncSessionState)
+        assert await request_scope.aresolve(_AsyncSessionState) is first
+    assert exits == ["session_state"]
+
+
+class _UnitOfWork:
+    def __init__(self, resource: _Resource) -> None:
+        self.resource = resource
+
+
+def _build_generator_and_context_manager_container(
+    events: list[str],
+    *,
+    is_async: bool,
+) -> Container:
+    container = Container(lock_mode=LockMode.NONE, use_resolver_context=False)
+    if is_async:
+
+        async def provide_async_resource() -> AsyncGenerator[_Resource, None]:
+            events.append("resource-enter")
+            try:
+                yield _Resource()
+            except ValueError:
+                events.append("resource-error")
+                raise
+            finally:
+                events.append("resource-exit")
+
+        @asynccontextmanager
+        async def provide_async_unit_of_work(
+            resource: _Resource,
+        ) -> AsyncGenerator[_UnitOfWork, None]:
+            yield _UnitOfWork(resource)
+            events.append("unit-of-work-exit")
+
+        container.add_generator(
+            provide_async_resource,
+            provides=_Resource,
+            scope=Scope.REQUEST,
+            lifetime=Lifetime.SCOPED,
+        )
+        container.add_context_manager(
+            provide_async_unit_of_work,
+            provides=_UnitOfWork,
+            scope=Scope.REQUEST,
+            lifetime=Lifetime.TRANSIENT,
+        )
+        return container
+
+    def provide_resource() -> Generator[_Resource, None, None]:
+        events.append("resource-enter")
+        try:
+            yield _Resource()
+        except ValueError:
+            events.append("resource-error")
+            raise
+        finally:
+            events.append("resource-exit")
+
+    @contextmanager
+    def provide_unit_of_work(resource: _Resource) -> Generator[_UnitOfWork, None, None]:
+        yield _UnitOfWork(resource)
+        events.append("unit-of-work-exit")
+
+    container.add_generator(
+        provide_resource,
+        provides=_Resource,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.SCOPED,
+    )
+    container.add_context_manager(
+        provide_unit_of_work,
+        provides=_UnitOfWork,
+        scope=Scope.REQUEST,
+        lifetime=Lifetime.TRANSIENT,
+    )
+    return container
+
+
+def test_generator_and_context_manager_slots_register_cleanup_without_wrappers() -> None:
+    events: list[str] = []
+    container = _build_generator_and_context_manager_container(events, is_async=False)
+    root_resolver = container.compile()
+    request_class = cast("Any", type(root_resolver))._runtime.class_by_level[Scope.REQUEST.level]
+    for dependency in (_Resource, _UnitOfWork):
+        slot = container._providers_registrations.get_by_type(dependency).slot
+        resolve_method = vars(request_class)[f"resolve_{slot}"]
+        assert f"_sync_slot_{slot}" not in resolve_method.__code__.co_names
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        unit_of_work = request_scope.resolve(_UnitOfWork)
+        assert unit_of_work.resource is request_scope.resolve(_Resource)
+        cleanup_callbacks = cast("Any", request_scope)._cleanup_callbacks
+        assert [kind for kind, _ in cleanup_callbacks] == [2, 0]
+        assert inspect.isgenerator(cleanup_callbacks[0][1])
+    assert events == ["resource-enter", "unit-of-work-exit", "resource-exit"]
+
+    events.clear()
+    with pytest.raises(ValueError, match="original"):
+        with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+            request_scope.resolve(_Resource)
+            raise ValueError("original")
+    assert events == ["resource-enter", "resource-error", "resource-exit"]
+
+
+@pytest.mark.asyncio
+async def test_async_generator_and_context_manager_slots_register_cleanup_without_wrappers() -> (
+    None
+):
+    events: list[str] = []
+    container = _build_generator_and_context_manager_container(events, is_async=True)
+    root_resolver = container.compile()
+    request_class = cast("Any", type(root_resolver))._runtime.class_by_level[Scope.REQUEST.level]
+    for dependency in (_Resource, _UnitOfWork):
+        slot = container._providers_registrations.get_by_type(dependency).slot
+        aresolve_method = vars(request_class)[f"aresolve_{slot}"]
+        assert f"_async_slot_{slot}" not in aresolve_method.__code__.co_names
+
+    async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        unit_of_work = await request_scope.aresolve(_UnitOfWork)
+        assert unit_of_work.resource is await request_scope.aresolve(_Resource)
+        cleanup_callbacks = cast("Any", request_scope)._cleanup_callbacks
+        assert [kind for kind, _ in cleanup_callbacks] == [3, 1]
+        assert inspect.isasyncgen(cleanup_callbacks[0][1])
+    assert events == ["resource-enter", "unit-of-work-exit", "resource-exit"]
+
+    events.clear()
+    with pytest.raises(ValueError, match="original"):
+        async with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+            await request_scope.aresolve(_Resource)
+            raise ValueError("original")
+    assert events == ["resource-enter", "resource-error", "resource-exit"]
+
+
+class _ChainLeaf:
+    pass
+
+
+class _ChainMiddle:
+    def __init__(self, leaf: _ChainLeaf) -> None:
+        self.leaf = leaf
+
+
+class _ChainTop:
+    def __init__(self, middle: _ChainMiddle, leaves: All[_ChainLeaf]) -> None:
+        self.middle = middle
+        self.leaves = leaves
+
+
+class _ChainSettings:
+    pass
+
+
+class _ChainHandler:
+    def __init__(self, top: _ChainTop, settings: _ChainSettings) -> None:
+        self.top = top
+        self.settings = settings
+
+
+def _build_transient_chain_container() -> Container:
+    container = Container(use_resolver_context=False)
+    container.add(_ChainLeaf, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    container.add(_ChainMiddle, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    container.add(_ChainTop, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    container.add(_ChainSettings, scope=Scope.REQUEST, lifetime=Lifetime.SCOPED)
+    container.add(_ChainHandler, scope=Scope.REQUEST, lifetime=Lifetime.TRANSIENT)
+    return container
+
+
+def _request_resolve_method_names(root_resolver: Any, dependency: Any) -> tuple[str, ...]:
+    runtime = cast("Any", type(root_resolver))._runtime
+    slot = next(
+        slot
+        for slot, dependency_type in runtime.dep_type_by_slot.items()
+        if dependency_type is dependency
+    )
+    request_class = runtime.class_by_level[Scope.REQUEST.level]
+    return vars(request_class)[f"resolve_{slot}"].__code__.co_names
+
+
+def test_transient_subtrees_are_fused_into_one_constructor_expression() -> None:
+    container = _build_transient_chain_container()
+    root_resolver = container.compile()
+    registrations = container._providers_registrations
+    settings_slot = registrations.get_by_type(_ChainSettings).slot
+
+    handler_names = _request_resolve_method_names(root_resolver, _ChainHandler)
+    assert {
+        f"_provider_{registrations.get_by_type(dependency).slot}"
+        for dependency in (_ChainLeaf, _ChainMiddle, _ChainTop, _ChainHandler)
+    } <= set(handler_names)
+    assert f"resolve_{settings_slot}" in handler_names
+    assert not any(
+        name.startswith("resolve_") and name != f"resolve_{settings_slot}" for name in handler_names
+    )
+
+    with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+        handler = request_scope.resolve(_ChainHandler)
+        other = request_scope.resolve(_ChainHandler)
+        assert handler is not other
+        assert handler.top is not other.top
+        assert handler.settings is other.settings
+        assert isinstance(handler.top.middle.leaf, _ChainLeaf)
+        assert [type(leaf) for leaf in handler.top.leaves] == [_ChainLeaf]
+
+
+def test_transient_subtree_fusion_respects_compiler_budget() -> None:
+    container = _build_transient_chain_container()
+    registrations = container._providers_registrations
+    top_slot = registrations.get_by_type(_ChainTop).slot
+    middle_slot = registrations.get_by_type(_ChainMiddle).slot
+
+    shallow_resolver = ResolversAssemblyCompiler(inline_transient_max_depth=2).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    handler_names = _request_resolve_method_names(shallow_resolver, _ChainHandler)
+    assert f"resolve_{top_slot}" in handler_names
+    top_names = _request_resolve_method_names(shallow_resolver, _ChainTop)
+    assert f"resolve_{middle_slot}" not in top_names
+
+    disabled_resolver = ResolversAssemblyCompiler(inline_transient_max_nodes=0).build_root_resolver(
+        root_scope=Scope.APP,
+        registrations=registrations,
+    )
+    top_names = _request_resolve_method_names(disabled_resolver, _ChainTop)
+    assert f"resolve_{middle_slot}" in top_names
+
+    for root_resolver in (shallow_resolver, disabled_resolver):
+        with root_resolver.enter_scope(Scope.REQUEST) as request_scope:
+            handler = request_scope.resolve(_ChainHandler)
+            assert isinstance(handler.top.middle.leaf, _ChainLeaf)
+            assert handler.settings is request_scope.resolve(_ChainSettings)
@@ -14,6 +14,8 @@ OPTIONAL_BENCHMARK_LIBRARIES: Final[tuple[str, ...]] = ("punq",)
 _BENCHMARK_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(
     r"^test_benchmark_(?P<library>[a-z0-9]+)_",
 )
+_STARTUP_PARAM_PATTERN: Final[re.Pattern[str]] = re.compile(r"^n(?P<provider_count>[0-9]+)$")
+REPORT_KINDS: Final[tuple[str, ...]] = ("comparison", "startup")
 
 
 class BenchmarkReportError(ValueError):
@@ -76,6 +78,35 @@ class BenchmarkReport:
         return normalized
 
 
+@dataclass(frozen=True)
+class StartupBenchmarkReport:
+    """Normalized startup benchmark data keyed by scenario and provider count."""
+
+    metadata: BenchmarkMetadata
+    scenarios: tuple[str, ...]
+    provider_counts: tuple[int, ...]
+    files: dict[str, str]
+    mean_seconds: dict[str, dict[int, float | None]]
+    peak_memory_bytes: dict[str, dict[int, int | None]]
+
+    def as_json_dict(self) -> dict[str, object]:
+        """Convert report into the normalized startup JSON artifact schema."""
+        return {
+            "metadata": {
+                "commit": self.metadata.commit,
+                "branch": self.metadata.branch,
+                "python_version": self.metadata.python_version,
+                "datetime_utc": self.metadata.datetime_utc,
+                "source_raw_file": self.metadata.source_raw_file,
+            },
+            "scenarios": list(self.scenarios),
+            "provider_counts": list(self.provider_counts),
+            "files": self.files,
+            "mean_seconds": _startup_matrix_to_json(self.mean_seconds),
+            "peak_memory_bytes": _startup_matrix_to_json(self.peak_memory_bytes),
+        }
+
+
 def _validate_libraries(libraries: tuple[str, ...]) -> None:
     if not libraries:
         msg = "At least one benchmark library must be selected."
@@ -163,6 +194,74 @@ def normalize_benchmark_report(
     )
 
 
+def normalize_startup_report(
+    raw_payload: dict[str, object],
+    *,
+    source_raw_file: str,
+) -> StartupBenchmarkReport:
+    """Normalize raw startup pytest-benchmark payload into per-provider-count rows."""
+    benchmark_entries = _read_benchmark_entries(raw_payload)
+    files_by_scenario: dict[str, str] = {}
+    mean_by_scenario: dict[str, dict[int, float]] = {}
+    peak_by_scenario: dict[str, dict[int, int]] = {}
+
+    for benchmark in benchmark_entries:
+        name = _read_str(benchmark, key="name")
+        full_name = _read_str(benchmark, key="fullname")
+        if _extract_library(name) != "diwire":
+            msg = f"Startup benchmarks only support diwire, got '{name}'."
+            raise BenchmarkReportError(msg)
+        benchmark_file = full_name.partition("::")[0]
+        if not benchmark_file:
+            msg = f"Invalid benchmark fullname '{full_name}'."
+            raise BenchmarkReportError(msg)
+        provider_count = _extract_provider_count(_read_str(benchmark, key="param"))
+        stats = _read_object(benchmark, key="stats")
+        extra_info = _read_object(benchmark, key="extra_info")
+
+        scenario = _scenario_name_from_file(benchmark_file)
+        _store_scenario_file(
+            files_by_scenario=files_by_scenario,
+            scenario=scenario,
+            benchmark_file=benchmark_file,
+        )
+        scenario_means = mean_by_scenario.setdefault(scenario, {})
+        if provider_count in scenario_means:
+            msg = (
+                f"Duplicate startup benchmark entry for scenario '{scenario}' "
+                f"with {provider_count} providers."
+            )
+            raise BenchmarkReportError(msg)
+        scenario_means[provider_count] = _read_float(stats, key="mean")
+        peak_by_scenario.setdefault(scenario, {})[provider_count] = _read_int(
+            extra_info,
+            key="peak_memory_bytes",
+        )
+
+    if not files_by_scenario:
+        msg = "No benchmark results found in raw payload."
+        raise BenchmarkReportError(msg)
+
+    scenarios = tuple(sorted(files_by_scenario))
+    provider_counts = tuple(
+        sorted({count for counts in mean_by_scenario.values() for count in counts}),
+    )
+    return StartupBenchmarkReport(
+        metadata=_build_metadata(raw_payload=raw_payload, source_raw_file=source_raw_file),
+        scenarios=scenarios,
+        provider_counts=provider_counts,
+        files=files_by_scenario,
+        mean_seconds={
+            scenario: {count: mean_by_scenario[scenario].get(count) for count in provider_counts}
+            for scenario in scenarios
+        },
+        peak_memory_bytes={
+            scenario: {count: peak_by_scenario[scenario].get(count) for count in provider_counts}
+            for scenario in scenarios
+        },
+    )
+
+
 def render_benchmark_markdown(report: BenchmarkReport) -> str:
     """Render the benchmark matrix as Markdown."""
     baseline_libraries = tuple(library for library in report.libraries if library != "diwire")
@@ -194,15 +293,43 @@ def render_benchmark_markdown(report: BenchmarkReport) -> str:
     return "\n".join(lines) + "\n"
 
 
+def render_startup_markdown(report: StartupBenchmarkReport) -> str:
+    """Render startup timings and peak memory as Markdown."""
+    lines = [
+        "## Startup Benchmark Results",
+        "",
+        f"- Commit: `{report.metadata.commit}`",
+        f"- Branch: `{report.metadata.branch}`",
+        f"- Python: `{report.metadata.python_version}`",
+        f"- Datetime (UTC): `{report.metadata.datetime_utc}`",
+        "",
+        "| Scenario | Providers | Mean time (ms) | Peak memory (KiB) |",
+        "| --- | --- | --- | --- |",
+    ]
+    for scenario in report.scenarios:
+        for provider_count in report.provider_counts:
+            row_parts = [
+                scenario,
+                f"{provider_count:,}",
+                _format_milliseconds(report.mean_seconds[scenario][provider_count]),
+                _format_kibibytes(report.peak_memory_bytes[scenario][provider_count]),
+            ]
+            lines.append("| " + " | ".join(row_parts) + " |")
+    return "\n".join(lines) + "\n"
+
+
 def write_benchmark_outputs(
-    report: BenchmarkReport,
+    report: BenchmarkReport | StartupBenchmarkReport,
     *,
     markdown_path: Path,
     json_path: Path,
     comment_path: Path,
 ) -> None:
     """Write Markdown and JSON benchmark report artifacts."""
-    markdown = render_benchmark_markdown(report)
+    if isinstance(report, StartupBenchmarkReport):
+        markdown = render_startup_markdown(report)
+    else:
+        markdown = render_benchmark_markdown(report)
     json_text = json.dumps(report.as_json_dict(), indent=2, sort_keys=True) + "\n"
 
     for output_path in (markdown_path, json_path, comment_path):
@@ -245,17 +372,30 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Comma-separated whitelist of scenarios to include (default: inferred from selected libraries).",
     )
+    parser.add_argument(
+        "--kind",
+        choices=REPORT_KINDS,
+        default="comparison",
+        help=(
+            "Report kind: 'comparison' for cross-library OPS tables or 'startup' for "
+            "registration/plan/compile timings and peak memory (default: comparison)."
+        ),
+    )
     args = parser.parse_args(argv)
 
     raw_payload = load_raw_benchmark_json(args.input)
-    selected_libraries = _parse_csv(args.libraries)
-    selected_scenarios = None if args.scenarios is None else _parse_csv(args.scenarios)
-    report = normalize_benchmark_report(
-        raw_payload,
-        source_raw_file=str(args.input),
-        libraries=selected_libraries,
-        scenarios=selected_scenarios,
-    )
+    report: BenchmarkReport | StartupBenchmarkReport
+    if args.kind == "startup":
+        report = normalize_startup_report(raw_payload, source_raw_file=str(args.input))
+    else:
+        selected_libraries = _parse_csv(args.libraries)
+        selected_scenarios = None if args.scenarios is None else _parse_csv(args.scenarios)
+        report = normalize_benchmark_report(
+            raw_payload,
+            source_raw_file=str(args.input),
+            libraries=selected_libraries,
+            scenarios=selected_scenarios,
+        )
     write_benchmark_outputs(
         report,
         markdown_path=args.markdown,
@@ -425,6 +565,14 @@ def _extract_library(benchmark_name: str) -> str:
     return library
 
 
+def _extract_provider_count(param: str) -> int:
+    match = _STARTUP_PARAM_PATTERN.match(param)
+    if match is None:
+        msg = f"Unexpected startup benchmark parameter '{param}'."
+        raise BenchmarkReportError(msg)
+    return int(match.group("provider_count"))
+
+
 def _scenario_name_from_file(benchmark_file: str) -> str:
     stem = Path(benchmark_file).stem
     return stem.removeprefix("test_")
@@ -494,6 +642,26 @@ def _read_float(container: dict[str, object], *, key: str) -> float:
     raise BenchmarkReportError(msg)
 
 
+def _read_int(container: dict[str, object], *, key: str) -> int:
+    value = container.get(key)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    msg = f"Expected '{key}' to be an integer value."
+    raise BenchmarkReportError(msg)
+
+
+def _format_milliseconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value * 1_000:,.2f}"
+
+
+def _format_kibibytes(value: int | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value / 1_024:,.0f}"
+
+
 def _format_ops(value: float | None) -> str:
     if value is None:
         return "-"
@@ -516,6 +684,18 @@ def _ops_to_json(
     }
 
 
+def _startup_matrix_to_json(
+    matrix: dict[str, dict[int, float | None]] | dict[str, dict[int, int | None]],
+) -> dict[str, dict[str, float | int | str]]:
+    return {
+        scenario: {
+            str(provider_count): "-" if value is None else value
+            for provider_count, value in values.items()
+        }
+        for scenario, values in matrix.items()
+    }
+
+
 def _select_scenarios(
     *,
     required_libraries: tuple[str, ...],
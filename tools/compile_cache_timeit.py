@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from diwire import Container, Lifetime, Scope
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+
+_SCOPES = (Scope.APP, Scope.SESSION, Scope.REQUEST, Scope.ACTION, Scope.STEP)
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """A single benchmark row comparing cold and warm compile-cache builds."""
+
+    name: str
+    provider_count: int
+    uncached_compile_ms: float
+    cold_compile_ms: float
+    warm_compile_ms: float
+    ratio_warm_over_uncached: float
+    cache_file_kib: float
+
+
+def _build_container(*, provider_count: int) -> Container:
+    container = Container()
+    previous: tuple[type[Any], Any] | None = None
+    for index in range(provider_count):
+        scope = _SCOPES[index % len(_SCOPES)]
+        namespace: dict[str, Any] = {}
+        if previous is not None and previous[1].level <= scope.level:
+            namespace["__init__"] = _init_with_dependency(previous[0])
+        provider_type = type(f"_CompileCacheBenchService{index}", (), namespace)
+        lifetime = Lifetime.TRANSIENT if index % 3 == 0 else Lifetime.SCOPED
+        container.add(provider_type, scope=scope, lifetime=lifetime)
+        previous = (provider_type, scope)
+    return container
+
+
+def _init_with_dependency(dependency_type: type[Any]) -> Any:
+    def init(self: Any, dependency: Any) -> None:
+        self.dependency = dependency
+
+    init.__annotations__ = {"dependency": dependency_type, "return": None}
+    return init
+
+
+def _measure_build_ms(*, compiler_factory: Any, container: Container, repeat: int) -> float:
+    registrations = container._providers_registrations  # noqa: SLF001
+    durations: list[float] = []
+    for _ in range(repeat):
+        compiler = compiler_factory()
+        gc.collect()
+        started = time.perf_counter()
+        compiler.build_root_resolver(root_scope=Scope.APP, registrations=registrations)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations) * 1_000.0
+
+
+def _scenario_graph(*, provider_count: int, repeat: int) -> ScenarioResult:
+    container = _build_container(provider_count=provider_count)
+    uncached_ms = _measure_build_ms(
+        compiler_factory=ResolversAssemblyCompiler,
+        container=container,
+        repeat=repeat,
+    )
+    cold_durations: list[float] = []
+    warm_durations: list[float] = []
+    cache_file_kib = 0.0
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold_durations.append(
+                _measure_build_ms(
+                    compiler_factory=lambda cache_dir=cache_dir: ResolversAssemblyCompiler(
+                        code_cache_dir=cache_dir,
+                    ),
+                    container=container,
+                    repeat=1,
+                ),
+            )
+            warm_durations.append(
+                _measure_build_ms(
+                    compiler_factory=lambda cache_dir=cache_dir: ResolversAssemblyCompiler(
+                        code_cache_dir=cache_dir,
+                    ),
+                    container=container,
+                    repeat=1,
+                ),
+            )
+            cache_file_kib = sum(path.stat().st_size for path in Path(cache_dir).iterdir()) / 1024.0
+
+    warm_ms = statistics.median(warm_durations)
+    return ScenarioResult(
+        name=f"mixed_scopes_n{provider_count}",
+        provider_count=provider_count,
+        uncached_compile_ms=uncached_ms,
+        cold_compile_ms=statistics.median(cold_durations),
+        warm_compile_ms=warm_ms,
+        ratio_warm_over_uncached=warm_ms / uncached_ms,
+        cache_file_kib=cache_file_kib,
+    )
+
+
+def _collect_results(*, provider_counts: tuple[int, ...], repeat: int) -> list[ScenarioResult]:
+    return [
+        _scenario_graph(provider_count=provider_count, repeat=repeat)
+        for provider_count in provider_counts
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+    )
+    parser.add_argument(
+        "--providers",
+        default="100,500,1000",
+        help="Comma-separated provider counts for generated graphs.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+    )
+    args = parser.parse_args()
+
+    provider_counts = tuple(int(part) for part in args.providers.split(",") if part.strip())
+    results = _collect_results(provider_counts=provider_counts, repeat=args.repeat)
+    payload = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+        "command": " ".join([*sys.argv]),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
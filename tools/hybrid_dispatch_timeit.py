@@ -14,7 +14,7 @@ from typing import Any
 
 @dataclass(frozen=True, slots=True)
 class ScenarioResult:
-    """A single benchmark row comparing legacy and hybrid dispatch timings."""
+    """A single benchmark row comparing legacy dispatch timings against a candidate."""
 
     name: str
     before_ns_op: float
@@ -67,6 +67,22 @@ def _compile_hybrid_dispatch(
     return namespace["resolve"]
 
 
+def _compile_table_dispatch(keys: tuple[Any, ...]) -> Any:
+    lines = [
+        "def resolve(dependency):",
+        "    slot = _dispatch_table.get(dependency)",
+        "    if slot is not None:",
+        "        return slot",
+        "    raise KeyError(dependency)",
+    ]
+    source = "\n".join(lines)
+    namespace: dict[str, Any] = {
+        "_dispatch_table": {key: index for index, key in enumerate(keys)},
+    }
+    exec(source, namespace)  # noqa: S102
+    return namespace["resolve"]
+
+
 def _measure_pair_ns_per_op(
     *,
     before_callable: Any,
@@ -125,6 +141,56 @@ def _scenario_class_path(
     )
 
 
+def _scenario_table_path(
+    *,
+    provider_count: int,
+    position_name: str,
+    index: int,
+    number: int,
+    repeat: int,
+) -> ScenarioResult:
+    keys = _class_keys(provider_count)
+    dependency = keys[index]
+    before_dispatch = _compile_identity_dispatch(keys)
+    after_dispatch = _compile_table_dispatch(keys)
+
+    def before_call() -> None:
+        _ = before_dispatch(dependency)
+
+    def after_call() -> None:
+        _ = after_dispatch(dependency)
+
+    before_ns, after_ns = _measure_pair_ns_per_op(
+        before_callable=before_call,
+        after_callable=after_call,
+        number=number,
+        repeat=repeat,
+    )
+    return ScenarioResult(
+        name=f"table_{position_name}_n{provider_count}",
+        before_ns_op=before_ns,
+        after_ns_op=after_ns,
+        ratio_after_over_before=after_ns / before_ns,
+        before_behavior="hit",
+        after_behavior="hit",
+    )
+
+
+def _table_crossover_provider_count(results: list[ScenarioResult]) -> int | None:
+    middle_results = sorted(
+        (
+            (int(result.name.rsplit("_n", maxsplit=1)[1]), result)
+            for result in results
+            if result.name.startswith("table_middle_")
+        ),
+        key=lambda item: item[0],
+    )
+    for provider_count, result in middle_results:
+        if result.ratio_after_over_before < 1.0:
+            return provider_count
+    return None
+
+
 def _scenario_alias_equal_not_identical(
     *,
     alias_name: str,
@@ -234,6 +300,22 @@ def _collect_results(*, number: int, repeat: int) -> list[ScenarioResult]:
                 ),
             )
 
+    for provider_count in (4, 8, 16, 32, 64, 256, 2048):
+        indices = {
+            "middle": provider_count // 2,
+            "last": provider_count - 1,
+        }
+        for position_name, index in indices.items():
+            results.append(
+                _scenario_table_path(
+                    provider_count=provider_count,
+                    position_name=position_name,
+                    index=index,
+                    number=number,
+                    repeat=repeat,
+                ),
+            )
+
     alias_factories = {
         "list_int": lambda: list[int],
         "dict_str_int": lambda: dict[str, int],
@@ -281,6 +363,7 @@ def main() -> None:
         "platform": platform.platform(),
         "number": args.number,
         "repeat": args.repeat,
+        "table_crossover_provider_count": _table_crossover_provider_count(results),
         "results": [asdict(result) for result in results],
         "command": " ".join([*sys.argv]),
     }
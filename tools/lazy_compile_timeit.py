@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from diwire import Container, Lifetime, Scope
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+
+_CHAIN_LENGTH = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """A single benchmark row comparing eager and lazy slot method compilation."""
+
+    name: str
+    provider_count: int
+    working_set_fraction: float
+    eager_build_ms: float
+    lazy_build_ms: float
+    eager_startup_ms: float
+    lazy_startup_ms: float
+    ratio_lazy_over_eager_startup: float
+
+
+def _init_with_dependency(dependency_type: type[Any]) -> Any:
+    def init(self: Any, dependency: Any) -> None:
+        self.dependency = dependency
+
+    init.__annotations__ = {"dependency": dependency_type, "return": None}
+    return init
+
+
+def _build_container(*, provider_count: int) -> tuple[Container, list[type[Any]]]:
+    container = Container()
+    chain_heads: list[type[Any]] = []
+    previous: type[Any] | None = None
+    for index in range(provider_count):
+        namespace: dict[str, Any] = {}
+        if index % _CHAIN_LENGTH and previous is not None:
+            namespace["__init__"] = _init_with_dependency(previous)
+        provider_type = type(f"_LazyCompileBenchService{index}", (), namespace)
+        lifetime = Lifetime.TRANSIENT if index % 2 else Lifetime.SCOPED
+        container.add(provider_type, scope=Scope.APP, lifetime=lifetime)
+        if index % _CHAIN_LENGTH == _CHAIN_LENGTH - 1:
+            chain_heads.append(provider_type)
+        previous = provider_type
+    return container, chain_heads
+
+
+def _measure_startup_ms(
+    *,
+    container: Container,
+    working_set: list[type[Any]],
+    lazy_slot_methods: bool,
+    repeat: int,
+) -> tuple[float, float]:
+    registrations = container._providers_registrations  # noqa: SLF001
+    build_durations: list[float] = []
+    startup_durations: list[float] = []
+    for _ in range(repeat):
+        compiler = ResolversAssemblyCompiler(lazy_slot_methods=lazy_slot_methods)
+        gc.collect()
+        started = time.perf_counter()
+        resolver = compiler.build_root_resolver(root_scope=Scope.APP, registrations=registrations)
+        built = time.perf_counter()
+        for dependency in working_set:
+            resolver.resolve(dependency)
+        finished = time.perf_counter()
+        build_durations.append(built - started)
+        startup_durations.append(finished - started)
+    return (
+        statistics.median(build_durations) * 1_000.0,
+        statistics.median(startup_durations) * 1_000.0,
+    )
+
+
+def _scenario_working_set(
+    *,
+    provider_count: int,
+    working_set_fraction: float,
+    repeat: int,
+) -> ScenarioResult:
+    container, chain_heads = _build_container(provider_count=provider_count)
+    working_set_size = max(1, round(len(chain_heads) * working_set_fraction))
+    working_set = chain_heads[:working_set_size]
+    eager_build_ms, eager_startup_ms = _measure_startup_ms(
+        container=container,
+        working_set=working_set,
+        lazy_slot_methods=False,
+        repeat=repeat,
+    )
+    lazy_build_ms, lazy_startup_ms = _measure_startup_ms(
+        container=container,
+        working_set=working_set,
+        lazy_slot_methods=True,
+        repeat=repeat,
+    )
+    return ScenarioResult(
+        name=f"chains_n{provider_count}",
+        provider_count=provider_count,
+        working_set_fraction=working_set_fraction,
+        eager_build_ms=eager_build_ms,
+        lazy_build_ms=lazy_build_ms,
+        eager_startup_ms=eager_startup_ms,
+        lazy_startup_ms=lazy_startup_ms,
+        ratio_lazy_over_eager_startup=lazy_startup_ms / eager_startup_ms,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+    )
+    parser.add_argument(
+        "--providers",
+        default="1000,5000,10000",
+        help="Comma-separated provider counts for generated graphs.",
+    )
+    parser.add_argument(
+        "--working-set",
+        type=float,
+        default=0.05,
+        help="Fraction of provider chains resolved after the build.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+    )
+    args = parser.parse_args()
+
+    provider_counts = tuple(int(part) for part in args.providers.split(",") if part.strip())
+    results = [
+        _scenario_working_set(
+            provider_count=provider_count,
+            working_set_fraction=args.working_set,
+            repeat=args.repeat,
+        )
+        for provider_count in provider_counts
+    ]
+    payload = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+        "command": " ".join([*sys.argv]),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from diwire import Container, Lifetime, Scope
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+from diwire._internal.resolvers.protocol import ResolverProtocol
+
+_CHAIN_LENGTH = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """A single benchmark row comparing full rebuilds with rebuilds reusing the previous one."""
+
+    name: str
+    provider_count: int
+    full_rebuild_ms: float
+    reusing_previous_ms: float
+    container_autoregister_ms: float
+    ratio_reusing_previous_over_full: float
+
+
+def _init_with_dependency(dependency_type: type[Any]) -> Any:
+    def init(self: Any, dependency: Any) -> None:
+        self.dependency = dependency
+
+    init.__annotations__ = {"dependency": dependency_type, "return": None}
+    return init
+
+
+def _provider_types(*, provider_count: int) -> list[type[Any]]:
+    provider_types: list[type[Any]] = []
+    previous: type[Any] | None = None
+    for index in range(provider_count):
+        namespace: dict[str, Any] = {}
+        if index % _CHAIN_LENGTH and previous is not None:
+            namespace["__init__"] = _init_with_dependency(previous)
+        provider_type = type(f"_RecompileBenchService{index}", (), namespace)
+        provider_types.append(provider_type)
+        previous = provider_type
+    return provider_types
+
+
+def _lifetime(index: int) -> Lifetime:
+    return Lifetime.TRANSIENT if index % 2 else Lifetime.SCOPED
+
+
+def _measure_interleaved_ms(*, provider_count: int, reuse_previous: bool) -> float:
+    provider_types = _provider_types(provider_count=provider_count)
+    container = Container(use_resolver_context=False)
+    registrations = container._providers_registrations  # noqa: SLF001
+    compiler = ResolversAssemblyCompiler()
+    resolver: ResolverProtocol | None = None
+    gc.collect()
+    started = time.perf_counter()
+    for index, provider_type in enumerate(provider_types):
+        container.add(provider_type, scope=Scope.APP, lifetime=_lifetime(index))
+        resolver = compiler.build_root_resolver(
+            root_scope=Scope.APP,
+            registrations=registrations,
+            previous_root_resolver=resolver if reuse_previous else None,
+        )
+        resolver.resolve(provider_type)
+    return (time.perf_counter() - started) * 1_000.0
+
+
+def _measure_container_autoregister_ms(*, provider_count: int) -> float:
+    # Every resolve sees a new type, registers it and recompiles the container graph.
+    provider_types = _provider_types(provider_count=provider_count)
+    container = Container(use_resolver_context=False)
+    gc.collect()
+    started = time.perf_counter()
+    for provider_type in provider_types:
+        container.resolve(provider_type)
+    return (time.perf_counter() - started) * 1_000.0
+
+
+def _scenario_interleaved(*, provider_count: int, repeat: int) -> ScenarioResult:
+    full_rebuild_ms = statistics.median(
+        _measure_interleaved_ms(provider_count=provider_count, reuse_previous=False)
+        for _ in range(repeat)
+    )
+    reusing_previous_ms = statistics.median(
+        _measure_interleaved_ms(provider_count=provider_count, reuse_previous=True)
+        for _ in range(repeat)
+    )
+    container_autoregister_ms = statistics.median(
+        _measure_container_autoregister_ms(provider_count=provider_count) for _ in range(repeat)
+    )
+    return ScenarioResult(
+        name=f"interleaved_n{provider_count}",
+        provider_count=provider_count,
+        full_rebuild_ms=full_rebuild_ms,
+        reusing_previous_ms=reusing_previous_ms,
+        container_autoregister_ms=container_autoregister_ms,
+        ratio_reusing_previous_over_full=reusing_previous_ms / full_rebuild_ms,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+    )
+    parser.add_argument(
+        "--providers",
+        default="1000",
+        help="Comma-separated numbers of types registered one at a time.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+    )
+    args = parser.parse_args()
+
+    provider_counts = tuple(int(part) for part in args.providers.split(",") if part.strip())
+    results = [
+        _scenario_interleaved(provider_count=provider_count, repeat=args.repeat)
+        for provider_count in provider_counts
+    ]
+    payload = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+        "command": " ".join([*sys.argv]),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from diwire import Container, Lifetime, Scope
+from diwire._internal.resolvers.assembly.compiler import ResolversAssemblyCompiler
+
+_SCOPES = (Scope.APP, Scope.SESSION, Scope.REQUEST, Scope.ACTION, Scope.STEP)
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    """A single benchmark row comparing per-class and shared slot method compilation."""
+
+    name: str
+    provider_count: int
+    before_compile_ms: float
+    after_compile_ms: float
+    ratio_after_over_before: float
+    before_retained_kib: float
+    after_retained_kib: float
+    before_function_count: int
+    after_function_count: int
+
+
+def _build_container(*, provider_count: int) -> Container:
+    container = Container()
+    previous: tuple[type[Any], Any] | None = None
+    for index in range(provider_count):
+        scope = _SCOPES[index % len(_SCOPES)]
+        namespace: dict[str, Any] = {}
+        if previous is not None and previous[1].level <= scope.level:
+            namespace["__init__"] = _init_with_dependency(previous[0])
+        provider_type = type(f"_SharingBenchService{index}", (), namespace)
+        lifetime = Lifetime.TRANSIENT if index % 3 == 0 else Lifetime.SCOPED
+        container.add(provider_type, scope=scope, lifetime=lifetime)
+        previous = (provider_type, scope)
+    return container
+
+
+def _init_with_dependency(dependency_type: type[Any]) -> Any:
+    def init(self: Any, dependency: Any) -> None:
+        self.dependency = dependency
+
+    init.__annotations__ = {"dependency": dependency_type, "return": None}
+    return init
+
+
+def _function_count(root_resolver: Any) -> int:
+    runtime = type(root_resolver)._runtime  # noqa: SLF001
+    return len(
+        {
+            id(value)
+            for resolver_class in runtime.class_by_level.values()
+            for name, value in vars(resolver_class).items()
+            if name.startswith(("resolve_", "aresolve_"))
+        },
+    )
+
+
+def _measure_compile(
+    *,
+    container: Container,
+    share_slot_methods: bool,
+    repeat: int,
+) -> tuple[float, float, int]:
+    compiler = ResolversAssemblyCompiler(share_slot_methods=share_slot_methods)
+    registrations = container._providers_registrations  # noqa: SLF001
+
+    durations: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        compiler.build_root_resolver(root_scope=Scope.APP, registrations=registrations)
+        durations.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    root_resolver = compiler.build_root_resolver(root_scope=Scope.APP, registrations=registrations)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    compile_ms = statistics.median(durations) * 1_000.0
+    retained_kib = (retained - baseline) / 1024.0
+    return compile_ms, retained_kib, _function_count(root_resolver)
+
+
+def _scenario_graph(*, provider_count: int, repeat: int) -> ScenarioResult:
+    container = _build_container(provider_count=provider_count)
+    before_ms, before_kib, before_functions = _measure_compile(
+        container=container,
+        share_slot_methods=False,
+        repeat=repeat,
+    )
+    after_ms, after_kib, after_functions = _measure_compile(
+        container=container,
+        share_slot_methods=True,
+        repeat=repeat,
+    )
+    return ScenarioResult(
+        name=f"mixed_scopes_n{provider_count}",
+        provider_count=provider_count,
+        before_compile_ms=before_ms,
+        after_compile_ms=after_ms,
+        ratio_after_over_before=after_ms / before_ms,
+        before_retained_kib=before_kib,
+        after_retained_kib=after_kib,
+        before_function_count=before_functions,
+        after_function_count=after_functions,
+    )
+
+
+def _collect_results(*, provider_counts: tuple[int, ...], repeat: int) -> list[ScenarioResult]:
+    return [
+        _scenario_graph(provider_count=provider_count, repeat=repeat)
+        for provider_count in provider_counts
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+    )
+    parser.add_argument(
+        "--providers",
+        default="100,500,1000",
+        help="Comma-separated provider counts for generated graphs.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+    )
+    args = parser.parse_args()
+
+    provider_counts = tuple(int(part) for part in args.providers.split(",") if part.strip())
+    results = _collect_results(provider_counts=provider_counts, repeat=args.repeat)
+    payload = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [asdict(result) for result in results],
+        "command": " ".join([*sys.argv]),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()